@@ -0,0 +1,27 @@
+"""add_employees_created_at_index
+
+Revision ID: 3b7c1e9a4d52
+Revises: ff935b13936e
+Create Date: 2026-10-19 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7c1e9a4d52'
+down_revision: Union[str, None] = 'ff935b13936e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index backing keyset pagination of employees on (created_at, id)
+    op.create_index('ix_employees_created_at_id', 'employees', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employees_created_at_id', table_name='employees')
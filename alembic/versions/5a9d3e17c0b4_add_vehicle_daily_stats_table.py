@@ -0,0 +1,65 @@
+"""add_vehicle_daily_stats_table
+
+Revision ID: 5a9d3e17c0b4
+Revises: c4e7a91b2d38
+Create Date: 2026-10-19 16:42:08.318274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9d3e17c0b4'
+down_revision: Union[str, None] = 'c4e7a91b2d38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Daily per-vehicle rollup of trips and fuel records used by the reports
+    op.create_table(
+        'vehicle_daily_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('group_id', sa.Integer(), nullable=False),
+        sa.Column('vehicle_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('trip_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('loading_size_cubic_meters', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fuel_liters', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fuel_cost', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['group_id'], ['groups.id']),
+        sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('group_id', 'vehicle_id', 'date', name='uq_vehicle_daily_stats_group_vehicle_date')
+    )
+    op.create_index('ix_vehicle_daily_stats_vehicle_date', 'vehicle_daily_stats', ['vehicle_id', 'date'])
+
+    # Backfill from existing trips and fuel records
+    op.execute("""
+        INSERT INTO vehicle_daily_stats
+            (group_id, vehicle_id, date, trip_count, loading_size_cubic_meters, fuel_liters, fuel_cost, updated_at)
+        SELECT group_id, vehicle_id, date,
+               SUM(trip_count), SUM(loading_size), SUM(fuel_liters), SUM(fuel_cost), CURRENT_TIMESTAMP
+        FROM (
+            SELECT group_id, vehicle_id, date,
+                   COUNT(*) AS trip_count, COALESCE(SUM(loading_size_cubic_meters), 0) AS loading_size,
+                   0 AS fuel_liters, 0 AS fuel_cost
+            FROM trips
+            GROUP BY group_id, vehicle_id, date
+            UNION ALL
+            SELECT group_id, vehicle_id, date,
+                   0, 0, SUM(liters), SUM(cost)
+            FROM fuel_records
+            GROUP BY group_id, vehicle_id, date
+        ) AS daily
+        GROUP BY group_id, vehicle_id, date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vehicle_daily_stats_vehicle_date', table_name='vehicle_daily_stats')
+    op.drop_table('vehicle_daily_stats')
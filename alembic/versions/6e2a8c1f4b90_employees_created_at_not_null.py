@@ -0,0 +1,39 @@
+"""employees_created_at_not_null
+
+Revision ID: 6e2a8c1f4b90
+Revises: 9b2f6c4d8e13
+Create Date: 2026-10-20 10:05:31.218406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2a8c1f4b90'
+down_revision: Union[str, None] = '9b2f6c4d8e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The employee listing's keyset cursor is (created_at, id); a NULL created_at
+    # cannot be encoded and is never matched by "created_at < cursor".
+    # Backfill legacy rows with their first group join, else the migration time (UTC).
+    now = 'UTC_TIMESTAMP()' if op.get_bind().dialect.name == 'mysql' else 'CURRENT_TIMESTAMP'
+    op.execute(f"""
+        UPDATE employees
+        SET created_at = COALESCE(
+            (SELECT MIN(employee_groups.joined_at) FROM employee_groups
+             WHERE employee_groups.employee_id = employees.id),
+            {now}
+        )
+        WHERE created_at IS NULL
+    """)
+    op.alter_column('employees', 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('employees', 'created_at', existing_type=sa.DateTime(), nullable=True)
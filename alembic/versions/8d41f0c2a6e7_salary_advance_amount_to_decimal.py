@@ -0,0 +1,122 @@
+"""salary_advance_amount_to_decimal
+
+Revision ID: 8d41f0c2a6e7
+Revises: 3b7c1e9a4d52
+Create Date: 2026-10-19 10:02:17.540913
+
+Converts salary_advances.amount from VARCHAR(50) to DECIMAL(14,2) without a
+long table lock, while the application keeps writing:
+
+- A nullable shadow column is added and, on MySQL, INSERT/UPDATE triggers
+  copy every new or changed amount into it, so running application
+  processes keep both columns in sync during the backfill.
+- Existing rows are backfilled in small committed batches.
+- The swap runs under LOCK TABLES ... WRITE: the triggers are dropped, a
+  catch-up pass fills anything still missing and the columns are swapped in
+  one ALTER TABLE. Writers wait for the lock instead of inserting rows that
+  would miss the new column; the wait lasts as long as the table rebuild.
+
+Old code that writes amount as a numeric string keeps working after the
+swap, because MySQL casts it into the DECIMAL column. Other databases get
+the same steps without triggers or locks and need writers stopped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0c2a6e7'
+down_revision: Union[str, None] = '3b7c1e9a4d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name == 'mysql'
+
+
+def _create_sync_triggers(source: str, target: str, cast_type: str) -> None:
+    """Mirror source into target for rows the application writes during the backfill"""
+    for event in ('INSERT', 'UPDATE'):
+        op.execute(
+            f"CREATE TRIGGER salary_advances_{target}_{event.lower()} BEFORE {event} ON salary_advances "
+            f"FOR EACH ROW SET NEW.{target} = CAST(NEW.{source} AS {cast_type})"
+        )
+
+
+def _drop_sync_triggers(target: str) -> None:
+    for event in ('insert', 'update'):
+        op.execute(f"DROP TRIGGER IF EXISTS salary_advances_{target}_{event}")
+
+
+def _backfill(source: str, target: str, cast_type: str) -> None:
+    """Copy source into target in id-range batches, committing after each batch"""
+    conn = op.get_bind()
+    max_id = conn.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM salary_advances")).scalar()
+
+    with op.get_context().autocommit_block():
+        for batch_start in range(0, max_id + 1, BATCH_SIZE):
+            conn.execute(
+                sa.text(
+                    f"UPDATE salary_advances SET {target} = CAST({source} AS {cast_type}) "
+                    f"WHERE id >= :start AND id < :end AND {target} IS NULL"
+                ),
+                {"start": batch_start, "end": batch_start + BATCH_SIZE}
+            )
+
+
+def _swap(source: str, target: str, cast_type: str, column_type: str, existing_type: sa.types.TypeEngine) -> None:
+    """Replace source with the backfilled target column, blocking writers for the swap"""
+    catch_up = (
+        f"UPDATE salary_advances SET {target} = CAST({source} AS {cast_type}) "
+        f"WHERE {target} IS NULL"
+    )
+
+    if not _is_mysql():
+        op.execute(catch_up)
+        op.drop_column('salary_advances', source)
+        op.alter_column('salary_advances', target, new_column_name=source, existing_type=existing_type, nullable=False)
+        return
+
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text("LOCK TABLES salary_advances WRITE"))
+        try:
+            _drop_sync_triggers(target)
+            conn.execute(sa.text(catch_up))
+            conn.execute(sa.text(
+                f"ALTER TABLE salary_advances DROP COLUMN {source}, "
+                f"CHANGE COLUMN {target} {source} {column_type} NOT NULL"
+            ))
+        finally:
+            conn.execute(sa.text("UNLOCK TABLES"))
+
+
+def upgrade() -> None:
+    # Step 1: Add a nullable shadow column (instant in MySQL 8) and keep it in sync with new writes
+    op.add_column('salary_advances', sa.Column('amount_decimal', sa.Numeric(14, 2), nullable=True))
+    if _is_mysql():
+        _create_sync_triggers('amount', 'amount_decimal', 'DECIMAL(14,2)')
+
+    # Step 2: Backfill in small batches so no single statement locks the whole table
+    _backfill('amount', 'amount_decimal', 'DECIMAL(14,2)')
+
+    # Step 3: Swap the columns
+    _swap('amount', 'amount_decimal', 'DECIMAL(14,2)', 'DECIMAL(14,2)', sa.Numeric(14, 2))
+
+    # Step 4: Index for per-employee range queries and SUMs
+    op.create_index('ix_salary_advances_employee_timestamp', 'salary_advances', ['employee_id', 'timestamp'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_salary_advances_employee_timestamp', table_name='salary_advances')
+
+    op.add_column('salary_advances', sa.Column('amount_string', sa.String(50), nullable=True))
+    if _is_mysql():
+        _create_sync_triggers('amount', 'amount_string', 'CHAR(50)')
+    _backfill('amount', 'amount_string', 'CHAR(50)')
+    _swap('amount', 'amount_string', 'CHAR(50)', 'VARCHAR(50)', sa.String(50))
@@ -0,0 +1,37 @@
+"""add_bot_persistence_table
+
+Revision ID: 9b2f6c4d8e13
+Revises: 5a9d3e17c0b4
+Create Date: 2026-10-19 18:10:52.604731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2f6c4d8e13'
+down_revision: Union[str, None] = '5a9d3e17c0b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Conversation state and user/chat data of the check-in bot
+    op.create_table(
+        'bot_persistence',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False, server_default=''),
+        sa.Column('entry_key', sa.String(length=255), nullable=False, server_default=''),
+        sa.Column('data', sa.Text(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'name', 'entry_key', name='uq_bot_persistence_kind_name_key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('bot_persistence')
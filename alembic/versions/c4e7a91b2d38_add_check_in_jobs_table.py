@@ -0,0 +1,43 @@
+"""add_check_in_jobs_table
+
+Revision ID: c4e7a91b2d38
+Revises: 8d41f0c2a6e7
+Create Date: 2026-10-19 14:05:31.522907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a91b2d38'
+down_revision: Union[str, None] = '8d41f0c2a6e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Durable queue for check-in post-processing (photo resize, group notification)
+    op.create_table(
+        'check_in_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('check_in_id', sa.Integer(), nullable=False),
+        sa.Column('raw_photo_path', sa.String(length=512), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('available_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['check_in_id'], ['check_ins.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_check_in_jobs_status_available_at', 'check_in_jobs', ['status', 'available_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_check_in_jobs_status_available_at', table_name='check_in_jobs')
+    op.drop_table('check_in_jobs')
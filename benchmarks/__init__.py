@@ -0,0 +1,7 @@
+"""
+Benchmark harness for the report and check-in hot paths
+
+Seeds a synthetic dataset into SQLite (default) or a scratch MySQL
+database, times the real code paths against it and writes the results as
+JSON so runs can be compared across commits. See benchmarks/README.md.
+"""
@@ -0,0 +1,224 @@
+"""
+Benchmarked code paths
+
+Each case takes the BenchmarkContext and returns a zero-argument callable
+that performs one operation (one request, one report render, ...) against
+the seeded database through the application's own code. Sessions are opened
+per operation so the identity map never hides a query.
+"""
+
+import asyncio
+import itertools
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from flask import Flask, g
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.use_cases.get_monthly_report import GetMonthlyReportUseCase
+from src.infrastructure.persistence.check_in_repository_impl import CheckInRepository
+from src.infrastructure.persistence.employee_repository_impl import EmployeeRepository
+from src.infrastructure.persistence.fuel_record_repository_impl import FuelRecordRepository
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.infrastructure.persistence.models import EmployeeGroupModel
+from src.infrastructure.persistence.trip_repository_impl import TripRepository
+from src.infrastructure.persistence.vehicle_daily_stats_repository_impl import VehicleDailyStatsRepository
+from src.infrastructure.persistence.vehicle_repository_impl import VehicleRepository
+from src.infrastructure.services.excel_export_service import ExcelExportService
+from src.infrastructure.services.photo_storage_service import PhotoStorageService
+from src.infrastructure.utils.timezone import get_ict_today
+from src.presentation.handlers.checkin_report_handler import CheckInReportHandler
+
+TARGET_GROUP_ID = 1
+
+
+class SkipBenchmark(Exception):
+    """Raised by a case that cannot run in this environment (e.g. no MongoDB)"""
+
+
+@dataclass
+class BenchmarkContext:
+    engine: Engine
+    Session: sessionmaker
+    work_dir: str
+    mongo_available: bool = False
+
+
+class _FakeCallbackQuery:
+    """The parts of telegram.CallbackQuery the report handlers touch"""
+
+    async def answer(self, *args, **kwargs):
+        pass
+
+    def __init__(self):
+        self.message = self
+
+    async def edit_message_text(self, text, *args, **kwargs):
+        self.text = text
+
+    async def reply_document(self, document, *args, **kwargs):
+        document.read()
+
+    async def delete_message(self, *args, **kwargs):
+        pass
+
+
+class _FakeUpdate:
+    def __init__(self):
+        self.callback_query = _FakeCallbackQuery()
+
+
+def checkin_post(ctx: BenchmarkContext) -> Callable[[], None]:
+    """POST /api/checkin as members of the target group, rotating through them (no photo)"""
+    import src.infrastructure.api.routes.checkin_routes as checkin_routes
+
+    session = ctx.Session()
+    group = GroupRepository(session).find_by_id(TARGET_GROUP_ID)
+    member_ids = [link.employee_id for link in session.query(EmployeeGroupModel).filter_by(group_id=TARGET_GROUP_ID)]
+    employee_repo = EmployeeRepository(session)
+    members = [employee_repo.find_by_id(employee_id) for employee_id in member_ids]
+    session.close()
+
+    checkin_routes.photo_storage = PhotoStorageService(
+        upload_dir=os.path.join(ctx.work_dir, 'photos'),
+        staging_dir=os.path.join(ctx.work_dir, 'staging')
+    )
+    app = Flask(__name__)
+    rotation = itertools.cycle(members)
+    current = {}
+
+    @app.before_request
+    def authenticate():
+        # What validate_telegram_auth attaches for a valid initData
+        g.current_user = current['employee']
+        g.current_group = group
+        g.telegram_user_id = current['employee'].telegram_id
+
+    app.register_blueprint(checkin_routes.checkin_bp, url_prefix='/api')
+    client = app.test_client()
+
+    def run():
+        employee = current['employee'] = next(rotation)
+        response = client.post('/api/checkin', data={
+            'telegram_user_id': employee.telegram_id,
+            'group_chat_id': group.chat_id,
+            'latitude': '11.55',
+            'longitude': '104.92'
+        }, content_type='multipart/form-data')
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/checkin returned {response.status_code}: {response.get_data(as_text=True)}")
+
+    return run
+
+
+def _report_handler(session) -> CheckInReportHandler:
+    return CheckInReportHandler(
+        GroupRepository(session),
+        CheckInRepository(session),
+        EmployeeRepository(session),
+        ExcelExportService()
+    )
+
+
+def checkin_report_daily(ctx: BenchmarkContext) -> Callable[[], None]:
+    """CheckInReportHandler.show_daily_report for the target group"""
+    def run():
+        session = ctx.Session()
+        try:
+            asyncio.run(_report_handler(session).show_daily_report(_FakeUpdate(), None, TARGET_GROUP_ID))
+        finally:
+            session.close()
+    return run
+
+
+def checkin_report_monthly(ctx: BenchmarkContext) -> Callable[[], None]:
+    """CheckInReportHandler.show_monthly_report for the target group"""
+    def run():
+        session = ctx.Session()
+        try:
+            asyncio.run(_report_handler(session).show_monthly_report(_FakeUpdate(), None, TARGET_GROUP_ID))
+        finally:
+            session.close()
+    return run
+
+
+def excel_checkin_report(ctx: BenchmarkContext) -> Callable[[], None]:
+    """CheckInReportHandler.export_monthly_report_excel (ExcelExportService.generate_checkin_report and its queries)"""
+    exports_dir = os.path.join(ctx.work_dir, 'exports')
+    os.makedirs(exports_dir, exist_ok=True)
+
+    def run():
+        session = ctx.Session()
+        try:
+            handler = _report_handler(session)
+            handler.excel_export_service.exports_dir = exports_dir
+            asyncio.run(handler.export_monthly_report_excel(_FakeUpdate(), None, TARGET_GROUP_ID))
+        finally:
+            session.close()
+    return run
+
+
+def _monthly_report(ctx: BenchmarkContext, use_rollup: bool) -> Callable[[], None]:
+    today = get_ict_today()
+
+    def run():
+        session = ctx.Session()
+        try:
+            GetMonthlyReportUseCase(
+                VehicleRepository(session),
+                None,
+                TripRepository(session),
+                FuelRecordRepository(session),
+                VehicleDailyStatsRepository(session) if use_rollup else None
+            ).execute(TARGET_GROUP_ID, today.year, today.month)
+        finally:
+            session.close()
+    return run
+
+
+def monthly_report_raw(ctx: BenchmarkContext) -> Callable[[], None]:
+    """GetMonthlyReportUseCase aggregating trips and fuel_records directly"""
+    return _monthly_report(ctx, use_rollup=False)
+
+
+def monthly_report_rollup(ctx: BenchmarkContext) -> Callable[[], None]:
+    """GetMonthlyReportUseCase reading vehicle_daily_stats, with the year-over-year comparison"""
+    return _monthly_report(ctx, use_rollup=True)
+
+
+def admin_group_listing(ctx: BenchmarkContext) -> Callable[[], None]:
+    """GET /api/admin/groups (first page of 50), MySQL groups joined with MongoDB form configs"""
+    if not ctx.mongo_available:
+        raise SkipBenchmark('MongoDB unavailable (pass --mongo-url)')
+
+    from src.infrastructure.api.routes.admin_group_routes import list_all_groups
+
+    app = Flask(__name__)
+    # Skip jwt_required_admin; admin principal lookups are cached and not what is measured here
+    view = list_all_groups.__wrapped__
+
+    def run():
+        with app.test_request_context('/api/admin/groups?limit=50'):
+            response, status = view()
+            if status != 200:
+                raise RuntimeError(f"/api/admin/groups returned {status}: {response.get_data(as_text=True)}")
+    return run
+
+
+CASES: Dict[str, Callable[[BenchmarkContext], Callable[[], None]]] = {
+    'checkin_post': checkin_post,
+    'checkin_report_daily': checkin_report_daily,
+    'checkin_report_monthly': checkin_report_monthly,
+    'excel_checkin_report': excel_checkin_report,
+    'monthly_report_raw': monthly_report_raw,
+    'monthly_report_rollup': monthly_report_rollup,
+    'admin_group_listing': admin_group_listing,
+}
+
+
+def default_iterations(name: str, requested: Optional[int]) -> int:
+    if requested:
+        return requested
+    return 200 if name == 'checkin_post' else 10
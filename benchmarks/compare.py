@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CANDIDATE.json [--fail-above PERCENT]
+
+Prints the median latency and queries per operation of every case in both
+runs. With --fail-above the exit status is 1 when any case's median got
+slower by more than PERCENT, so a CI job can gate on it.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--fail-above', type=float, help="Fail if a median regresses by more than this percentage")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    if baseline['dataset'].get('scale') != candidate['dataset'].get('scale'):
+        print("warning: the runs used different dataset scales", file=sys.stderr)
+
+    print(f"{'case':<26} {baseline.get('commit') or 'baseline':>12} {candidate.get('commit') or 'candidate':>12} "
+          f"{'change':>9} {'queries':>13}")
+    regressions = []
+    for name, new in candidate['results'].items():
+        old = baseline['results'].get(name)
+        if not old or 'skipped' in old or 'skipped' in new:
+            print(f"{name:<26} {'-':>12} {'-':>12}")
+            continue
+        change = (new['median_ms'] - old['median_ms']) / old['median_ms'] * 100 if old['median_ms'] else 0.0
+        queries = f"{old['queries_per_op']:g} -> {new['queries_per_op']:g}"
+        print(f"{name:<26} {old['median_ms']:>10.2f}ms {new['median_ms']:>10.2f}ms {change:>+8.1f}% {queries:>13}")
+        if args.fail_above is not None and change > args.fail_above:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nRegressed by more than {args.fail_above}%: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
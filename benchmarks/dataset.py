@@ -0,0 +1,201 @@
+"""
+Synthetic dataset for the benchmarks
+
+Generation is deterministic for a given spec and seed, so numbers from
+different commits are measured against identical data. Group 1 is the
+benchmark target: it always has the largest headcount and fleet, and its
+check-ins, trips and fuel records cover today, this month and the same month
+last year so every report has something to render.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List
+
+from sqlalchemy import func, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import (
+    Base,
+    CheckInModel,
+    EmployeeGroupModel,
+    EmployeeModel,
+    FuelRecordModel,
+    GroupModel,
+    TripModel,
+    VehicleModel,
+    utc_now,
+)
+from src.infrastructure.persistence.vehicle_daily_stats_repository_impl import VehicleDailyStatsRepository
+
+INSERT_BATCH_SIZE = 10_000
+HISTORY_DAYS = 400  # Reaches back past the same month last year
+VEHICLE_TYPES = ('TRUCK', 'VAN', 'MOTORCYCLE', 'CAR')
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    groups: int
+    min_employees_per_group: int
+    max_employees_per_group: int
+    vehicles_per_group: int
+    check_ins: int
+    trips: int
+    fuel_records: int
+
+
+SCALES: Dict[str, DatasetSpec] = {
+    'small': DatasetSpec(groups=5, min_employees_per_group=10, max_employees_per_group=50,
+                         vehicles_per_group=5, check_ins=10_000, trips=5_000, fuel_records=2_000),
+    'medium': DatasetSpec(groups=20, min_employees_per_group=10, max_employees_per_group=300,
+                          vehicles_per_group=20, check_ins=100_000, trips=50_000, fuel_records=20_000),
+    'large': DatasetSpec(groups=50, min_employees_per_group=10, max_employees_per_group=1000,
+                         vehicles_per_group=50, check_ins=1_000_000, trips=1_000_000, fuel_records=1_000_000),
+}
+
+
+def is_seeded(session: Session) -> bool:
+    return session.query(func.count(GroupModel.id)).scalar() > 0
+
+
+def seed(engine: Engine, spec: DatasetSpec, seed_value: int = 42) -> Dict[str, int]:
+    """Create the schema and insert the dataset; returns row counts per table"""
+    Base.metadata.create_all(engine)
+    rng = random.Random(seed_value)
+    now = utc_now().replace(microsecond=0)
+    today = now.date()
+
+    headcounts = _headcounts(rng, spec)
+    group_employees: Dict[int, List[int]] = {}
+    employee_id = 0
+    for group_id, headcount in enumerate(headcounts, start=1):
+        group_employees[group_id] = list(range(employee_id + 1, employee_id + headcount + 1))
+        employee_id += headcount
+
+    groups = [
+        {'id': group_id, 'chat_id': f'-100{group_id:06d}', 'name': f'Bench Group {group_id}',
+         'business_name': f'Bench Branch {group_id}', 'package_level': 'premium', 'created_at': now}
+        for group_id in group_employees
+    ]
+    employees = [
+        {'id': emp_id, 'telegram_id': str(900_000_000 + emp_id), 'name': f'Employee {emp_id:07d}', 'created_at': now}
+        for emp_id in range(1, employee_id + 1)
+    ]
+    links = [
+        {'employee_id': emp_id, 'group_id': group_id, 'joined_at': now}
+        for group_id, members in group_employees.items() for emp_id in members
+    ]
+    vehicles = [
+        {'id': (group_id - 1) * spec.vehicles_per_group + index, 'group_id': group_id,
+         'license_plate': f'{group_id}A-{index:04d}', 'vehicle_type': VEHICLE_TYPES[index % len(VEHICLE_TYPES)],
+         'driver_name': f'Driver {index}', 'created_at': now}
+        for group_id in group_employees for index in range(1, spec.vehicles_per_group + 1)
+    ]
+
+    with engine.begin() as conn:
+        for model, rows in ((GroupModel, groups), (EmployeeModel, employees),
+                            (EmployeeGroupModel, links), (VehicleModel, vehicles)):
+            for batch in _batches(rows):
+                conn.execute(insert(model), batch)
+        for batch in _batches(_check_ins(rng, spec, group_employees, now)):
+            conn.execute(insert(CheckInModel), batch)
+        for batch in _batches(_trips(rng, spec, len(group_employees), today, now)):
+            conn.execute(insert(TripModel), batch)
+        for batch in _batches(_fuel_records(rng, spec, len(group_employees), today, now)):
+            conn.execute(insert(FuelRecordModel), batch)
+
+    session = Session(bind=engine)
+    try:
+        stats_rows = VehicleDailyStatsRepository(session).rebuild()
+    finally:
+        session.close()
+
+    return {
+        'groups': len(groups),
+        'employees': len(employees),
+        'target_group_employees': headcounts[0],
+        'vehicles': len(vehicles),
+        'check_ins': spec.check_ins,
+        'trips': spec.trips,
+        'fuel_records': spec.fuel_records,
+        'vehicle_daily_stats': stats_rows,
+    }
+
+
+def describe(spec: DatasetSpec) -> Dict[str, int]:
+    return asdict(spec)
+
+
+def _headcounts(rng: random.Random, spec: DatasetSpec) -> List[int]:
+    counts = [rng.randint(spec.min_employees_per_group, spec.max_employees_per_group) for _ in range(spec.groups)]
+    counts[0] = spec.max_employees_per_group
+    return counts
+
+
+def _check_ins(rng, spec, group_employees, now) -> Iterator[dict]:
+    # A quarter of all check-ins belong to the target group, half of those in the last 31 days
+    group_ids = list(group_employees)
+    for index in range(spec.check_ins):
+        if index % 4 == 0:
+            group_id = 1
+            days_back = rng.randint(0, 30) if index % 8 == 0 else rng.randint(0, HISTORY_DAYS)
+        else:
+            group_id = rng.choice(group_ids)
+            days_back = rng.randint(0, HISTORY_DAYS)
+        if index % 40 == 0:
+            days_back = 0  # Keep today's report populated
+        yield {
+            'employee_id': rng.choice(group_employees[group_id]),
+            'group_id': group_id,
+            'latitude': 11.55 + rng.uniform(-0.05, 0.05),
+            'longitude': 104.92 + rng.uniform(-0.05, 0.05),
+            'type': 'checkout' if index % 2 else 'checkin',
+            'timestamp': now - timedelta(days=days_back, seconds=rng.randint(0, 36_000)),
+        }
+
+
+def _trips(rng, spec, group_count, today: date, now: datetime) -> Iterator[dict]:
+    # Trip numbers must be unique per vehicle and day
+    trip_numbers: Dict[tuple, int] = {}
+    for index in range(spec.trips):
+        group_id = 1 if index % 4 == 0 else rng.randint(1, group_count)
+        vehicle_id = (group_id - 1) * spec.vehicles_per_group + rng.randint(1, spec.vehicles_per_group)
+        trip_date = today - timedelta(days=rng.randint(0, HISTORY_DAYS))
+        key = (vehicle_id, trip_date)
+        trip_numbers[key] = trip_numbers.get(key, 0) + 1
+        yield {
+            'group_id': group_id,
+            'vehicle_id': vehicle_id,
+            'driver_name': f'Driver {vehicle_id}',
+            'date': trip_date,
+            'trip_number': trip_numbers[key],
+            'loading_size_cubic_meters': round(rng.uniform(2, 12), 1),
+            'created_at': now,
+        }
+
+
+def _fuel_records(rng, spec, group_count, today: date, now: datetime) -> Iterator[dict]:
+    for index in range(spec.fuel_records):
+        group_id = 1 if index % 4 == 0 else rng.randint(1, group_count)
+        liters = round(rng.uniform(10, 80), 1)
+        yield {
+            'group_id': group_id,
+            'vehicle_id': (group_id - 1) * spec.vehicles_per_group + rng.randint(1, spec.vehicles_per_group),
+            'date': today - timedelta(days=rng.randint(0, HISTORY_DAYS)),
+            'liters': liters,
+            'cost': round(liters * 1.05, 2),
+            'created_at': now,
+        }
+
+
+def _batches(rows) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,155 @@
+"""
+Local stand-ins for Telegram and MongoDB used by the load test
+
+FakeTelegramServer answers Bot API calls over HTTP, so the real
+notification service (python-telegram-bot, httpx) runs unchanged against it
+via TELEGRAM_BOT_API_URL. FakeMongoDatabase covers the collection methods
+the check-in path uses (the idempotency store) and is installed into the
+mongodb singleton.
+"""
+
+import copy
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from pymongo.errors import DuplicateKeyError
+from werkzeug.serving import make_server
+from werkzeug.wrappers import Request, Response
+
+
+class FakeTelegramServer:
+    """Bot API endpoint accepting sendMessage/sendPhoto with a fixed latency"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        self._message_ids = itertools.count(1)
+        self._server = make_server('127.0.0.1', 0, self._app, threaded=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, name='FakeTelegram', daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Value for TELEGRAM_BOT_API_URL"""
+        return f"http://127.0.0.1:{self._server.server_port}/bot"
+
+    def start(self) -> 'FakeTelegramServer':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+
+    @Request.application
+    def _app(self, request: Request) -> Response:
+        method = request.path.rsplit('/', 1)[-1]
+        with self._lock:
+            self.calls[method] += 1
+            message_id = next(self._message_ids)
+        if self.latency:
+            time.sleep(self.latency)
+
+        chat_id = request.values.get('chat_id', '0')
+        message = {
+            'message_id': message_id,
+            'date': int(time.time()),
+            'chat': {'id': int(chat_id), 'type': 'supergroup', 'title': 'Load test'},
+        }
+        if method == 'sendPhoto':
+            message['photo'] = [{'file_id': f'photo-{message_id}', 'file_unique_id': f'u{message_id}',
+                                 'width': 1, 'height': 1}]
+            message['caption'] = request.values.get('caption', '')
+        else:
+            message['text'] = request.values.get('text', '')
+        return Response(json.dumps({'ok': True, 'result': message}), mimetype='application/json')
+
+
+class _FakeCollection:
+    """Thread-safe in-memory collection keyed by _id, supporting equality and $lt filters and $set updates"""
+
+    def __init__(self):
+        self._documents: Dict[Any, dict] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def insert_one(self, document: dict):
+        with self._lock:
+            document = copy.deepcopy(document)
+            document.setdefault('_id', next(self._ids))
+            if document['_id'] in self._documents:
+                raise DuplicateKeyError(f"duplicate key: {document['_id']}")
+            self._documents[document['_id']] = document
+        return _InsertOneResult(document['_id'])
+
+    def find_one(self, filter: Optional[dict] = None, *args, **kwargs) -> Optional[dict]:
+        with self._lock:
+            match = self._find(filter or {})
+            return copy.deepcopy(match) if match else None
+
+    def find_one_and_update(self, filter: dict, update: dict, *args, **kwargs) -> Optional[dict]:
+        with self._lock:
+            match = self._find(filter)
+            if match is None:
+                return None
+            before = copy.deepcopy(match)
+            match.update(update.get('$set', {}))
+            return before
+
+    def update_one(self, filter: dict, update: dict, *args, **kwargs) -> None:
+        with self._lock:
+            match = self._find(filter)
+            if match is not None:
+                match.update(update.get('$set', {}))
+
+    def delete_one(self, filter: dict) -> None:
+        with self._lock:
+            match = self._find(filter)
+            if match is not None:
+                del self._documents[match['_id']]
+
+    def count_documents(self, filter: dict, *args, **kwargs) -> int:
+        with self._lock:
+            return sum(1 for document in self._documents.values() if _matches(document, filter))
+
+    def _find(self, filter: dict) -> Optional[dict]:
+        if '_id' in filter and not isinstance(filter['_id'], dict):
+            document = self._documents.get(filter['_id'])
+            return document if document is not None and _matches(document, filter) else None
+        return next((document for document in self._documents.values() if _matches(document, filter)), None)
+
+
+class _InsertOneResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
+def _matches(document: dict, filter: dict) -> bool:
+    for key, expected in filter.items():
+        value = document.get(key)
+        if isinstance(expected, dict) and '$lt' in expected:
+            if value is None or not value < expected['$lt']:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+class FakeMongoDatabase:
+    """Attribute and item access create collections on first use, like pymongo's Database"""
+
+    def __init__(self):
+        self._collections: Dict[str, _FakeCollection] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        with self._lock:
+            return self._collections.setdefault(name, _FakeCollection())
+
+    def __getattr__(self, name: str) -> _FakeCollection:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self[name]
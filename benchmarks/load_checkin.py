@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Load test: the morning check-in burst against the real Flask app
+
+Usage:
+    python -m benchmarks.load_checkin [--users 500] [--concurrency 100] [--ramp 10]
+                                      [--checkout-ratio 0.2] [--photo-ratio 1.0]
+                                      [--pool-size 5] [--max-overflow 10] [--pool-timeout 30]
+                                      [--database-url URL] [--reuse] [--output PATH]
+
+The app from create_app() is served by the same threaded werkzeug server as
+main.py, with Telegram auth, idempotency and the check-in job worker all
+enabled. Every virtual user sends one multipart check-in (or check-out) with
+a valid X-Telegram-Init-Data signed by a test bot token. Group notifications
+go to a local fake Bot API server and MongoDB is replaced by an in-memory
+fake, so nothing leaves the machine.
+
+Reports throughput, latency percentiles, errors, DB pool saturation and how
+long the job worker needs to drain the burst.
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+import httpx
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from werkzeug.serving import make_server
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.persistence.database import database
+from src.infrastructure.persistence.models import (
+    CheckInJobModel,
+    EmployeeGroupModel,
+    EmployeeModel,
+    GroupModel,
+    utc_now,
+)
+from src.infrastructure.persistence.mongodb_connection import mongodb
+
+from .dataset import SCALES, is_seeded, seed
+from .fakes import FakeMongoDatabase, FakeTelegramServer
+from .run import RESULTS_DIR, _git_revision, _has_schema
+
+TEST_BOT_TOKEN = '123456:LOAD-TEST-TOKEN'
+
+
+def sign_init_data(user: Dict, bot_token: str, auth_date: Optional[int] = None) -> str:
+    """Telegram Web App initData for user, signed the way Telegram signs it"""
+    fields = {
+        'auth_date': str(auth_date or int(time.time())),
+        'query_id': uuid.uuid4().hex,
+        'user': json.dumps(user, separators=(',', ':')),
+    }
+    data_check_string = '\n'.join(f"{key}={value}" for key, value in sorted(fields.items()))
+    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    fields['hash'] = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+    return urlencode(fields)
+
+
+class PoolSampler:
+    """Samples checked-out connections of a QueuePool in a background thread"""
+
+    def __init__(self, pool, capacity: int, interval: float = 0.005):
+        self.pool = pool
+        self.capacity = capacity
+        self.interval = interval
+        self.samples: List[int] = []
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='PoolSampler', daemon=True)
+
+    def start(self) -> 'PoolSampler':
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict:
+        self._stopping.set()
+        self._thread.join()
+        samples = self.samples or [0]
+        return {
+            'capacity': self.capacity,
+            'peak_checked_out': max(samples),
+            'mean_checked_out': round(statistics.fmean(samples), 2),
+            'saturated_ratio': round(sum(1 for s in samples if s >= self.capacity) / len(samples), 3),
+        }
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.samples.append(self.pool.checkedout())
+            time.sleep(self.interval)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Simulate the morning check-in burst")
+    parser.add_argument('--users', type=int, default=500, help="Employees checking in (default: 500)")
+    parser.add_argument('--concurrency', type=int, default=100, help="Maximum requests in flight (default: 100)")
+    parser.add_argument('--ramp', type=float, default=10, help="Seconds over which arrivals are spread (default: 10)")
+    parser.add_argument('--checkout-ratio', type=float, default=0.2, help="Share of check-outs (default: 0.2)")
+    parser.add_argument('--photo-ratio', type=float, default=1.0, help="Share of requests with a photo (default: 1.0)")
+    parser.add_argument('--photo-size', default='1280x960', help="Uploaded photo dimensions (default: 1280x960)")
+    parser.add_argument('--pool-size', type=int, default=settings.DB_POOL_SIZE)
+    parser.add_argument('--max-overflow', type=int, default=settings.DB_MAX_OVERFLOW)
+    parser.add_argument('--pool-timeout', type=int, default=settings.DB_POOL_TIMEOUT)
+    parser.add_argument('--telegram-latency', type=float, default=0.15, help="Fake Bot API latency in seconds")
+    parser.add_argument('--drain-timeout', type=float, default=120, help="Seconds to wait for the job worker")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='medium', help="Dataset when seeding")
+    parser.add_argument('--database-url', help="SQLAlchemy URL of a scratch database (default: temporary SQLite)")
+    parser.add_argument('--reuse', action='store_true', help="Use an already seeded database instead of seeding")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="JSON results path (default: benchmarks/results/load-<commit>.json)")
+    args = parser.parse_args(argv)
+
+    commit, dirty = _git_revision()
+    output = os.path.abspath(args.output or os.path.join(
+        RESULTS_DIR, f"load-{commit or 'unknown'}{'-dirty' if dirty else ''}.json"
+    ))
+
+    # Photo directories and the notification service's photo paths are relative to the working directory
+    work_dir = tempfile.mkdtemp(prefix='office-automation-load-')
+    previous_cwd = os.getcwd()
+    os.chdir(work_dir)
+
+    telegram = FakeTelegramServer(args.telegram_latency).start()
+    settings.CHECKIN_BOT_TOKEN = TEST_BOT_TOKEN
+    settings.TELEGRAM_BOT_API_URL = telegram.base_url
+    settings.TELEGRAM_AUTH_ENABLED = True
+    settings.TELEGRAM_AUTH_STRICT_MODE = True
+    settings.CHECKIN_JOB_WORKER_ENABLED = True
+    settings.ADMIN_PRINCIPAL_CHANGE_STREAM = False
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(work_dir, 'load.db')}"
+    engine = create_engine(
+        database_url,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        pool_timeout=args.pool_timeout,
+        # SQLite serialises writers; wait for the lock instead of failing
+        **({'connect_args': {'timeout': 30}} if database_url.startswith('sqlite') else {})
+    )
+    Session = sessionmaker(bind=engine)
+    database.engine = engine
+    database.SessionLocal = Session
+
+    session = Session()
+    seeded = _has_schema(engine) and is_seeded(session)
+    session.close()
+    if seeded and not args.reuse:
+        parser.error("the database already has data; pass --reuse or point --database-url at an empty database")
+    if not seeded:
+        print(f"Seeding {args.scale} dataset...", file=sys.stderr)
+        seed(engine, SCALES[args.scale], args.seed)
+
+    mongodb._client = object()
+    mongodb._db = FakeMongoDatabase()
+
+    from src.infrastructure.api.flask_app import create_app
+    from src.infrastructure.services.check_in_job_worker import check_in_job_worker
+    app = create_app()
+    for noisy in ('httpx', 'httpcore', 'telegram', 'werkzeug'):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, name='LoadTestAPI', daemon=True)
+    server_thread.start()
+
+    try:
+        users = _load_users(Session, args.users)
+        if len(users) < args.users:
+            print(f"Only {len(users)} employees in the dataset; using all of them", file=sys.stderr)
+        photo = _make_photo(args.photo_size)
+
+        print(f"Sending {len(users)} requests, concurrency {args.concurrency}, ramp {args.ramp}s...", file=sys.stderr)
+        sampler = PoolSampler(engine.pool, capacity=args.pool_size + args.max_overflow).start()
+        started = time.perf_counter()
+        records = asyncio.run(_burst(
+            f"http://127.0.0.1:{server.server_port}", users, photo, args, random.Random(args.seed)
+        ))
+        duration = time.perf_counter() - started
+        pool = sampler.stop()
+
+        queued = sum(1 for record in records if record['status'] == 200)
+        drain_seconds = _wait_for_jobs(Session, args.drain_timeout)
+    finally:
+        check_in_job_worker.stop()
+        server.shutdown()
+        telegram.stop()
+        os.chdir(previous_cwd)
+
+    report = {
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': utc_now().isoformat(timespec='seconds') + 'Z',
+        'database': engine.dialect.name,
+        'config': {
+            'users': len(users),
+            'concurrency': args.concurrency,
+            'ramp_seconds': args.ramp,
+            'checkout_ratio': args.checkout_ratio,
+            'photo_ratio': args.photo_ratio,
+            'photo_size': args.photo_size,
+            'pool_size': args.pool_size,
+            'max_overflow': args.max_overflow,
+            'pool_timeout': args.pool_timeout,
+            'telegram_latency': args.telegram_latency,
+        },
+        **_summarise(records, duration),
+        'db_pool': pool,
+        'jobs': {
+            'queued': queued,
+            'drain_seconds': drain_seconds,
+            'failed': _count_jobs(Session, ('failed',)),
+        },
+        'telegram_calls': dict(telegram.calls),
+    }
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    _print_report(report)
+    print(f"\nResults written to {output}")
+    return report
+
+
+def _load_users(Session, limit: int) -> List[Dict]:
+    """One group membership per employee: telegram_id, name and group chat_id"""
+    session = Session()
+    try:
+        rows = (
+            session.query(EmployeeModel.telegram_id, EmployeeModel.name, GroupModel.chat_id)
+            .join(EmployeeGroupModel, EmployeeGroupModel.employee_id == EmployeeModel.id)
+            .join(GroupModel, GroupModel.id == EmployeeGroupModel.group_id)
+            .order_by(EmployeeModel.id)
+            .limit(limit)
+            .all()
+        )
+        return [{'telegram_id': telegram_id, 'name': name, 'chat_id': chat_id} for telegram_id, name, chat_id in rows]
+    finally:
+        session.close()
+
+
+def _make_photo(size: str) -> bytes:
+    width, height = (int(value) for value in size.split('x'))
+    # Noise compresses like a real photo; a flat image would be unrealistically small
+    image = Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=85)
+    return buffer.getvalue()
+
+
+async def _burst(base_url: str, users: List[Dict], photo: bytes, args, rng: random.Random) -> List[Dict]:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    plans = [
+        (rng.uniform(0, args.ramp), 'checkout' if rng.random() < args.checkout_ratio else 'checkin',
+         rng.random() < args.photo_ratio)
+        for _ in users
+    ]
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.pool_timeout + 60) as client:
+        start = time.monotonic()
+
+        async def send(user: Dict, delay: float, check_in_type: str, with_photo: bool) -> Dict:
+            await asyncio.sleep(max(0.0, start + delay - time.monotonic()))
+            async with semaphore:
+                # Bytes after the JPEG end marker make every upload unique: processed photos are
+                # content-addressed, so repeated bytes would skip the resize after the first upload
+                files = {'photo': ('photo.jpg', photo + uuid.uuid4().bytes, 'image/jpeg')} if with_photo else None
+                data = {
+                    'telegram_user_id': user['telegram_id'],
+                    'group_chat_id': user['chat_id'],
+                    'latitude': f"{11.55 + rng.uniform(-0.01, 0.01):.6f}",
+                    'longitude': f"{104.92 + rng.uniform(-0.01, 0.01):.6f}",
+                    'type': check_in_type,
+                }
+                headers = {
+                    'X-Telegram-Init-Data': sign_init_data(
+                        {'id': int(user['telegram_id']), 'first_name': user['name']}, TEST_BOT_TOKEN
+                    ),
+                    'Idempotency-Key': uuid.uuid4().hex,
+                }
+                request_started = time.perf_counter()
+                try:
+                    response = await client.post('/api/checkin', data=data, files=files, headers=headers)
+                    status = response.status_code
+                    pool_timeout = status >= 500 and 'QueuePool limit' in response.text
+                except httpx.HTTPError as e:
+                    status, pool_timeout = f"error:{type(e).__name__}", False
+                return {
+                    'type': check_in_type,
+                    'status': status,
+                    'latency': time.perf_counter() - request_started,
+                    'pool_timeout': pool_timeout,
+                }
+
+        return await asyncio.gather(*(send(user, *plan) for user, plan in zip(users, plans)))
+
+
+def _percentiles(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, 1)
+
+    return {
+        'mean': round(statistics.fmean(ordered) * 1000, 1),
+        'p50': at(0.50),
+        'p90': at(0.90),
+        'p95': at(0.95),
+        'p99': at(0.99),
+        'max': round(ordered[-1] * 1000, 1),
+    }
+
+
+def _summarise(records: List[Dict], duration: float) -> Dict:
+    succeeded = [record for record in records if record['status'] == 200]
+    statuses = Counter(str(record['status']) for record in records if record['status'] != 200)
+    return {
+        'requests': len(records),
+        'duration_seconds': round(duration, 2),
+        'throughput_rps': round(len(succeeded) / duration, 1) if duration else 0.0,
+        'latency_ms': _percentiles([record['latency'] for record in records]),
+        'latency_ms_by_type': {
+            check_in_type: _percentiles([record['latency'] for record in records if record['type'] == check_in_type])
+            for check_in_type in ('checkin', 'checkout')
+        },
+        'errors': {
+            'total': len(records) - len(succeeded),
+            'rate': round((len(records) - len(succeeded)) / len(records), 4) if records else 0.0,
+            'by_status': dict(statuses),
+            'pool_timeouts': sum(1 for record in records if record['pool_timeout']),
+        },
+    }
+
+
+def _count_jobs(Session, statuses) -> int:
+    session = Session()
+    try:
+        return session.query(CheckInJobModel).filter(CheckInJobModel.status.in_(statuses)).count()
+    finally:
+        session.close()
+
+
+def _wait_for_jobs(Session, timeout: float) -> Optional[float]:
+    """Seconds after the burst until no job is pending, or None if the worker did not finish in time"""
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if _count_jobs(Session, ('pending', 'processing')) == 0:
+            return round(time.perf_counter() - started, 2)
+        time.sleep(0.25)
+    return None
+
+
+def _print_report(report: Dict) -> None:
+    latency = report['latency_ms']
+    errors = report['errors']
+    pool = report['db_pool']
+    drain = report['jobs']['drain_seconds']
+    print(f"\nrequests      {report['requests']} in {report['duration_seconds']}s "
+          f"({report['throughput_rps']} successful req/s)")
+    if latency:
+        print(f"latency ms    p50 {latency['p50']}  p90 {latency['p90']}  p95 {latency['p95']}  "
+              f"p99 {latency['p99']}  max {latency['max']}")
+    print(f"errors        {errors['total']} ({errors['rate']:.2%}) {errors['by_status'] or ''} "
+          f"pool timeouts {errors['pool_timeouts']}")
+    print(f"db pool       peak {pool['peak_checked_out']}/{pool['capacity']}  mean {pool['mean_checked_out']}  "
+          f"saturated {pool['saturated_ratio']:.1%} of the time")
+    print(f"job worker    {report['jobs']['queued']} queued, "
+          f"{'drained in ' + str(drain) + 's' if drain is not None else 'not drained before timeout'}, "
+          f"{report['jobs']['failed']} failed")
+    print(f"telegram      {report['telegram_calls']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Run the benchmarks and write the results as JSON
+
+Usage:
+    python -m benchmarks.run [--scale small|medium|large] [--database-url URL] [--reuse]
+                             [--mongo-url URL] [--only CASE ...] [--iterations N] [--output PATH] [--keep]
+
+Without --database-url a fresh SQLite database is seeded in a temporary
+directory, which is removed afterwards together with the photos and exports
+the cases write there (--keep leaves it in place for inspection). Pass a scratch MySQL database to measure against the production
+engine; with --reuse an already seeded database is used as is, which saves
+the seeding time of the large scale between runs.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.request_stats import track_queries
+from src.infrastructure.metrics.sqlalchemy_metrics import instrument_engine
+from src.infrastructure.persistence.database import database
+from src.infrastructure.persistence.models import CheckInJobModel, CheckInModel, utc_now
+
+from .cases import CASES, BenchmarkContext, SkipBenchmark, TARGET_GROUP_ID, default_iterations
+from .dataset import SCALES, describe, is_seeded, seed
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+MONGO_BENCHMARK_DATABASE = 'office_automation_benchmark'
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Benchmark report generation and the check-in write path")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small', help="Dataset size (default: small)")
+    parser.add_argument('--database-url', help="SQLAlchemy URL of a scratch database (default: temporary SQLite)")
+    parser.add_argument('--reuse', action='store_true', help="Use an already seeded database instead of seeding")
+    parser.add_argument('--mongo-url', help="MongoDB for the admin group listing (skipped without it)")
+    parser.add_argument('--only', nargs='+', choices=sorted(CASES), help="Run only these cases")
+    parser.add_argument('--iterations', type=int, help="Operations per case (default: 200 check-ins, 10 otherwise)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed of the synthetic dataset")
+    parser.add_argument('--output', help="JSON results path (default: benchmarks/results/<scale>-<commit>.json)")
+    parser.add_argument('--keep', action='store_true', help="Keep the temporary work directory")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='office-automation-bench-')
+    try:
+        return _benchmark(parser, args, work_dir)
+    finally:
+        if args.keep:
+            print(f"Work directory kept at {work_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _benchmark(parser: argparse.ArgumentParser, args: argparse.Namespace, work_dir: str) -> Dict:
+    engine = create_engine(args.database_url or f"sqlite:///{os.path.join(work_dir, 'benchmark.db')}")
+    instrument_engine(engine)
+    Session = sessionmaker(bind=engine)
+    # Routes and handlers that use the database singleton run against the benchmark database
+    database.engine = engine
+    database.SessionLocal = Session
+
+    spec = SCALES[args.scale]
+    session = Session()
+    seeded = args.reuse and _has_schema(engine) and is_seeded(session)
+    if not seeded and _has_schema(engine) and is_seeded(session):
+        session.close()
+        parser.error("the database already has data; pass --reuse or point --database-url at an empty database")
+    session.close()
+
+    dataset = {'scale': args.scale, 'seed': args.seed, **describe(spec)}
+    if not seeded:
+        print(f"Seeding {args.scale} dataset...", file=sys.stderr)
+        started = time.perf_counter()
+        dataset['rows'] = seed(engine, spec, args.seed)
+        dataset['seed_seconds'] = round(time.perf_counter() - started, 1)
+
+    ctx = BenchmarkContext(engine=engine, Session=Session, work_dir=work_dir,
+                           mongo_available=_connect_mongo(args.mongo_url, spec.groups))
+    try:
+        results = {name: _run_case(name, ctx, default_iterations(name, args.iterations))
+                   for name in (args.only or CASES)}
+    finally:
+        if ctx.mongo_available:
+            from src.infrastructure.persistence.mongodb_connection import mongodb
+            mongodb.get_database().client.drop_database(MONGO_BENCHMARK_DATABASE)
+        # Release the SQLite file before the work directory is removed
+        engine.dispose()
+
+    commit, dirty = _git_revision()
+    report = {
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': utc_now().isoformat(timespec='seconds') + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'database': engine.dialect.name,
+        'dataset': dataset,
+        'results': results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{args.scale}-{commit or 'unknown'}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    _print_summary(results)
+    print(f"\nResults written to {output}")
+    return report
+
+
+def _run_case(name: str, ctx: BenchmarkContext, iterations: int) -> Dict:
+    print(f"Running {name} ({iterations}x)...", file=sys.stderr)
+    last_check_in_id = _max_check_in_id(ctx)
+    try:
+        operation = CASES[name](ctx)
+        operation()  # Warm-up: imports, first connection, statement caches
+
+        durations = []
+        queries = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            with track_queries() as stats:
+                operation_started = time.perf_counter()
+                operation()
+                durations.append(time.perf_counter() - operation_started)
+            queries.append(stats.count)
+        elapsed = time.perf_counter() - started
+    except SkipBenchmark as e:
+        return {'skipped': str(e)}
+    finally:
+        _delete_check_ins_after(ctx, last_check_in_id)
+
+    durations.sort()
+    return {
+        'iterations': iterations,
+        'ops_per_sec': round(iterations / elapsed, 2),
+        'mean_ms': _ms(statistics.fmean(durations)),
+        'median_ms': _ms(statistics.median(durations)),
+        'p95_ms': _ms(durations[min(len(durations) - 1, int(len(durations) * 0.95))]),
+        'min_ms': _ms(durations[0]),
+        'max_ms': _ms(durations[-1]),
+        'queries_per_op': round(statistics.fmean(queries), 1),
+    }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _has_schema(engine) -> bool:
+    from sqlalchemy import inspect
+    return inspect(engine).has_table('groups')
+
+
+def _max_check_in_id(ctx: BenchmarkContext) -> int:
+    session = ctx.Session()
+    try:
+        return session.query(func.max(CheckInModel.id)).scalar() or 0
+    finally:
+        session.close()
+
+
+def _delete_check_ins_after(ctx: BenchmarkContext, check_in_id: int) -> None:
+    """Remove check-ins written by a case so every run (and --reuse) sees the seeded data"""
+    session = ctx.Session()
+    try:
+        session.query(CheckInJobModel).filter(CheckInJobModel.check_in_id > check_in_id).delete()
+        session.query(CheckInModel).filter(CheckInModel.id > check_in_id).delete()
+        session.commit()
+    finally:
+        session.close()
+
+
+def _connect_mongo(mongo_url: Optional[str], group_count: int) -> bool:
+    """Seed form configurations for every third group into a throwaway MongoDB database"""
+    if not mongo_url:
+        return False
+
+    from src.infrastructure.persistence.mongodb_connection import mongodb
+    settings.MONGODB_URL = mongo_url
+    settings.MONGODB_DATABASE = MONGO_BENCHMARK_DATABASE
+    try:
+        db = mongodb.connect()
+    except Exception as e:
+        print(f"MongoDB unavailable, skipping admin_group_listing: {e}", file=sys.stderr)
+        return False
+
+    db.form_configurations.delete_many({})
+    db.form_submissions.delete_many({})
+    for group_id in range(TARGET_GROUP_ID, group_count + 1, 3):
+        config_id = db.form_configurations.insert_one({
+            'telegram_group_chat_id': f'-100{group_id:06d}',
+            'form_name': f'Bench Form {group_id}',
+            'opnform_form_id': f'bench-{group_id}',
+            'is_active': True,
+        }).inserted_id
+        db.form_submissions.insert_many([
+            {'form_config_id': config_id, 'data': {'index': index}} for index in range(50)
+        ])
+    return True
+
+
+def _git_revision():
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+
+def _print_summary(results: Dict) -> None:
+    print(f"\n{'case':<26} {'median ms':>10} {'p95 ms':>10} {'ops/s':>10} {'queries':>8}")
+    for name, result in results.items():
+        if 'skipped' in result:
+            print(f"{name:<26} skipped: {result['skipped']}")
+            continue
+        print(f"{name:<26} {result['median_ms']:>10.2f} {result['p95_ms']:>10.2f} "
+              f"{result['ops_per_sec']:>10.1f} {result['queries_per_op']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
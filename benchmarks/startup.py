@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Report where process startup time goes on imports
+
+Usage:
+    python -m benchmarks.startup [--module main] [--top 15] [--json]
+
+Imports the entry point in a fresh interpreter with `python -X importtime`
+and prints the total, the import time per package (each module's own time,
+grouped; src.* by layer and subpackage) and the slowest modules including
+their dependencies. openpyxl, gspread, google-auth and flasgger are loaded
+on first use and should not show up here; if one does, a module-level import
+has crept back in.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """(module, depth, self_us, cumulative_us) for every line of -X importtime output"""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def package_of(module: str) -> str:
+    parts = module.split('.')
+    return '.'.join(parts[:3]) if parts[0] == 'src' else parts[0]
+
+
+def breakdown(modules: List[Tuple[str, int, int, int]], top: int) -> Dict:
+    packages: Dict[str, int] = defaultdict(int)
+    for name, _, self_us, _ in modules:
+        packages[package_of(name)] += self_us
+    roots = [cumulative for _, depth, _, cumulative in modules if depth == 0]
+    slowest = sorted((m for m in modules if m[1] > 0), key=lambda m: m[3], reverse=True)[:top]
+    return {
+        'total_ms': round(sum(roots) / 1000, 1),
+        'modules': len(modules),
+        'packages_ms': {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        'slowest_ms': {name: round(cumulative / 1000, 1) for name, _, _, cumulative in slowest},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Import-time breakdown of an entry point")
+    parser.add_argument('--module', default='main', help="Module to import (default: main)")
+    parser.add_argument('--top', type=int, default=15, help="Rows per table (default: 15)")
+    parser.add_argument('--json', action='store_true', help="Print the breakdown as JSON")
+    args = parser.parse_args(argv)
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {args.module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {args.module} failed:\n{result.stderr[-2000:]}")
+    report = breakdown(parse_importtime(result.stderr), args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return report
+
+    print(f"import {args.module}: {report['total_ms']:.0f} ms, {report['modules']} modules\n")
+    print(f"{'package (own time)':<52} {'ms':>8}")
+    for name, ms in report['packages_ms'].items():
+        print(f"{name:<52} {ms:>8.1f}")
+    print(f"\n{'module (with dependencies)':<52} {'ms':>8}")
+    for name, ms in report['slowest_ms'].items():
+        print(f"{name:<52} {ms:>8.1f}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,45 @@
 import multiprocessing
+import signal
 import sys
 import os
+import threading
+from functools import partial
 from src.infrastructure.telegram.bot_app import BotApplication
 from src.infrastructure.telegram.balance_bot_app import BalanceBotApplication
 from src.infrastructure.api.flask_app import create_app
 from src.infrastructure.persistence.database import database
 from src.infrastructure.config.settings import settings
 from src.infrastructure.utils.logging_config import setup_logging
+from src.infrastructure.metrics import reset_multiprocess_dir
+from src.infrastructure.api.server import bind_socket, serve
+from src.infrastructure.services.check_in_job_worker import check_in_job_worker
+from src.infrastructure.supervisor import Component, Supervisor, parse_replicas
 
+# Supervisor mode replica counts unless overridden by SUPERVISOR_REPLICAS
+DEFAULT_REPLICAS = {'checkin_bot': 1, 'balance_bot': 1, 'api': 1, 'checkin_worker': 0}
 
-def run_checkin_bot():
+
+def run_checkin_bot(probe=None):
     """Run the check-in bot in a separate process"""
     setup_logging()
     settings.load_admin_ids([
         # 123456789,  # Replace with actual admin telegram IDs
     ])
     bot = BotApplication()
-    bot.run()
+    bot.run(
+        heartbeat=probe.beat_forever if probe else None,
+        on_ready=probe.ready if probe else None
+    )
 
 
-def run_balance_bot():
+def run_balance_bot(probe=None):
     """Run the balance bot in a separate process"""
     setup_logging()
     bot = BalanceBotApplication()
-    bot.run()
+    bot.run(
+        heartbeat=probe.beat_forever if probe else None,
+        on_ready=probe.ready if probe else None
+    )
 
 
 def run_api_server():
@@ -47,12 +63,85 @@ def run_api_server():
     app.run(host=host, port=port, debug=debug, use_reloader=False)
 
 
+def run_api_replica(sock, offload_checkin_jobs, probe):
+    """Run one supervised API worker on the listening socket shared by all of them"""
+    setup_logging()
+    if offload_checkin_jobs:
+        # Dedicated checkin_worker replicas process the job queue
+        settings.CHECKIN_JOB_WORKER_ENABLED = False
+
+    app = create_app()
+    serve(app, sock, settings.SUPERVISOR_DRAIN_TIMEOUT, probe.ready, probe.beat)
+    check_in_job_worker.stop()
+
+
+def run_checkin_worker(probe):
+    """Process queued check-ins (photos, group notifications) outside the API workers"""
+    setup_logging()
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+
+    check_in_job_worker.start()
+    probe.ready()
+    # Beat from this thread rather than between jobs, so a job that runs longer
+    # than SUPERVISOR_HEARTBEAT_TIMEOUT is not killed; a dead worker thread stops the beat
+    while not stopping.wait(probe.heartbeat_interval):
+        if check_in_job_worker.is_alive:
+            probe.beat()
+    probe.ready(False)
+    # Lets the job in progress finish
+    check_in_job_worker.stop(settings.SUPERVISOR_DRAIN_TIMEOUT)
+
+
+def supervise():
+    """Run every component under the supervisor (SUPERVISOR_ENABLED=true)"""
+    if sys.platform == 'win32':
+        sys.exit("Supervisor mode needs fork(); run without SUPERVISOR_ENABLED on Windows")
+    replicas = parse_replicas(settings.SUPERVISOR_REPLICAS, DEFAULT_REPLICAS)
+
+    # Once here instead of racing in every API replica; close the connection before forking
+    database.create_tables()
+    database.engine.dispose()
+
+    sock = None
+    if replicas['api']:
+        host = os.getenv('API_HOST', '0.0.0.0')
+        port = int(os.getenv('API_PORT', '80'))
+        sock = bind_socket(host, port)
+        print(f"API listening on {host}:{port} with {replicas['api']} worker(s)")
+
+    Supervisor(
+        [
+            Component('checkin_bot', run_checkin_bot, replicas['checkin_bot'], max_replicas=1),
+            Component('balance_bot', run_balance_bot, replicas['balance_bot'], max_replicas=1),
+            Component('api', partial(run_api_replica, sock, replicas['checkin_worker'] > 0), replicas['api']),
+            Component('checkin_worker', run_checkin_worker, replicas['checkin_worker']),
+        ],
+        heartbeat_timeout=settings.SUPERVISOR_HEARTBEAT_TIMEOUT,
+        backoff_max=settings.SUPERVISOR_RESTART_BACKOFF_MAX,
+        drain_timeout=settings.SUPERVISOR_DRAIN_TIMEOUT,
+        kill_grace=settings.SUPERVISOR_KILL_GRACE,
+        probe_host=settings.SUPERVISOR_PROBE_HOST,
+        probe_port=settings.SUPERVISOR_PROBE_PORT
+    ).run()
+
+
 def main():
     """Main entry point - runs both bots and API server in separate processes"""
     # Use 'fork' on Unix systems for proper initialization
     if sys.platform != 'win32':
         multiprocessing.set_start_method('fork', force=True)
 
+    # One log writer for all services; forked children inherit its queue
+    setup_logging(multiprocess=True)
+
+    # Drop metric files left by a previous run before the children start writing
+    reset_multiprocess_dir()
+
+    if settings.SUPERVISOR_ENABLED:
+        supervise()
+        return
+
     # Create processes for each component
     checkin_process = multiprocessing.Process(target=run_checkin_bot, name="CheckinBot")
     balance_process = multiprocessing.Process(target=run_balance_bot, name="BalanceBot")
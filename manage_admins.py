@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Change an admin portal user's status or role
+
+Writes admin_users and invalidates the admin principal cache in every API
+process, so a deactivated admin loses access within
+ADMIN_PRINCIPAL_VERSION_CHECK_INTERVAL seconds.
+
+Usage:
+    python manage_admins.py deactivate TELEGRAM_ID
+    python manage_admins.py activate TELEGRAM_ID
+    python manage_admins.py set-role TELEGRAM_ID ROLE
+"""
+import argparse
+import sys
+from src.infrastructure.api.middleware.admin_principal_cache import admin_principal_cache
+from src.infrastructure.persistence.mongodb_connection import mongodb
+from src.infrastructure.utils.logging_config import setup_logging
+
+def main():
+    parser = argparse.ArgumentParser(description="Change an admin's status or role")
+    commands = parser.add_subparsers(dest='command', required=True)
+    for name in ('deactivate', 'activate'):
+        commands.add_parser(name, help=f"{name.capitalize()} an admin").add_argument('telegram_id')
+    set_role = commands.add_parser('set-role', help="Change an admin's role")
+    set_role.add_argument('telegram_id')
+    set_role.add_argument('role')
+    args = parser.parse_args()
+
+    setup_logging()
+    mongodb.connect()
+    try:
+        if args.command == 'set-role':
+            found = admin_principal_cache.update_admin(args.telegram_id, role=args.role)
+        else:
+            status = 'active' if args.command == 'activate' else 'inactive'
+            found = admin_principal_cache.update_admin(args.telegram_id, status=status)
+    finally:
+        mongodb.close()
+
+    if not found:
+        print(f"No admin with Telegram ID {args.telegram_id}")
+        sys.exit(1)
+    print(f"Updated admin {args.telegram_id}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Rebuild the vehicle_daily_stats rollup from trips and fuel_records
+
+The rollup is updated as trips and fuel are recorded; run this to backfill
+it or to repair drift. Without options every group and date is rebuilt.
+
+Usage:
+    python rebuild_vehicle_stats.py [--group-id ID] [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+"""
+import argparse
+from datetime import date
+from src.infrastructure.persistence.database import database
+from src.infrastructure.persistence.vehicle_daily_stats_repository_impl import VehicleDailyStatsRepository
+from src.infrastructure.utils.logging_config import setup_logging
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the vehicle_daily_stats rollup")
+    parser.add_argument('--group-id', type=int, help="Only rebuild this group")
+    parser.add_argument('--from', dest='start_date', type=date.fromisoformat, help="First date to rebuild (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='end_date', type=date.fromisoformat, help="Last date to rebuild (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    setup_logging()
+    session = database.get_session()
+    try:
+        rows = VehicleDailyStatsRepository(session).rebuild(args.group_id, args.start_date, args.end_date)
+    finally:
+        session.close()
+
+    print(f"Rebuilt {rows} vehicle_daily_stats rows")
+
+if __name__ == '__main__':
+    main()
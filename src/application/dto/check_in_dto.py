@@ -18,3 +18,4 @@ class CheckInResponse:
     timestamp: str
     location: str
     type: str  # 'checkin' or 'checkout'
+    check_in_id: Optional[int] = None
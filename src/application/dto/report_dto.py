@@ -61,6 +61,10 @@ class MonthlyReportResponse:
     total_trips: int
     total_fuel_liters: float
     total_fuel_cost: float
+    # Same month last year (only when daily rollups are available)
+    previous_year_total_trips: Optional[int] = None
+    previous_year_total_fuel_liters: Optional[float] = None
+    previous_year_total_fuel_cost: Optional[float] = None
 
 @dataclass
 class DailyBreakdown:
@@ -18,3 +18,23 @@ class TripResponse:
     loading_size_cubic_meters: Optional[float]
     created_at: str
     vehicle_license_plate: str = None  # For display purposes
+
+@dataclass
+class RecordTripsBatchRequest:
+    group_id: int
+    vehicle_id: int
+    trip_count: int
+    total_loading_size_cubic_meters: Optional[float] = None  # Split equally across trips
+
+@dataclass
+class TripsBatchResponse:
+    group_id: int
+    vehicle_id: int
+    driver_name: Optional[str]
+    date: str
+    trip_count: int
+    first_trip_number: int
+    last_trip_number: int
+    loading_size_per_trip_cubic_meters: Optional[float]
+    total_loading_size_cubic_meters: Optional[float]
+    vehicle_license_plate: str = None  # For display purposes
@@ -15,6 +15,11 @@ class AddEmployeeToGroupUseCase:
         self.group_repository = group_repository
 
     def execute(self, employee_id: int, group_id: int) -> EmployeeGroup:
+        # Already linked: the common case is a single query
+        existing = self.employee_group_repository.find_by_employee_and_group(employee_id, group_id)
+        if existing:
+            return existing
+
         # Verify employee exists
         employee = self.employee_repository.find_by_id(employee_id)
         if not employee:
@@ -25,19 +30,10 @@ class AddEmployeeToGroupUseCase:
         if not group:
             raise ValueError("Group not found")
 
-        # Return existing association if present
-        if self.employee_group_repository.exists(employee_id, group_id):
-            existing = self.employee_group_repository.find_by_employee_and_group(
-                employee_id,
-                group_id
-            )
-            if existing:
-                return existing
-
-        # Create association
+        # Create association; a concurrent request may have created it meanwhile
         employee_group = EmployeeGroup.create(
             employee_id=employee_id,
             group_id=group_id
         )
 
-        return self.employee_group_repository.save(employee_group)
+        return self.employee_group_repository.upsert(employee_group)
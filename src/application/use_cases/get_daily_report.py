@@ -33,9 +33,9 @@ class GetDailyReportUseCase:
         vehicles = self.vehicle_repository.find_by_group_id(group_id)
         vehicle_map = {v.id: v for v in vehicles}
 
-        # Get all trips and fuel records for the date
-        trips = self.trip_repository.find_by_group_and_date(group_id, report_date)
-        fuel_records = self.fuel_record_repository.find_by_group_and_date(group_id, report_date)
+        # Fetch only the columns the report needs, already sorted by created_at
+        trips = self.trip_repository.find_details_by_group_and_date(group_id, report_date)
+        fuel_records = self.fuel_record_repository.find_details_by_group_and_date(group_id, report_date)
 
         # Aggregate data by vehicle
         vehicle_data: Dict[int, dict] = defaultdict(lambda: {
@@ -46,15 +46,15 @@ class GetDailyReportUseCase:
         })
 
         # Count trips and sum loading size per vehicle
-        for trip in trips:
-            vehicle_data[trip.vehicle_id]['trip_count'] += 1
-            if trip.loading_size_cubic_meters:
-                vehicle_data[trip.vehicle_id]['total_loading_size'] += trip.loading_size_cubic_meters
+        for vehicle_id, _, loading_size, _ in trips:
+            vehicle_data[vehicle_id]['trip_count'] += 1
+            if loading_size:
+                vehicle_data[vehicle_id]['total_loading_size'] += loading_size
 
         # Sum fuel per vehicle
-        for fuel_record in fuel_records:
-            vehicle_data[fuel_record.vehicle_id]['total_fuel_liters'] += fuel_record.liters
-            vehicle_data[fuel_record.vehicle_id]['total_fuel_cost'] += fuel_record.cost
+        for vehicle_id, liters, cost, _ in fuel_records:
+            vehicle_data[vehicle_id]['total_fuel_liters'] += liters
+            vehicle_data[vehicle_id]['total_fuel_cost'] += cost
 
         # Create vehicle summaries
         vehicle_summaries = []
@@ -82,23 +82,23 @@ class GetDailyReportUseCase:
 
         # Detailed lists
         trip_details = []
-        for trip in sorted(trips, key=lambda t: t.created_at):
-            vehicle = vehicle_map.get(trip.vehicle_id)
+        for vehicle_id, trip_number, _, created_at in trips:
+            vehicle = vehicle_map.get(vehicle_id)
             trip_details.append(TripDailyDetail(
                 vehicle_plate=vehicle.license_plate if vehicle else "Unknown",
                 driver_name=None,  # Driver functionality disabled
-                trip_number=trip.trip_number,
-                created_at=trip.created_at.isoformat()
+                trip_number=trip_number,
+                created_at=created_at.isoformat()
             ))
 
         fuel_details = []
-        for record in sorted(fuel_records, key=lambda f: f.created_at):
-            vehicle = vehicle_map.get(record.vehicle_id)
+        for vehicle_id, liters, cost, created_at in fuel_records:
+            vehicle = vehicle_map.get(vehicle_id)
             fuel_details.append(FuelDailyDetail(
                 vehicle_plate=vehicle.license_plate if vehicle else "Unknown",
-                liters=record.liters,
-                cost=record.cost,
-                created_at=record.created_at.isoformat()
+                liters=liters,
+                cost=cost,
+                created_at=created_at.isoformat()
             ))
 
         return DailyReportResponse(
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ...domain.repositories.employee_repository import IEmployeeRepository
 from ...domain.repositories.salary_advance_repository import ISalaryAdvanceRepository
 from ...domain.repositories.allowance_repository import IAllowanceRepository
@@ -37,37 +38,105 @@ class EmployeeStatusResponse:
     allowances: List[AllowanceSummary]
     total_salary_advances: float
     total_allowances: float
+    salary_advance_count: int = 0
+    allowance_count: int = 0
+
+@dataclass(frozen=True)
+class EmployeeStatusTotals:
+    total_salary_advances: float
+    total_allowances: float
+    salary_advance_count: int
+    allowance_count: int
 
 class GetEmployeeStatusUseCase:
+    """
+    Build an employee's status: profile, paginated advance/allowance history and totals.
+
+    Totals are aggregated in SQL. When a status_cache is given (any object with
+    get(key)/set(key, value)), totals are cached under (employee_id, start, end);
+    callers recording new advances or allowances should invalidate them with
+    invalidate_employee_status_cache. Invalidation only reaches the cache it is
+    given, so with a per-process cache the other processes keep serving their
+    entries until the cache TTL expires.
+    """
+
     def __init__(
         self,
         employee_repository: IEmployeeRepository,
         salary_advance_repository: ISalaryAdvanceRepository,
-        allowance_repository: IAllowanceRepository
+        allowance_repository: IAllowanceRepository,
+        status_cache=None
     ):
         self.employee_repository = employee_repository
         self.salary_advance_repository = salary_advance_repository
         self.allowance_repository = allowance_repository
+        self.status_cache = status_cache
 
-    def execute_by_id(self, employee_id: int) -> EmployeeStatusResponse:
+    def execute_by_id(
+        self,
+        employee_id: int,
+        period: Optional[Tuple[datetime, datetime]] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> EmployeeStatusResponse:
         # Get employee
         employee = self.employee_repository.find_by_id(employee_id)
         if not employee:
             raise ValueError(f"Employee with ID {employee_id} not found")
 
-        return self._build_response(employee)
+        return self._build_response(employee, period, limit, offset)
 
-    def execute_by_telegram_id(self, telegram_id: str) -> EmployeeStatusResponse:
+    def execute_by_telegram_id(
+        self,
+        telegram_id: str,
+        period: Optional[Tuple[datetime, datetime]] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> EmployeeStatusResponse:
         # Get employee
         employee = self.employee_repository.find_by_telegram_id(telegram_id)
         if not employee:
             raise ValueError(f"Employee with Telegram ID {telegram_id} not found")
 
-        return self._build_response(employee)
+        return self._build_response(employee, period, limit, offset)
+
+    def _get_totals(self, employee_id: int, start: Optional[datetime], end: Optional[datetime]) -> EmployeeStatusTotals:
+        cache_key = (employee_id, start, end)
+        if self.status_cache is not None:
+            totals = self.status_cache.get(cache_key)
+            if totals is not None:
+                return totals
 
-    def _build_response(self, employee) -> EmployeeStatusResponse:
-        # Get salary advances
-        salary_advances = self.salary_advance_repository.find_by_employee_id(employee.id)
+        total_advances, advance_count = self.salary_advance_repository.summarize_by_employee_id(
+            employee_id, start=start, end=end
+        )
+        total_allowances, allowance_count = self.allowance_repository.summarize_by_employee_id(
+            employee_id, start=start, end=end
+        )
+        totals = EmployeeStatusTotals(
+            total_salary_advances=float(total_advances),
+            total_allowances=float(total_allowances),
+            salary_advance_count=advance_count,
+            allowance_count=allowance_count
+        )
+
+        if self.status_cache is not None:
+            self.status_cache.set(cache_key, totals)
+        return totals
+
+    def _build_response(
+        self,
+        employee,
+        period: Optional[Tuple[datetime, datetime]],
+        limit: int,
+        offset: int
+    ) -> EmployeeStatusResponse:
+        start, end = period if period else (None, None)
+
+        # Get a page of salary advances
+        salary_advances = self.salary_advance_repository.find_page_by_employee_id(
+            employee.id, limit, offset=offset, start=start, end=end
+        )
         salary_advance_summaries = [
             SalaryAdvanceSummary(
                 id=adv.id,
@@ -79,8 +148,10 @@ class GetEmployeeStatusUseCase:
             for adv in salary_advances
         ]
 
-        # Get allowances
-        allowances = self.allowance_repository.find_by_employee_id(employee.id)
+        # Get a page of allowances
+        allowances = self.allowance_repository.find_page_by_employee_id(
+            employee.id, limit, offset=offset, start=start, end=end
+        )
         allowance_summaries = [
             AllowanceSummary(
                 id=allow.id,
@@ -93,9 +164,8 @@ class GetEmployeeStatusUseCase:
             for allow in allowances
         ]
 
-        # Calculate totals
-        total_salary_advances = sum(float(adv.amount.amount) for adv in salary_advances)
-        total_allowances = sum(allow.amount for allow in allowances)
+        # Totals cover the whole period, not just the current page
+        totals = self._get_totals(employee.id, start, end)
 
         return EmployeeStatusResponse(
             id=employee.id,
@@ -110,6 +180,14 @@ class GetEmployeeStatusUseCase:
             created_at=employee.created_at.isoformat(),
             salary_advances=salary_advance_summaries,
             allowances=allowance_summaries,
-            total_salary_advances=total_salary_advances,
-            total_allowances=total_allowances
+            total_salary_advances=totals.total_salary_advances,
+            total_allowances=totals.total_allowances,
+            salary_advance_count=totals.salary_advance_count,
+            allowance_count=totals.allowance_count
         )
+
+
+def invalidate_employee_status_cache(status_cache, employee_id: int) -> None:
+    """Drop every cached status summary for an employee (all periods) from this cache"""
+    if status_cache is not None:
+        status_cache.delete_matching(lambda key: key[0] == employee_id)
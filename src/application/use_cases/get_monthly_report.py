@@ -1,11 +1,11 @@
 from datetime import date
-from typing import Dict, Optional
-from collections import defaultdict
+from typing import Dict, Optional, Tuple
 import calendar
 from ...domain.repositories.vehicle_repository import IVehicleRepository
 from ...domain.repositories.driver_repository import IDriverRepository
 from ...domain.repositories.trip_repository import ITripRepository
 from ...domain.repositories.fuel_record_repository import IFuelRecordRepository
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
 from ..dto.report_dto import MonthlyReportResponse, VehicleMonthlySummary
 
 class GetMonthlyReportUseCase:
@@ -14,12 +14,14 @@ class GetMonthlyReportUseCase:
         vehicle_repository: IVehicleRepository,
         driver_repository: Optional[IDriverRepository],
         trip_repository: ITripRepository,
-        fuel_record_repository: IFuelRecordRepository
+        fuel_record_repository: IFuelRecordRepository,
+        stats_repository: Optional[IVehicleDailyStatsRepository] = None
     ):
         self.vehicle_repository = vehicle_repository
         self.driver_repository = driver_repository
         self.trip_repository = trip_repository
         self.fuel_record_repository = fuel_record_repository
+        self.stats_repository = stats_repository
 
     def execute(self, group_id: int, year: int = None, month: int = None) -> MonthlyReportResponse:
         if year is None or month is None:
@@ -34,30 +36,7 @@ class GetMonthlyReportUseCase:
         # Get all vehicles for the group
         vehicles = self.vehicle_repository.find_by_group_id(group_id)
 
-        # Get all trips for the month
-        trips = self.trip_repository.find_by_group_and_date_range(group_id, first_day, last_day)
-
-        # Get all fuel records for the month
-        fuel_records = self.fuel_record_repository.find_by_group_and_date_range(group_id, first_day, last_day)
-
-        # Aggregate data by vehicle
-        vehicle_data: Dict[int, dict] = defaultdict(lambda: {
-            'trip_count': 0,
-            'total_loading_size': 0.0,
-            'total_fuel_liters': 0.0,
-            'total_fuel_cost': 0.0
-        })
-
-        # Count trips and sum loading size per vehicle
-        for trip in trips:
-            vehicle_data[trip.vehicle_id]['trip_count'] += 1
-            if trip.loading_size_cubic_meters:
-                vehicle_data[trip.vehicle_id]['total_loading_size'] += trip.loading_size_cubic_meters
-
-        # Sum fuel per vehicle
-        for fuel_record in fuel_records:
-            vehicle_data[fuel_record.vehicle_id]['total_fuel_liters'] += fuel_record.liters
-            vehicle_data[fuel_record.vehicle_id]['total_fuel_cost'] += fuel_record.cost
+        trip_totals, fuel_totals = self._totals_by_vehicle(group_id, first_day, last_day)
 
         # Create vehicle summaries
         vehicle_summaries = []
@@ -68,13 +47,14 @@ class GetMonthlyReportUseCase:
         days_in_month = calendar.monthrange(year, month)[1]
 
         for vehicle in vehicles:
-            data = vehicle_data[vehicle.id]
+            trip_count, total_loading_size = trip_totals.get(vehicle.id, (0, 0.0))
+            fuel_liters, fuel_cost = fuel_totals.get(vehicle.id, (0.0, 0.0))
 
             # Calculate averages
-            avg_trips_per_day = data['trip_count'] / days_in_month if days_in_month > 0 else 0
+            avg_trips_per_day = trip_count / days_in_month if days_in_month > 0 else 0
             avg_fuel_per_trip = (
-                data['total_fuel_liters'] / data['trip_count']
-                if data['trip_count'] > 0 else 0
+                fuel_liters / trip_count
+                if trip_count > 0 else 0
             )
 
             vehicle_summaries.append(VehicleMonthlySummary(
@@ -82,19 +62,19 @@ class GetMonthlyReportUseCase:
                 license_plate=vehicle.license_plate,
                 vehicle_type=vehicle.vehicle_type,
                 driver_name=None,  # Driver functionality disabled
-                total_trips=data['trip_count'],
-                total_loading_size=data['total_loading_size'],
-                total_fuel_liters=data['total_fuel_liters'],
-                total_fuel_cost=data['total_fuel_cost'],
+                total_trips=trip_count,
+                total_loading_size=total_loading_size,
+                total_fuel_liters=fuel_liters,
+                total_fuel_cost=fuel_cost,
                 avg_trips_per_day=round(avg_trips_per_day, 1),
                 avg_fuel_per_trip=round(avg_fuel_per_trip, 1)
             ))
 
-            total_trips += data['trip_count']
-            total_fuel_liters += data['total_fuel_liters']
-            total_fuel_cost += data['total_fuel_cost']
+            total_trips += trip_count
+            total_fuel_liters += fuel_liters
+            total_fuel_cost += fuel_cost
 
-        return MonthlyReportResponse(
+        report = MonthlyReportResponse(
             year=year,
             month=month,
             days_in_month=days_in_month,
@@ -104,3 +84,37 @@ class GetMonthlyReportUseCase:
             total_fuel_liters=total_fuel_liters,
             total_fuel_cost=total_fuel_cost
         )
+
+        # Year-over-year comparison is cheap with the rollup (<= 31 rows per vehicle)
+        if self.stats_repository:
+            previous_first_day = date(year - 1, month, 1)
+            previous_last_day = date(year - 1, month, calendar.monthrange(year - 1, month)[1])
+            previous_trips, previous_fuel = self._totals_by_vehicle(group_id, previous_first_day, previous_last_day)
+            report.previous_year_total_trips = sum(count for count, _ in previous_trips.values())
+            report.previous_year_total_fuel_liters = sum(liters for liters, _ in previous_fuel.values())
+            report.previous_year_total_fuel_cost = sum(cost for _, cost in previous_fuel.values())
+
+        return report
+
+    def _totals_by_vehicle(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Tuple[Dict[int, Tuple[int, float]], Dict[int, Tuple[float, float]]]:
+        """Per-vehicle (trip_count, loading_size) and (fuel_liters, fuel_cost) totals"""
+        if not self.stats_repository:
+            # Aggregated by the database from the raw tables (GROUP BY vehicle_id)
+            return (
+                self.trip_repository.sum_by_vehicle_for_group(group_id, start_date, end_date),
+                self.fuel_record_repository.sum_by_vehicle_for_group(group_id, start_date, end_date)
+            )
+
+        trip_totals: Dict[int, Tuple[int, float]] = {}
+        fuel_totals: Dict[int, Tuple[float, float]] = {}
+        for day in self.stats_repository.find_by_group_and_date_range(group_id, start_date, end_date):
+            count, loading = trip_totals.get(day.vehicle_id, (0, 0.0))
+            trip_totals[day.vehicle_id] = (count + day.trip_count, loading + day.loading_size_cubic_meters)
+            liters, cost = fuel_totals.get(day.vehicle_id, (0.0, 0.0))
+            fuel_totals[day.vehicle_id] = (liters + day.fuel_liters, cost + day.fuel_cost)
+        return trip_totals, fuel_totals
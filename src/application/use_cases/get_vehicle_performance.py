@@ -1,11 +1,12 @@
 from datetime import date, timedelta
-from typing import Dict, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 import calendar
+from ...domain.entities.vehicle import Vehicle
 from ...domain.repositories.vehicle_repository import IVehicleRepository
 from ...domain.repositories.driver_repository import IDriverRepository
 from ...domain.repositories.trip_repository import ITripRepository
 from ...domain.repositories.fuel_record_repository import IFuelRecordRepository
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
 from ..dto.report_dto import VehiclePerformanceResponse, DailyBreakdown
 
 class GetVehiclePerformanceUseCase:
@@ -14,12 +15,14 @@ class GetVehiclePerformanceUseCase:
         vehicle_repository: IVehicleRepository,
         driver_repository: Optional[IDriverRepository],
         trip_repository: ITripRepository,
-        fuel_record_repository: IFuelRecordRepository
+        fuel_record_repository: IFuelRecordRepository,
+        stats_repository: Optional[IVehicleDailyStatsRepository] = None
     ):
         self.vehicle_repository = vehicle_repository
         self.driver_repository = driver_repository
         self.trip_repository = trip_repository
         self.fuel_record_repository = fuel_record_repository
+        self.stats_repository = stats_repository
 
     def execute(self, vehicle_id: int) -> VehiclePerformanceResponse:
         # Get vehicle
@@ -27,23 +30,77 @@ class GetVehiclePerformanceUseCase:
         if not vehicle:
             raise ValueError(f"Vehicle with ID {vehicle_id} not found")
 
-        # Get current month data
         today = date.today()
+        start_date, end_date = self._date_range(today)
+
+        if self.stats_repository:
+            # Daily rollup rows: at most one per day in the range
+            trip_days, fuel_days = {}, {}
+            for day in self.stats_repository.find_by_vehicle_and_date_range(vehicle_id, start_date, end_date):
+                trip_days[day.date] = (day.trip_count, day.loading_size_cubic_meters)
+                fuel_days[day.date] = (day.fuel_liters, day.fuel_cost)
+        else:
+            # One aggregate per table covers both the month and the last 7 days
+            trip_days = self.trip_repository.sum_by_date_for_vehicle(vehicle_id, start_date, end_date)
+            fuel_days = self.fuel_record_repository.sum_by_date_for_vehicle(vehicle_id, start_date, end_date)
+
+        return self._build_response(vehicle, trip_days, fuel_days, today)
+
+    def execute_for_group(self, group_id: int) -> List[VehiclePerformanceResponse]:
+        """Performance of every vehicle in a group, from one fetch of daily totals"""
+        vehicles = self.vehicle_repository.find_by_group_id(group_id)
+        if not vehicles:
+            return []
+
+        today = date.today()
+        start_date, end_date = self._date_range(today)
+
+        if self.stats_repository:
+            trip_totals, fuel_totals = {}, {}
+            for day in self.stats_repository.find_by_group_and_date_range(group_id, start_date, end_date):
+                trip_totals[(day.vehicle_id, day.date)] = (day.trip_count, day.loading_size_cubic_meters)
+                fuel_totals[(day.vehicle_id, day.date)] = (day.fuel_liters, day.fuel_cost)
+        else:
+            trip_totals = self.trip_repository.sum_by_vehicle_and_date_for_group(group_id, start_date, end_date)
+            fuel_totals = self.fuel_record_repository.sum_by_vehicle_and_date_for_group(group_id, start_date, end_date)
+
+        # Split the (vehicle_id, date) rows per vehicle
+        trip_days: Dict[int, Dict[date, Tuple[int, float]]] = {v.id: {} for v in vehicles}
+        fuel_days: Dict[int, Dict[date, Tuple[float, float]]] = {v.id: {} for v in vehicles}
+        for (vehicle_id, day), totals in trip_totals.items():
+            if vehicle_id in trip_days:
+                trip_days[vehicle_id][day] = totals
+        for (vehicle_id, day), totals in fuel_totals.items():
+            if vehicle_id in fuel_days:
+                fuel_days[vehicle_id][day] = totals
+
+        return [
+            self._build_response(vehicle, trip_days[vehicle.id], fuel_days[vehicle.id], today)
+            for vehicle in vehicles
+        ]
+
+    @staticmethod
+    def _date_range(today: date) -> Tuple[date, date]:
+        """Smallest range covering the current month and the last 7 days"""
         first_day_of_month = date(today.year, today.month, 1)
         last_day_of_month = date(today.year, today.month, calendar.monthrange(today.year, today.month)[1])
+        seven_days_ago = today - timedelta(days=6)  # Including today = 7 days
+        return min(first_day_of_month, seven_days_ago), last_day_of_month
 
-        month_trips = self.trip_repository.find_by_vehicle_and_date_range(
-            vehicle_id, first_day_of_month, last_day_of_month
-        )
-        month_fuel = self.fuel_record_repository.find_by_vehicle_and_date_range(
-            vehicle_id, first_day_of_month, last_day_of_month
-        )
-
+    @staticmethod
+    def _build_response(
+        vehicle: Vehicle,
+        trip_days: Dict[date, Tuple[int, float]],
+        fuel_days: Dict[date, Tuple[float, float]],
+        today: date
+    ) -> VehiclePerformanceResponse:
         # Calculate month totals
-        month_total_trips = len(month_trips)
-        month_total_loading_size = sum(t.loading_size_cubic_meters or 0 for t in month_trips)
-        month_total_fuel = sum(f.liters for f in month_fuel)
-        month_total_cost = sum(f.cost for f in month_fuel)
+        month_trips = [totals for day, totals in trip_days.items() if (day.year, day.month) == (today.year, today.month)]
+        month_fuel = [totals for day, totals in fuel_days.items() if (day.year, day.month) == (today.year, today.month)]
+        month_total_trips = sum(count for count, _ in month_trips)
+        month_total_loading_size = sum(loading for _, loading in month_trips)
+        month_total_fuel = sum(liters for liters, _ in month_fuel)
+        month_total_cost = sum(cost for _, cost in month_fuel)
 
         # Calculate month averages
         days_in_month = calendar.monthrange(today.year, today.month)[1]
@@ -51,43 +108,18 @@ class GetVehiclePerformanceUseCase:
         month_avg_fuel_per_trip = month_total_fuel / month_total_trips if month_total_trips > 0 else 0
         month_avg_cost_per_trip = month_total_cost / month_total_trips if month_total_trips > 0 else 0
 
-        # Get last 7 days data
-        seven_days_ago = today - timedelta(days=6)  # Including today = 7 days
-        last_7_days_trips = self.trip_repository.find_by_vehicle_and_date_range(
-            vehicle_id, seven_days_ago, today
-        )
-        last_7_days_fuel = self.fuel_record_repository.find_by_vehicle_and_date_range(
-            vehicle_id, seven_days_ago, today
-        )
-
-        # Aggregate last 7 days by date
-        daily_data: Dict[date, dict] = defaultdict(lambda: {
-            'trips': 0,
-            'total_loading_size': 0.0,
-            'fuel_liters': 0.0,
-            'fuel_cost': 0.0
-        })
-
-        for trip in last_7_days_trips:
-            daily_data[trip.date]['trips'] += 1
-            if trip.loading_size_cubic_meters:
-                daily_data[trip.date]['total_loading_size'] += trip.loading_size_cubic_meters
-
-        for fuel in last_7_days_fuel:
-            daily_data[fuel.date]['fuel_liters'] += fuel.liters
-            daily_data[fuel.date]['fuel_cost'] += fuel.cost
-
         # Create daily breakdown (last 7 days, most recent first)
         daily_breakdowns = []
         for i in range(6, -1, -1):  # 6 down to 0 for reverse chronological order
             check_date = today - timedelta(days=i)
-            data = daily_data[check_date]
+            trips, total_loading_size = trip_days.get(check_date, (0, 0.0))
+            fuel_liters, fuel_cost = fuel_days.get(check_date, (0.0, 0.0))
             daily_breakdowns.append(DailyBreakdown(
                 date=check_date.isoformat(),
-                trips=data['trips'],
-                total_loading_size=data['total_loading_size'],
-                fuel_liters=data['fuel_liters'],
-                fuel_cost=data['fuel_cost']
+                trips=trips,
+                total_loading_size=total_loading_size,
+                fuel_liters=fuel_liters,
+                fuel_cost=fuel_cost
             ))
 
         return VehiclePerformanceResponse(
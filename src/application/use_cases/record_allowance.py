@@ -1,16 +1,19 @@
 from ...domain.entities.allowance import Allowance
 from ...domain.repositories.allowance_repository import IAllowanceRepository
 from ...domain.repositories.employee_repository import IEmployeeRepository
+from .get_employee_status import invalidate_employee_status_cache
 from ..dto.allowance_dto import RecordAllowanceRequest, AllowanceResponse
 
 class RecordAllowanceUseCase:
     def __init__(
         self,
         allowance_repository: IAllowanceRepository,
-        employee_repository: IEmployeeRepository
+        employee_repository: IEmployeeRepository,
+        status_cache=None
     ):
         self.allowance_repository = allowance_repository
         self.employee_repository = employee_repository
+        self.status_cache = status_cache
 
     def execute(self, request: RecordAllowanceRequest) -> AllowanceResponse:
         # Verify employee exists
@@ -30,6 +33,9 @@ class RecordAllowanceUseCase:
         # Save allowance
         saved_allowance = self.allowance_repository.save(allowance)
 
+        # Cached status totals for this employee are now stale
+        invalidate_employee_status_cache(self.status_cache, saved_allowance.employee_id)
+
         return AllowanceResponse(
             id=saved_allowance.id,
             employee_id=saved_allowance.employee_id,
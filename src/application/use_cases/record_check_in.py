@@ -51,5 +51,6 @@ class RecordCheckInUseCase:
             message="Check-in recorded successfully",
             timestamp=format_ict_datetime(saved_check_in.timestamp),
             location=f"{location.latitude}, {location.longitude}",
-            type=saved_check_in.type.value
+            type=saved_check_in.type.value,
+            check_in_id=saved_check_in.id
         )
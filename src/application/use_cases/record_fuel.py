@@ -1,17 +1,26 @@
+from contextlib import nullcontext
 from datetime import date
+from typing import Optional
 from ...domain.entities.fuel_record import FuelRecord
+from ...domain.entities.vehicle_daily_stats import VehicleDailyStats
 from ...domain.repositories.fuel_record_repository import IFuelRecordRepository
 from ...domain.repositories.vehicle_repository import IVehicleRepository
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
+from ...domain.repositories.unit_of_work import IUnitOfWork
 from ..dto.fuel_dto import RecordFuelRequest, FuelResponse
 
 class RecordFuelUseCase:
     def __init__(
         self,
         fuel_record_repository: IFuelRecordRepository,
-        vehicle_repository: IVehicleRepository
+        vehicle_repository: IVehicleRepository,
+        stats_repository: Optional[IVehicleDailyStatsRepository] = None,
+        unit_of_work: Optional[IUnitOfWork] = None
     ):
         self.fuel_record_repository = fuel_record_repository
         self.vehicle_repository = vehicle_repository
+        self.stats_repository = stats_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: RecordFuelRequest) -> FuelResponse:
         # Validate vehicle exists and belongs to group
@@ -40,8 +49,18 @@ class RecordFuelUseCase:
             receipt_photo_url=request.receipt_photo_url
         )
 
-        # Save to repository
-        saved_fuel_record = self.fuel_record_repository.save(fuel_record)
+        # The record and its daily rollup increment commit (or roll back) together
+        with self.unit_of_work or nullcontext():
+            saved_fuel_record = self.fuel_record_repository.save(fuel_record)
+
+            if self.stats_repository:
+                self.stats_repository.add(VehicleDailyStats(
+                    group_id=request.group_id,
+                    vehicle_id=request.vehicle_id,
+                    date=today,
+                    fuel_liters=request.liters,
+                    fuel_cost=request.cost
+                ))
 
         return FuelResponse(
             id=saved_fuel_record.id,
@@ -2,16 +2,19 @@ from ...domain.entities.salary_advance import SalaryAdvance
 from ...domain.value_objects.money import Money
 from ...domain.repositories.salary_advance_repository import ISalaryAdvanceRepository
 from ...domain.repositories.employee_repository import IEmployeeRepository
+from .get_employee_status import invalidate_employee_status_cache
 from ..dto.salary_advance_dto import SalaryAdvanceRequest, SalaryAdvanceResponse
 
 class RecordSalaryAdvanceUseCase:
     def __init__(
         self,
         salary_advance_repository: ISalaryAdvanceRepository,
-        employee_repository: IEmployeeRepository
+        employee_repository: IEmployeeRepository,
+        status_cache=None
     ):
         self.salary_advance_repository = salary_advance_repository
         self.employee_repository = employee_repository
+        self.status_cache = status_cache
 
     def execute(self, request: SalaryAdvanceRequest) -> SalaryAdvanceResponse:
         # Find employee by name
@@ -33,6 +36,9 @@ class RecordSalaryAdvanceUseCase:
         # Save salary advance
         saved_advance = self.salary_advance_repository.save(salary_advance)
 
+        # Cached status totals for this employee are now stale
+        invalidate_employee_status_cache(self.status_cache, saved_advance.employee_id)
+
         return SalaryAdvanceResponse(
             success=True,
             message="Salary advance recorded successfully",
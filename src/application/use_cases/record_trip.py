@@ -1,17 +1,26 @@
+from contextlib import nullcontext
 from datetime import date
+from typing import Optional
 from ...domain.entities.trip import Trip
+from ...domain.entities.vehicle_daily_stats import VehicleDailyStats
 from ...domain.repositories.trip_repository import ITripRepository
 from ...domain.repositories.vehicle_repository import IVehicleRepository
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
+from ...domain.repositories.unit_of_work import IUnitOfWork
 from ..dto.trip_dto import RecordTripRequest, TripResponse
 
 class RecordTripUseCase:
     def __init__(
         self,
         trip_repository: ITripRepository,
-        vehicle_repository: IVehicleRepository
+        vehicle_repository: IVehicleRepository,
+        stats_repository: Optional[IVehicleDailyStatsRepository] = None,
+        unit_of_work: Optional[IUnitOfWork] = None
     ):
         self.trip_repository = trip_repository
         self.vehicle_repository = vehicle_repository
+        self.stats_repository = stats_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, request: RecordTripRequest) -> TripResponse:
         # Validate vehicle exists and belongs to group
@@ -24,25 +33,36 @@ class RecordTripUseCase:
         # Get today's date
         today = date.today()
 
-        # Get next trip number for this vehicle today (auto-increment)
-        max_trip_number = self.trip_repository.get_max_trip_number_for_date(
-            request.vehicle_id,
-            today
-        )
-        next_trip_number = max_trip_number + 1
-
-        # Create new trip (snapshot driver name from vehicle)
-        trip = Trip.create(
-            group_id=request.group_id,
-            vehicle_id=request.vehicle_id,
-            driver_name=vehicle.driver_name,
-            trip_date=today,
-            trip_number=next_trip_number,
-            loading_size_cubic_meters=request.loading_size_cubic_meters
-        )
+        # The trip and its daily rollup increment commit (or roll back) together
+        with self.unit_of_work or nullcontext():
+            # Get next trip number for this vehicle today (auto-increment)
+            max_trip_number = self.trip_repository.get_max_trip_number_for_date(
+                request.vehicle_id,
+                today
+            )
+            next_trip_number = max_trip_number + 1
+
+            # Create new trip (snapshot driver name from vehicle)
+            trip = Trip.create(
+                group_id=request.group_id,
+                vehicle_id=request.vehicle_id,
+                driver_name=vehicle.driver_name,
+                trip_date=today,
+                trip_number=next_trip_number,
+                loading_size_cubic_meters=request.loading_size_cubic_meters
+            )
+
+            # Save to repository
+            saved_trip = self.trip_repository.save(trip)
 
-        # Save to repository
-        saved_trip = self.trip_repository.save(trip)
+            if self.stats_repository:
+                self.stats_repository.add(VehicleDailyStats(
+                    group_id=request.group_id,
+                    vehicle_id=request.vehicle_id,
+                    date=today,
+                    trip_count=1,
+                    loading_size_cubic_meters=request.loading_size_cubic_meters or 0.0
+                ))
 
         # Get total trips for today for this vehicle
         total_trips_today = self.trip_repository.count_by_vehicle_and_date(
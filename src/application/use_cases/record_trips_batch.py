@@ -0,0 +1,110 @@
+import logging
+from contextlib import nullcontext
+from datetime import date
+from typing import Optional
+from ...domain.entities.trip import Trip
+from ...domain.entities.vehicle_daily_stats import VehicleDailyStats
+from ...domain.repositories.trip_repository import ITripRepository, TripNumberConflictError
+from ...domain.repositories.vehicle_repository import IVehicleRepository
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
+from ...domain.repositories.unit_of_work import IUnitOfWork
+from ..dto.trip_dto import RecordTripsBatchRequest, TripsBatchResponse
+
+logger = logging.getLogger(__name__)
+
+class RecordTripsBatchUseCase:
+    """
+    Record several trips for one vehicle at once.
+
+    Reads (and locks) today's max trip number once, assigns a contiguous
+    range of trip numbers and inserts all trips, together with the daily
+    rollup increment, in one transaction. If another writer takes one of the
+    numbers first, or the two deadlock on the lock, the whole batch is retried.
+    """
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        trip_repository: ITripRepository,
+        vehicle_repository: IVehicleRepository,
+        stats_repository: Optional[IVehicleDailyStatsRepository] = None,
+        unit_of_work: Optional[IUnitOfWork] = None
+    ):
+        self.trip_repository = trip_repository
+        self.vehicle_repository = vehicle_repository
+        self.stats_repository = stats_repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, request: RecordTripsBatchRequest) -> TripsBatchResponse:
+        if request.trip_count <= 0:
+            raise ValueError("Trip count must be greater than 0")
+
+        # Validate vehicle exists and belongs to group
+        vehicle = self.vehicle_repository.find_by_id(request.vehicle_id)
+        if not vehicle:
+            raise ValueError(f"Vehicle with ID {request.vehicle_id} not found")
+        if vehicle.group_id != request.group_id:
+            raise ValueError("Vehicle does not belong to this group")
+
+        # Get today's date
+        today = date.today()
+
+        loading_size_per_trip = None
+        if request.total_loading_size_cubic_meters is not None:
+            loading_size_per_trip = request.total_loading_size_cubic_meters / request.trip_count
+
+        with self.unit_of_work or nullcontext():
+            for attempt in range(1, self.MAX_ATTEMPTS + 1):
+                try:
+                    # Next trip numbers for this vehicle today, locked until commit
+                    first_trip_number = self.trip_repository.get_max_trip_number_for_date(
+                        request.vehicle_id,
+                        today,
+                        lock=True
+                    ) + 1
+
+                    # Create trips (snapshot driver name from vehicle)
+                    trips = [
+                        Trip.create(
+                            group_id=request.group_id,
+                            vehicle_id=request.vehicle_id,
+                            driver_name=vehicle.driver_name,
+                            trip_date=today,
+                            trip_number=first_trip_number + i,
+                            loading_size_cubic_meters=loading_size_per_trip
+                        )
+                        for i in range(request.trip_count)
+                    ]
+
+                    self.trip_repository.save_all(trips)
+                    break
+                except TripNumberConflictError as e:
+                    if attempt == self.MAX_ATTEMPTS:
+                        raise ValueError("Trips are being recorded for this vehicle by someone else, please try again")
+                    logger.warning(
+                        f"Trip number conflict for vehicle {request.vehicle_id} on {today}, "
+                        f"retrying ({attempt}/{self.MAX_ATTEMPTS}): {e}"
+                    )
+
+            if self.stats_repository:
+                self.stats_repository.add(VehicleDailyStats(
+                    group_id=request.group_id,
+                    vehicle_id=request.vehicle_id,
+                    date=today,
+                    trip_count=request.trip_count,
+                    loading_size_cubic_meters=request.total_loading_size_cubic_meters or 0.0
+                ))
+
+        return TripsBatchResponse(
+            group_id=request.group_id,
+            vehicle_id=request.vehicle_id,
+            driver_name=vehicle.driver_name,
+            date=today.isoformat(),
+            trip_count=request.trip_count,
+            first_trip_number=first_trip_number,
+            last_trip_number=first_trip_number + request.trip_count - 1,
+            loading_size_per_trip_cubic_meters=loading_size_per_trip,
+            total_loading_size_cubic_meters=request.total_loading_size_cubic_meters,
+            vehicle_license_plate=vehicle.license_plate
+        )
@@ -19,46 +19,23 @@ class RegisterGroupUseCase:
         created_by_last_name: Optional[str] = None
     ) -> Group:
         # Check if group already exists
-        existing_group = self.group_repository.find_by_chat_id(chat_id)
+        group = self.group_repository.find_by_chat_id(chat_id)
 
-        # Get or create telegram user
-        user_id = None
-        if created_by_telegram_id:
-            user = self.user_repository.find_by_telegram_id(created_by_telegram_id)
-            if not user:
-                # Create new user
-                user = TelegramUser.create(
-                    telegram_id=created_by_telegram_id,
-                    username=created_by_username,
-                    first_name=created_by_first_name,
-                    last_name=created_by_last_name
-                )
-                user = self.user_repository.save(user)
-            else:
-                # Update user info if changed
-                if (user.username != created_by_username or
-                    user.first_name != created_by_first_name or
-                    user.last_name != created_by_last_name):
-                    user.username = created_by_username
-                    user.first_name = created_by_first_name
-                    user.last_name = created_by_last_name
-                    user = self.user_repository.save(user)
+        if not group:
+            # Create new group; a concurrent request may have created it meanwhile
+            group = self.group_repository.upsert_by_chat_id(Group.create(chat_id=chat_id, name=name))
 
-            user_id = user.id
+        if not created_by_telegram_id:
+            return group
 
-        if existing_group:
-            # Update owner if not set
-            if not existing_group.created_by_user_id and user_id:
-                existing_group.created_by_user_id = user_id
-                return self.group_repository.save(existing_group)
-            return existing_group
-
-        # Create new group
-        group = Group.create(
-            chat_id=chat_id,
-            name=name,
-            created_by_user_id=user_id
-        )
-
-        # Save to repository
-        return self.group_repository.save(group)
+        # Create or refresh the Telegram user's profile in one upsert; admin
+        # group listings join on it and search by username
+        user_id = self.user_repository.upsert_profile(TelegramUser.create(
+            telegram_id=created_by_telegram_id,
+            username=created_by_username,
+            first_name=created_by_first_name,
+            last_name=created_by_last_name
+        ))
+        if group.created_by_user_id:
+            return group
+        return self.group_repository.set_owner_if_missing(group.id, user_id)
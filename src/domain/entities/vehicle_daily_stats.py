@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass
+class VehicleDailyStats:
+    """Totals of one vehicle's trips and fuel records for one day"""
+    group_id: int
+    vehicle_id: int
+    date: date
+    trip_count: int = 0
+    loading_size_cubic_meters: float = 0.0
+    fuel_liters: float = 0.0
+    fuel_cost: float = 0.0
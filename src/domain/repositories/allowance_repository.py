@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from ..entities.allowance import Allowance
 
 class IAllowanceRepository(ABC):
@@ -10,3 +11,25 @@ class IAllowanceRepository(ABC):
     @abstractmethod
     def find_by_employee_id(self, employee_id: int) -> List[Allowance]:
         pass
+
+    @abstractmethod
+    def find_page_by_employee_id(
+        self,
+        employee_id: int,
+        limit: int,
+        offset: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Allowance]:
+        """Find a page of an employee's allowances, newest first, optionally within [start, end]"""
+        pass
+
+    @abstractmethod
+    def summarize_by_employee_id(
+        self,
+        employee_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> tuple[float, int]:
+        """Return (total amount, row count) of an employee's allowances, optionally within [start, end]"""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from datetime import date
 from ..entities.check_in import CheckIn
 
@@ -21,3 +21,12 @@ class ICheckInRepository(ABC):
     def find_by_group_and_date_range(self, group_id: int, start_date: date, end_date: date) -> List[CheckIn]:
         """Find all check-ins for a group within a date range"""
         pass
+
+    @abstractmethod
+    def find_by_id(self, check_in_id: int) -> Optional[CheckIn]:
+        pass
+
+    @abstractmethod
+    def update_photo_url(self, check_in_id: int, photo_url: Optional[str]) -> None:
+        """Set the photo URL of an existing check-in"""
+        pass
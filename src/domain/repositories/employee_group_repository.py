@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..entities.employee_group import EmployeeGroup
+from ..entities.group import Group
 
 class IEmployeeGroupRepository(ABC):
     @abstractmethod
     def save(self, employee_group: EmployeeGroup) -> EmployeeGroup:
         pass
 
+    @abstractmethod
+    def upsert(self, employee_group: EmployeeGroup) -> EmployeeGroup:
+        """Atomically insert the link or return the existing one"""
+        pass
+
     @abstractmethod
     def find_by_employee_id(self, employee_id: int) -> List[EmployeeGroup]:
         pass
@@ -22,3 +28,13 @@ class IEmployeeGroupRepository(ABC):
     @abstractmethod
     def find_by_employee_and_group(self, employee_id: int, group_id: int) -> Optional[EmployeeGroup]:
         pass
+
+    @abstractmethod
+    def find_by_employee_id_with_groups(self, employee_id: int) -> List[Tuple[EmployeeGroup, Group]]:
+        """Find an employee's group memberships joined with their groups, ordered by joined_at"""
+        pass
+
+    @abstractmethod
+    def link(self, employee_id: int, group_id: int) -> None:
+        """Link an employee to a group unless already linked, in a single statement"""
+        pass
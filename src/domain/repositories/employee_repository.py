@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Iterable
+from datetime import datetime
 from ..entities.employee import Employee
 
 class IEmployeeRepository(ABC):
@@ -11,6 +12,11 @@ class IEmployeeRepository(ABC):
     def find_by_id(self, employee_id: int) -> Optional[Employee]:
         pass
 
+    @abstractmethod
+    def find_by_ids(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Load several employees in one query, keyed by id; missing ids are omitted"""
+        pass
+
     @abstractmethod
     def find_by_telegram_id(self, telegram_id: str) -> Optional[Employee]:
         pass
@@ -22,3 +28,16 @@ class IEmployeeRepository(ABC):
     @abstractmethod
     def find_all(self) -> List[Employee]:
         pass
+
+    @abstractmethod
+    def find_page(
+        self,
+        group_id: Optional[int] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Employee]:
+        """Find a page of employees ordered by (created_at, id) descending.
+
+        `after` is the (created_at, id) of the last employee on the previous page."""
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Dict, Tuple
+from datetime import date, datetime
 from ..entities.fuel_record import FuelRecord
 
 class IFuelRecordRepository(ABC):
@@ -36,6 +36,44 @@ class IFuelRecordRepository(ABC):
         """Find all fuel records for a group within a date range."""
         pass
 
+    @abstractmethod
+    def find_details_by_group_and_date(self, group_id: int, fuel_date: date) -> List[Tuple[int, float, float, datetime]]:
+        """Find (vehicle_id, liters, cost, created_at) for a group's fuel records on a date, oldest first."""
+        pass
+
+    @abstractmethod
+    def sum_by_vehicle_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, Tuple[float, float]]:
+        """Aggregate a group's fuel records per vehicle in SQL.
+        Returns {vehicle_id: (total_liters, total_cost)}."""
+        pass
+
+    @abstractmethod
+    def sum_by_date_for_vehicle(
+        self,
+        vehicle_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, Tuple[float, float]]:
+        """Aggregate a vehicle's fuel records per day in SQL.
+        Returns {date: (total_liters, total_cost)} for days with fuel records."""
+        pass
+
+    @abstractmethod
+    def sum_by_vehicle_and_date_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[Tuple[int, date], Tuple[float, float]]:
+        """Aggregate a group's fuel records per vehicle and day in SQL.
+        Returns {(vehicle_id, date): (total_liters, total_cost)} for days with fuel records."""
+        pass
+
     @abstractmethod
     def has_records_for_vehicle(self, vehicle_id: int) -> bool:
         """Check if any fuel records exist for the vehicle."""
@@ -7,6 +7,20 @@ class IGroupRepository(ABC):
     def save(self, group: Group) -> Group:
         pass
 
+    @abstractmethod
+    def upsert_by_chat_id(self, group: Group) -> Group:
+        """
+        Atomically insert a group or return the one with the same chat_id
+
+        An existing group keeps its name; its owner is only filled in if unset.
+        """
+        pass
+
+    @abstractmethod
+    def set_owner_if_missing(self, group_id: int, created_by_user_id: int) -> Group:
+        """Set the group's owner unless one is already recorded"""
+        pass
+
     @abstractmethod
     def find_by_id(self, group_id: int) -> Optional[Group]:
         pass
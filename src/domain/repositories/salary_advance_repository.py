@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Dict
+from datetime import datetime
+from decimal import Decimal
 from ..entities.salary_advance import SalaryAdvance
 
 class ISalaryAdvanceRepository(ABC):
@@ -10,3 +12,39 @@ class ISalaryAdvanceRepository(ABC):
     @abstractmethod
     def find_by_employee_id(self, employee_id: int) -> List[SalaryAdvance]:
         pass
+
+    @abstractmethod
+    def find_page_by_employee_id(
+        self,
+        employee_id: int,
+        limit: int,
+        offset: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ) -> List[SalaryAdvance]:
+        """Find a page of an employee's salary advances, newest first, optionally filtered by time and amount range"""
+        pass
+
+    @abstractmethod
+    def summarize_by_employee_id(
+        self,
+        employee_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> tuple[Decimal, int]:
+        """Return (total amount, row count) of an employee's salary advances, optionally within [start, end]"""
+        pass
+
+    @abstractmethod
+    def sum_by_employee_ids(
+        self,
+        employee_ids: List[int],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ) -> Dict[int, Decimal]:
+        """Total salary advances per employee in one grouped query; employees without advances are omitted"""
+        pass
@@ -7,6 +7,16 @@ class ITelegramUserRepository(ABC):
     def save(self, user: TelegramUser) -> TelegramUser:
         pass
 
+    @abstractmethod
+    def upsert(self, user: TelegramUser) -> TelegramUser:
+        """Atomically insert a user or update the profile of the one with the same telegram_id"""
+        pass
+
+    @abstractmethod
+    def upsert_profile(self, user: TelegramUser) -> int:
+        """Like upsert, in a single statement without reading the user back. Returns the user's id"""
+        pass
+
     @abstractmethod
     def find_by_telegram_id(self, telegram_id: str) -> Optional[TelegramUser]:
         pass
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Dict, Tuple
+from datetime import date, datetime
 from ..entities.trip import Trip
 
+class TripNumberConflictError(Exception):
+    """Raised when a trip number for a vehicle and date is already taken, or the
+    write lost a lock race with a concurrent insert (deadlock, lock wait timeout)"""
+    pass
+
 class ITripRepository(ABC):
     @abstractmethod
     def save(self, trip: Trip) -> Trip:
@@ -13,9 +18,18 @@ class ITripRepository(ABC):
         pass
 
     @abstractmethod
-    def get_max_trip_number_for_date(self, vehicle_id: int, trip_date: date) -> int:
+    def save_all(self, trips: List[Trip]) -> int:
+        """Insert new trips in a single batch and transaction.
+        Returns the number of trips inserted. Rolls back on any database error;
+        raises TripNumberConflictError if a trip number is already taken or the
+        insert deadlocked with another writer, so the caller can retry."""
+        pass
+
+    @abstractmethod
+    def get_max_trip_number_for_date(self, vehicle_id: int, trip_date: date, lock: bool = False) -> int:
         """Get the highest trip number for a vehicle on a specific date.
-        Returns 0 if no trips exist for that date."""
+        Returns 0 if no trips exist for that date. With lock=True the rows
+        (and the gap after them) are locked until the transaction ends."""
         pass
 
     @abstractmethod
@@ -46,6 +60,44 @@ class ITripRepository(ABC):
         """Find all trips for a group within a date range."""
         pass
 
+    @abstractmethod
+    def find_details_by_group_and_date(self, group_id: int, trip_date: date) -> List[Tuple[int, int, Optional[float], datetime]]:
+        """Find (vehicle_id, trip_number, loading_size_cubic_meters, created_at) for a group's trips on a date, oldest first."""
+        pass
+
+    @abstractmethod
+    def sum_by_vehicle_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, Tuple[int, float]]:
+        """Aggregate a group's trips per vehicle in SQL.
+        Returns {vehicle_id: (trip_count, total_loading_size)}."""
+        pass
+
+    @abstractmethod
+    def sum_by_date_for_vehicle(
+        self,
+        vehicle_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, Tuple[int, float]]:
+        """Aggregate a vehicle's trips per day in SQL.
+        Returns {date: (trip_count, total_loading_size)} for days with trips."""
+        pass
+
+    @abstractmethod
+    def sum_by_vehicle_and_date_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[Tuple[int, date], Tuple[int, float]]:
+        """Aggregate a group's trips per vehicle and day in SQL.
+        Returns {(vehicle_id, date): (trip_count, total_loading_size)} for days with trips."""
+        pass
+
     @abstractmethod
     def has_trips_for_vehicle(self, vehicle_id: int) -> bool:
         """Check if any trips exist for the vehicle."""
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+class IUnitOfWork(ABC):
+    """
+    Groups several repository writes into one transaction.
+
+    Inside ``with unit_of_work:`` repositories only flush their writes; the
+    outermost block commits once on exit, or rolls back every write if it raises.
+    """
+
+    @abstractmethod
+    def __enter__(self) -> 'IUnitOfWork':
+        pass
+
+    @abstractmethod
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
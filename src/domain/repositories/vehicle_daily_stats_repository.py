@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from datetime import date
+from ..entities.vehicle_daily_stats import VehicleDailyStats
+
+class IVehicleDailyStatsRepository(ABC):
+    @abstractmethod
+    def add(self, stats: VehicleDailyStats) -> None:
+        """Atomically add the given counts to the vehicle's row for that day (created if missing)."""
+        pass
+
+    @abstractmethod
+    def find_by_group_and_date_range(self, group_id: int, start_date: date, end_date: date) -> List[VehicleDailyStats]:
+        """Find the daily rows of all vehicles in a group within a date range."""
+        pass
+
+    @abstractmethod
+    def find_by_vehicle_and_date_range(self, vehicle_id: int, start_date: date, end_date: date) -> List[VehicleDailyStats]:
+        """Find a vehicle's daily rows within a date range."""
+        pass
+
+    @abstractmethod
+    def rebuild(
+        self,
+        group_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        """Recompute the rows in scope from trips and fuel records. Returns the number of rows written."""
+        pass
@@ -1,16 +1,23 @@
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from flasgger import Swagger
 from ..config.settings import settings
 from ..persistence.mongodb_connection import mongodb
-from .middleware import validate_telegram_auth
+from .middleware import validate_telegram_auth, admin_principal_cache
 from ..utils.logging_config import setup_logging
+from ..services.check_in_job_worker import check_in_job_worker
+from ..metrics.flask_metrics import init_metrics, init_query_profiling
 
 def create_app():
     setup_logging()
     app = Flask(__name__)
 
+    # Request latency and per-request query counts; serves /metrics
+    if settings.METRICS_ENABLED:
+        init_metrics(app)
+    if settings.DB_PROFILING_ENABLED:
+        init_query_profiling(app)
+
     # Configure JWT
     app.config['JWT_SECRET_KEY'] = settings.JWT_SECRET_KEY
     app.config['JWT_ALGORITHM'] = settings.JWT_ALGORITHM
@@ -26,6 +33,14 @@ def create_app():
     except Exception as e:
         app.logger.error(f"Failed to connect to MongoDB: {e}")
 
+    # Push admin_users changes into the admin principal cache (replica sets only)
+    if settings.ADMIN_PRINCIPAL_CHANGE_STREAM:
+        admin_principal_cache.start_change_stream()
+
+    # Resize photos and send group notifications for queued check-ins
+    if settings.CHECKIN_JOB_WORKER_ENABLED:
+        check_in_job_worker.start()
+
     # Register Telegram authentication middleware
     app.before_request(validate_telegram_auth)
 
@@ -40,7 +55,7 @@ def create_app():
             r"/api/*": {
                 "origins": "*",
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization", "X-Telegram-Init-Data"]
+                "allow_headers": ["Content-Type", "Authorization", "X-Telegram-Init-Data", "Idempotency-Key"]
             }
         })
     else:
@@ -50,7 +65,7 @@ def create_app():
             r"/api/*": {
                 "origins": all_origins,
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization", "X-Telegram-Init-Data"]
+                "allow_headers": ["Content-Type", "Authorization", "X-Telegram-Init-Data", "Idempotency-Key"]
             }
         })
 
@@ -58,7 +73,31 @@ def create_app():
     app.config['UPLOAD_FOLDER'] = 'uploads/photos'
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-    # Configure Swagger
+    # Swagger UI; flasgger is only imported when the docs are enabled
+    if settings.API_DOCS_ENABLED:
+        _init_api_docs(app)
+
+    # Register blueprints
+    from .routes.checkin_routes import checkin_bp
+    from .routes.employee_routes import employee_bp
+    from .routes.auth_routes import auth_bp
+    from .routes.admin_group_routes import admin_group_bp
+    from .routes.webhook_routes import webhook_bp
+    from .routes.user_group_routes import user_group_bp
+    app.register_blueprint(checkin_bp, url_prefix='/api')
+    app.register_blueprint(employee_bp, url_prefix='/api')
+    app.register_blueprint(auth_bp)  # auth_bp already has /api/auth prefix
+    app.register_blueprint(admin_group_bp)  # admin_group_bp already has /api/admin/groups prefix
+    app.register_blueprint(webhook_bp)  # webhook_bp already has /api/webhooks prefix
+    app.register_blueprint(user_group_bp, url_prefix='/api')
+
+    return app
+
+
+def _init_api_docs(app):
+    """Serve the Swagger UI at /api-docs/ and the spec at /apispec.json"""
+    from flasgger import Swagger
+
     swagger_config = {
         "headers": [],
         "specs": [
@@ -131,19 +170,3 @@ def create_app():
     }
 
     Swagger(app, config=swagger_config, template=swagger_template)
-
-    # Register blueprints
-    from .routes.checkin_routes import checkin_bp
-    from .routes.employee_routes import employee_bp
-    from .routes.auth_routes import auth_bp
-    from .routes.admin_group_routes import admin_group_bp
-    from .routes.webhook_routes import webhook_bp
-    from .routes.user_group_routes import user_group_bp
-    app.register_blueprint(checkin_bp, url_prefix='/api')
-    app.register_blueprint(employee_bp, url_prefix='/api')
-    app.register_blueprint(auth_bp)  # auth_bp already has /api/auth prefix
-    app.register_blueprint(admin_group_bp)  # admin_group_bp already has /api/admin/groups prefix
-    app.register_blueprint(webhook_bp)  # webhook_bp already has /api/webhooks prefix
-    app.register_blueprint(user_group_bp, url_prefix='/api')
-
-    return app
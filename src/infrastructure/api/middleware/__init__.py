@@ -1,4 +1,6 @@
 from .telegram_auth import validate_telegram_auth
 from .jwt_auth import jwt_required_admin, optional_jwt_auth
+from .admin_principal_cache import admin_principal_cache
+from .idempotency import idempotent
 
-__all__ = ['validate_telegram_auth', 'jwt_required_admin', 'optional_jwt_auth']
+__all__ = ['validate_telegram_auth', 'jwt_required_admin', 'optional_jwt_auth', 'admin_principal_cache', 'idempotent']
@@ -0,0 +1,214 @@
+"""
+In-process cache of admin principals for JWT-protected endpoints
+
+Every admin portal request used to load the admin user from MongoDB after
+verifying the JWT. This cache keeps admin_users documents for a short TTL
+and invalidates them through a shared version counter:
+
+- Status and role changes go through update_admin() (used by
+  manage_admins.py), which calls invalidate(): it drops the local entry and
+  bumps `cache_versions.admin_users` in MongoDB. Login only refreshes profile
+  fields and calls clear_local(), so it does not flush every process.
+- Each process re-reads that version at most every
+  ADMIN_PRINCIPAL_VERSION_CHECK_INTERVAL seconds and clears its cache when
+  it changed, so a deactivation is seen by every API process quickly.
+- A MongoDB change stream on admin_users (replica sets only, on by
+  default) pushes invalidations as soon as a document changes, including
+  edits made directly in the database. Without it such edits are seen once
+  the cached entry expires (ADMIN_PRINCIPAL_CACHE_TTL).
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from pymongo.errors import PyMongoError
+
+from ...config.settings import settings
+from ...metrics.registry import cache_lookup_recorder
+from ...persistence.models import utc_now
+from ...persistence.mongodb_connection import mongodb
+from ...utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+VERSION_DOCUMENT_ID = 'admin_users'
+
+
+class AdminPrincipalCache:
+    """TTL cache of admin_users documents keyed by telegram_id, with versioned invalidation"""
+
+    def __init__(self, ttl: int, version_check_interval: int, maxsize: int = 256):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize, on_lookup=cache_lookup_recorder('admin_principal'))
+        self.version_check_interval = version_check_interval
+        self._version = None
+        self._last_version_check = 0.0
+        self._lock = threading.Lock()
+        self._change_stream_thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss counters of the underlying cache"""
+        return {'hits': self._cache.hits, 'misses': self._cache.misses, 'size': len(self._cache)}
+
+    def get_admin(self, telegram_id: str) -> Optional[dict]:
+        """
+        Get an admin_users document, from cache when possible
+
+        Missing admins are not cached so newly created admins work immediately.
+        The returned document is shared between requests and must not be mutated.
+
+        Args:
+            telegram_id: Admin Telegram ID (JWT identity)
+
+        Returns:
+            admin_users document or None
+        """
+        self._sync_version()
+
+        admin_user = self._cache.get(telegram_id)
+        if admin_user is not None:
+            return admin_user
+
+        db = mongodb.get_database()
+        admin_user = db.admin_users.find_one({"telegram_id": telegram_id})
+        if admin_user:
+            self._cache.set(telegram_id, admin_user)
+        return admin_user
+
+    def update_admin(self, telegram_id: str, status: Optional[str] = None, role: Optional[str] = None) -> bool:
+        """
+        Change an admin's status and/or role, then invalidate it in every API process
+
+        Args:
+            telegram_id: Admin Telegram ID
+            status: New status ('active' or 'inactive'), None to leave unchanged
+            role: New role, None to leave unchanged
+
+        Returns:
+            True if the admin exists
+        """
+        changes = {key: value for key, value in (('status', status), ('role', role)) if value is not None}
+        if not changes:
+            raise ValueError("Nothing to update: pass a status or a role")
+
+        db = mongodb.get_database()
+        result = db.admin_users.update_one(
+            {"telegram_id": telegram_id},
+            {"$set": {**changes, "updated_at": utc_now()}}
+        )
+        if not result.matched_count:
+            return False
+
+        self.invalidate(telegram_id)
+        return True
+
+    def invalidate(self, telegram_id: Optional[str] = None) -> None:
+        """
+        Invalidate one admin (or all admins) in every API process
+
+        Args:
+            telegram_id: Admin to drop locally; None clears the whole local cache
+        """
+        if telegram_id is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(telegram_id)
+
+        try:
+            db = mongodb.get_database()
+            db.cache_versions.update_one(
+                {"_id": VERSION_DOCUMENT_ID},
+                {"$inc": {"version": 1}},
+                upsert=True
+            )
+        except PyMongoError as e:
+            logger.warning(f"Failed to bump admin principal cache version: {e}")
+
+    def clear_local(self, telegram_id: Optional[str] = None) -> None:
+        """
+        Drop one admin (or all admins) from this process only, without bumping the shared version
+
+        For writes that leave status and role alone: other processes may serve
+        the old document until their entry expires, which cannot change an
+        authorization decision.
+
+        Args:
+            telegram_id: Admin to drop; None clears the whole local cache
+        """
+        if telegram_id is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(telegram_id)
+
+    def _sync_version(self) -> None:
+        """Clear the local cache if another process bumped the shared version"""
+        now = time.monotonic()
+        if now - self._last_version_check < self.version_check_interval:
+            return
+
+        with self._lock:
+            if now - self._last_version_check < self.version_check_interval:
+                return
+            self._last_version_check = now
+
+            try:
+                db = mongodb.get_database()
+                doc = db.cache_versions.find_one({"_id": VERSION_DOCUMENT_ID})
+            except PyMongoError as e:
+                logger.warning(f"Failed to read admin principal cache version: {e}")
+                return
+
+            version = doc.get('version', 0) if doc else 0
+            if self._version is not None and version != self._version:
+                logger.info(f"Admin principal cache version changed ({self._version} -> {version}), clearing")
+                self._cache.clear()
+            self._version = version
+
+    def start_change_stream(self) -> None:
+        """
+        Watch admin_users for changes in a background thread
+
+        Requires MongoDB to run as a replica set; on standalone servers the
+        watcher logs a warning and exits, leaving version polling in place.
+        """
+        if self._change_stream_thread and self._change_stream_thread.is_alive():
+            return
+
+        self._change_stream_thread = threading.Thread(
+            target=self._watch_admin_users,
+            name='admin-principal-change-stream',
+            daemon=True
+        )
+        self._change_stream_thread.start()
+
+    def _watch_admin_users(self) -> None:
+        retry_delay = 1
+        while True:
+            try:
+                db = mongodb.get_database()
+                with db.admin_users.watch(full_document='updateLookup') as stream:
+                    logger.info("Watching admin_users change stream for cache invalidation")
+                    retry_delay = 1
+                    for change in stream:
+                        telegram_id = (change.get('fullDocument') or {}).get('telegram_id')
+                        if telegram_id:
+                            self._cache.delete(telegram_id)
+                        else:
+                            # Deletes carry no document; drop everything
+                            self._cache.clear()
+            except PyMongoError as e:
+                if 'replica set' in str(e) or getattr(e, 'code', None) == 40573:
+                    logger.warning("admin_users change stream unavailable (not a replica set), using version polling")
+                    return
+                logger.warning(f"admin_users change stream interrupted: {e}; retrying in {retry_delay}s")
+                self._cache.clear()
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 60)
+
+
+admin_principal_cache = AdminPrincipalCache(
+    ttl=settings.ADMIN_PRINCIPAL_CACHE_TTL,
+    version_check_interval=settings.ADMIN_PRINCIPAL_VERSION_CHECK_INTERVAL
+)
@@ -0,0 +1,222 @@
+"""
+Idempotent POST handling for Mini App endpoints
+
+Clients on flaky mobile networks retry check-ins whose response was lost.
+Routes decorated with @idempotent remember the response for each
+idempotency key in MongoDB (`idempotency_keys`, expired by a TTL index) and
+return it again on a replay instead of recording a second check-in.
+
+The key comes from the `Idempotency-Key` header. Clients that cannot set
+headers may send a `nonce` form field instead; it is combined with the hash
+of the request's Telegram initData. Keys are scoped to the route and the
+Telegram user, so two users can never collide.
+
+Replays of a key still in flight get 409. Reusing a key with a different
+payload gets 422. Server errors (5xx) are not stored, so the client can
+retry them with the same key.
+"""
+
+import hashlib
+import logging
+from datetime import timedelta
+from functools import wraps
+from typing import Optional
+
+from flask import Response, g, jsonify, make_response, request
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from ...config.settings import settings
+from ...persistence.models import utc_now
+from ...persistence.mongodb_connection import mongodb
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+FILE_HASH_CHUNK_SIZE = 64 * 1024
+
+
+class IdempotencyStore:
+    """MongoDB-backed record of in-flight and completed idempotent requests"""
+
+    def __init__(self, ttl: int, lock_timeout: int):
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+
+    @property
+    def _collection(self):
+        return mongodb.get_database().idempotency_keys
+
+    def begin(self, key: str, fingerprint: str) -> Optional[dict]:
+        """
+        Claim a key for a new request
+
+        Returns:
+            None if the caller now owns the key, otherwise the existing record
+        """
+        now = utc_now()
+        try:
+            self._collection.insert_one({
+                '_id': key,
+                'fingerprint': fingerprint,
+                'status': 'in_progress',
+                'locked_at': now,
+                'expires_at': now + timedelta(seconds=self.ttl)
+            })
+            return None
+        except DuplicateKeyError:
+            pass
+
+        # Take over a record left behind by a crashed request
+        taken_over = self._collection.find_one_and_update(
+            {
+                '_id': key,
+                'fingerprint': fingerprint,
+                'status': 'in_progress',
+                'locked_at': {'$lt': now - timedelta(seconds=self.lock_timeout)}
+            },
+            {'$set': {'locked_at': now}}
+        )
+        if taken_over:
+            return None
+
+        return self._collection.find_one({'_id': key})
+
+    def complete(self, key: str, status_code: int, body: str, mimetype: str) -> None:
+        """Store the response to replay for this key"""
+        self._collection.update_one(
+            {'_id': key},
+            {'$set': {
+                'status': 'completed',
+                'response': {'status_code': status_code, 'body': body, 'mimetype': mimetype},
+                'expires_at': utc_now() + timedelta(seconds=self.ttl)
+            }}
+        )
+
+    def release(self, key: str) -> None:
+        """Forget a key whose request failed so it can be retried"""
+        self._collection.delete_one({'_id': key, 'status': 'in_progress'})
+
+
+idempotency_store = IdempotencyStore(
+    ttl=settings.IDEMPOTENCY_KEY_TTL,
+    lock_timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT
+)
+
+
+def get_idempotency_key() -> Optional[str]:
+    """Get the client's idempotency key from the header or initData hash + nonce"""
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if key:
+        return key.strip()
+
+    nonce = request.form.get('nonce')
+    telegram_data = getattr(g, 'telegram_data', None) or {}
+    if nonce and telegram_data.get('hash'):
+        return f"{telegram_data['hash']}:{nonce}"
+    return None
+
+
+def request_fingerprint() -> str:
+    """Hash of the request payload, used to reject a key reused for another request"""
+    hasher = hashlib.sha256()
+    hasher.update(request.path.encode())
+    for name, value in sorted(request.form.items(multi=True)):
+        if name != 'initData':
+            hasher.update(f"\x00{name}={value}".encode())
+    for name, file in sorted(request.files.items(multi=True), key=lambda item: (item[0], item[1].filename or '')):
+        hasher.update(f"\x00{name}:{file.filename}:".encode())
+        hasher.update(_file_digest(file.stream))
+    return hasher.hexdigest()
+
+
+def _file_digest(stream) -> bytes:
+    """SHA-256 of an uploaded file's content, leaving the stream at its start for the route"""
+    hasher = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(FILE_HASH_CHUNK_SIZE), b''):
+        hasher.update(chunk)
+    stream.seek(0)
+    return hasher.digest()
+
+
+def idempotent(fn):
+    """
+    Decorator replaying the stored response for a repeated idempotency key
+
+    Requests without a key are handled normally. If MongoDB is unavailable
+    the request is handled normally as well, without idempotency.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        client_key = get_idempotency_key()
+        if not client_key:
+            return fn(*args, **kwargs)
+
+        if len(client_key) > MAX_KEY_LENGTH:
+            return jsonify({
+                'success': False,
+                'error': f'{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters'
+            }), 400
+
+        user_scope = getattr(g, 'telegram_user_id', None) or request.form.get('telegram_user_id', '')
+        key = hashlib.sha256(f"{request.path}\x00{user_scope}\x00{client_key}".encode()).hexdigest()
+        fingerprint = request_fingerprint()
+
+        try:
+            existing = idempotency_store.begin(key, fingerprint)
+        except PyMongoError as e:
+            logger.warning(f"Idempotency store unavailable, handling request without it: {e}")
+            return fn(*args, **kwargs)
+
+        if existing:
+            if existing.get('fingerprint') != fingerprint:
+                return jsonify({
+                    'success': False,
+                    'error': f'{IDEMPOTENCY_HEADER} was already used for a different request'
+                }), 422
+            if existing.get('status') == 'completed':
+                stored = existing['response']
+                logger.info(f"Replaying stored response for idempotent request to {request.path}")
+                return Response(
+                    stored['body'],
+                    status=stored['status_code'],
+                    mimetype=stored['mimetype'],
+                    headers={REPLAYED_HEADER: 'true'}
+                )
+            response = jsonify({
+                'success': False,
+                'error': 'A request with this idempotency key is still being processed'
+            })
+            response.headers['Retry-After'] = '1'
+            return response, 409
+
+        try:
+            response = make_response(fn(*args, **kwargs))
+        except Exception:
+            _release(key)
+            raise
+
+        try:
+            if response.status_code >= 500:
+                _release(key)
+            else:
+                idempotency_store.complete(
+                    key,
+                    response.status_code,
+                    response.get_data(as_text=True),
+                    response.mimetype
+                )
+        except PyMongoError as e:
+            logger.warning(f"Failed to record idempotent response: {e}")
+        return response
+
+    return wrapper
+
+
+def _release(key: str) -> None:
+    try:
+        idempotency_store.release(key)
+    except PyMongoError as e:
+        logger.warning(f"Failed to release idempotency key: {e}")
@@ -13,7 +13,7 @@ from flask_jwt_extended.exceptions import NoAuthorizationError, InvalidHeaderErr
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 from ...config.settings import settings
-from ...persistence.mongodb_connection import mongodb
+from .admin_principal_cache import admin_principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -76,9 +76,8 @@ def jwt_required_admin(fn):
             # Get JWT claims
             jwt_data = get_jwt()
 
-            # Get admin user from MongoDB
-            db = mongodb.get_database()
-            admin_user = db.admin_users.find_one({"telegram_id": current_user_id})
+            # Get admin user (cached, falls back to MongoDB)
+            admin_user = admin_principal_cache.get_admin(current_user_id)
 
             if not admin_user:
                 logger.warning(f"Admin user not found: {current_user_id}")
@@ -139,8 +138,7 @@ def optional_jwt_auth(fn):
             current_user_id = get_jwt_identity()
 
             if current_user_id:
-                db = mongodb.get_database()
-                admin_user = db.admin_users.find_one({"telegram_id": current_user_id})
+                admin_user = admin_principal_cache.get_admin(current_user_id)
 
                 if admin_user and admin_user.get('status') == 'active':
                     g.current_admin = admin_user
@@ -10,6 +10,7 @@ from ...config.settings import settings
 from ...persistence.database import database
 from ...persistence.employee_repository_impl import EmployeeRepository
 from ...persistence.group_repository_impl import GroupRepository
+from ...metrics.registry import record_cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +176,16 @@ def get_employee_by_telegram_id_cached(telegram_id: str, cache_time: int):
         session.close()
 
 
+def _metered_lookup(cached_func, cache_name: str, *args):
+    """Call an lru_cache-wrapped lookup and report whether it was a cache hit (when metrics are on)"""
+    if not settings.METRICS_ENABLED:
+        return cached_func(*args)
+    misses_before = cached_func.cache_info().misses
+    result = cached_func(*args)
+    record_cache_lookup(cache_name, cached_func.cache_info().misses == misses_before)
+    return result
+
+
 @lru_cache(maxsize=500)
 def get_group_by_chat_id_cached(chat_id: str, cache_time: int):
     """
@@ -329,7 +340,9 @@ def validate_telegram_auth():
         cache_time = int(time.time() // settings.TELEGRAM_AUTH_CACHE_TTL)
 
         # Check if user exists in database
-        employee = get_employee_by_telegram_id_cached(telegram_user_id, cache_time)
+        employee = _metered_lookup(
+            get_employee_by_telegram_id_cached, 'telegram_auth_employee', telegram_user_id, cache_time
+        )
 
         if not employee:
             logger.warning(f"Unregistered user attempt: {telegram_user_id} for {request.path}")
@@ -347,7 +360,7 @@ def validate_telegram_auth():
             group_chat_id = request.form.get('group_chat_id')
 
         if group_chat_id:
-            group = get_group_by_chat_id_cached(group_chat_id, cache_time)
+            group = _metered_lookup(get_group_by_chat_id_cached, 'telegram_auth_group', group_chat_id, cache_time)
             if not group:
                 logger.warning(f"Invalid group_chat_id: {group_chat_id}")
                 return jsonify({"error": "Group not found"}), 404
@@ -358,7 +371,11 @@ def validate_telegram_auth():
         g.telegram_data = parsed_data
         g.telegram_user_id = telegram_user_id
 
-        logger.info(f"Authenticated user {employee.name} ({telegram_user_id}) for {request.path}")
+        # Logged on every request; sampled by LOG_SAMPLE_RATE
+        logger.info(
+            f"Authenticated user {employee.name} ({telegram_user_id}) for {request.path}",
+            extra={'sample': True}
+        )
 
         # Allow request to proceed
         return None
@@ -5,13 +5,18 @@ Read-only API endpoints for admin portal to view groups.
 Queries MySQL groups table (no duplication with MongoDB).
 """
 
-from flask import Blueprint, request, jsonify
+import json
+from datetime import datetime, timedelta
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from ....infrastructure.persistence.database import database
 from ....infrastructure.persistence.group_repository_impl import GroupRepository
 from ....infrastructure.persistence.mongodb_connection import mongodb
 from ..middleware.jwt_auth import jwt_required_admin
 from ...external.opnform_client import opnform_client
+from ...config.settings import settings
+from ...utils.pagination import encode_cursor, decode_cursor, parse_limit, parse_offset
 from bson import ObjectId
+from bson.errors import InvalidId
 import logging
 
 logger = logging.getLogger(__name__)
@@ -811,7 +816,7 @@ def get_webhook_url(group_id):
 @jwt_required_admin
 def get_group_submissions(group_id):
     """
-    Get form submissions for a group
+    Get form submissions for a group (cursor-paginated, newest first)
     ---
     tags:
       - Admin - Groups
@@ -827,12 +832,24 @@ def get_group_submissions(group_id):
         name: limit
         type: integer
         default: 50
-        description: Maximum number of results
+        description: Maximum number of results (max 200)
+      - in: query
+        name: cursor
+        type: string
+        description: Opaque cursor from the previous page's next_cursor
       - in: query
         name: offset
         type: integer
-        default: 0
-        description: Number of results to skip
+        description: Deprecated offset pagination, used only when no cursor is given
+      - in: query
+        name: include_data
+        type: boolean
+        default: false
+        description: Include the bulky submission_data field
+      - in: query
+        name: include_total
+        type: boolean
+        description: Count matching submissions (defaults to true on the first page only). Counts stop at SUBMISSIONS_COUNT_CAP
       - in: query
         name: start_date
         type: string
@@ -871,7 +888,7 @@ def get_group_submissions(group_id):
                         example: "sub-123"
                       submission_data:
                         type: object
-                        description: The actual form submission data from OpnForm
+                        description: The actual form submission data from OpnForm (only with include_data=true)
                       processing_status:
                         type: string
                         example: "received"
@@ -881,12 +898,20 @@ def get_group_submissions(group_id):
                 total:
                   type: integer
                   example: 100
+                  description: Matching submissions, null when not counted
+                total_is_capped:
+                  type: boolean
+                  example: false
+                  description: True when more than SUBMISSIONS_COUNT_CAP submissions match (total is then the cap, a lower bound)
                 limit:
                   type: integer
                   example: 50
-                offset:
-                  type: integer
-                  example: 0
+                has_more:
+                  type: boolean
+                  example: true
+                next_cursor:
+                  type: string
+                  example: "WyIyMDIzLTEyLTE0VDEwOjAwOjAwIiwiNjdzdWIxMjMiXQ"
                 group_id:
                   type: integer
                   example: 1
@@ -896,6 +921,8 @@ def get_group_submissions(group_id):
                 form_name:
                   type: string
                   example: "Registration Form"
+      400:
+        description: Invalid cursor, limit, offset or date
       404:
         description: Group not found
         schema:
@@ -909,24 +936,11 @@ def get_group_submissions(group_id):
               example: "Group not found"
     """
     try:
-        # Verify group exists in MySQL
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_id(group_id)
-
-        if not group:
-            session.close()
-            return jsonify({"success": False, "error": "Group not found"}), 404
-
-        # Get form configuration from MongoDB
-        db_mongo = mongodb.get_database()
-        form_config = db_mongo.form_configurations.find_one({
-            'telegram_group_chat_id': group.chat_id,
-            'is_active': True
-        })
+        group, form_config, error_response = _get_group_form_config(group_id)
+        if error_response:
+            return error_response
 
         if not form_config:
-            session.close()
             return jsonify({
                 "success": True,
                 "data": {
@@ -936,56 +950,63 @@ def get_group_submissions(group_id):
                 }
             }), 200
 
-        # Build query filter
-        query_filter = {'form_config_id': form_config['_id']}
-
-        # Date filters
-        from datetime import datetime
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-
-        if start_date or end_date:
-            query_filter['created_at'] = {}
-            if start_date:
-                query_filter['created_at']['$gte'] = datetime.fromisoformat(start_date)
-            if end_date:
-                # Add one day to include the end_date
-                end_datetime = datetime.fromisoformat(end_date)
-                from datetime import timedelta
-                query_filter['created_at']['$lt'] = end_datetime + timedelta(days=1)
-
-        # Get total count
-        total = db_mongo.form_submissions.count_documents(query_filter)
+        try:
+            query_filter = _build_submission_filter(form_config)
+            limit = parse_limit(request.args.get('limit'))
+            cursor = request.args.get('cursor')
+            keyset_filter = _decode_submission_cursor(cursor) if cursor else None
+            # Legacy offset pagination (O(offset) on deep pages) when no cursor is used
+            offset = None
+            if not cursor and request.args.get('offset') is not None:
+                offset = parse_offset(request.args.get('offset'))
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
 
-        # Pagination
-        limit = int(request.args.get('limit', 50))
-        offset = int(request.args.get('offset', 0))
+        db_mongo = mongodb.get_database()
 
-        # Get submissions
+        # Exact totals repeat the whole filter scan, so only count when asked
+        # (first page by default) and stop counting at a fixed cap
+        include_total = _parse_bool(request.args.get('include_total'), default=not cursor)
+        total = None
+        total_is_capped = False
+        if include_total:
+            count_cap = settings.SUBMISSIONS_COUNT_CAP
+            # Count one past the cap to tell "exactly cap" from "more than cap"
+            total = db_mongo.form_submissions.count_documents(query_filter, limit=count_cap + 1)
+            total_is_capped = total > count_cap
+            total = min(total, count_cap)
+
+        page_filter = {'$and': [query_filter, keyset_filter]} if keyset_filter else query_filter
+
+        # Fetch one extra document to know whether another page exists
         submissions = list(db_mongo.form_submissions.find(
-            query_filter,
-            sort=[('created_at', -1)],
-            skip=offset,
-            limit=limit
+            page_filter,
+            projection=_submission_projection(),
+            sort=SUBMISSION_SORT,
+            skip=offset or 0,
+            limit=limit + 1
         ))
+        has_more = len(submissions) > limit
+        submissions = submissions[:limit]
 
-        # Convert ObjectId to string
-        for sub in submissions:
-            sub['_id'] = str(sub['_id'])
-            if sub.get('form_config_id'):
-                sub['form_config_id'] = str(sub['form_config_id'])
-            if sub.get('created_at'):
-                sub['created_at'] = sub['created_at'].isoformat()
-
-        session.close()
+        next_cursor = None
+        if has_more:
+            last = submissions[-1]
+            next_cursor = encode_cursor([
+                last['created_at'].isoformat() if last.get('created_at') else None,
+                str(last['_id'])
+            ])
 
         return jsonify({
             "success": True,
             "data": {
-                "submissions": submissions,
+                "submissions": [_serialize_submission(sub) for sub in submissions],
                 "total": total,
+                "total_is_capped": total_is_capped,
                 "limit": limit,
                 "offset": offset,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
                 "group_id": group_id,
                 "group_name": group.name,
                 "form_name": form_config.get('form_name')
@@ -995,3 +1016,186 @@ def get_group_submissions(group_id):
     except Exception as e:
         logger.error(f"Error getting group submissions: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
+
+
+@admin_group_bp.route('/<int:group_id>/submissions/export', methods=['GET'])
+@jwt_required_admin
+def export_group_submissions(group_id):
+    """
+    Stream all form submissions for a group as NDJSON
+    ---
+    tags:
+      - Admin - Groups
+    security:
+      - Bearer: []
+    produces:
+      - application/x-ndjson
+    parameters:
+      - in: path
+        name: group_id
+        type: integer
+        required: true
+        description: Group ID (MySQL)
+      - in: query
+        name: include_data
+        type: boolean
+        default: true
+        description: Include the submission_data field
+      - in: query
+        name: start_date
+        type: string
+        format: date
+        description: Filter submissions from this date (YYYY-MM-DD)
+      - in: query
+        name: end_date
+        type: string
+        format: date
+        description: Filter submissions until this date (YYYY-MM-DD)
+    responses:
+      200:
+        description: One JSON submission per line, newest first
+      400:
+        description: Invalid date
+      404:
+        description: Group not found or no form linked
+    """
+    try:
+        group, form_config, error_response = _get_group_form_config(group_id)
+        if error_response:
+            return error_response
+
+        if not form_config:
+            return jsonify({"success": False, "error": "No form linked to this group"}), 404
+
+        try:
+            query_filter = _build_submission_filter(form_config)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+
+        projection = _submission_projection(default_include_data=True)
+        batch_size = settings.SUBMISSIONS_EXPORT_BATCH_SIZE
+
+        def generate():
+            # Server-side cursor: documents arrive batch_size at a time and are
+            # written out immediately, so memory use does not grow with the export
+            db_mongo = mongodb.get_database()
+            cursor = db_mongo.form_submissions.find(
+                query_filter,
+                projection=projection,
+                sort=SUBMISSION_SORT,
+                batch_size=batch_size
+            )
+            try:
+                for sub in cursor:
+                    yield json.dumps(_serialize_submission(sub), default=str, ensure_ascii=False) + '\n'
+            finally:
+                cursor.close()
+
+        filename = f"group-{group_id}-submissions.ndjson"
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
+
+    except Exception as e:
+        logger.error(f"Error exporting group submissions: {e}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+# Newest first; _id breaks ties so keyset pagination never skips or repeats documents
+SUBMISSION_SORT = [('created_at', -1), ('_id', -1)]
+
+
+def _get_group_form_config(group_id):
+    """
+    Load a MySQL group and its active MongoDB form configuration
+
+    Returns:
+        Tuple of (group, form_config, error_response); error_response is set
+        when the group does not exist
+    """
+    session = database.get_session()
+    try:
+        group = GroupRepository(session).find_by_id(group_id)
+    finally:
+        session.close()
+
+    if not group:
+        return None, None, (jsonify({"success": False, "error": "Group not found"}), 404)
+
+    db_mongo = mongodb.get_database()
+    form_config = db_mongo.form_configurations.find_one({
+        'telegram_group_chat_id': group.chat_id,
+        'is_active': True
+    })
+    return group, form_config, None
+
+
+def _build_submission_filter(form_config):
+    """Build the form_submissions filter for a form config and optional start/end dates"""
+    query_filter = {'form_config_id': form_config['_id']}
+
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+
+    if start_date or end_date:
+        query_filter['created_at'] = {}
+        if start_date:
+            query_filter['created_at']['$gte'] = datetime.fromisoformat(start_date)
+        if end_date:
+            # Add one day to include the end_date
+            end_datetime = datetime.fromisoformat(end_date)
+            query_filter['created_at']['$lt'] = end_datetime + timedelta(days=1)
+
+    return query_filter
+
+
+def _decode_submission_cursor(cursor):
+    """
+    Turn a submissions cursor into a filter for documents after (created_at, _id)
+
+    Documents without created_at sort after every dated one in the descending
+    order, so a dated cursor continues into them and a cursor taken among them
+    (created_at null) pages through them by _id alone.
+    """
+    values = decode_cursor(cursor)
+    try:
+        created_at, submission_id = values
+        submission_id = ObjectId(submission_id)
+        if created_at is None:
+            return {'created_at': None, '_id': {'$lt': submission_id}}
+        created_at = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError, InvalidId) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    return {'$or': [
+        {'created_at': {'$lt': created_at}},
+        {'created_at': created_at, '_id': {'$lt': submission_id}},
+        {'created_at': None}
+    ]}
+
+
+def _submission_projection(default_include_data=False):
+    """Exclude submission_data unless include_data=true"""
+    if _parse_bool(request.args.get('include_data'), default=default_include_data):
+        return None
+    return {'submission_data': 0}
+
+
+def _parse_bool(value, default):
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def _serialize_submission(sub):
+    """Convert ObjectIds and datetimes in a submission document to strings"""
+    sub['_id'] = str(sub['_id'])
+    if sub.get('form_config_id'):
+        sub['form_config_id'] = str(sub['form_config_id'])
+    if sub.get('customer_id'):
+        sub['customer_id'] = str(sub['customer_id'])
+    if sub.get('created_at'):
+        sub['created_at'] = sub['created_at'].isoformat()
+    return sub
@@ -23,6 +23,7 @@ from flask_jwt_extended import (
 from ...config.settings import settings
 from ...persistence.mongodb_connection import mongodb
 from ..middleware.jwt_auth import jwt_required_admin
+from ..middleware.admin_principal_cache import admin_principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -227,6 +228,10 @@ def telegram_login():
                 }
             )
 
+            # Only profile fields changed (status and role are untouched), so a
+            # local drop is enough; other processes refresh when their entry expires
+            admin_principal_cache.clear_local(user_id)
+
         # Check if user is active
         if admin_user.get('status') != 'active':
             logger.warning(f"Inactive admin user login attempt: {user_id}")
@@ -306,8 +311,7 @@ def refresh():
         identity = get_jwt_identity()
 
         # Verify user still exists and is active
-        db = mongodb.get_database()
-        admin_user = db.admin_users.find_one({"telegram_id": identity})
+        admin_user = admin_principal_cache.get_admin(identity)
 
         if not admin_user or admin_user.get('status') != 'active':
             return jsonify({"error": "Invalid or inactive user"}), 401
@@ -1,18 +1,30 @@
+from datetime import datetime
 from flask import Blueprint, request, jsonify
 from ....infrastructure.persistence.database import database
 from ....infrastructure.persistence.employee_repository_impl import EmployeeRepository
 from ....infrastructure.persistence.salary_advance_repository_impl import SalaryAdvanceRepository
 from ....infrastructure.persistence.allowance_repository_impl import AllowanceRepository
 from ....application.use_cases.register_employee import RegisterEmployeeUseCase
-from ....application.use_cases.get_employee_status import GetEmployeeStatusUseCase
+from ....application.use_cases.get_employee_status import GetEmployeeStatusUseCase, EmployeeStatusResponse
 from ....application.use_cases.record_allowance import RecordAllowanceUseCase
 from ....application.use_cases.record_salary_advance import RecordSalaryAdvanceUseCase
 from ....application.dto.employee_dto import RegisterEmployeeRequest
 from ....application.dto.allowance_dto import RecordAllowanceRequest
 from ....application.dto.salary_advance_dto import SalaryAdvanceRequest
+from ....infrastructure.config.settings import settings
+from ....infrastructure.metrics.registry import cache_lookup_recorder
+from ....infrastructure.utils.pagination import encode_cursor, decode_cursor, parse_limit, parse_offset
+from ....infrastructure.utils.timezone import ict_month_to_utc_range
+from ....infrastructure.utils.ttl_cache import TTLCache
 
 employee_bp = Blueprint('employee', __name__)
 
+# Status totals per (employee_id, period); invalidated when this process records advances/allowances.
+# Other API replicas keep their entries until the TTL expires, which bounds how stale totals can be.
+employee_status_cache = TTLCache(
+    ttl=settings.EMPLOYEE_STATUS_CACHE_TTL, maxsize=2048, on_lookup=cache_lookup_recorder('employee_status')
+)
+
 def get_repositories():
     """Get repository instances with a new session"""
     session = database.get_session()
@@ -26,7 +38,7 @@ def get_repositories():
 @employee_bp.route('/employees', methods=['GET'])
 def get_employees():
     """
-    Get all employees
+    Get employees (paginated, newest first)
     ---
     tags:
       - Employees
@@ -37,6 +49,23 @@ def get_employees():
         required: false
         description: Filter employees by Telegram chat ID (group chat ID)
         example: "-1001234567890"
+      - in: query
+        name: search
+        type: string
+        required: false
+        description: Filter employees by name (case-insensitive substring)
+        example: "John"
+      - in: query
+        name: limit
+        type: integer
+        required: false
+        default: 50
+        description: Page size (max 200)
+      - in: query
+        name: cursor
+        type: string
+        required: false
+        description: Opaque cursor from the previous page's pagination.next_cursor
     responses:
       200:
         description: Employees retrieved successfully
@@ -81,6 +110,20 @@ def get_employees():
                   created_at:
                     type: string
                     example: "2024-01-01T10:30:00"
+            pagination:
+              type: object
+              properties:
+                limit:
+                  type: integer
+                  example: 50
+                has_more:
+                  type: boolean
+                  example: true
+                next_cursor:
+                  type: string
+                  example: "WyIyMDI0LTAxLTAxVDEwOjMwOjAwIiwxMl0"
+      400:
+        description: Invalid limit or cursor
       404:
         description: Group not found
       500:
@@ -88,40 +131,49 @@ def get_employees():
     """
     try:
         chat_id = request.args.get('chat_id')
+        search = request.args.get('search')
+
+        try:
+            limit = parse_limit(request.args.get('limit'))
+            after = _decode_employee_cursor(request.args.get('cursor'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
 
         # Get repositories
         employee_repo, _, _, session = get_repositories()
 
         try:
             # If chat_id is provided, filter by group
+            group_id = None
             if chat_id:
-                from ....infrastructure.persistence.employee_group_repository_impl import EmployeeGroupRepository
                 from ....infrastructure.persistence.group_repository_impl import GroupRepository
 
-                group_repo = GroupRepository(session)
-                employee_group_repo = EmployeeGroupRepository(session)
-
                 # Find group by chat_id
-                group = group_repo.find_by_chat_id(str(chat_id))
+                group = GroupRepository(session).find_by_chat_id(str(chat_id))
                 if not group:
                     return jsonify({
                         'success': False,
                         'error': f'Group with chat_id {chat_id} not found'
                     }), 404
+                group_id = group.id
+
+            # Fetch one extra row to know whether another page exists
+            employees = employee_repo.find_page(
+                group_id=group_id,
+                search=search,
+                limit=limit + 1,
+                after=after
+            )
+            has_more = len(employees) > limit
+            employees = employees[:limit]
 
-                # Get all employee-group associations for this group
-                associations = employee_group_repo.find_by_group_id(group.id)
-                employee_ids = [assoc.employee_id for assoc in associations]
-
-                # Get employees by IDs
-                employees = []
-                for emp_id in employee_ids:
-                    emp = employee_repo.find_by_id(emp_id)
-                    if emp:
-                        employees.append(emp)
-            else:
-                # Get all employees
-                employees = employee_repo.find_all()
+            next_cursor = None
+            if has_more:
+                last = employees[-1]
+                next_cursor = encode_cursor([last.created_at.isoformat(), last.id])
 
             return jsonify({
                 'success': True,
@@ -139,7 +191,12 @@ def get_employees():
                         'created_at': emp.created_at.isoformat() if emp.created_at else None
                     }
                     for emp in employees
-                ]
+                ],
+                'pagination': {
+                    'limit': limit,
+                    'has_more': has_more,
+                    'next_cursor': next_cursor
+                }
             }), 200
 
         finally:
@@ -151,6 +208,17 @@ def get_employees():
             'error': f'Internal server error: {str(e)}'
         }), 500
 
+def _decode_employee_cursor(cursor):
+    """Decode an employee listing cursor into its (created_at, id) keyset"""
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        created_at, employee_id = values
+        return datetime.fromisoformat(created_at), int(employee_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 @employee_bp.route('/employees/register', methods=['POST'])
 def register_employee():
     """
@@ -337,6 +405,24 @@ def get_employee_status(employee_id):
         required: true
         description: Employee ID
         example: 1
+      - in: query
+        name: month
+        type: string
+        required: false
+        description: Only include history and totals for this ICT month (YYYY-MM)
+        example: "2024-05"
+      - in: query
+        name: limit
+        type: integer
+        required: false
+        default: 50
+        description: Page size for the salary_advances and allowances lists (max 200)
+      - in: query
+        name: offset
+        type: integer
+        required: false
+        default: 0
+        description: Number of history rows to skip in each list
     responses:
       200:
         description: Employee status retrieved successfully
@@ -413,12 +499,35 @@ def get_employee_status(employee_id):
                       type: number
                     total_compensation:
                       type: number
+                    salary_advance_count:
+                      type: integer
+                    allowance_count:
+                      type: integer
+                    month:
+                      type: string
+                pagination:
+                  type: object
+                  properties:
+                    limit:
+                      type: integer
+                    offset:
+                      type: integer
+      400:
+        description: Invalid month, limit or offset
       404:
         description: Employee not found
       500:
         description: Internal server error
     """
     try:
+        try:
+            period, month, limit, offset = _parse_status_query()
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
         # Get repositories
         employee_repo, salary_advance_repo, allowance_repo, session = get_repositories()
 
@@ -427,52 +536,16 @@ def get_employee_status(employee_id):
             use_case = GetEmployeeStatusUseCase(
                 employee_repo,
                 salary_advance_repo,
-                allowance_repo
+                allowance_repo,
+                status_cache=employee_status_cache
+            )
+            response = use_case.execute_by_id(
+                int(employee_id), period=period, limit=limit, offset=offset
             )
-            response = use_case.execute_by_id(int(employee_id))
 
             return jsonify({
                 'success': True,
-                'data': {
-                    'employee': {
-                        'id': response.id,
-                        'telegram_id': response.telegram_id,
-                        'name': response.name,
-                        'phone': response.phone,
-                        'role': response.role,
-                        'date_start_work': response.date_start_work,
-                        'probation_months': response.probation_months,
-                        'base_salary': response.base_salary,
-                        'bonus': response.bonus,
-                        'created_at': response.created_at
-                    },
-                    'salary_advances': [
-                        {
-                            'id': adv.id,
-                            'amount': adv.amount,
-                            'note': adv.note,
-                            'created_by': adv.created_by,
-                            'timestamp': adv.timestamp
-                        }
-                        for adv in response.salary_advances
-                    ],
-                    'allowances': [
-                        {
-                            'id': allow.id,
-                            'amount': allow.amount,
-                            'allowance_type': allow.allowance_type,
-                            'note': allow.note,
-                            'created_by': allow.created_by,
-                            'timestamp': allow.timestamp
-                        }
-                        for allow in response.allowances
-                    ],
-                    'summary': {
-                        'total_salary_advances': response.total_salary_advances,
-                        'total_allowances': response.total_allowances,
-                        'total_compensation': (response.base_salary or 0) + (response.bonus or 0) + response.total_allowances
-                    }
-                }
+                'data': _serialize_employee_status(response, month, limit, offset)
             }), 200
 
         finally:
@@ -503,6 +576,24 @@ def get_employee_status_by_telegram_id(telegram_id):
         required: true
         description: Telegram user ID
         example: "123456789"
+      - in: query
+        name: month
+        type: string
+        required: false
+        description: Only include history and totals for this ICT month (YYYY-MM)
+        example: "2024-05"
+      - in: query
+        name: limit
+        type: integer
+        required: false
+        default: 50
+        description: Page size for the salary_advances and allowances lists (max 200)
+      - in: query
+        name: offset
+        type: integer
+        required: false
+        default: 0
+        description: Number of history rows to skip in each list
     responses:
       200:
         description: Employee status retrieved successfully
@@ -512,6 +603,14 @@ def get_employee_status_by_telegram_id(telegram_id):
         description: Internal server error
     """
     try:
+        try:
+            period, month, limit, offset = _parse_status_query()
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
         # Get repositories
         employee_repo, salary_advance_repo, allowance_repo, session = get_repositories()
 
@@ -520,52 +619,16 @@ def get_employee_status_by_telegram_id(telegram_id):
             use_case = GetEmployeeStatusUseCase(
                 employee_repo,
                 salary_advance_repo,
-                allowance_repo
+                allowance_repo,
+                status_cache=employee_status_cache
+            )
+            response = use_case.execute_by_telegram_id(
+                str(telegram_id), period=period, limit=limit, offset=offset
             )
-            response = use_case.execute_by_telegram_id(str(telegram_id))
 
             return jsonify({
                 'success': True,
-                'data': {
-                    'employee': {
-                        'id': response.id,
-                        'telegram_id': response.telegram_id,
-                        'name': response.name,
-                        'phone': response.phone,
-                        'role': response.role,
-                        'date_start_work': response.date_start_work,
-                        'probation_months': response.probation_months,
-                        'base_salary': response.base_salary,
-                        'bonus': response.bonus,
-                        'created_at': response.created_at
-                    },
-                    'salary_advances': [
-                        {
-                            'id': adv.id,
-                            'amount': adv.amount,
-                            'note': adv.note,
-                            'created_by': adv.created_by,
-                            'timestamp': adv.timestamp
-                        }
-                        for adv in response.salary_advances
-                    ],
-                    'allowances': [
-                        {
-                            'id': allow.id,
-                            'amount': allow.amount,
-                            'allowance_type': allow.allowance_type,
-                            'note': allow.note,
-                            'created_by': allow.created_by,
-                            'timestamp': allow.timestamp
-                        }
-                        for allow in response.allowances
-                    ],
-                    'summary': {
-                        'total_salary_advances': response.total_salary_advances,
-                        'total_allowances': response.total_allowances,
-                        'total_compensation': (response.base_salary or 0) + (response.bonus or 0) + response.total_allowances
-                    }
-                }
+                'data': _serialize_employee_status(response, month, limit, offset)
             }), 200
 
         finally:
@@ -582,6 +645,71 @@ def get_employee_status_by_telegram_id(telegram_id):
             'error': f'Internal server error: {str(e)}'
         }), 500
 
+def _parse_status_query():
+    """Parse month/limit/offset query parameters of the status endpoints"""
+    month = request.args.get('month')
+    period = None
+    if month:
+        try:
+            month_start = datetime.strptime(month, '%Y-%m')
+        except ValueError:
+            raise ValueError(f"Invalid month '{month}', expected YYYY-MM")
+        period = ict_month_to_utc_range(month_start.year, month_start.month)
+
+    limit = parse_limit(request.args.get('limit'))
+    offset = parse_offset(request.args.get('offset'))
+    return period, month, limit, offset
+
+def _serialize_employee_status(response: EmployeeStatusResponse, month, limit, offset):
+    """Convert an EmployeeStatusResponse into the status endpoints' JSON payload"""
+    return {
+        'employee': {
+            'id': response.id,
+            'telegram_id': response.telegram_id,
+            'name': response.name,
+            'phone': response.phone,
+            'role': response.role,
+            'date_start_work': response.date_start_work,
+            'probation_months': response.probation_months,
+            'base_salary': response.base_salary,
+            'bonus': response.bonus,
+            'created_at': response.created_at
+        },
+        'salary_advances': [
+            {
+                'id': adv.id,
+                'amount': adv.amount,
+                'note': adv.note,
+                'created_by': adv.created_by,
+                'timestamp': adv.timestamp
+            }
+            for adv in response.salary_advances
+        ],
+        'allowances': [
+            {
+                'id': allow.id,
+                'amount': allow.amount,
+                'allowance_type': allow.allowance_type,
+                'note': allow.note,
+                'created_by': allow.created_by,
+                'timestamp': allow.timestamp
+            }
+            for allow in response.allowances
+        ],
+        'summary': {
+            'total_salary_advances': response.total_salary_advances,
+            'total_allowances': response.total_allowances,
+            'total_compensation': (response.base_salary or 0) + (response.bonus or 0) + response.total_allowances,
+            'salary_advance_count': response.salary_advance_count,
+            'allowance_count': response.allowance_count,
+            'month': month
+        },
+        'pagination': {
+            'limit': limit,
+            'offset': offset
+        }
+    }
+
 @employee_bp.route('/employees/<employee_id>/allowances', methods=['POST'])
 def record_allowance(employee_id):
     """
@@ -682,7 +810,7 @@ def record_allowance(employee_id):
 
         try:
             # Execute use case
-            use_case = RecordAllowanceUseCase(allowance_repo, employee_repo)
+            use_case = RecordAllowanceUseCase(allowance_repo, employee_repo, status_cache=employee_status_cache)
             response = use_case.execute(allowance_request)
 
             return jsonify({
@@ -809,7 +937,7 @@ def record_salary_advance(employee_id):
             )
 
             # Execute use case
-            use_case = RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo)
+            use_case = RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo, status_cache=employee_status_cache)
             response = use_case.execute(salary_advance_request)
 
             return jsonify({
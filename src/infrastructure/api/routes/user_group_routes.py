@@ -1,7 +1,6 @@
 from flask import Blueprint, jsonify, g
 from ....infrastructure.persistence.database import database
 from ....infrastructure.persistence.employee_group_repository_impl import EmployeeGroupRepository
-from ....infrastructure.persistence.group_repository_impl import GroupRepository
 from ....infrastructure.persistence.mongodb_connection import mongodb
 from ....infrastructure.external.opnform_client import opnform_client
 import logging
@@ -15,7 +14,6 @@ def get_repositories():
     session = database.get_session()
     return (
         EmployeeGroupRepository(session),
-        GroupRepository(session),
         session
     )
 
@@ -88,21 +86,17 @@ def get_user_groups():
         current_user = g.current_user
 
         # Get repositories
-        employee_group_repo, group_repo, session = get_repositories()
+        employee_group_repo, session = get_repositories()
 
         try:
-            # Get all employee_group records for this employee
-            employee_groups = employee_group_repo.find_by_employee_id(current_user.id)
-
-            # Fetch full group details for each enrollment
-            user_groups = []
-            for eg in employee_groups:
-                group = group_repo.find_by_id(eg.group_id)
-                if group:
-                    user_groups.append({
-                        'employee_group': eg,
-                        'group': group
-                    })
+            # Get all employee_group records joined with their groups in one query
+            user_groups = [
+                {
+                    'employee_group': eg,
+                    'group': group
+                }
+                for eg, group in employee_group_repo.find_by_employee_id_with_groups(current_user.id)
+            ]
 
             # Enrich with OpnForm data
             enriched_groups = _enrich_with_form_data(user_groups)
@@ -0,0 +1,108 @@
+"""
+Serving the API from a socket shared by several worker processes
+
+In supervisor mode the listening socket is bound once by the supervisor and
+inherited by every API replica, so the kernel spreads connections across the
+replicas and a restarting replica never closes the port. On SIGTERM a replica
+stops accepting connections and waits for its in-flight requests before it
+returns.
+"""
+
+import logging
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Optional
+
+from flask import Flask
+from werkzeug.serving import make_server
+from werkzeug.wsgi import ClosingIterator
+
+logger = logging.getLogger(__name__)
+
+
+def bind_socket(host: str, port: int, backlog: int = 128) -> socket.socket:
+    """Bind the listening socket in the supervisor, before the API replicas are forked"""
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class _InFlightRequests:
+    """WSGI middleware counting requests until their response body is closed"""
+
+    def __init__(self, app):
+        self.app = app
+        self._count = 0
+        self._idle = threading.Condition()
+
+    def __call__(self, environ, start_response):
+        with self._idle:
+            self._count += 1
+        try:
+            response = self.app(environ, start_response)
+        except BaseException:
+            self._finished()
+            raise
+        return ClosingIterator(response, [self._finished])
+
+    def _finished(self) -> None:
+        with self._idle:
+            self._count -= 1
+            self._idle.notify_all()
+
+    def wait_idle(self, timeout: float) -> int:
+        """Wait until no request is in flight; returns how many were still running at the timeout"""
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._count and time.monotonic() < deadline:
+                self._idle.wait(deadline - time.monotonic())
+            return self._count
+
+
+def serve(
+    app: Flask,
+    sock: socket.socket,
+    drain_timeout: float,
+    set_ready: Optional[Callable[[bool], None]] = None,
+    heartbeat: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    Serve `app` on the inherited socket until SIGTERM, then drain
+
+    Args:
+        app: Flask application
+        sock: Listening socket from bind_socket()
+        drain_timeout: Seconds to wait for in-flight requests after SIGTERM
+        set_ready: Readiness callback, called with True once serving and False on SIGTERM
+        heartbeat: Liveness callback, called from the accept loop about twice a second
+    """
+    in_flight = _InFlightRequests(app.wsgi_app)
+    app.wsgi_app = in_flight
+    host, port = sock.getsockname()[:2]
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    if heartbeat:
+        # serve_forever() calls service_actions() on every poll, so beats stop if the loop does
+        server.service_actions = heartbeat
+
+    def on_sigterm(signum, frame):
+        if set_ready:
+            set_ready(False)
+        # shutdown() waits for serve_forever(), which this (main) thread is running
+        threading.Thread(target=server.shutdown, name="APIShutdown", daemon=True).start()
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+    if set_ready:
+        set_ready(True)
+    try:
+        server.serve_forever()
+    finally:
+        remaining = in_flight.wait_idle(drain_timeout)
+        if remaining:
+            logger.warning(f"Stopping with {remaining} request(s) still in flight after {drain_timeout:.0f}s")
+        server.server_close()
@@ -16,6 +16,11 @@ class Settings:
     DB_PASSWORD: str = os.getenv('DB_PASSWORD', '')
     DB_NAME: str = os.getenv('DB_NAME', 'office_automation')
 
+    # Connection pool per process; size it with benchmarks/load_checkin.py before changing
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', '5'))
+    DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT: int = int(os.getenv('DB_POOL_TIMEOUT', '30'))  # seconds to wait for a free connection
+
     @property
     def DATABASE_URL(self) -> str:
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -31,11 +36,20 @@ class Settings:
     JWT_REFRESH_TOKEN_EXPIRES: int = int(os.getenv('JWT_REFRESH_TOKEN_EXPIRES', '2592000'))  # 30 days in seconds
     JWT_ALGORITHM: str = os.getenv('JWT_ALGORITHM', 'HS256')
 
+    # Admin principal cache for JWT-protected admin endpoints (per API process)
+    ADMIN_PRINCIPAL_CACHE_TTL: int = int(os.getenv('ADMIN_PRINCIPAL_CACHE_TTL', '60'))  # seconds
+    ADMIN_PRINCIPAL_VERSION_CHECK_INTERVAL: int = int(os.getenv('ADMIN_PRINCIPAL_VERSION_CHECK_INTERVAL', '5'))  # seconds
+    ADMIN_PRINCIPAL_CHANGE_STREAM: bool = os.getenv('ADMIN_PRINCIPAL_CHANGE_STREAM', 'true').lower() == 'true'
+
     # Admin portal configuration
     ADMIN_TELEGRAM_IDS: str = os.getenv('ADMIN_TELEGRAM_IDS', '570671598')  # Comma-separated list of admin Telegram IDs
     ADMIN_PORTAL_URL: str = os.getenv('ADMIN_PORTAL_URL', 'http://localhost:3000')
     CORS_ALLOWED_ORIGINS: str = os.getenv('CORS_ALLOWED_ORIGINS', '*')
 
+    # Admin form submission listing/export
+    SUBMISSIONS_COUNT_CAP: int = int(os.getenv('SUBMISSIONS_COUNT_CAP', '10000'))  # Stop exact counts here
+    SUBMISSIONS_EXPORT_BATCH_SIZE: int = int(os.getenv('SUBMISSIONS_EXPORT_BATCH_SIZE', '500'))
+
     # OpnForm integration
     # Default mirrors the expected request pattern:
     # curl --request GET https://api.opnform.com/open/workspaces/<workspace_id>/forms \
@@ -58,6 +72,66 @@ class Settings:
     TELEGRAM_RATE_LIMIT_WINDOW: int = int(os.getenv('TELEGRAM_RATE_LIMIT_WINDOW', '60'))  # seconds
     TELEGRAM_AUTH_EXEMPT_PATHS: str = os.getenv('TELEGRAM_AUTH_EXEMPT_PATHS', '/health,/api-docs,/metrics,/api/auth,/api/admin,/api/webhooks')
 
+    # Bot API endpoint for API-side notifications (a local Bot API server or a load-test fake)
+    TELEGRAM_BOT_API_URL: str = os.getenv('TELEGRAM_BOT_API_URL', 'https://api.telegram.org/bot')
+
+    # Check-in photo storage
+    PHOTO_UPLOAD_DIR: str = os.getenv('PHOTO_UPLOAD_DIR', 'uploads/photos')
+    PHOTO_URL_PREFIX: str = os.getenv('PHOTO_URL_PREFIX', '/uploads/photos')  # URL path PHOTO_UPLOAD_DIR is served under
+    PHOTO_MAX_DIMENSION: int = int(os.getenv('PHOTO_MAX_DIMENSION', '1600'))  # Longest side in pixels
+    PHOTO_FORMAT: str = os.getenv('PHOTO_FORMAT', 'WEBP')  # WEBP or JPEG
+    PHOTO_QUALITY: int = int(os.getenv('PHOTO_QUALITY', '80'))
+    PHOTO_STAGING_DIR: str = os.getenv('PHOTO_STAGING_DIR', 'uploads/staging')  # Raw uploads awaiting processing
+
+    # Check-in post-processing jobs (photo resize, group notification)
+    CHECKIN_JOB_WORKER_ENABLED: bool = os.getenv('CHECKIN_JOB_WORKER_ENABLED', 'true').lower() == 'true'
+    CHECKIN_JOB_POLL_INTERVAL: float = float(os.getenv('CHECKIN_JOB_POLL_INTERVAL', '5'))  # seconds
+    CHECKIN_JOB_MAX_ATTEMPTS: int = int(os.getenv('CHECKIN_JOB_MAX_ATTEMPTS', '5'))
+    CHECKIN_JOB_STALE_AFTER: int = int(os.getenv('CHECKIN_JOB_STALE_AFTER', '300'))  # Reclaim jobs stuck in processing
+
+    # Idempotent check-in requests (Idempotency-Key header)
+    IDEMPOTENCY_KEY_TTL: int = int(os.getenv('IDEMPOTENCY_KEY_TTL', '86400'))  # Replay window, seconds
+    IDEMPOTENCY_LOCK_TIMEOUT: int = int(os.getenv('IDEMPOTENCY_LOCK_TIMEOUT', '60'))  # Take over abandoned keys after
+
+    # Employee status summary cache (per API process). Writes only invalidate the
+    # process that handled them, so other API replicas may serve totals up to this stale
+    EMPLOYEE_STATUS_CACHE_TTL: int = int(os.getenv('EMPLOYEE_STATUS_CACHE_TTL', '60'))  # seconds
+
+    # Group and vehicle lookup caches (per bot process)
+    BOT_GROUP_CACHE_TTL: int = int(os.getenv('BOT_GROUP_CACHE_TTL', '300'))  # seconds
+    BOT_VEHICLE_CACHE_TTL: int = int(os.getenv('BOT_VEHICLE_CACHE_TTL', '300'))  # seconds
+
+    # Prometheus metrics (/metrics on the API server)
+    METRICS_ENABLED: bool = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    # Shared directory for metrics of all processes started by main.py; empty = this process only
+    PROMETHEUS_MULTIPROC_DIR: str = os.getenv('PROMETHEUS_MULTIPROC_DIR', '')
+
+    # Development query profiler: logs every request's queries and flags N+1 loops
+    DB_PROFILING_ENABLED: bool = os.getenv('DB_PROFILING_ENABLED', 'false').lower() == 'true'
+    # Executions of one statement (with varying parameters) that count as a likely N+1
+    DB_PROFILING_N_PLUS_ONE_THRESHOLD: int = int(os.getenv('DB_PROFILING_N_PLUS_ONE_THRESHOLD', '3'))
+
+    # Bot conversation state persistence (bot_persistence table)
+    BOT_PERSISTENCE_ENABLED: bool = os.getenv('BOT_PERSISTENCE_ENABLED', 'true').lower() == 'true'
+    BOT_PERSISTENCE_UPDATE_INTERVAL: int = int(os.getenv('BOT_PERSISTENCE_UPDATE_INTERVAL', '30'))  # Flush every N seconds
+
+    # Startup profile: "full" creates missing tables and MongoDB indexes on every start; "fast" skips
+    # create_all while Alembic reports the schema at head and index creation while the index set is unchanged
+    STARTUP_PROFILE: str = os.getenv('STARTUP_PROFILE', 'full').lower()
+    # Swagger UI at /api-docs/ (flasgger); off by default in the fast profile
+    API_DOCS_ENABLED: bool = os.getenv('API_DOCS_ENABLED', 'false' if STARTUP_PROFILE == 'fast' else 'true').lower() == 'true'
+
+    # Supervisor mode for main.py: restarts crashed processes, probes, graceful drain on SIGTERM
+    SUPERVISOR_ENABLED: bool = os.getenv('SUPERVISOR_ENABLED', 'false').lower() == 'true'
+    # Replicas per component, e.g. "api=4,checkin_worker=1" (defaults: one of each bot, one API, no checkin_worker)
+    SUPERVISOR_REPLICAS: str = os.getenv('SUPERVISOR_REPLICAS', '')
+    SUPERVISOR_PROBE_HOST: str = os.getenv('SUPERVISOR_PROBE_HOST', '127.0.0.1')
+    SUPERVISOR_PROBE_PORT: int = int(os.getenv('SUPERVISOR_PROBE_PORT', '8081'))  # /livez and /readyz
+    SUPERVISOR_HEARTBEAT_TIMEOUT: float = float(os.getenv('SUPERVISOR_HEARTBEAT_TIMEOUT', '30'))  # seconds
+    SUPERVISOR_RESTART_BACKOFF_MAX: float = float(os.getenv('SUPERVISOR_RESTART_BACKOFF_MAX', '60'))  # seconds
+    SUPERVISOR_DRAIN_TIMEOUT: float = float(os.getenv('SUPERVISOR_DRAIN_TIMEOUT', '30'))  # seconds after SIGTERM
+    SUPERVISOR_KILL_GRACE: float = float(os.getenv('SUPERVISOR_KILL_GRACE', '10'))  # SIGTERM to SIGKILL for a stuck replica
+
     ADMIN_IDS: list[int] = []
 
     @classmethod
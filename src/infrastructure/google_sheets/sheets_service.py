@@ -1,5 +1,3 @@
-import gspread
-from google.oauth2.service_account import Credentials
 from datetime import datetime, timezone, timedelta
 from ..config.settings import settings
 
@@ -14,6 +12,11 @@ class GoogleSheetsService:
     def _authenticate(self):
         """Authenticate with Google Sheets API"""
         if self.client is None:
+            # gspread and google-auth take a noticeable part of the bot's startup; load them on first use
+            import gspread
+            from google.oauth2.service_account import Credentials
+            from ..metrics.sheets_metrics import MeteredHTTPClient
+
             scopes = [
                 'https://www.googleapis.com/auth/spreadsheets',
                 'https://www.googleapis.com/auth/drive'
@@ -22,7 +25,7 @@ class GoogleSheetsService:
                 self.credentials_file,
                 scopes=scopes
             )
-            self.client = gspread.authorize(creds)
+            self.client = gspread.authorize(creds, http_client=MeteredHTTPClient)
         return self.client
 
     def _escape_html(self, text: str) -> str:
@@ -0,0 +1,20 @@
+"""
+Prometheus metrics for the API server and the bots
+
+Integration-specific hooks live in their own modules (flask_metrics,
+sqlalchemy_metrics, mongo_metrics, telegram_metrics, sheets_metrics) so a
+process only imports the libraries it actually uses.
+"""
+
+from .registry import cache_lookup_recorder, record_cache_lookup, render_latest, reset_multiprocess_dir
+from .request_stats import QueryStats, current_query_stats, track_queries
+
+__all__ = [
+    'cache_lookup_recorder',
+    'record_cache_lookup',
+    'render_latest',
+    'reset_multiprocess_dir',
+    'QueryStats',
+    'current_query_stats',
+    'track_queries',
+]
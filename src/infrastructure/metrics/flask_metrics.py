@@ -0,0 +1,78 @@
+"""Request instrumentation, query profiling and the /metrics endpoint for the Flask API"""
+
+import time
+
+from flask import Flask, Response, g, request
+
+from .registry import db_queries_per_request, db_time_per_request, http_request_duration, render_latest
+from .query_profiler import log_profile, start_profiling, stop_profiling
+from .request_stats import current_query_stats, start_tracking, stop_tracking
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Time every request and serve /metrics
+
+    Register before any other before_request hook so authentication is
+    included in the measured latency.
+    """
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.teardown_request(_end_request)
+    app.add_url_rule('/metrics', 'metrics', _metrics_view, methods=['GET'])
+
+
+def init_query_profiling(app: Flask) -> None:
+    """Log the queries of every request and flag likely N+1 loops (development only)"""
+    app.before_request(_start_profiling)
+    app.teardown_request(_end_profiling)
+
+
+def _route_label() -> str:
+    # The rule template (/api/admin/groups/<int:group_id>) keeps label cardinality bounded
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+def _start_request() -> None:
+    g._metrics_start = time.perf_counter()
+    g._metrics_stats_token = start_tracking()
+
+
+def _record_request(response: Response) -> Response:
+    start = g.pop('_metrics_start', None)
+    if start is None or request.endpoint == 'metrics':
+        return response
+
+    route = _route_label()
+    http_request_duration.labels(
+        method=request.method,
+        route=route,
+        status=str(response.status_code)
+    ).observe(time.perf_counter() - start)
+
+    stats = current_query_stats()
+    if stats is not None:
+        db_queries_per_request.labels(source='api', route=route).observe(stats.count)
+        db_time_per_request.labels(source='api', route=route).observe(stats.duration)
+    return response
+
+
+def _end_request(exc) -> None:
+    token = g.pop('_metrics_stats_token', None)
+    if token is not None:
+        stop_tracking(token)
+
+
+def _start_profiling() -> None:
+    g._profile_token = start_profiling(f"{request.method} {request.path}")
+
+
+def _end_profiling(exc) -> None:
+    token = g.pop('_profile_token', None)
+    if token is not None:
+        log_profile(stop_profiling(token))
+
+
+def _metrics_view() -> Response:
+    body, content_type = render_latest()
+    return Response(body, mimetype=None, content_type=content_type)
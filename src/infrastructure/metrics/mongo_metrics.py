@@ -0,0 +1,44 @@
+"""pymongo command monitoring: latency metrics and query profiling"""
+
+from pymongo import monitoring
+
+from .query_profiler import current_profile
+from .registry import mongo_command_duration
+
+# Session and cluster bookkeeping that differs between otherwise identical commands
+_IGNORED_COMMAND_FIELDS = ('lsid', 'txnNumber', '$db', '$clusterTime', '$readPreference')
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Records the duration of every MongoDB command; pass it in MongoClient(event_listeners=...)"""
+
+    def __init__(self):
+        # request_id -> (statement, parameters) of commands started inside a profile
+        self._profiled = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if current_profile() is None:
+            return
+        command = event.command
+        statement = f"{event.command_name} {command.get(event.command_name, '')}".strip()
+        parameters = {
+            key: value for key, value in command.items()
+            if key != event.command_name and key not in _IGNORED_COMMAND_FIELDS
+        }
+        self._profiled[event.request_id] = (statement, parameters)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        duration = event.duration_micros / 1_000_000
+        mongo_command_duration.labels(command=event.command_name, status='ok').observe(duration)
+        self._record_profile(event, duration)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        duration = event.duration_micros / 1_000_000
+        mongo_command_duration.labels(command=event.command_name, status='error').observe(duration)
+        self._record_profile(event, duration)
+
+    def _record_profile(self, event, duration: float) -> None:
+        profiled = self._profiled.pop(event.request_id, None)
+        profile = current_profile()
+        if profiled is not None and profile is not None:
+            profile.add('mongo', profiled[0], profiled[1], duration)
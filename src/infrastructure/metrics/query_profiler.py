@@ -0,0 +1,149 @@
+"""
+Development query profiler: per-request query log and N+1 detection
+
+With DB_PROFILING_ENABLED every SQL statement and MongoDB command executed
+while handling an API request or bot update is recorded. When the request
+ends a summary is logged with the query count, total DB time and the
+slowest statement. Statements repeated with different parameters (a
+find_by_id inside a for loop) are flagged as likely N+1 queries.
+
+assert_max_queries() uses the same recording to fail tests that exceed a
+query budget.
+"""
+
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_current_profile: ContextVar[Optional['QueryProfile']] = ContextVar('query_profile', default=None)
+
+
+@dataclass
+class QueryRecord:
+    kind: str  # 'sql' or 'mongo'
+    statement: str
+    parameters: Any
+    duration: float
+
+
+@dataclass
+class QueryProfile:
+    """Queries recorded for one request, update or test block"""
+    label: str = ''
+    records: List[QueryRecord] = field(default_factory=list)
+    parent: Optional['QueryProfile'] = None
+
+    def add(self, kind: str, statement: str, parameters: Any, duration: float) -> None:
+        record = QueryRecord(kind, statement, parameters, duration)
+        # Enclosing profiles (a test budget around a request) see nested queries too
+        profile = self
+        while profile is not None:
+            profile.records.append(record)
+            profile = profile.parent
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    @property
+    def total_duration(self) -> float:
+        return sum(record.duration for record in self.records)
+
+    @property
+    def slowest(self) -> Optional[QueryRecord]:
+        return max(self.records, key=lambda record: record.duration, default=None)
+
+    def repeated_statements(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(statement, executions) for statements run at least threshold times with varying parameters"""
+        threshold = threshold or settings.DB_PROFILING_N_PLUS_ONE_THRESHOLD
+        executions: Dict[Tuple[str, str], int] = defaultdict(int)
+        distinct_parameters: Dict[Tuple[str, str], set] = defaultdict(set)
+        for record in self.records:
+            key = (record.kind, record.statement)
+            executions[key] += 1
+            distinct_parameters[key].add(repr(record.parameters))
+
+        return [
+            (statement, count)
+            for (kind, statement), count in executions.items()
+            if count >= threshold and len(distinct_parameters[(kind, statement)]) > 1
+        ]
+
+    def summary(self) -> str:
+        sql_count = sum(1 for record in self.records if record.kind == 'sql')
+        lines = [
+            f"{self.label or 'queries'}: {self.count} queries "
+            f"({sql_count} SQL, {self.count - sql_count} Mongo) in {self.total_duration * 1000:.1f} ms"
+        ]
+        slowest = self.slowest
+        if slowest is not None:
+            lines.append(f"  slowest ({slowest.duration * 1000:.1f} ms): {_shorten(slowest.statement)}")
+        for statement, count in self.repeated_statements():
+            lines.append(f"  possible N+1, {count}x: {_shorten(statement)}")
+        return '\n'.join(lines)
+
+
+def _shorten(statement: str, limit: int = 300) -> str:
+    statement = ' '.join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + '...'
+
+
+def current_profile() -> Optional[QueryProfile]:
+    """Profile of the request or update being handled, if profiling"""
+    return _current_profile.get()
+
+
+def start_profiling(label: str = '') -> Token:
+    """Open a profile nested in the current one; pass the token to stop_profiling()"""
+    return _current_profile.set(QueryProfile(label=label, parent=_current_profile.get()))
+
+
+def stop_profiling(token: Token) -> QueryProfile:
+    """Close the profile opened by start_profiling() and return it"""
+    profile = _current_profile.get()
+    _current_profile.reset(token)
+    return profile
+
+
+@contextmanager
+def profile_queries(label: str = '') -> Iterator[QueryProfile]:
+    """Record the queries executed inside the block"""
+    token = start_profiling(label)
+    try:
+        yield _current_profile.get()
+    finally:
+        stop_profiling(token)
+
+
+def log_profile(profile: QueryProfile) -> None:
+    """Log the profile summary; a warning when it contains likely N+1 queries"""
+    if not profile.records:
+        return
+    if profile.repeated_statements():
+        logger.warning(profile.summary())
+    else:
+        logger.info(profile.summary())
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, label: str = '') -> Iterator[QueryProfile]:
+    """
+    Fail with AssertionError if the block runs more than max_queries queries
+
+    Only engines passed through instrument_engine() and Mongo clients with
+    MongoCommandMetrics are seen. The error lists the profile summary.
+    """
+    with profile_queries(label) as profile:
+        yield profile
+    if profile.count > max_queries:
+        statements = '\n'.join(f"  {_shorten(record.statement, 120)}" for record in profile.records)
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {profile.count}\n{profile.summary()}\n{statements}"
+        )
@@ -0,0 +1,142 @@
+"""
+Metric definitions shared by the API server and the bots
+
+main.py runs the API and both bots as separate processes, but only the API
+serves /metrics. When PROMETHEUS_MULTIPROC_DIR is set, prometheus_client
+runs in multiprocess mode: every process writes its samples to files in that
+directory and /metrics aggregates all of them. Without it, /metrics reports
+the API process only.
+
+The directory must be set before prometheus_client is first imported, which
+is why every metric lives here and settings is imported first.
+"""
+
+import glob
+import os
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+from ..config.settings import settings
+
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    os.makedirs(settings.PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', settings.PROMETHEUS_MULTIPROC_DIR)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess  # noqa: E402
+
+# Fast paths (cache hits, single queries) sit in the low buckets; report exports in the high ones
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100, 250)
+
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    'API request latency by blueprint route',
+    ['method', 'route', 'status'],
+    buckets=LATENCY_BUCKETS
+)
+
+db_query_duration = Histogram(
+    'db_query_duration_seconds',
+    'SQL statement execution time',
+    ['operation'],
+    buckets=QUERY_BUCKETS
+)
+
+db_queries_per_request = Histogram(
+    'db_queries_per_request',
+    'SQL statements executed while handling one API request or bot update',
+    ['source', 'route'],
+    buckets=QUERY_COUNT_BUCKETS
+)
+
+db_time_per_request = Histogram(
+    'db_time_per_request_seconds',
+    'Total SQL time spent while handling one API request or bot update',
+    ['source', 'route'],
+    buckets=LATENCY_BUCKETS
+)
+
+mongo_command_duration = Histogram(
+    'mongo_command_duration_seconds',
+    'MongoDB command round-trip time',
+    ['command', 'status'],
+    buckets=QUERY_BUCKETS
+)
+
+telegram_api_duration = Histogram(
+    'telegram_api_request_duration_seconds',
+    'Telegram Bot API call latency (getUpdates long polling excluded)',
+    ['method'],
+    buckets=LATENCY_BUCKETS
+)
+
+telegram_api_errors = Counter(
+    'telegram_api_errors_total',
+    'Telegram Bot API calls that failed or returned an error status',
+    ['method']
+)
+
+sheets_api_requests = Counter(
+    'sheets_api_requests_total',
+    'Google Sheets / Drive API calls',
+    ['method', 'status']
+)
+
+sheets_api_duration = Histogram(
+    'sheets_api_request_duration_seconds',
+    'Google Sheets / Drive API call latency',
+    ['method'],
+    buckets=LATENCY_BUCKETS
+)
+
+cache_lookups = Counter(
+    'cache_lookups_total',
+    'In-process cache lookups by result',
+    ['cache', 'result']
+)
+
+bot_handler_duration = Histogram(
+    'bot_handler_duration_seconds',
+    'Bot update handling time per handler callback',
+    ['bot', 'handler', 'status'],
+    buckets=LATENCY_BUCKETS
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one lookup in a named in-process cache"""
+    cache_lookups.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+
+def cache_lookup_recorder(cache: str) -> Optional[Callable[[bool], None]]:
+    """TTLCache on_lookup hook counting lookups under this cache name, or None when metrics are off"""
+    if not settings.METRICS_ENABLED:
+        return None
+    return partial(record_cache_lookup, cache)
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """Current metrics in the Prometheus text format, with its content type"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def reset_multiprocess_dir() -> None:
+    """Remove samples left by earlier runs; call once before starting the worker processes"""
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if not directory:
+        return
+    for path in glob.glob(os.path.join(directory, '*.db')):
+        os.remove(path)
@@ -0,0 +1,48 @@
+"""
+Per-request database statistics
+
+An API request or bot update opens a QueryStats scope; the SQLAlchemy
+listeners add every statement executed in that context to it. Threads and
+asyncio tasks each see their own scope through a ContextVar.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+_current_stats: ContextVar[Optional['QueryStats']] = ContextVar('query_stats', default=None)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statistics of the request or update being handled, if any"""
+    return _current_stats.get()
+
+
+def start_tracking() -> Token:
+    """Open a statistics scope; pass the token to stop_tracking()"""
+    return _current_stats.set(QueryStats())
+
+
+def stop_tracking(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statistics for the statements executed inside the block"""
+    token = start_tracking()
+    try:
+        yield _current_stats.get()
+    finally:
+        stop_tracking(token)
@@ -0,0 +1,27 @@
+"""Google Sheets instrumentation: API call counts and latency"""
+
+import time
+
+from gspread.exceptions import APIError
+from gspread.http_client import HTTPClient
+
+from .registry import sheets_api_duration, sheets_api_requests
+
+
+class MeteredHTTPClient(HTTPClient):
+    """gspread HTTP client counting every Sheets/Drive API call; pass as gspread.authorize(http_client=...)"""
+
+    def request(self, method: str, endpoint: str, *args, **kwargs):
+        method = method.upper()
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            response = super().request(method, endpoint, *args, **kwargs)
+            status = str(response.status_code)
+            return response
+        except APIError as e:
+            status = str(e.response.status_code)
+            raise
+        finally:
+            sheets_api_duration.labels(method=method).observe(time.perf_counter() - start)
+            sheets_api_requests.labels(method=method, status=status).inc()
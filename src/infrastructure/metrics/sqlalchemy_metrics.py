@@ -0,0 +1,42 @@
+"""SQLAlchemy engine instrumentation: statement timings, per-request counts and profiling"""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .registry import db_query_duration
+from .query_profiler import current_profile
+from .request_stats import current_query_stats
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed through the engine"""
+    if getattr(engine, '_metrics_instrumented', False):
+        return
+    engine._metrics_instrumented = True
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['query_start_time'].pop()
+        db_query_duration.labels(operation=statement_operation(statement)).observe(duration)
+
+        stats = current_query_stats()
+        if stats is not None:
+            stats.add(duration)
+
+        profile = current_profile()
+        if profile is not None:
+            profile.add('sql', statement, parameters, duration)
+
+
+def statement_operation(statement: str) -> str:
+    """Leading SQL keyword (SELECT, INSERT, ...), used as a low-cardinality label"""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ''
+    if keyword in ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH'):
+        return keyword
+    return 'OTHER'
@@ -0,0 +1,91 @@
+"""Telegram instrumentation: Bot API call latency and bot handler timings"""
+
+import functools
+import time
+
+from telegram.ext import Application, BaseHandler, ConversationHandler
+from telegram.request import HTTPXRequest
+
+from .query_profiler import log_profile, profile_queries
+from .registry import (
+    bot_handler_duration,
+    db_queries_per_request,
+    db_time_per_request,
+    telegram_api_duration,
+    telegram_api_errors,
+)
+from .request_stats import track_queries
+
+
+class MeteredHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest recording latency and errors per Bot API method (sendMessage, sendPhoto, ...)"""
+
+    async def do_request(self, url: str, method: str, *args, **kwargs):
+        api_method = url.rsplit('/', 1)[-1]
+        if api_method == 'getUpdates':
+            # Long polling blocks for the poll timeout and would swamp the histogram
+            return await super().do_request(url, method, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            code, payload = await super().do_request(url, method, *args, **kwargs)
+        except Exception:
+            telegram_api_errors.labels(method=api_method).inc()
+            raise
+        finally:
+            telegram_api_duration.labels(method=api_method).observe(time.perf_counter() - start)
+
+        if code >= 400:
+            telegram_api_errors.labels(method=api_method).inc()
+        return code, payload
+
+
+def instrument_handlers(application: Application, bot: str, profile: bool = False) -> None:
+    """
+    Time every handler callback registered on the application
+
+    Call after all handlers are added. Callbacks nested in
+    ConversationHandlers are timed individually. With profile=True the
+    queries of every update are logged and likely N+1 loops flagged.
+    """
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            _instrument(handler, bot, profile)
+
+
+def _instrument(handler: BaseHandler, bot: str, profile: bool) -> None:
+    if isinstance(handler, ConversationHandler):
+        nested = list(handler.entry_points) + list(handler.fallbacks)
+        for state_handlers in handler.states.values():
+            nested.extend(state_handlers)
+        for child in nested:
+            _instrument(child, bot, profile)
+        return
+
+    callback = handler.callback
+    if getattr(callback, '_metrics_wrapped', False):
+        return
+    name = getattr(callback, '__name__', type(handler).__name__)
+
+    @functools.wraps(callback)
+    async def timed_callback(update, context):
+        start = time.perf_counter()
+        status = 'ok'
+        try:
+            with track_queries() as stats:
+                if not profile:
+                    return await callback(update, context)
+                with profile_queries(f"{bot} {name}") as query_profile:
+                    try:
+                        return await callback(update, context)
+                    finally:
+                        log_profile(query_profile)
+        except Exception:
+            status = 'error'
+            raise
+        finally:
+            bot_handler_duration.labels(bot=bot, handler=name, status=status).observe(time.perf_counter() - start)
+            db_queries_per_request.labels(source=bot, route=name).observe(stats.count)
+            db_time_per_request.labels(source=bot, route=name).observe(stats.duration)
+
+    timed_callback._metrics_wrapped = True
+    handler.callback = timed_callback
@@ -1,5 +1,7 @@
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from ...domain.entities.allowance import Allowance
 from ...domain.repositories.allowance_repository import IAllowanceRepository
 from .models import AllowanceModel
@@ -29,6 +31,44 @@ class AllowanceRepository(IAllowanceRepository):
         ).all()
         return [self._to_entity(db_allowance) for db_allowance in db_allowances]
 
+    def find_page_by_employee_id(
+        self,
+        employee_id: int,
+        limit: int,
+        offset: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Allowance]:
+        query = self._filter_by_employee(
+            self.session.query(AllowanceModel), employee_id, start, end
+        )
+        db_allowances = query.order_by(
+            AllowanceModel.timestamp.desc(),
+            AllowanceModel.id.desc()
+        ).offset(offset).limit(limit).all()
+        return [self._to_entity(db_allowance) for db_allowance in db_allowances]
+
+    def summarize_by_employee_id(
+        self,
+        employee_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> tuple[float, int]:
+        query = self._filter_by_employee(
+            self.session.query(func.sum(AllowanceModel.amount), func.count(AllowanceModel.id)),
+            employee_id, start, end
+        )
+        total, count = query.one()
+        return float(total or 0), count
+
+    def _filter_by_employee(self, query, employee_id: int, start: Optional[datetime], end: Optional[datetime]):
+        query = query.filter(AllowanceModel.employee_id == employee_id)
+        if start:
+            query = query.filter(AllowanceModel.timestamp >= start)
+        if end:
+            query = query.filter(AllowanceModel.timestamp <= end)
+        return query
+
     def _to_entity(self, model: AllowanceModel) -> Allowance:
         return Allowance(
             id=model.id,
@@ -0,0 +1,119 @@
+"""
+Read-through caches for group and vehicle lookups in the bot process
+
+Nearly every bot update starts by resolving its chat to a group and many
+then list the group's vehicles for a keyboard. Both rarely change, so these
+repositories keep the results in a TTLCache and delegate everything else to
+the wrapped repository.
+
+Writes made through these repositories (/register, setup changes, package
+or name updates saved with save()) invalidate the affected entries at once.
+Writes from other processes are picked up when the entry expires; call
+invalidate() or clear() after changing groups out of band. Missing groups
+are not cached, so a newly registered group is found immediately.
+
+Cached entities are shared between updates and must not be mutated.
+"""
+
+from typing import List, Optional
+
+from ...domain.entities.group import Group
+from ...domain.entities.vehicle import Vehicle
+from ...domain.repositories.group_repository import IGroupRepository
+from ...domain.repositories.vehicle_repository import IVehicleRepository
+from ..utils.ttl_cache import TTLCache
+
+
+class CachedGroupRepository(IGroupRepository):
+    """Group repository caching lookups by chat_id and id"""
+
+    def __init__(self, repository: IGroupRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    def save(self, group: Group) -> Group:
+        saved = self.repository.save(group)
+        self.invalidate(saved)
+        return saved
+
+    def upsert_by_chat_id(self, group: Group) -> Group:
+        saved = self.repository.upsert_by_chat_id(group)
+        self.invalidate(saved)
+        return saved
+
+    def set_owner_if_missing(self, group_id: int, created_by_user_id: int) -> Group:
+        saved = self.repository.set_owner_if_missing(group_id, created_by_user_id)
+        self.invalidate(saved)
+        return saved
+
+    def find_by_id(self, group_id: int) -> Optional[Group]:
+        group = self.cache.get(('id', group_id))
+        if group is None:
+            group = self.repository.find_by_id(group_id)
+            if group:
+                self._store(group)
+        return group
+
+    def find_by_chat_id(self, chat_id: str) -> Optional[Group]:
+        group = self.cache.get(('chat', str(chat_id)))
+        if group is None:
+            group = self.repository.find_by_chat_id(chat_id)
+            if group:
+                self._store(group)
+        return group
+
+    def find_all(self) -> List[Group]:
+        return self.repository.find_all()
+
+    def invalidate(self, group: Optional[Group] = None) -> None:
+        """Drop one group's entries, or every group when None"""
+        if group is None:
+            self.cache.delete_matching(lambda key: key[0] in ('id', 'chat'))
+            return
+        self.cache.delete(('id', group.id))
+        self.cache.delete(('chat', str(group.chat_id)))
+
+    def _store(self, group: Group) -> None:
+        self.cache.set(('id', group.id), group)
+        self.cache.set(('chat', str(group.chat_id)), group)
+
+
+class CachedVehicleRepository(IVehicleRepository):
+    """Vehicle repository caching each group's vehicle list"""
+
+    def __init__(self, repository: IVehicleRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    def save(self, vehicle: Vehicle) -> Vehicle:
+        saved = self.repository.save(vehicle)
+        self.invalidate(saved.group_id)
+        return saved
+
+    def find_by_id(self, vehicle_id: int) -> Optional[Vehicle]:
+        return self.repository.find_by_id(vehicle_id)
+
+    def find_by_group_id(self, group_id: int) -> List[Vehicle]:
+        vehicles = self.cache.get(('vehicles', group_id))
+        if vehicles is None:
+            vehicles = self.repository.find_by_group_id(group_id)
+            self.cache.set(('vehicles', group_id), vehicles)
+        return list(vehicles)
+
+    def find_by_license_plate(self, group_id: int, license_plate: str) -> Optional[Vehicle]:
+        return self.repository.find_by_license_plate(group_id, license_plate)
+
+    def delete(self, vehicle_id: int) -> bool:
+        """Delete vehicle by ID. Returns True if deleted."""
+        vehicle = self.repository.find_by_id(vehicle_id)
+        deleted = self.repository.delete(vehicle_id)
+        if vehicle:
+            self.invalidate(vehicle.group_id)
+        return deleted
+
+    def invalidate(self, group_id: Optional[int] = None) -> None:
+        """Drop one group's vehicle list, or every list when None"""
+        if group_id is None:
+            self.cache.delete_matching(lambda key: key[0] == 'vehicles')
+        else:
+            self.cache.delete(('vehicles', group_id))
@@ -0,0 +1,102 @@
+from datetime import timedelta
+from typing import List, Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from .models import CheckInJobModel, utc_now
+from .unit_of_work import commit
+
+
+class CheckInJobQueue:
+    """
+    Durable queue of check-in post-processing jobs backed by the check_in_jobs table
+
+    Jobs survive restarts: a job left in 'processing' by a crashed worker is
+    reclaimed once its lock is older than stale_after seconds. Claims are a
+    conditional UPDATE, so several API processes can poll the same table
+    without running a job twice at the same time.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue(self, check_in_id: int, raw_photo_path: Optional[str] = None) -> int:
+        """Queue post-processing for a check-in and return the job id"""
+        job = CheckInJobModel(check_in_id=check_in_id, raw_photo_path=raw_photo_path)
+        self.session.add(job)
+        commit(self.session)
+        return job.id
+
+    def claim_due(self, limit: int, stale_after: int) -> List[CheckInJobModel]:
+        """
+        Claim up to `limit` jobs that are due or whose worker went away
+
+        Returns:
+            Claimed jobs, already marked 'processing' with attempts incremented
+        """
+        now = utc_now()
+        claimable = or_(
+            and_(CheckInJobModel.status == 'pending', CheckInJobModel.available_at <= now),
+            and_(
+                CheckInJobModel.status == 'processing',
+                CheckInJobModel.locked_at < now - timedelta(seconds=stale_after)
+            )
+        )
+
+        candidate_ids = [
+            job_id for (job_id,) in self.session.query(CheckInJobModel.id)
+            .filter(claimable)
+            .order_by(CheckInJobModel.available_at, CheckInJobModel.id)
+            .limit(limit)
+            .all()
+        ]
+
+        claimed_ids = []
+        for job_id in candidate_ids:
+            # Another worker may have claimed it since the SELECT
+            updated = self.session.query(CheckInJobModel).filter(
+                CheckInJobModel.id == job_id,
+                claimable
+            ).update({
+                CheckInJobModel.status: 'processing',
+                CheckInJobModel.locked_at: now,
+                CheckInJobModel.attempts: CheckInJobModel.attempts + 1
+            }, synchronize_session=False)
+            if updated:
+                claimed_ids.append(job_id)
+        self.session.commit()
+
+        if not claimed_ids:
+            return []
+        return self.session.query(CheckInJobModel).filter(
+            CheckInJobModel.id.in_(claimed_ids)
+        ).order_by(CheckInJobModel.id).all()
+
+    def complete(self, job_id: int) -> None:
+        """Mark a job as done"""
+        self.session.query(CheckInJobModel).filter_by(id=job_id).update({
+            CheckInJobModel.status: 'done',
+            CheckInJobModel.locked_at: None,
+            CheckInJobModel.last_error: None
+        }, synchronize_session=False)
+        self.session.commit()
+
+    def fail(self, job_id: int, error: str, max_attempts: int, retry_delay: int) -> str:
+        """
+        Record a failed attempt, scheduling a retry until max_attempts is reached
+
+        Returns:
+            The job's new status ('pending' or 'failed')
+        """
+        job = self.session.query(CheckInJobModel).filter_by(id=job_id).first()
+        if not job:
+            return 'failed'
+
+        job.last_error = error[:2000]
+        job.locked_at = None
+        if job.attempts >= max_attempts:
+            job.status = 'failed'
+        else:
+            job.status = 'pending'
+            job.available_at = utc_now() + timedelta(seconds=retry_delay)
+        self.session.commit()
+        return job.status
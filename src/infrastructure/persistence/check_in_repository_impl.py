@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -7,6 +7,7 @@ from ...domain.value_objects.location import Location
 from ...domain.value_objects.check_in_type import CheckInType
 from ...domain.repositories.check_in_repository import ICheckInRepository
 from .models import CheckInModel
+from .unit_of_work import commit
 
 class CheckInRepository(ICheckInRepository):
     def __init__(self, session: Session):
@@ -23,11 +24,22 @@ class CheckInRepository(ICheckInRepository):
             timestamp=check_in.timestamp
         )
         self.session.add(db_check_in)
-        self.session.commit()
-        self.session.refresh(db_check_in)
+        commit(self.session)
 
         return self._to_entity(db_check_in)
 
+    def find_by_id(self, check_in_id: int) -> Optional[CheckIn]:
+        db_check_in = self.session.query(CheckInModel).filter_by(id=check_in_id).first()
+        return self._to_entity(db_check_in) if db_check_in else None
+
+    def update_photo_url(self, check_in_id: int, photo_url: Optional[str]) -> None:
+        """Set the photo URL of an existing check-in"""
+        self.session.query(CheckInModel).filter_by(id=check_in_id).update(
+            {CheckInModel.photo_url: photo_url},
+            synchronize_session=False
+        )
+        self.session.commit()
+
     def find_by_employee_id(self, employee_id: int) -> List[CheckIn]:
         db_check_ins = self.session.query(CheckInModel).filter_by(
             employee_id=employee_id
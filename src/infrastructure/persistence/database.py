@@ -1,16 +1,54 @@
+import logging
+from pathlib import Path
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from .models import Base
 from ..config.settings import settings
+from ..metrics.sqlalchemy_metrics import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_SCRIPT_LOCATION = Path(__file__).resolve().parents[3] / 'alembic'
 
 class Database:
     def __init__(self):
-        self.engine = create_engine(settings.DATABASE_URL)
+        self.engine = create_engine(
+            settings.DATABASE_URL,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT
+        )
         self.SessionLocal = sessionmaker(bind=self.engine)
+        if settings.METRICS_ENABLED or settings.DB_PROFILING_ENABLED:
+            instrument_engine(self.engine)
 
     def create_tables(self):
+        """
+        Create missing tables
+
+        In the fast startup profile this is skipped while the database is at
+        the Alembic head, instead of checking every table on each start.
+        """
+        if settings.STARTUP_PROFILE == 'fast' and self.schema_is_current():
+            logger.info("Schema is at the Alembic head, skipping create_all")
+            return
         Base.metadata.create_all(self.engine)
 
+    def schema_is_current(self) -> bool:
+        """Whether the database's Alembic revision is the latest migration"""
+        from alembic.runtime.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+
+        try:
+            heads = set(ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION)).get_heads())
+            with self.engine.connect() as connection:
+                current = set(MigrationContext.configure(connection).get_current_heads())
+        except Exception as e:
+            logger.warning(f"Could not read the Alembic revision, falling back to create_all: {e}")
+            return False
+        return bool(current) and current == heads
+
     def get_session(self) -> Session:
         return self.SessionLocal()
 
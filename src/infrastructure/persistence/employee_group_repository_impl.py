@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from ...domain.entities.employee_group import EmployeeGroup
+from ...domain.entities.group import Group
 from ...domain.repositories.employee_group_repository import IEmployeeGroupRepository
-from .models import EmployeeGroupModel
+from .group_repository_impl import GroupRepository
+from .models import EmployeeGroupModel, GroupModel, utc_now
+from .unit_of_work import commit
+from .upsert import insert_ignore, upsert_returning_id
 
 class EmployeeGroupRepository(IEmployeeGroupRepository):
     def __init__(self, session: Session):
@@ -20,6 +24,33 @@ class EmployeeGroupRepository(IEmployeeGroupRepository):
 
         return self._to_entity(db_employee_group)
 
+    def upsert(self, employee_group: EmployeeGroup) -> EmployeeGroup:
+        """Atomically insert the link or return the existing one"""
+        employee_group_id = upsert_returning_id(
+            self.session,
+            EmployeeGroupModel,
+            {
+                'employee_id': employee_group.employee_id,
+                'group_id': employee_group.group_id,
+                'joined_at': employee_group.joined_at
+            },
+            conflict_columns=['employee_id', 'group_id']
+        )
+        self.session.commit()
+
+        db_employee_group = self.session.query(EmployeeGroupModel).filter_by(id=employee_group_id).first()
+        return self._to_entity(db_employee_group)
+
+    def link(self, employee_id: int, group_id: int) -> None:
+        """Link an employee to a group unless already linked, in a single statement"""
+        insert_ignore(
+            self.session,
+            EmployeeGroupModel,
+            {'employee_id': employee_id, 'group_id': group_id, 'joined_at': utc_now()},
+            conflict_columns=['employee_id', 'group_id']
+        )
+        commit(self.session)
+
     def find_by_employee_id(self, employee_id: int) -> List[EmployeeGroup]:
         db_employee_groups = self.session.query(EmployeeGroupModel).filter_by(
             employee_id=employee_id
@@ -45,6 +76,16 @@ class EmployeeGroupRepository(IEmployeeGroupRepository):
         ).first()
         return self._to_entity(db_employee_group) if db_employee_group else None
 
+    def find_by_employee_id_with_groups(self, employee_id: int) -> List[Tuple[EmployeeGroup, Group]]:
+        """Find an employee's group memberships joined with their groups in a single query"""
+        rows = self.session.query(EmployeeGroupModel, GroupModel).join(
+            GroupModel, EmployeeGroupModel.group_id == GroupModel.id
+        ).filter(
+            EmployeeGroupModel.employee_id == employee_id
+        ).order_by(EmployeeGroupModel.joined_at, EmployeeGroupModel.id).all()
+
+        return [(self._to_entity(db_eg), GroupRepository._to_entity(db_group)) for db_eg, db_group in rows]
+
     def _to_entity(self, model: EmployeeGroupModel) -> EmployeeGroup:
         return EmployeeGroup(
             id=model.id,
@@ -1,8 +1,20 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Iterable
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
 from ...domain.entities.employee import Employee
 from ...domain.repositories.employee_repository import IEmployeeRepository
-from .models import EmployeeModel
+from .models import EmployeeModel, EmployeeGroupModel
+
+LIKE_ESCAPE = '\\'
+
+
+def _contains_pattern(text: str) -> str:
+    """LIKE pattern matching text literally anywhere, for use with escape=LIKE_ESCAPE"""
+    for special in (LIKE_ESCAPE, '%', '_'):
+        text = text.replace(special, LIKE_ESCAPE + special)
+    return f"%{text}%"
+
 
 class EmployeeRepository(IEmployeeRepository):
     def __init__(self, session: Session):
@@ -44,6 +56,13 @@ class EmployeeRepository(IEmployeeRepository):
         db_employee = self.session.query(EmployeeModel).filter_by(id=employee_id).first()
         return self._to_entity(db_employee) if db_employee else None
 
+    def find_by_ids(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        employee_ids = set(employee_ids)
+        if not employee_ids:
+            return {}
+        db_employees = self.session.query(EmployeeModel).filter(EmployeeModel.id.in_(employee_ids)).all()
+        return {db_employee.id: self._to_entity(db_employee) for db_employee in db_employees}
+
     def find_by_telegram_id(self, telegram_id: str) -> Optional[Employee]:
         db_employee = self.session.query(EmployeeModel).filter_by(telegram_id=telegram_id).first()
         return self._to_entity(db_employee) if db_employee else None
@@ -58,6 +77,37 @@ class EmployeeRepository(IEmployeeRepository):
         db_employees = self.session.query(EmployeeModel).order_by(EmployeeModel.created_at.desc()).all()
         return [self._to_entity(emp) for emp in db_employees]
 
+    def find_page(
+        self,
+        group_id: Optional[int] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Employee]:
+        query = self.session.query(EmployeeModel)
+
+        if group_id is not None:
+            query = query.join(
+                EmployeeGroupModel, EmployeeGroupModel.employee_id == EmployeeModel.id
+            ).filter(EmployeeGroupModel.group_id == group_id)
+
+        if search:
+            query = query.filter(EmployeeModel.name.ilike(_contains_pattern(search), escape=LIKE_ESCAPE))
+
+        if after:
+            # Keyset pagination: continue strictly after the last (created_at, id) seen
+            after_created_at, after_id = after
+            query = query.filter(or_(
+                EmployeeModel.created_at < after_created_at,
+                and_(EmployeeModel.created_at == after_created_at, EmployeeModel.id < after_id)
+            ))
+
+        db_employees = query.order_by(
+            EmployeeModel.created_at.desc(),
+            EmployeeModel.id.desc()
+        ).limit(limit).all()
+        return [self._to_entity(emp) for emp in db_employees]
+
     def _to_entity(self, model: EmployeeModel) -> Employee:
         return Employee(
             id=model.id,
@@ -1,9 +1,11 @@
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Dict, Tuple
+from datetime import date, datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import func, select
 from ...domain.entities.fuel_record import FuelRecord
 from ...domain.repositories.fuel_record_repository import IFuelRecordRepository
 from .models import FuelRecordModel
+from .unit_of_work import commit
 
 class FuelRecordRepository(IFuelRecordRepository):
     def __init__(self, session: Session):
@@ -29,7 +31,7 @@ class FuelRecordRepository(IFuelRecordRepository):
             )
             self.session.add(db_fuel)
 
-        self.session.commit()
+        commit(self.session)
         self.session.refresh(db_fuel)
 
         return self._to_entity(db_fuel)
@@ -71,6 +73,81 @@ class FuelRecordRepository(IFuelRecordRepository):
         ).all()
         return [self._to_entity(f) for f in db_fuels]
 
+    def find_details_by_group_and_date(self, group_id: int, fuel_date: date) -> List[Tuple[int, float, float, datetime]]:
+        rows = self.session.execute(
+            select(FuelRecordModel.vehicle_id, FuelRecordModel.liters, FuelRecordModel.cost, FuelRecordModel.created_at)
+            .where(FuelRecordModel.group_id == group_id, FuelRecordModel.date == fuel_date)
+            .order_by(FuelRecordModel.created_at, FuelRecordModel.id)
+        ).all()
+        return [tuple(row) for row in rows]
+
+    def sum_by_vehicle_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, Tuple[float, float]]:
+        rows = self.session.execute(
+            select(
+                FuelRecordModel.vehicle_id,
+                func.sum(FuelRecordModel.liters),
+                func.sum(FuelRecordModel.cost)
+            )
+            .where(
+                FuelRecordModel.group_id == group_id,
+                FuelRecordModel.date >= start_date,
+                FuelRecordModel.date <= end_date
+            )
+            .group_by(FuelRecordModel.vehicle_id)
+        ).all()
+        return {vehicle_id: (float(liters), float(cost)) for vehicle_id, liters, cost in rows}
+
+    def sum_by_date_for_vehicle(
+        self,
+        vehicle_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, Tuple[float, float]]:
+        rows = self.session.execute(
+            select(
+                FuelRecordModel.date,
+                func.sum(FuelRecordModel.liters),
+                func.sum(FuelRecordModel.cost)
+            )
+            .where(
+                FuelRecordModel.vehicle_id == vehicle_id,
+                FuelRecordModel.date >= start_date,
+                FuelRecordModel.date <= end_date
+            )
+            .group_by(FuelRecordModel.date)
+        ).all()
+        return {fuel_date: (float(liters), float(cost)) for fuel_date, liters, cost in rows}
+
+    def sum_by_vehicle_and_date_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[Tuple[int, date], Tuple[float, float]]:
+        rows = self.session.execute(
+            select(
+                FuelRecordModel.vehicle_id,
+                FuelRecordModel.date,
+                func.sum(FuelRecordModel.liters),
+                func.sum(FuelRecordModel.cost)
+            )
+            .where(
+                FuelRecordModel.group_id == group_id,
+                FuelRecordModel.date >= start_date,
+                FuelRecordModel.date <= end_date
+            )
+            .group_by(FuelRecordModel.vehicle_id, FuelRecordModel.date)
+        ).all()
+        return {
+            (vehicle_id, fuel_date): (float(liters), float(cost))
+            for vehicle_id, fuel_date, liters, cost in rows
+        }
+
     def has_records_for_vehicle(self, vehicle_id: int) -> bool:
         return self.session.query(FuelRecordModel.id).filter_by(vehicle_id=vehicle_id).first() is not None
 
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from ...domain.entities.group import Group
 from ...domain.repositories.group_repository import IGroupRepository
 from .models import GroupModel
+from .upsert import upsert_returning_id
 
 class GroupRepository(IGroupRepository):
     def __init__(self, session: Session):
@@ -38,6 +39,38 @@ class GroupRepository(IGroupRepository):
 
         return self._to_entity(db_group)
 
+    def upsert_by_chat_id(self, group: Group) -> Group:
+        """
+        Atomically insert a group or return the one with the same chat_id
+
+        An existing group keeps its name; its owner is only filled in if unset.
+        """
+        group_id = upsert_returning_id(
+            self.session,
+            GroupModel,
+            {
+                'chat_id': group.chat_id,
+                'name': group.name,
+                'business_name': group.business_name,
+                'package_level': group.package_level,
+                'created_by_user_id': group.created_by_user_id,
+                'created_at': group.created_at
+            },
+            conflict_columns=['chat_id'],
+            fill_columns=['created_by_user_id']
+        )
+        self.session.commit()
+        return self.find_by_id(group_id)
+
+    def set_owner_if_missing(self, group_id: int, created_by_user_id: int) -> Group:
+        """Set the group's owner unless one is already recorded"""
+        self.session.query(GroupModel).filter(
+            GroupModel.id == group_id,
+            GroupModel.created_by_user_id.is_(None)
+        ).update({GroupModel.created_by_user_id: created_by_user_id}, synchronize_session=False)
+        self.session.commit()
+        return self.find_by_id(group_id)
+
     def find_by_id(self, group_id: int) -> Optional[Group]:
         db_group = self.session.query(GroupModel).filter_by(id=group_id).first()
         return self._to_entity(db_group) if db_group else None
@@ -50,7 +83,8 @@ class GroupRepository(IGroupRepository):
         db_groups = self.session.query(GroupModel).all()
         return [self._to_entity(db_group) for db_group in db_groups]
 
-    def _to_entity(self, model: GroupModel) -> Group:
+    @staticmethod
+    def _to_entity(model: GroupModel) -> Group:
         return Group(
             id=model.id,
             chat_id=model.chat_id,
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Date, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, Float, Numeric, DateTime, Date, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime, timezone
@@ -56,13 +56,17 @@ class EmployeeModel(Base):
     probation_months = Column(Integer, nullable=True)
     base_salary = Column(Float, nullable=True)
     bonus = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=utc_now)
+    created_at = Column(DateTime, default=utc_now, nullable=False)  # Keyset pagination key
 
     check_ins = relationship('CheckInModel', back_populates='employee')
     salary_advances = relationship('SalaryAdvanceModel', back_populates='employee')
     employee_groups = relationship('EmployeeGroupModel', back_populates='employee')
     allowances = relationship('AllowanceModel', back_populates='employee')
 
+    __table_args__ = (
+        Index('ix_employees_created_at_id', 'created_at', 'id'),
+    )
+
 class EmployeeGroupModel(Base):
     __tablename__ = 'employee_groups'
 
@@ -93,18 +97,41 @@ class CheckInModel(Base):
     employee = relationship('EmployeeModel', back_populates='check_ins')
     group = relationship('GroupModel', back_populates='check_ins')
 
+class CheckInJobModel(Base):
+    """Post-processing queued for a check-in (photo resize, group notification)"""
+    __tablename__ = 'check_in_jobs'
+
+    id = Column(Integer, primary_key=True)
+    check_in_id = Column(Integer, ForeignKey('check_ins.id'), nullable=False)
+    raw_photo_path = Column(String(512), nullable=True)  # Staged upload, removed once processed
+    status = Column(String(20), nullable=False, default='pending')  # 'pending', 'processing', 'done' or 'failed'
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, nullable=False, default=utc_now)  # Not retried before this time
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+
+    __table_args__ = (
+        Index('ix_check_in_jobs_status_available_at', 'status', 'available_at'),
+    )
+
 class SalaryAdvanceModel(Base):
     __tablename__ = 'salary_advances'
 
     id = Column(Integer, primary_key=True)
     employee_id = Column(Integer, ForeignKey('employees.id'))
-    amount = Column(String(50), nullable=False)  # Store as string to preserve precision
+    amount = Column(Numeric(14, 2), nullable=False)  # Exact decimal, summable in SQL
     note = Column(Text)
     created_by = Column(String(255), nullable=False)
     timestamp = Column(DateTime, default=utc_now)
 
     employee = relationship('EmployeeModel', back_populates='salary_advances')
 
+    __table_args__ = (
+        Index('ix_salary_advances_employee_timestamp', 'employee_id', 'timestamp'),
+    )
+
 class AllowanceModel(Base):
     __tablename__ = 'allowances'
 
@@ -174,3 +201,37 @@ class FuelRecordModel(Base):
 
     group = relationship('GroupModel')
     vehicle = relationship('VehicleModel', back_populates='fuel_records')
+
+class VehicleDailyStatsModel(Base):
+    """Per-vehicle daily totals, kept up to date as trips and fuel are recorded"""
+    __tablename__ = 'vehicle_daily_stats'
+
+    id = Column(Integer, primary_key=True)
+    group_id = Column(Integer, ForeignKey('groups.id'), nullable=False)
+    vehicle_id = Column(Integer, ForeignKey('vehicles.id'), nullable=False)
+    date = Column(Date, nullable=False)
+    trip_count = Column(Integer, nullable=False, default=0)
+    loading_size_cubic_meters = Column(Float, nullable=False, default=0)
+    fuel_liters = Column(Float, nullable=False, default=0)
+    fuel_cost = Column(Float, nullable=False, default=0)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+
+    __table_args__ = (
+        UniqueConstraint('group_id', 'vehicle_id', 'date', name='uq_vehicle_daily_stats_group_vehicle_date'),
+        Index('ix_vehicle_daily_stats_vehicle_date', 'vehicle_id', 'date'),
+    )
+
+class BotPersistenceModel(Base):
+    """Bot user/chat/bot data and conversation states, saved across restarts"""
+    __tablename__ = 'bot_persistence'
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20), nullable=False)  # user_data, chat_data, bot_data, conversation
+    name = Column(String(100), nullable=False, default='')  # Conversation name
+    entry_key = Column(String(255), nullable=False, default='')  # User/chat id or conversation key
+    data = Column(Text, nullable=False)  # JSON
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+
+    __table_args__ = (
+        UniqueConstraint('kind', 'name', 'entry_key', name='uq_bot_persistence_kind_name_key'),
+    )
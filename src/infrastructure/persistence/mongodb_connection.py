@@ -8,13 +8,51 @@ form submissions, customer configurations, and related data.
 from pymongo import MongoClient
 from pymongo.database import Database
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+import hashlib
 import logging
 from typing import Optional
 
 from ..config.settings import settings
+from ..metrics.mongo_metrics import MongoCommandMetrics
 
 logger = logging.getLogger(__name__)
 
+# (collection, keys, options) ensured on connect; any change here changes the fingerprint
+# recorded in schema_info, so the fast startup profile creates the new set once
+INDEXES = [
+    # Admin users collection indexes
+    ('admin_users', 'telegram_id', {'unique': True}),
+    ('admin_users', 'username', {}),
+
+    # Customers collection indexes (for OpnForm)
+    ('customers', 'telegram_user_id', {'unique': True}),
+    ('customers', 'telegram_group_id', {}),
+    ('customers', 'webhook_endpoint', {'unique': True}),
+    ('customers', 'status', {}),
+
+    # Form configurations indexes
+    ('form_configurations', [('customer_id', 1), ('opnform_form_id', 1)], {'unique': True}),
+    ('form_configurations', [('customer_id', 1), ('is_active', 1)], {}),
+    # Linking to MySQL groups
+    ('form_configurations', 'telegram_group_chat_id', {}),
+
+    # Form submissions indexes
+    ('form_submissions', [('customer_id', 1), ('created_at', -1)], {}),
+    ('form_submissions', [('form_config_id', 1), ('created_at', -1)], {}),
+    # Keyset pagination of a form's submissions on (created_at, _id)
+    ('form_submissions', [('form_config_id', 1), ('created_at', -1), ('_id', -1)], {}),
+    ('form_submissions', 'opnform_submission_id', {'unique': True, 'sparse': True}),
+    ('form_submissions', [('metadata.submitted_at', -1)], {}),
+    ('form_submissions', 'processing_status', {}),
+
+    # Report cache indexes
+    ('report_cache', [('customer_id', 1), ('form_config_id', 1), ('report_type', 1), ('report_date', -1)], {}),
+    ('report_cache', 'expires_at', {'expireAfterSeconds': 0}),  # TTL index
+
+    # Idempotency keys for Mini App POSTs
+    ('idempotency_keys', 'expires_at', {'expireAfterSeconds': 0}),  # TTL index
+]
+
 
 class MongoDBConnection:
     """
@@ -54,7 +92,8 @@ class MongoDBConnection:
                     settings.MONGODB_URL,
                     maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
                     serverSelectionTimeoutMS=5000,  # 5 second timeout
-                    connectTimeoutMS=5000
+                    connectTimeoutMS=5000,
+                    event_listeners=[MongoCommandMetrics()] if settings.METRICS_ENABLED or settings.DB_PROFILING_ENABLED else []
                 )
 
                 # Test connection
@@ -79,46 +118,23 @@ class MongoDBConnection:
 
         This method is called once when connection is first established.
         Indexes improve query performance and enforce uniqueness constraints.
+        In the fast startup profile nothing is sent to the server except a
+        fingerprint check while the index set is unchanged.
         """
+        fingerprint = hashlib.sha1(repr(INDEXES).encode()).hexdigest()
         try:
-            logger.info("Creating MongoDB indexes...")
-
-            # Admin users collection indexes
-            self._db.admin_users.create_index("telegram_id", unique=True)
-            self._db.admin_users.create_index("username")
+            if settings.STARTUP_PROFILE == 'fast' and self._db.schema_info.find_one(
+                {'_id': 'indexes', 'fingerprint': fingerprint}
+            ):
+                logger.info("MongoDB indexes are up to date, skipping index creation")
+                return
 
-            # Customers collection indexes (for OpnForm)
-            self._db.customers.create_index("telegram_user_id", unique=True)
-            self._db.customers.create_index("telegram_group_id")
-            self._db.customers.create_index("webhook_endpoint", unique=True)
-            self._db.customers.create_index("status")
-
-            # Form configurations indexes
-            self._db.form_configurations.create_index(
-                [("customer_id", 1), ("opnform_form_id", 1)],
-                unique=True
+            logger.info("Creating MongoDB indexes...")
+            for collection, keys, options in INDEXES:
+                self._db[collection].create_index(keys, **options)
+            self._db.schema_info.update_one(
+                {'_id': 'indexes'}, {'$set': {'fingerprint': fingerprint}}, upsert=True
             )
-            self._db.form_configurations.create_index([("customer_id", 1), ("is_active", 1)])
-
-            # Form submissions indexes
-            self._db.form_submissions.create_index([("customer_id", 1), ("created_at", -1)])
-            self._db.form_submissions.create_index([("form_config_id", 1), ("created_at", -1)])
-            self._db.form_submissions.create_index("opnform_submission_id", unique=True, sparse=True)
-            self._db.form_submissions.create_index([("metadata.submitted_at", -1)])
-            self._db.form_submissions.create_index("processing_status")
-
-            # Report cache indexes
-            self._db.report_cache.create_index([
-                ("customer_id", 1),
-                ("form_config_id", 1),
-                ("report_type", 1),
-                ("report_date", -1)
-            ])
-            self._db.report_cache.create_index("expires_at", expireAfterSeconds=0)  # TTL index
-
-            # Add telegram_group_chat_id index to form_configurations (for linking to MySQL groups)
-            self._db.form_configurations.create_index("telegram_group_chat_id")
-
             logger.info("MongoDB indexes created successfully")
 
         except Exception as e:
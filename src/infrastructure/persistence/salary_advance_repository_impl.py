@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional, Dict
+from datetime import datetime
 from decimal import Decimal
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from ...domain.entities.salary_advance import SalaryAdvance
 from ...domain.value_objects.money import Money
 from ...domain.repositories.salary_advance_repository import ISalaryAdvanceRepository
@@ -13,7 +15,7 @@ class SalaryAdvanceRepository(ISalaryAdvanceRepository):
     def save(self, salary_advance: SalaryAdvance) -> SalaryAdvance:
         db_advance = SalaryAdvanceModel(
             employee_id=salary_advance.employee_id,
-            amount=str(salary_advance.amount.amount),
+            amount=salary_advance.amount.amount,
             note=salary_advance.note,
             created_by=salary_advance.created_by,
             timestamp=salary_advance.timestamp
@@ -30,11 +32,88 @@ class SalaryAdvanceRepository(ISalaryAdvanceRepository):
         ).all()
         return [self._to_entity(db_advance) for db_advance in db_advances]
 
+    def find_page_by_employee_id(
+        self,
+        employee_id: int,
+        limit: int,
+        offset: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ) -> List[SalaryAdvance]:
+        query = self._apply_filters(
+            self.session.query(SalaryAdvanceModel).filter(SalaryAdvanceModel.employee_id == employee_id),
+            start, end, min_amount, max_amount
+        )
+        db_advances = query.order_by(
+            SalaryAdvanceModel.timestamp.desc(),
+            SalaryAdvanceModel.id.desc()
+        ).offset(offset).limit(limit).all()
+        return [self._to_entity(db_advance) for db_advance in db_advances]
+
+    def summarize_by_employee_id(
+        self,
+        employee_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> tuple[Decimal, int]:
+        query = self._apply_filters(
+            self.session.query(
+                func.sum(SalaryAdvanceModel.amount),
+                func.count(SalaryAdvanceModel.id)
+            ).filter(SalaryAdvanceModel.employee_id == employee_id),
+            start, end
+        )
+        total, count = query.one()
+        return Decimal(total or 0), count
+
+    def sum_by_employee_ids(
+        self,
+        employee_ids: List[int],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ) -> Dict[int, Decimal]:
+        if not employee_ids:
+            return {}
+
+        query = self._apply_filters(
+            self.session.query(
+                SalaryAdvanceModel.employee_id,
+                func.sum(SalaryAdvanceModel.amount)
+            ).filter(SalaryAdvanceModel.employee_id.in_(employee_ids)),
+            start, end, min_amount, max_amount
+        )
+        rows = query.group_by(SalaryAdvanceModel.employee_id).all()
+        return {employee_id: Decimal(total) for employee_id, total in rows}
+
+    @staticmethod
+    def _apply_filters(
+        query,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None
+    ):
+        # Compare against None: a zero amount bound is a real filter. Each bound
+        # becomes a sargable predicate on (employee_id, timestamp) or amount.
+        if start is not None:
+            query = query.filter(SalaryAdvanceModel.timestamp >= start)
+        if end is not None:
+            query = query.filter(SalaryAdvanceModel.timestamp <= end)
+        if min_amount is not None:
+            query = query.filter(SalaryAdvanceModel.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(SalaryAdvanceModel.amount <= max_amount)
+        return query
+
     def _to_entity(self, model: SalaryAdvanceModel) -> SalaryAdvance:
         return SalaryAdvance(
             id=model.id,
             employee_id=model.employee_id,
-            amount=Money(Decimal(model.amount)),
+            amount=Money(model.amount),
             note=model.note,
             created_by=model.created_by,
             timestamp=model.timestamp
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from ...domain.entities.telegram_user import TelegramUser
 from ...domain.repositories.telegram_user_repository import ITelegramUserRepository
 from .models import TelegramUserModel
+from .upsert import upsert_returning_id
 from datetime import datetime, timezone
 
 class TelegramUserRepository(ITelegramUserRepository):
@@ -44,6 +45,29 @@ class TelegramUserRepository(ITelegramUserRepository):
 
         return self._to_entity(db_user)
 
+    def upsert(self, user: TelegramUser) -> TelegramUser:
+        """Atomically insert a user or update the profile of the one with the same telegram_id"""
+        return self.find_by_id(self.upsert_profile(user))
+
+    def upsert_profile(self, user: TelegramUser) -> int:
+        """Like upsert, in a single statement without reading the user back. Returns the user's id"""
+        user_id = upsert_returning_id(
+            self.session,
+            TelegramUserModel,
+            {
+                'telegram_id': user.telegram_id,
+                'username': user.username,
+                'first_name': user.first_name,
+                'last_name': user.last_name,
+                'created_at': user.created_at,
+                'updated_at': datetime.now(timezone.utc).replace(tzinfo=None)
+            },
+            conflict_columns=['telegram_id'],
+            update_columns=['username', 'first_name', 'last_name', 'updated_at']
+        )
+        self.session.commit()
+        return user_id
+
     def find_by_telegram_id(self, telegram_id: str) -> Optional[TelegramUser]:
         db_user = self.session.query(TelegramUserModel).filter_by(telegram_id=telegram_id).first()
         return self._to_entity(db_user) if db_user else None
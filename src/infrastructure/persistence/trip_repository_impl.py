@@ -1,10 +1,22 @@
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Dict, Tuple
+from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 from ...domain.entities.trip import Trip
-from ...domain.repositories.trip_repository import ITripRepository
+from ...domain.repositories.trip_repository import ITripRepository, TripNumberConflictError
 from .models import TripModel
+from .unit_of_work import commit
+
+# MySQL: deadlock found, lock wait timeout exceeded. Concurrent first-of-day
+# batches take gap locks on the same empty (vehicle_id, date) range.
+LOCK_CONFLICT_ERROR_CODES = (1213, 1205)
+
+
+def _is_lock_conflict(error: OperationalError) -> bool:
+    args = getattr(error.orig, 'args', ())
+    return bool(args) and args[0] in LOCK_CONFLICT_ERROR_CODES
+
 
 class TripRepository(ITripRepository):
     def __init__(self, session: Session):
@@ -28,7 +40,7 @@ class TripRepository(ITripRepository):
             )
             self.session.add(db_trip)
 
-        self.session.commit()
+        commit(self.session)
         self.session.refresh(db_trip)
 
         return self._to_entity(db_trip)
@@ -37,11 +49,55 @@ class TripRepository(ITripRepository):
         db_trip = self.session.query(TripModel).filter_by(id=trip_id).first()
         return self._to_entity(db_trip) if db_trip else None
 
-    def get_max_trip_number_for_date(self, vehicle_id: int, trip_date: date) -> int:
-        max_number = self.session.query(func.max(TripModel.trip_number)).filter_by(
+    def save_all(self, trips: List[Trip]) -> int:
+        if not trips:
+            return 0
+
+        # Core executemany: one multi-row INSERT instead of an INSERT + refresh per trip
+        try:
+            self.session.execute(
+                insert(TripModel),
+                [
+                    {
+                        'group_id': trip.group_id,
+                        'vehicle_id': trip.vehicle_id,
+                        'driver_name': trip.driver_name,
+                        'date': trip.date,
+                        'trip_number': trip.trip_number,
+                        'loading_size_cubic_meters': trip.loading_size_cubic_meters,
+                        'created_at': trip.created_at
+                    }
+                    for trip in trips
+                ]
+            )
+            commit(self.session)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            # Duplicate key on uq_vehicle_date_trip_number (vehicle_id, date, trip_number)
+            if isinstance(e, IntegrityError) and 'trip_number' in str(e.orig):
+                raise TripNumberConflictError(str(e.orig)) from e
+            if isinstance(e, OperationalError) and _is_lock_conflict(e):
+                raise TripNumberConflictError(str(e.orig)) from e
+            raise
+
+        return len(trips)
+
+    def get_max_trip_number_for_date(self, vehicle_id: int, trip_date: date, lock: bool = False) -> int:
+        query = self.session.query(func.max(TripModel.trip_number)).filter_by(
             vehicle_id=vehicle_id,
             date=trip_date
-        ).scalar()
+        )
+        if not lock:
+            max_number = query.scalar()
+            return max_number if max_number else 0
+
+        try:
+            max_number = query.with_for_update().scalar()
+        except OperationalError as e:
+            self.session.rollback()
+            if _is_lock_conflict(e):
+                raise TripNumberConflictError(str(e.orig)) from e
+            raise
         return max_number if max_number else 0
 
     def find_by_vehicle_and_date_range(
@@ -83,6 +139,86 @@ class TripRepository(ITripRepository):
         ).all()
         return [self._to_entity(t) for t in db_trips]
 
+    def find_details_by_group_and_date(self, group_id: int, trip_date: date) -> List[Tuple[int, int, Optional[float], datetime]]:
+        rows = self.session.execute(
+            select(
+                TripModel.vehicle_id,
+                TripModel.trip_number,
+                TripModel.loading_size_cubic_meters,
+                TripModel.created_at
+            )
+            .where(TripModel.group_id == group_id, TripModel.date == trip_date)
+            .order_by(TripModel.created_at, TripModel.id)
+        ).all()
+        return [tuple(row) for row in rows]
+
+    def sum_by_vehicle_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[int, Tuple[int, float]]:
+        rows = self.session.execute(
+            select(
+                TripModel.vehicle_id,
+                func.count(TripModel.id),
+                func.coalesce(func.sum(TripModel.loading_size_cubic_meters), 0)
+            )
+            .where(
+                TripModel.group_id == group_id,
+                TripModel.date >= start_date,
+                TripModel.date <= end_date
+            )
+            .group_by(TripModel.vehicle_id)
+        ).all()
+        return {vehicle_id: (count, float(loading)) for vehicle_id, count, loading in rows}
+
+    def sum_by_date_for_vehicle(
+        self,
+        vehicle_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, Tuple[int, float]]:
+        rows = self.session.execute(
+            select(
+                TripModel.date,
+                func.count(TripModel.id),
+                func.coalesce(func.sum(TripModel.loading_size_cubic_meters), 0)
+            )
+            .where(
+                TripModel.vehicle_id == vehicle_id,
+                TripModel.date >= start_date,
+                TripModel.date <= end_date
+            )
+            .group_by(TripModel.date)
+        ).all()
+        return {trip_date: (count, float(loading)) for trip_date, count, loading in rows}
+
+    def sum_by_vehicle_and_date_for_group(
+        self,
+        group_id: int,
+        start_date: date,
+        end_date: date
+    ) -> Dict[Tuple[int, date], Tuple[int, float]]:
+        rows = self.session.execute(
+            select(
+                TripModel.vehicle_id,
+                TripModel.date,
+                func.count(TripModel.id),
+                func.coalesce(func.sum(TripModel.loading_size_cubic_meters), 0)
+            )
+            .where(
+                TripModel.group_id == group_id,
+                TripModel.date >= start_date,
+                TripModel.date <= end_date
+            )
+            .group_by(TripModel.vehicle_id, TripModel.date)
+        ).all()
+        return {
+            (vehicle_id, trip_date): (count, float(loading))
+            for vehicle_id, trip_date, count, loading in rows
+        }
+
     def has_trips_for_vehicle(self, vehicle_id: int) -> bool:
         return self.session.query(TripModel.id).filter_by(vehicle_id=vehicle_id).first() is not None
 
@@ -0,0 +1,46 @@
+"""
+Single-transaction writes across repositories sharing a session
+
+Repositories end their writes with commit(session) instead of
+session.commit(). Outside a unit of work that commits as before; inside one
+it only flushes, and the unit of work commits or rolls back on exit.
+"""
+
+from sqlalchemy.orm import Session
+from ...domain.repositories.unit_of_work import IUnitOfWork
+
+# Nesting depth of open units of work, kept on the session so every
+# repository bound to it (or to the same scoped_session) sees it
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+def commit(session: Session) -> None:
+    """Commit the session's transaction unless a unit of work owns it, then only flush"""
+    if session.info.get(_DEPTH_KEY):
+        session.flush()
+    else:
+        session.commit()
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def __enter__(self) -> 'SqlAlchemyUnitOfWork':
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        depth = self.session.info.pop(_DEPTH_KEY) - 1
+        if depth:
+            # Nested block; the outermost one commits
+            self.session.info[_DEPTH_KEY] = depth
+            return
+        if exc_type is not None:
+            self.session.rollback()
+            return
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
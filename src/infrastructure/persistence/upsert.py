@@ -0,0 +1,167 @@
+"""
+Dialect-aware INSERT helpers for concurrent writers
+
+MySQL is the production database; SQLite is used by the test suite. Each
+helper is a single statement and never raises IntegrityError when a
+concurrent request inserted the same unique key first.
+"""
+
+from typing import Any, Dict, List, Sequence
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+
+
+def insert_ignore(session: Session, model, values: Dict[str, Any], conflict_columns: List[str]) -> None:
+    """
+    Insert a row unless one with the same unique key already exists
+
+    Args:
+        session: Session whose transaction the statement joins (not committed)
+        model: Declarative model class
+        values: Column values for the new row
+        conflict_columns: Columns of the unique key that may collide
+    """
+    dialect = session.get_bind().dialect.name
+    table = model.__table__
+
+    if dialect == 'mysql':
+        stmt = mysql.insert(table).values(**values)
+        # Assigning the key column to itself turns the duplicate into a no-op
+        key_column = conflict_columns[0]
+        stmt = stmt.on_duplicate_key_update({key_column: stmt.inserted[key_column]})
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(table).values(**values).on_conflict_do_nothing(index_elements=conflict_columns)
+    else:
+        raise NotImplementedError(f"insert_ignore is not supported for dialect '{dialect}'")
+
+    session.execute(stmt)
+
+
+def upsert_returning_id(
+    session: Session,
+    model,
+    values: Dict[str, Any],
+    conflict_columns: List[str],
+    update_columns: Sequence[str] = (),
+    fill_columns: Sequence[str] = ()
+) -> int:
+    """
+    Insert a row or update the existing one, returning its primary key
+
+    Uses INSERT ... ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id) on MySQL,
+    so the id of the existing row is reported when the key already exists.
+
+    Args:
+        session: Session whose transaction the statement joins (not committed)
+        model: Declarative model class with an integer `id` primary key
+        values: Column values for the new row
+        conflict_columns: Columns of the unique key that may collide
+        update_columns: Columns overwritten with the new values on conflict
+        fill_columns: Columns set from the new values only where currently NULL
+
+    Returns:
+        id of the inserted or existing row
+    """
+    dialect = session.get_bind().dialect.name
+    table = model.__table__
+
+    if dialect == 'mysql':
+        stmt = mysql.insert(table).values(**values)
+        new_values = stmt.inserted
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(table).values(**values)
+        new_values = stmt.excluded
+    else:
+        raise NotImplementedError(f"upsert_returning_id is not supported for dialect '{dialect}'")
+
+    set_ = {column: new_values[column] for column in update_columns}
+    set_.update({column: func.coalesce(table.c[column], new_values[column]) for column in fill_columns})
+
+    if dialect == 'mysql':
+        set_['id'] = func.last_insert_id(table.c.id)
+        return session.execute(stmt.on_duplicate_key_update(set_)).lastrowid
+
+    if not set_:
+        # DO UPDATE needs at least one assignment to RETURN the existing row
+        set_ = {conflict_columns[0]: new_values[conflict_columns[0]]}
+    stmt = stmt.on_conflict_do_update(index_elements=conflict_columns, set_=set_).returning(table.c.id)
+    return session.execute(stmt).scalar_one()
+
+
+def upsert_increment(
+    session: Session,
+    model,
+    values: Dict[str, Any],
+    conflict_columns: List[str],
+    increment_columns: Sequence[str],
+    update_columns: Sequence[str] = ()
+) -> None:
+    """
+    Insert a row, or add the new values to the existing row's counters
+
+    Args:
+        session: Session whose transaction the statement joins (not committed)
+        model: Declarative model class
+        values: Column values for the new row
+        conflict_columns: Columns of the unique key that may collide
+        increment_columns: Columns incremented by the new values on conflict
+        update_columns: Columns overwritten with the new values on conflict
+    """
+    dialect = session.get_bind().dialect.name
+    table = model.__table__
+
+    if dialect == 'mysql':
+        stmt = mysql.insert(table).values(**values)
+        new_values = stmt.inserted
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(table).values(**values)
+        new_values = stmt.excluded
+    else:
+        raise NotImplementedError(f"upsert_increment is not supported for dialect '{dialect}'")
+
+    set_ = {column: table.c[column] + new_values[column] for column in increment_columns}
+    set_.update({column: new_values[column] for column in update_columns})
+
+    if dialect == 'mysql':
+        session.execute(stmt.on_duplicate_key_update(set_))
+    else:
+        session.execute(stmt.on_conflict_do_update(index_elements=conflict_columns, set_=set_))
+
+
+def upsert_many(
+    session: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: List[str],
+    update_columns: Sequence[str]
+) -> None:
+    """
+    Insert several rows in one statement, overwriting existing rows' values
+
+    Args:
+        session: Session whose transaction the statement joins (not committed)
+        model: Declarative model class
+        rows: Column values of each row (all with the same keys)
+        conflict_columns: Columns of the unique key that may collide
+        update_columns: Columns overwritten with the new values on conflict
+    """
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+    table = model.__table__
+
+    if dialect == 'mysql':
+        stmt = mysql.insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+    else:
+        raise NotImplementedError(f"upsert_many is not supported for dialect '{dialect}'")
+
+    session.execute(stmt)
@@ -0,0 +1,135 @@
+from typing import List, Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, literal, select, union_all
+from ...domain.entities.vehicle_daily_stats import VehicleDailyStats
+from ...domain.repositories.vehicle_daily_stats_repository import IVehicleDailyStatsRepository
+from .models import VehicleDailyStatsModel, TripModel, FuelRecordModel, utc_now
+from .upsert import upsert_increment
+from .unit_of_work import commit
+
+class VehicleDailyStatsRepository(IVehicleDailyStatsRepository):
+    COUNTER_COLUMNS = ('trip_count', 'loading_size_cubic_meters', 'fuel_liters', 'fuel_cost')
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(self, stats: VehicleDailyStats) -> None:
+        try:
+            upsert_increment(
+                self.session,
+                VehicleDailyStatsModel,
+                {
+                    'group_id': stats.group_id,
+                    'vehicle_id': stats.vehicle_id,
+                    'date': stats.date,
+                    'trip_count': stats.trip_count,
+                    'loading_size_cubic_meters': stats.loading_size_cubic_meters,
+                    'fuel_liters': stats.fuel_liters,
+                    'fuel_cost': stats.fuel_cost,
+                    'updated_at': utc_now()
+                },
+                conflict_columns=['group_id', 'vehicle_id', 'date'],
+                increment_columns=self.COUNTER_COLUMNS,
+                update_columns=['updated_at']
+            )
+            commit(self.session)
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def find_by_group_and_date_range(self, group_id: int, start_date: date, end_date: date) -> List[VehicleDailyStats]:
+        db_stats = self.session.query(VehicleDailyStatsModel).filter(
+            VehicleDailyStatsModel.group_id == group_id,
+            VehicleDailyStatsModel.date >= start_date,
+            VehicleDailyStatsModel.date <= end_date
+        ).order_by(VehicleDailyStatsModel.vehicle_id, VehicleDailyStatsModel.date).all()
+        return [self._to_entity(s) for s in db_stats]
+
+    def find_by_vehicle_and_date_range(self, vehicle_id: int, start_date: date, end_date: date) -> List[VehicleDailyStats]:
+        db_stats = self.session.query(VehicleDailyStatsModel).filter(
+            VehicleDailyStatsModel.vehicle_id == vehicle_id,
+            VehicleDailyStatsModel.date >= start_date,
+            VehicleDailyStatsModel.date <= end_date
+        ).order_by(VehicleDailyStatsModel.date).all()
+        return [self._to_entity(s) for s in db_stats]
+
+    def rebuild(
+        self,
+        group_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        trips = select(
+            TripModel.group_id,
+            TripModel.vehicle_id,
+            TripModel.date,
+            func.count(TripModel.id).label('trip_count'),
+            func.coalesce(func.sum(TripModel.loading_size_cubic_meters), 0).label('loading_size_cubic_meters'),
+            literal(0.0).label('fuel_liters'),
+            literal(0.0).label('fuel_cost')
+        ).where(*self._scope(TripModel, group_id, start_date, end_date)).group_by(
+            TripModel.group_id, TripModel.vehicle_id, TripModel.date
+        )
+        fuel = select(
+            FuelRecordModel.group_id,
+            FuelRecordModel.vehicle_id,
+            FuelRecordModel.date,
+            literal(0),
+            literal(0.0),
+            func.sum(FuelRecordModel.liters),
+            func.sum(FuelRecordModel.cost)
+        ).where(*self._scope(FuelRecordModel, group_id, start_date, end_date)).group_by(
+            FuelRecordModel.group_id, FuelRecordModel.vehicle_id, FuelRecordModel.date
+        )
+        daily = union_all(trips, fuel).subquery('daily')
+        rollup = select(
+            daily.c.group_id,
+            daily.c.vehicle_id,
+            daily.c.date,
+            func.sum(daily.c.trip_count),
+            func.sum(daily.c.loading_size_cubic_meters),
+            func.sum(daily.c.fuel_liters),
+            func.sum(daily.c.fuel_cost),
+            literal(utc_now())
+        ).group_by(daily.c.group_id, daily.c.vehicle_id, daily.c.date)
+
+        try:
+            self.session.execute(
+                delete(VehicleDailyStatsModel).where(
+                    *self._scope(VehicleDailyStatsModel, group_id, start_date, end_date)
+                )
+            )
+            result = self.session.execute(
+                insert(VehicleDailyStatsModel).from_select(
+                    ['group_id', 'vehicle_id', 'date', *self.COUNTER_COLUMNS, 'updated_at'],
+                    rollup
+                )
+            )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return result.rowcount
+
+    @staticmethod
+    def _scope(model, group_id: Optional[int], start_date: Optional[date], end_date: Optional[date]) -> list:
+        conditions = []
+        if group_id is not None:
+            conditions.append(model.group_id == group_id)
+        if start_date is not None:
+            conditions.append(model.date >= start_date)
+        if end_date is not None:
+            conditions.append(model.date <= end_date)
+        return conditions
+
+    def _to_entity(self, db_stats: VehicleDailyStatsModel) -> VehicleDailyStats:
+        return VehicleDailyStats(
+            group_id=db_stats.group_id,
+            vehicle_id=db_stats.vehicle_id,
+            date=db_stats.date,
+            trip_count=db_stats.trip_count,
+            loading_size_cubic_meters=db_stats.loading_size_cubic_meters,
+            fuel_liters=db_stats.fuel_liters,
+            fuel_cost=db_stats.fuel_cost
+        )
@@ -1,3 +1,4 @@
 from .excel_export_service import ExcelExportService
+from .photo_storage_service import PhotoStorageService
 
-__all__ = ['ExcelExportService']
\ No newline at end of file
+__all__ = ['ExcelExportService', 'PhotoStorageService']
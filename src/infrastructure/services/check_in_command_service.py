@@ -0,0 +1,87 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ...domain.entities.check_in import CheckIn
+from ...domain.entities.employee import Employee
+from ...domain.entities.group import Group
+from ...domain.value_objects.check_in_type import CheckInType
+from ...domain.value_objects.location import Location
+from ..persistence.check_in_job_queue import CheckInJobQueue
+from ..persistence.check_in_repository_impl import CheckInRepository
+from ..persistence.employee_group_repository_impl import EmployeeGroupRepository
+from ..persistence.unit_of_work import SqlAlchemyUnitOfWork
+from ..utils.timezone import format_ict_datetime
+from .check_in_job_worker import check_in_job_worker
+
+
+@dataclass
+class CheckInCommand:
+    employee: Employee
+    group: Group
+    latitude: float
+    longitude: float
+    type: CheckInType = CheckInType.CHECKIN
+    raw_photo_path: Optional[str] = None
+
+
+@dataclass
+class CheckInResult:
+    check_in: CheckIn
+    timestamp: str
+    location: str
+
+
+class CheckInCommandService:
+    """
+    Records a Mini App check-in or check-out in one transaction
+
+    The employee and group are passed in already resolved (normally by the
+    Telegram auth middleware), so the write path does not read them again.
+    It is three INSERTs and a COMMIT: the employee-group link (ignored when
+    it already exists), the check-in and its post-processing job. If the
+    transaction fails, the staged photo is removed since no job will pick
+    it up.
+    """
+
+    def __init__(self, session: Session, job_worker=None):
+        self.session = session
+        self.unit_of_work = SqlAlchemyUnitOfWork(session)
+        self.employee_group_repository = EmployeeGroupRepository(session)
+        self.check_in_repository = CheckInRepository(session)
+        self.job_queue = CheckInJobQueue(session)
+        self.job_worker = job_worker or check_in_job_worker
+
+    def execute(self, command: CheckInCommand) -> CheckInResult:
+        location = Location(latitude=command.latitude, longitude=command.longitude)
+
+        try:
+            with self.unit_of_work:
+                # Automatically link the employee to the group on first check-in
+                self.employee_group_repository.link(command.employee.id, command.group.id)
+
+                check_in = self.check_in_repository.save(
+                    CheckIn.create(
+                        employee_id=command.employee.id,
+                        group_id=command.group.id,
+                        location=location,
+                        type=command.type
+                    )
+                )
+
+                # Photo processing and the group notification run in the background worker
+                self.job_queue.enqueue(check_in.id, command.raw_photo_path)
+        except Exception:
+            if command.raw_photo_path and os.path.exists(command.raw_photo_path):
+                os.remove(command.raw_photo_path)
+            raise
+
+        self.job_worker.wake()
+
+        return CheckInResult(
+            check_in=check_in,
+            timestamp=format_ict_datetime(check_in.timestamp),
+            location=f"{location.latitude}, {location.longitude}"
+        )
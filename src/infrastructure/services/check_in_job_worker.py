@@ -0,0 +1,165 @@
+import logging
+import os
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config.settings import settings
+from ..persistence.database import database
+from ..persistence.check_in_job_queue import CheckInJobQueue
+from ..persistence.check_in_repository_impl import CheckInRepository
+from ..persistence.employee_repository_impl import EmployeeRepository
+from ..persistence.group_repository_impl import GroupRepository
+from ..telegram.notification_service import get_notification_service
+from ..utils.timezone import format_ict_datetime
+from ...domain.value_objects.check_in_type import CheckInType
+from .photo_storage_service import PhotoStorageService
+
+logger = logging.getLogger(__name__)
+
+
+class CheckInJobWorker:
+    """
+    Runs check-in post-processing off the request thread
+
+    For each queued job the worker processes the staged photo, stores the
+    resulting photo_url on the check-in and sends the group notification.
+    Every step is safe to repeat, so a job interrupted by a restart is
+    simply run again.
+    """
+
+    BATCH_SIZE = 10
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = None,
+        photo_storage: Optional[PhotoStorageService] = None,
+        notification_service_factory: Callable = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        stale_after: Optional[int] = None
+    ):
+        self.session_factory = session_factory or database.get_session
+        self.photo_storage = photo_storage or PhotoStorageService()
+        self.notification_service_factory = notification_service_factory or get_notification_service
+        self.poll_interval = poll_interval if poll_interval is not None else settings.CHECKIN_JOB_POLL_INTERVAL
+        self.max_attempts = max_attempts or settings.CHECKIN_JOB_MAX_ATTEMPTS
+        self.stale_after = stale_after or settings.CHECKIN_JOB_STALE_AFTER
+
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the polling thread is running (it may be busy with a long job)"""
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self) -> None:
+        """Start the background polling thread (idempotent)"""
+        if self.is_alive:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="CheckInJobWorker", daemon=True)
+        self._thread.start()
+        logger.info("Check-in job worker started")
+
+    def stop(self, timeout: float = 10) -> None:
+        """Stop the polling thread after the job in progress finishes"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def wake(self) -> None:
+        """Process newly queued jobs now instead of at the next poll"""
+        self._wakeup.set()
+
+    def run_pending(self) -> int:
+        """
+        Claim and process due jobs until none are left
+
+        Returns:
+            Number of jobs processed (successfully or not)
+        """
+        processed = 0
+        while not self._stopping.is_set():
+            session = self.session_factory()
+            try:
+                jobs = CheckInJobQueue(session).claim_due(self.BATCH_SIZE, self.stale_after)
+                for job in jobs:
+                    self._process(session, job.id, job.check_in_id, job.raw_photo_path, job.attempts)
+            finally:
+                session.close()
+            processed += len(jobs)
+            if len(jobs) < self.BATCH_SIZE:
+                break
+        return processed
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error(f"Check-in job worker error: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _process(self, session: Session, job_id: int, check_in_id: int, raw_photo_path: Optional[str], attempts: int) -> None:
+        queue = CheckInJobQueue(session)
+        try:
+            self._handle(session, check_in_id, raw_photo_path)
+            queue.complete(job_id)
+        except Exception as e:
+            session.rollback()
+            # Exponential backoff: 10s, 20s, 40s, ...
+            status = queue.fail(job_id, str(e), self.max_attempts, retry_delay=10 * 2 ** (attempts - 1))
+            logger.warning(f"Check-in job {job_id} attempt {attempts} failed ({status}): {e}")
+
+    def _handle(self, session: Session, check_in_id: int, raw_photo_path: Optional[str]) -> None:
+        check_in_repo = CheckInRepository(session)
+        check_in = check_in_repo.find_by_id(check_in_id)
+        if not check_in:
+            logger.warning(f"Check-in {check_in_id} no longer exists, dropping its job")
+            return
+
+        photo_url = check_in.photo_url
+        if raw_photo_path and not photo_url and os.path.exists(raw_photo_path):
+            try:
+                photo_url = self.photo_storage.process_staged(raw_photo_path)
+            except ValueError as e:
+                # Not retryable: notify without the photo
+                logger.warning(f"Dropping unreadable photo for check-in {check_in_id}: {e}")
+                photo_url = None
+            check_in_repo.update_photo_url(check_in_id, photo_url)
+        if raw_photo_path and os.path.exists(raw_photo_path):
+            os.remove(raw_photo_path)
+
+        employee = EmployeeRepository(session).find_by_id(check_in.employee_id)
+        group = GroupRepository(session).find_by_id(check_in.group_id)
+        if not employee or not group:
+            logger.warning(f"Employee or group missing for check-in {check_in_id}, skipping notification")
+            return
+
+        notification_service = self.notification_service_factory()
+        send = (
+            notification_service.send_checkout_notification
+            if check_in.type == CheckInType.CHECKOUT
+            else notification_service.send_checkin_notification
+        )
+        sent = send(
+            group_chat_id=group.chat_id,
+            employee_name=employee.name,
+            timestamp=format_ict_datetime(check_in.timestamp),
+            location=f"{check_in.location.latitude}, {check_in.location.longitude}",
+            latitude=check_in.location.latitude,
+            longitude=check_in.location.longitude,
+            photo_url=photo_url
+        )
+        if not sent:
+            raise RuntimeError(f"Failed to send notification to group {group.chat_id}")
+
+
+# Singleton worker for the API process
+check_in_job_worker = CheckInJobWorker()
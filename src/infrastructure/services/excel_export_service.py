@@ -1,9 +1,6 @@
 import os
 from datetime import datetime
 from typing import List, Dict
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
 
 from ...domain.entities.check_in import CheckIn
 from ...domain.entities.employee import Employee
@@ -12,7 +9,12 @@ from ..utils.timezone import format_ict_datetime, format_ict_time, utc_to_ict
 
 
 class ExcelExportService:
-    """Service for exporting check-in reports to Excel format"""
+    """
+    Service for exporting check-in reports to Excel format
+
+    openpyxl is imported by the methods that build workbooks, so the bot and
+    API processes don't pay for it at startup.
+    """
 
     def __init__(self):
         self.exports_dir = "exports/checkins"
@@ -43,6 +45,8 @@ class ExcelExportService:
         Returns:
             Absolute file path to generated Excel file
         """
+        from openpyxl import Workbook
+
         # Create workbook
         wb = Workbook()
         ws = wb.active
@@ -78,6 +82,8 @@ class ExcelExportService:
         employees: Dict[int, Employee]
     ):
         """Add summary section at the top of the report"""
+        from openpyxl.styles import Font
+
         month_names = [
             "January", "February", "March", "April", "May", "June",
             "July", "August", "September", "October", "November", "December"
@@ -106,6 +112,8 @@ class ExcelExportService:
 
     def _add_table_headers(self, ws):
         """Add table headers at row 6"""
+        from openpyxl.styles import Alignment, Font, PatternFill
+
         headers = ['Employee', 'Date', 'Time', 'Location']
 
         for col_num, header in enumerate(headers, 1):
@@ -124,6 +132,8 @@ class ExcelExportService:
         employees: Dict[int, Employee]
     ):
         """Populate data rows sorted by date and employee name"""
+        from openpyxl.styles import Font
+
         # Sort check-ins by timestamp (date in ICT), then by employee name
         sorted_check_ins = sorted(
             check_ins,
@@ -174,6 +184,8 @@ class ExcelExportService:
 
     def _apply_formatting(self, ws):
         """Apply formatting to the worksheet"""
+        from openpyxl.styles import Alignment, PatternFill
+
         # Set column widths
         ws.column_dimensions['A'].width = 25  # Employee
         ws.column_dimensions['B'].width = 15  # Date
@@ -0,0 +1,194 @@
+import hashlib
+import os
+import tempfile
+import uuid
+from typing import BinaryIO, Optional, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ..config.settings import settings
+
+
+class PhotoStorageService:
+    """
+    Stores check-in photos on local disk
+
+    Uploads are streamed to disk in chunks, downscaled (respecting EXIF
+    orientation) and re-encoded. Files are named by the SHA-256 of the
+    uploaded bytes, so a retried upload maps to the photo already stored,
+    and sharded into two levels of sub-directories (ab/cd/abcd....webp).
+    Public URLs are built from url_prefix, independent of where upload_dir
+    lives on disk; path_for_url() maps them back to files.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    FORMAT_EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg'}
+
+    def __init__(
+        self,
+        upload_dir: Optional[str] = None,
+        max_dimension: Optional[int] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+        staging_dir: Optional[str] = None,
+        url_prefix: Optional[str] = None
+    ):
+        self.upload_dir = upload_dir or settings.PHOTO_UPLOAD_DIR
+        self.url_prefix = '/' + (url_prefix or settings.PHOTO_URL_PREFIX).strip('/')
+        self.staging_dir = staging_dir or settings.PHOTO_STAGING_DIR
+        self.max_dimension = max_dimension or settings.PHOTO_MAX_DIMENSION
+        self.image_format = (image_format or settings.PHOTO_FORMAT).upper()
+        self.quality = quality or settings.PHOTO_QUALITY
+
+        if self.image_format not in self.FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported photo format: {self.image_format}")
+
+    def save_upload(self, stream: BinaryIO) -> str:
+        """
+        Store an uploaded photo and return its public URL
+
+        Args:
+            stream: File-like object with the uploaded image bytes
+
+        Returns:
+            URL path such as /uploads/photos/ab/cd/<sha256>.webp
+
+        Raises:
+            ValueError: If the upload is not a readable image
+        """
+        digest, raw_path = self.store_raw(stream)
+        try:
+            return self.process(raw_path, digest)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+
+    def store_raw(self, stream: BinaryIO, directory: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Copy an upload to a temporary file in chunks, hashing as it goes
+
+        Returns:
+            Tuple of (sha256 hex digest, temporary file path)
+        """
+        directory = directory or self.upload_dir
+        os.makedirs(directory, exist_ok=True)
+        hasher = hashlib.sha256()
+        fd, raw_path = tempfile.mkstemp(dir=directory, suffix='.upload')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    out.write(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+        except Exception:
+            os.remove(raw_path)
+            raise
+        return hasher.hexdigest(), raw_path
+
+    def stage_upload(self, stream: BinaryIO) -> str:
+        """
+        Durably store an upload as-is for later processing
+
+        Only the image header is checked here; resizing and re-encoding are
+        left to process_staged() so the request can return quickly.
+
+        Returns:
+            Path of the staged raw file (<sha256>.<unique id>.upload, so two
+            uploads of the same bytes never share a staged file)
+
+        Raises:
+            ValueError: If the upload is not a readable image
+        """
+        digest, raw_path = self.store_raw(stream, directory=self.staging_dir)
+        try:
+            self.validate(raw_path)
+        except BaseException:
+            os.remove(raw_path)
+            raise
+
+        staged_path = os.path.join(self.staging_dir, f"{digest}.{uuid.uuid4().hex}.upload")
+        os.replace(raw_path, staged_path)
+        return staged_path
+
+    def process_staged(self, staged_path: str) -> str:
+        """
+        Process a file written by stage_upload()
+
+        The staged file is left in place; callers remove it once the
+        resulting URL has been recorded.
+
+        Returns:
+            URL path of the processed photo
+        """
+        digest = os.path.basename(staged_path).split('.', 1)[0]
+        return self.process(staged_path, digest)
+
+    def validate(self, raw_path: str) -> None:
+        """Check that a file has a readable image header without decoding it"""
+        try:
+            with Image.open(raw_path) as image:
+                image.verify()
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as e:
+            raise ValueError("Invalid image file") from e
+
+    def process(self, raw_path: str, digest: str) -> str:
+        """
+        Downscale and re-encode a raw upload into its content-addressed path
+
+        Returns:
+            URL path of the processed photo
+        """
+        relative_path = self._relative_path(digest)
+        final_path = os.path.join(self.upload_dir, relative_path)
+
+        # Same bytes were already processed (e.g. a retried upload)
+        if os.path.exists(final_path):
+            return self._url_for(relative_path)
+
+        try:
+            with Image.open(raw_path) as image:
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((self.max_dimension, self.max_dimension), Image.LANCZOS)
+                if image.mode not in ('RGB', 'RGBA') or self.image_format == 'JPEG':
+                    image = image.convert('RGB')
+
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                # Write next to the target and rename so readers never see a partial file
+                tmp_path = f"{final_path}.{os.getpid()}.tmp"
+                try:
+                    image.save(tmp_path, format=self.image_format, quality=self.quality, optimize=True)
+                    os.replace(tmp_path, final_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            raise ValueError("Invalid image file") from e
+
+        return self._url_for(relative_path)
+
+    def _relative_path(self, digest: str) -> str:
+        extension = self.FORMAT_EXTENSIONS[self.image_format]
+        return os.path.join(digest[:2], digest[2:4], f"{digest}.{extension}")
+
+    def path_for_url(self, photo_url: str) -> Optional[str]:
+        """
+        Map a URL returned by this service back to the stored file
+
+        Returns:
+            File path under upload_dir, or None if the URL is not one of ours
+        """
+        prefix = self.url_prefix.rstrip('/') + '/'
+        if not photo_url or not photo_url.startswith(prefix):
+            return None
+        parts = photo_url[len(prefix):].split('/')
+        if any(part in ('', '.', '..') for part in parts):
+            return None
+        return os.path.join(self.upload_dir, *parts)
+
+    def _url_for(self, relative_path: str) -> str:
+        return '/'.join([self.url_prefix.rstrip('/'), *relative_path.split(os.sep)])
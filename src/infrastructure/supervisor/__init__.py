@@ -0,0 +1,18 @@
+"""
+Process supervisor used by main.py when SUPERVISOR_ENABLED=true
+
+Runs every component (bots, API workers, check-in workers) as replicas it
+restarts with backoff, serves liveness/readiness probes and drains the
+replicas on SIGTERM.
+"""
+
+from .probes import Probe, ProbeServer
+from .supervisor import Component, Supervisor, parse_replicas
+
+__all__ = [
+    'Component',
+    'Probe',
+    'ProbeServer',
+    'Supervisor',
+    'parse_replicas',
+]
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Probe:
+    """
+    Shared liveness and readiness state of one replica
+
+    Created by the supervisor before the replica is forked. Inside the
+    replica the component calls beat() from its own main loop (the API
+    server's accept loop, the bot's event loop) at least every
+    heartbeat_interval seconds, so a wedged loop stops the heartbeat. The job
+    worker beats from its main thread while the polling thread is alive, so
+    a long job is not mistaken for a hang. It calls ready() once it can serve (and ready(False) when it
+    starts draining); the supervisor reads both without any IPC round trip.
+    """
+
+    def __init__(self, heartbeat_interval: float = 5.0):
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat = multiprocessing.Value('d', 0.0, lock=False)
+        self._ready = multiprocessing.Value('b', 0, lock=False)
+
+    def beat(self) -> None:
+        """Refresh the liveness timestamp (call from the component's main loop)"""
+        self._heartbeat.value = time.time()
+
+    async def beat_forever(self) -> None:
+        """Beat every heartbeat_interval seconds as a task on an asyncio event loop"""
+        while True:
+            self.beat()
+            await asyncio.sleep(self.heartbeat_interval)
+
+    def ready(self, ready: bool = True) -> None:
+        self._ready.value = 1 if ready else 0
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self._ready.value)
+
+    @property
+    def last_heartbeat(self) -> float:
+        return self._heartbeat.value
+
+
+class ProbeServer:
+    """
+    HTTP endpoints for the process manager or load balancer
+
+    GET /livez  - 200 while the supervisor loop is running
+    GET /readyz - 200 when every component has a ready replica and the
+                  supervisor is not draining, 503 otherwise
+
+    Both return the supervisor's status document as JSON.
+    """
+
+    def __init__(self, host: str, port: int, status: Callable[[], Tuple[bool, bool, Dict]]):
+        self._status = status
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ProbeServer", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_port
+
+    def start(self) -> None:
+        self._thread.start()
+        logger.info(f"Supervisor probes listening on port {self.port} (/livez, /readyz)")
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def close_inherited(self) -> None:
+        """Release the listening socket in a forked replica without touching the parent's server"""
+        self._server.socket.close()
+
+    def _handler(self):
+        status = self._status
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                live, ready, document = status()
+                if self.path == '/livez':
+                    ok = live
+                elif self.path == '/readyz':
+                    ok = ready
+                else:
+                    self.send_error(404)
+                    return
+                body = json.dumps(document).encode()
+                self.send_response(200 if ok else 503)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Probes poll every few seconds; keep them out of the logs
+                pass
+
+        return Handler
@@ -0,0 +1,248 @@
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .probes import Probe, ProbeServer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Component:
+    """A process type run by the supervisor, e.g. the API server with 4 replicas"""
+    name: str
+    target: Callable[[Probe], None]
+    replicas: int = 1
+    max_replicas: Optional[int] = None  # 1 for a bot: only one poller per token may call getUpdates
+
+    def __post_init__(self):
+        if self.replicas < 0:
+            raise ValueError(f"{self.name}: replica count cannot be negative")
+        if self.max_replicas is not None and self.replicas > self.max_replicas:
+            raise ValueError(f"{self.name} supports at most {self.max_replicas} replica(s), got {self.replicas}")
+
+
+class _Replica:
+    def __init__(self, component: Component, index: int):
+        self.component = component
+        self.index = index
+        self.process: Optional[multiprocessing.Process] = None
+        self.probe: Optional[Probe] = None
+        self.started_at = 0.0
+        self.ready_reported = False
+        self.starts = 0
+        self.failures = 0
+        self.restart_at = 0.0
+        self.terminated_at: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.component.name}-{self.index}"
+
+
+def parse_replicas(spec: str, defaults: Dict[str, int]) -> Dict[str, int]:
+    """
+    Parse "api=4,checkin_worker=1" into replica counts on top of the defaults
+
+    Raises:
+        ValueError: for an unknown component or a malformed entry
+    """
+    replicas = dict(defaults)
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        name, separator, count = entry.partition('=')
+        name = name.strip()
+        if not separator or name not in replicas:
+            raise ValueError(f"Invalid replica entry '{entry}' (components: {', '.join(replicas)})")
+        replicas[name] = int(count)
+    return replicas
+
+
+class Supervisor:
+    """
+    Keeps the configured replicas of every component running
+
+    A replica that exits, or whose heartbeat stops because its main loop is
+    stuck, is restarted after an exponential backoff (backoff_initial
+    doubling up to backoff_max) that resets once the replica has stayed up
+    for stable_after seconds. A stuck replica gets SIGTERM and kill_grace
+    seconds to exit before SIGKILL, so it can release the shared log queue
+    lock rather than die holding it. SIGTERM or SIGINT starts a drain: readiness
+    turns false, every replica receives SIGTERM and gets drain_timeout
+    seconds to finish its in-flight work before it is killed.
+    """
+
+    def __init__(
+        self,
+        components: List[Component],
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 30.0,
+        backoff_initial: float = 1.0,
+        backoff_max: float = 60.0,
+        stable_after: float = 60.0,
+        drain_timeout: float = 30.0,
+        kill_grace: float = 10.0,
+        probe_host: str = '127.0.0.1',
+        probe_port: Optional[int] = None,
+        poll_interval: float = 0.5
+    ):
+        self.components = components
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.drain_timeout = drain_timeout
+        self.kill_grace = kill_grace
+        self.probe_host = probe_host
+        self.probe_port = probe_port
+        self.poll_interval = poll_interval
+
+        self._replicas = [_Replica(component, index) for component in components for index in range(component.replicas)]
+        self._stopping = threading.Event()
+        self._probe_server: Optional[ProbeServer] = None
+        self._last_tick = 0.0
+        self._snapshot = self._describe(time.time())
+
+    def run(self) -> None:
+        """Supervise until SIGTERM/SIGINT (or stop()), then drain every replica"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._on_signal)
+            signal.signal(signal.SIGINT, self._on_signal)
+        if self.probe_port is not None:
+            self._probe_server = ProbeServer(self.probe_host, self.probe_port, self.status)
+            self._probe_server.start()
+
+        logger.info("Supervising " + ", ".join(f"{c.name} x{c.replicas}" for c in self.components))
+        try:
+            while not self._stopping.is_set():
+                now = time.time()
+                for replica in self._replicas:
+                    self._check(replica, now)
+                self._snapshot = self._describe(now)
+                self._last_tick = time.monotonic()
+                self._stopping.wait(self.poll_interval)
+            self._drain()
+        finally:
+            if self._probe_server:
+                self._probe_server.stop()
+
+    def stop(self) -> None:
+        """Start the drain; run() returns once every replica has stopped"""
+        self._stopping.set()
+
+    def status(self) -> Tuple[bool, bool, Dict]:
+        """(live, ready, details) as served by the probe endpoints"""
+        live = time.monotonic() - self._last_tick < max(5.0, 10 * self.poll_interval)
+        draining = self._stopping.is_set()
+        snapshot = self._snapshot
+        ready = live and not draining and all(
+            entry['ready'] > 0 for entry in snapshot.values() if entry['replicas']
+        )
+        return live, ready, {'draining': draining, 'components': snapshot}
+
+    def _on_signal(self, signum, frame) -> None:
+        logger.info(f"Received {signal.Signals(signum).name}, draining")
+        self._stopping.set()
+
+    def _check(self, replica: _Replica, now: float) -> None:
+        process = replica.process
+        if process is None:
+            if now >= replica.restart_at:
+                self._start(replica, now)
+            return
+
+        if process.is_alive():
+            last_heartbeat = max(replica.probe.last_heartbeat, replica.started_at)
+            if now - last_heartbeat <= self.heartbeat_timeout:
+                if replica.probe.is_ready and not replica.ready_reported:
+                    # Startup time as seen by traffic: fork to ready
+                    replica.ready_reported = True
+                    logger.info(f"{replica.name} ready after {now - replica.started_at:.1f}s")
+                return
+            if replica.terminated_at is None:
+                logger.error(f"{replica.name} (pid {process.pid}) sent no heartbeat for "
+                             f"{now - last_heartbeat:.0f}s, terminating it")
+                replica.terminated_at = now
+                process.terminate()
+                return
+            if now - replica.terminated_at < self.kill_grace:
+                return
+            logger.error(f"{replica.name} (pid {process.pid}) did not exit {self.kill_grace:.0f}s "
+                         f"after SIGTERM, killing it")
+            process.kill()
+            process.join()
+
+        uptime = now - replica.started_at
+        if uptime >= self.stable_after:
+            replica.failures = 0
+        delay = min(self.backoff_initial * 2 ** replica.failures, self.backoff_max)
+        replica.failures += 1
+        logger.warning(f"{replica.name} (pid {process.pid}) exited with code {process.exitcode} "
+                       f"after {uptime:.0f}s, restarting in {delay:.0f}s")
+        process.close()
+        replica.process = None
+        replica.restart_at = now + delay
+
+    def _start(self, replica: _Replica, now: float) -> None:
+        replica.probe = Probe(self.heartbeat_interval)
+        replica.process = multiprocessing.Process(
+            target=self._bootstrap,
+            args=(replica.component, replica.probe),
+            name=replica.name
+        )
+        replica.process.start()
+        replica.started_at = now
+        replica.ready_reported = False
+        replica.terminated_at = None
+        replica.starts += 1
+        logger.info(f"Started {replica.name} (pid {replica.process.pid})")
+
+    def _bootstrap(self, component: Component, probe: Probe) -> None:
+        # Runs in the forked replica, which inherited the supervisor's signal handlers and probe socket
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        # Ctrl+C reaches the whole process group; the supervisor turns it into an orderly SIGTERM
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        if self._probe_server:
+            self._probe_server.close_inherited()
+        # Covers startup; from then on the component beats from its main loop
+        probe.beat()
+        component.target(probe)
+
+    def _drain(self) -> None:
+        running = [replica for replica in self._replicas if replica.process is not None and replica.process.is_alive()]
+        logger.info(f"Draining {len(running)} replica(s), waiting up to {self.drain_timeout:.0f}s")
+        for replica in running:
+            replica.probe.ready(False)
+            replica.process.terminate()
+
+        deadline = time.monotonic() + self.drain_timeout
+        for replica in running:
+            replica.process.join(max(0.0, deadline - time.monotonic()))
+        for replica in running:
+            if replica.process.is_alive():
+                logger.warning(f"{replica.name} (pid {replica.process.pid}) did not drain in time, killing it")
+                replica.process.kill()
+                replica.process.join()
+        logger.info("All replicas stopped")
+
+    def _describe(self, now: float) -> Dict:
+        components = {component.name: {'replicas': [], 'ready': 0} for component in self.components}
+        for replica in self._replicas:
+            process = replica.process
+            alive = process is not None and process.is_alive()
+            ready = alive and replica.probe.is_ready and now - replica.probe.last_heartbeat <= self.heartbeat_timeout
+            entry = components[replica.component.name]
+            entry['ready'] += ready
+            entry['replicas'].append({
+                'name': replica.name,
+                'pid': process.pid if process is not None else None,
+                'alive': alive,
+                'ready': ready,
+                'restarts': max(replica.starts - 1, 0),
+                'uptime': round(now - replica.started_at) if alive else 0,
+            })
+        return components
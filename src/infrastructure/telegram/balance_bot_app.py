@@ -1,3 +1,5 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -12,6 +14,7 @@ from ...infrastructure.google_sheets.sheets_service import GoogleSheetsService
 from ...application.use_cases.get_balance_summary import GetBalanceSummaryUseCase
 from ...presentation.handlers.balance_summary_handler import BalanceSummaryHandler
 from ...infrastructure.llm.expense_parser_client import ExpenseParserClient
+from ..metrics.telegram_metrics import MeteredHTTPXRequest, instrument_handlers
 
 
 class BalanceBotApplication:
@@ -19,7 +22,10 @@ class BalanceBotApplication:
 
     def __init__(self):
         # Create application with balance bot token
-        self.app = Application.builder().token(settings.BALANCE_BOT_TOKEN).build()
+        builder = Application.builder().token(settings.BALANCE_BOT_TOKEN)
+        if settings.METRICS_ENABLED:
+            builder = builder.request(MeteredHTTPXRequest(connection_pool_size=256))
+        self.app = builder.build()
 
         self.sheets_service = GoogleSheetsService()
         self.expense_parser = ExpenseParserClient()
@@ -105,7 +111,35 @@ class BalanceBotApplication:
             )
         )
 
-    def run(self):
-        """Start the bot"""
+        if settings.METRICS_ENABLED or settings.DB_PROFILING_ENABLED:
+            instrument_handlers(self.app, 'balance_bot', profile=settings.DB_PROFILING_ENABLED)
+
+    def run(
+        self,
+        heartbeat: Optional[Callable[[], Awaitable[None]]] = None,
+        on_ready: Optional[Callable[[], None]] = None
+    ):
+        """
+        Start the bot
+
+        Args:
+            heartbeat: Coroutine function run as a task on the bot's event loop
+                (supervisor liveness), so it stops beating when the loop is blocked
+            on_ready: Called once the bot has initialized (reached Telegram) and
+                is about to start polling (supervisor readiness)
+        """
         print("Balance Bot is running...")
+
+        async def post_init(app):
+            if heartbeat:
+                self._heartbeat_task = asyncio.get_running_loop().create_task(heartbeat())
+            if on_ready:
+                on_ready()
+
+        async def post_shutdown(app):
+            if heartbeat:
+                self._heartbeat_task.cancel()
+
+        self.app.post_init = post_init
+        self.app.post_shutdown = post_shutdown
         self.app.run_polling()
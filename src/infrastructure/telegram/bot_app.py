@@ -1,3 +1,5 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
@@ -11,9 +13,6 @@ from telegram.ext import (
 from telegram.error import TelegramError
 from ...infrastructure.config.settings import settings
 from ...infrastructure.persistence.database import database
-from ...infrastructure.persistence.employee_repository_impl import EmployeeRepository
-from ...infrastructure.persistence.check_in_repository_impl import CheckInRepository
-from ...infrastructure.persistence.salary_advance_repository_impl import SalaryAdvanceRepository
 from ...presentation.handlers.employee_handler import WAITING_EMPLOYEE_NAME
 from ...presentation.handlers.registration_handler import WAITING_FOR_BUSINESS_NAME
 from ...presentation.handlers.salary_advance_handler import (
@@ -40,11 +39,11 @@ from ...presentation.handlers.vehicle_operations_handler import (
     UPLOAD_FUEL_RECEIPT
 )
 from ...presentation.handlers.report_handler import SELECT_VEHICLE_FOR_PERFORMANCE
-from ...infrastructure.persistence.vehicle_repository_impl import VehicleRepository
-from ...infrastructure.persistence.trip_repository_impl import TripRepository
-from ...infrastructure.persistence.fuel_record_repository_impl import FuelRecordRepository
 
 # Import wrapper modules
+from .dependency_container import BotContainer, UpdateScopedApplication
+from .sql_persistence import SQLPersistence
+from ..metrics.telegram_metrics import MeteredHTTPXRequest, instrument_handlers
 from .wrappers.employee_wrappers import create_employee_wrappers
 from .wrappers.salary_wrappers import create_salary_wrappers
 from .wrappers.registration_wrappers import create_registration_wrappers
@@ -61,50 +60,22 @@ class BotApplication:
 
         # Create application with check-in bot token (or fallback to BOT_TOKEN for backward compatibility)
         bot_token = settings.CHECKIN_BOT_TOKEN or settings.BOT_TOKEN
-        self.app = Application.builder().token(bot_token).build()
+        self.container = BotContainer()
+        builder = (
+            Application.builder()
+            .token(bot_token)
+            .application_class(UpdateScopedApplication, kwargs={'container': self.container})
+        )
+        if settings.METRICS_ENABLED:
+            builder = builder.request(MeteredHTTPXRequest(connection_pool_size=256))
+        if settings.BOT_PERSISTENCE_ENABLED:
+            # Keep half-finished conversations across restarts
+            builder = builder.persistence(SQLPersistence(update_interval=settings.BOT_PERSISTENCE_UPDATE_INTERVAL))
+        self.app = builder.build()
 
         # Setup handlers
         self._setup_handlers()
 
-    def _get_repositories(self):
-        """Get repository instances with a new session"""
-        session = database.get_session()
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-        from ...infrastructure.persistence.employee_group_repository_impl import EmployeeGroupRepository
-        from ...infrastructure.persistence.telegram_user_repository_impl import TelegramUserRepository
-
-        return (
-            session,
-            EmployeeRepository(session),
-            CheckInRepository(session),
-            SalaryAdvanceRepository(session),
-            GroupRepository(session),
-            EmployeeGroupRepository(session),
-            VehicleRepository(session),
-            TripRepository(session),
-            FuelRecordRepository(session),
-            TelegramUserRepository(session)
-        )
-
-    def _get_repositories_for_handlers(self):
-        """Get repository tuple unpacked specifically for handlers"""
-        (session, employee_repo, check_in_repo, salary_advance_repo,
-         group_repo, employee_group_repo, vehicle_repo, trip_repo,
-         fuel_repo, telegram_user_repo) = self._get_repositories()
-
-        return {
-            'session': session,
-            'employee_repo': employee_repo,
-            'check_in_repo': check_in_repo,
-            'salary_advance_repo': salary_advance_repo,
-            'group_repo': group_repo,
-            'employee_group_repo': employee_group_repo,
-            'vehicle_repo': vehicle_repo,
-            'trip_repo': trip_repo,
-            'fuel_repo': fuel_repo,
-            'telegram_user_repo': telegram_user_repo
-        }
-
     async def show_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE, employee_name: str = None):
         """Show main menu"""
         user = update.effective_user
@@ -192,13 +163,13 @@ class BotApplication:
     def _setup_handlers(self):
         """Setup all conversation handlers"""
         # Create wrapper functions from modules
-        employee_wrappers = create_employee_wrappers(self._get_repositories, self.show_menu)
-        salary_wrappers = create_salary_wrappers(self._get_repositories, self.show_menu)
-        registration_wrappers = create_registration_wrappers(self._get_repositories_for_handlers)
-        menu_wrappers = create_menu_wrappers(self._get_repositories_for_handlers)
-        setup_wrappers = create_setup_wrappers(self._get_repositories)
-        vehicle_ops_wrappers = create_vehicle_operations_wrappers(self._get_repositories)
-        report_wrappers = create_report_wrappers(self._get_repositories)
+        employee_wrappers = create_employee_wrappers(self.container, self.show_menu)
+        salary_wrappers = create_salary_wrappers(self.container, self.show_menu)
+        registration_wrappers = create_registration_wrappers(self.container)
+        menu_wrappers = create_menu_wrappers(self.container)
+        setup_wrappers = create_setup_wrappers(self.container)
+        vehicle_ops_wrappers = create_vehicle_operations_wrappers(self.container)
+        report_wrappers = create_report_wrappers(self.container)
 
         # Extract wrappers for easier reference
         start_wrapper = employee_wrappers['start_wrapper']
@@ -268,6 +239,8 @@ class BotApplication:
                 WAITING_EMPLOYEE_NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, register_wrapper)],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="registration",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Placeholder handler for request advance button
@@ -288,6 +261,8 @@ class BotApplication:
                 WAITING_ADVANCE_NOTE: [MessageHandler(filters.TEXT & ~filters.COMMAND, salary_advance_save_wrapper)],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="salary_advance",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Setup conversation handler
@@ -327,6 +302,8 @@ class BotApplication:
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="setup",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Trip recording conversation handler
@@ -347,6 +324,8 @@ class BotApplication:
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="trip_recording",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Fuel recording conversation handler
@@ -371,6 +350,8 @@ class BotApplication:
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="fuel_recording",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Vehicle performance conversation handler
@@ -384,6 +365,8 @@ class BotApplication:
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="vehicle_performance",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Group registration conversation handler
@@ -397,6 +380,8 @@ class BotApplication:
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.cancel)],
+            name="group_registration",
+            persistent=settings.BOT_PERSISTENCE_ENABLED,
         )
 
         # Add handlers
@@ -442,7 +427,35 @@ class BotApplication:
         # Add cancel handlers
         self.app.add_handler(CallbackQueryHandler(cancel_menu_wrapper, pattern="^cancel_menu$"))
 
-    def run(self):
-        """Start the bot"""
+        if settings.METRICS_ENABLED or settings.DB_PROFILING_ENABLED:
+            instrument_handlers(self.app, 'checkin_bot', profile=settings.DB_PROFILING_ENABLED)
+
+    def run(
+        self,
+        heartbeat: Optional[Callable[[], Awaitable[None]]] = None,
+        on_ready: Optional[Callable[[], None]] = None
+    ):
+        """
+        Start the bot
+
+        Args:
+            heartbeat: Coroutine function run as a task on the bot's event loop
+                (supervisor liveness), so it stops beating when the loop is blocked
+            on_ready: Called once the bot has initialized (reached Telegram) and
+                is about to start polling (supervisor readiness)
+        """
         print("Check-in Bot is running...")
+
+        async def post_init(app):
+            if heartbeat:
+                self._heartbeat_task = asyncio.get_running_loop().create_task(heartbeat())
+            if on_ready:
+                on_ready()
+
+        async def post_shutdown(app):
+            if heartbeat:
+                self._heartbeat_task.cancel()
+
+        self.app.post_init = post_init
+        self.app.post_shutdown = post_shutdown
         self.app.run_polling()
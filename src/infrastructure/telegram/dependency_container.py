@@ -0,0 +1,135 @@
+"""
+Per-update dependencies for the check-in bot
+
+Handlers, use cases and repositories are stateless, so they are built once
+and shared by every update. Repositories are given a scoped session that
+resolves to the current update's own Session: it is opened on first use
+(updates that never touch the database never open one) and closed once the
+update has been processed, even if a handler raises. Group and vehicle
+lookups are additionally cached across updates (see cached_repositories).
+
+The scope is entered by UpdateScopedApplication.process_update, so handlers
+must run blocking (the PTB default); a non-blocking handler could outlive
+its update's session.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session, scoped_session
+from telegram.ext import Application
+
+from ..config.settings import settings
+from ..persistence.database import database
+from ..persistence.employee_repository_impl import EmployeeRepository
+from ..persistence.check_in_repository_impl import CheckInRepository
+from ..persistence.salary_advance_repository_impl import SalaryAdvanceRepository
+from ..persistence.group_repository_impl import GroupRepository
+from ..persistence.employee_group_repository_impl import EmployeeGroupRepository
+from ..persistence.vehicle_repository_impl import VehicleRepository
+from ..persistence.trip_repository_impl import TripRepository
+from ..persistence.fuel_record_repository_impl import FuelRecordRepository
+from ..persistence.telegram_user_repository_impl import TelegramUserRepository
+from ..persistence.vehicle_daily_stats_repository_impl import VehicleDailyStatsRepository
+from ..persistence.unit_of_work import SqlAlchemyUnitOfWork
+from ..persistence.cached_repositories import CachedGroupRepository, CachedVehicleRepository
+from ..utils.ttl_cache import TTLCache
+from ..metrics.registry import cache_lookup_recorder
+
+_current_scope: ContextVar[Optional[object]] = ContextVar('bot_update_scope', default=None)
+
+
+def _scope_key() -> object:
+    key = _current_scope.get()
+    if key is None:
+        raise RuntimeError("Database access outside of an update scope")
+    return key
+
+
+class BotContainer:
+    """Lazily built, shared repositories backed by a per-update session"""
+
+    def __init__(self, session_factory: Callable[[], Session] = None):
+        self.session = scoped_session(session_factory or database.SessionLocal, scopefunc=_scope_key)
+
+    @contextmanager
+    def update_scope(self):
+        """Give the enclosed code its own session, closed on exit"""
+        token = _current_scope.set(object())
+        try:
+            yield
+        finally:
+            try:
+                self.session.remove()
+            finally:
+                _current_scope.reset(token)
+
+    @cached_property
+    def employee_repo(self) -> EmployeeRepository:
+        return EmployeeRepository(self.session)
+
+    @cached_property
+    def check_in_repo(self) -> CheckInRepository:
+        return CheckInRepository(self.session)
+
+    @cached_property
+    def salary_advance_repo(self) -> SalaryAdvanceRepository:
+        return SalaryAdvanceRepository(self.session)
+
+    @cached_property
+    def group_repo(self) -> CachedGroupRepository:
+        return CachedGroupRepository(
+            GroupRepository(self.session),
+            TTLCache(ttl=settings.BOT_GROUP_CACHE_TTL, maxsize=4096, on_lookup=cache_lookup_recorder('bot_group'))
+        )
+
+    @cached_property
+    def employee_group_repo(self) -> EmployeeGroupRepository:
+        return EmployeeGroupRepository(self.session)
+
+    @cached_property
+    def vehicle_repo(self) -> CachedVehicleRepository:
+        return CachedVehicleRepository(
+            VehicleRepository(self.session),
+            TTLCache(ttl=settings.BOT_VEHICLE_CACHE_TTL, maxsize=4096, on_lookup=cache_lookup_recorder('bot_vehicle'))
+        )
+
+    @cached_property
+    def trip_repo(self) -> TripRepository:
+        return TripRepository(self.session)
+
+    @cached_property
+    def fuel_repo(self) -> FuelRecordRepository:
+        return FuelRecordRepository(self.session)
+
+    @cached_property
+    def telegram_user_repo(self) -> TelegramUserRepository:
+        return TelegramUserRepository(self.session)
+
+    @cached_property
+    def stats_repo(self) -> VehicleDailyStatsRepository:
+        return VehicleDailyStatsRepository(self.session)
+
+    @cached_property
+    def unit_of_work(self) -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(self.session)
+
+
+class UpdateScopedApplication(Application):
+    """Application that processes every update inside the container's update scope"""
+
+    def __init__(self, *, container: BotContainer, **kwargs):
+        super().__init__(**kwargs)
+        self.container = container
+
+    async def process_update(self, update: object) -> None:
+        with self.container.update_scope():
+            await super().process_update(update)
+
+    async def update_persistence(self) -> None:
+        # Write each periodic persistence run as one batch instead of waiting for shutdown
+        await super().update_persistence()
+        if self.persistence:
+            await self.persistence.flush()
@@ -7,6 +7,8 @@ import os
 from telegram import Bot
 from telegram.error import TelegramError
 from ...infrastructure.config.settings import settings
+from ..metrics.telegram_metrics import MeteredHTTPXRequest
+from ..services.photo_storage_service import PhotoStorageService
 
 
 class TelegramNotificationService:
@@ -17,7 +19,12 @@ class TelegramNotificationService:
         bot_token = settings.CHECKIN_BOT_TOKEN or settings.BOT_TOKEN
         if not bot_token:
             raise ValueError("Bot token not configured")
-        self.bot = Bot(token=bot_token)
+        self.bot = Bot(
+            token=bot_token,
+            base_url=settings.TELEGRAM_BOT_API_URL,
+            request=MeteredHTTPXRequest() if settings.METRICS_ENABLED else None
+        )
+        self.photo_storage = PhotoStorageService()
 
     def send_checkin_notification(
         self,
@@ -69,9 +76,9 @@ class TelegramNotificationService:
             try:
                 # If photo_url is provided, send photo with caption
                 if photo_url:
-                    # Convert relative path to absolute if needed
-                    photo_path = photo_url.lstrip('/')
-                    if os.path.exists(photo_path):
+                    # Resolve the photo URL to its file under PHOTO_UPLOAD_DIR
+                    photo_path = self.photo_storage.path_for_url(photo_url)
+                    if photo_path and os.path.exists(photo_path):
                         with open(photo_path, 'rb') as photo_file:
                             loop.run_until_complete(
                                 self.bot.send_photo(
@@ -83,7 +90,7 @@ class TelegramNotificationService:
                             )
                     else:
                         # If file doesn't exist, just send text message
-                        print(f"Photo file not found: {photo_path}")
+                        print(f"Photo file not found: {photo_url}")
                         loop.run_until_complete(
                             self.bot.send_message(
                                 chat_id=group_chat_id,
@@ -156,9 +163,9 @@ class TelegramNotificationService:
 
             # If photo_url is provided, send photo with caption
             if photo_url:
-                # Convert relative path to absolute if needed
-                photo_path = photo_url.lstrip('/')
-                if os.path.exists(photo_path):
+                # Resolve the photo URL to its file under PHOTO_UPLOAD_DIR
+                photo_path = self.photo_storage.path_for_url(photo_url)
+                if photo_path and os.path.exists(photo_path):
                     with open(photo_path, 'rb') as photo_file:
                         await self.bot.send_photo(
                             chat_id=group_chat_id,
@@ -168,7 +175,7 @@ class TelegramNotificationService:
                         )
                 else:
                     # If file doesn't exist, just send text message
-                    print(f"Photo file not found: {photo_path}")
+                    print(f"Photo file not found: {photo_url}")
                     await self.bot.send_message(
                         chat_id=group_chat_id,
                         text=message,
@@ -240,9 +247,9 @@ class TelegramNotificationService:
             try:
                 # If photo_url is provided, send photo with caption
                 if photo_url:
-                    # Convert relative path to absolute if needed
-                    photo_path = photo_url.lstrip('/')
-                    if os.path.exists(photo_path):
+                    # Resolve the photo URL to its file under PHOTO_UPLOAD_DIR
+                    photo_path = self.photo_storage.path_for_url(photo_url)
+                    if photo_path and os.path.exists(photo_path):
                         with open(photo_path, 'rb') as photo_file:
                             loop.run_until_complete(
                                 self.bot.send_photo(
@@ -254,7 +261,7 @@ class TelegramNotificationService:
                             )
                     else:
                         # If file doesn't exist, just send text message
-                        print(f"Photo file not found: {photo_path}")
+                        print(f"Photo file not found: {photo_url}")
                         loop.run_until_complete(
                             self.bot.send_message(
                                 chat_id=group_chat_id,
@@ -327,9 +334,9 @@ class TelegramNotificationService:
 
             # If photo_url is provided, send photo with caption
             if photo_url:
-                # Convert relative path to absolute if needed
-                photo_path = photo_url.lstrip('/')
-                if os.path.exists(photo_path):
+                # Resolve the photo URL to its file under PHOTO_UPLOAD_DIR
+                photo_path = self.photo_storage.path_for_url(photo_url)
+                if photo_path and os.path.exists(photo_path):
                     with open(photo_path, 'rb') as photo_file:
                         await self.bot.send_photo(
                             chat_id=group_chat_id,
@@ -339,7 +346,7 @@ class TelegramNotificationService:
                         )
                 else:
                     # If file doesn't exist, just send text message
-                    print(f"Photo file not found: {photo_path}")
+                    print(f"Photo file not found: {photo_url}")
                     await self.bot.send_message(
                         chat_id=group_chat_id,
                         text=message,
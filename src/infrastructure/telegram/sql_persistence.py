@@ -0,0 +1,181 @@
+"""
+MySQL-backed persistence for the check-in bot
+
+Keeps user_data, chat_data, bot_data and the states of persistent
+ConversationHandlers in the bot_persistence table, so half-finished trip,
+fuel, salary-advance and setup flows survive a restart.
+
+Nothing is written while updates are handled. PTB hands changed entries to
+the persistence every `update_interval` seconds (and once more on
+shutdown); they are buffered and written by flush() as one batch: a single
+multi-row upsert plus one DELETE for dropped entries, in one transaction.
+UpdateScopedApplication calls flush() after each of those runs.
+
+Values are stored as JSON. Entries that cannot be encoded are logged and
+skipped rather than failing the whole batch.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from telegram.ext import BasePersistence, PersistenceInput
+
+from ..persistence.database import database
+from ..persistence.models import BotPersistenceModel, utc_now
+from ..persistence.upsert import upsert_many
+
+logger = logging.getLogger(__name__)
+
+USER_DATA = 'user_data'
+CHAT_DATA = 'chat_data'
+BOT_DATA = 'bot_data'
+CONVERSATION = 'conversation'
+
+ConversationKey = Tuple[Union[int, str], ...]
+ConversationDict = Dict[ConversationKey, object]
+# (kind, name, entry_key) -> JSON document, or None to delete the row
+PendingWrites = Dict[Tuple[str, str, str], Optional[str]]
+
+
+class SQLPersistence(BasePersistence):
+    """PTB persistence storing bot state in MySQL with buffered, batched writes"""
+
+    def __init__(self, session_factory: Callable[[], Session] = None, update_interval: float = 60):
+        super().__init__(store_data=PersistenceInput(callback_data=False), update_interval=update_interval)
+        self.session_factory = session_factory or database.SessionLocal
+        self._pending: PendingWrites = {}
+        self._flush_lock = asyncio.Lock()
+
+    # ==================== Loading ====================
+
+    async def get_user_data(self) -> Dict[int, dict]:
+        rows = await asyncio.to_thread(self._load, USER_DATA)
+        return {int(key): data for (_, key), data in rows.items()}
+
+    async def get_chat_data(self) -> Dict[int, dict]:
+        rows = await asyncio.to_thread(self._load, CHAT_DATA)
+        return {int(key): data for (_, key), data in rows.items()}
+
+    async def get_bot_data(self) -> dict:
+        rows = await asyncio.to_thread(self._load, BOT_DATA)
+        return rows.get(('', ''), {})
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        rows = await asyncio.to_thread(self._load, CONVERSATION, name)
+        return {tuple(json.loads(key)): state for (_, key), state in rows.items()}
+
+    # ==================== Buffered updates ====================
+
+    async def update_user_data(self, user_id: int, data: dict) -> None:
+        self._buffer(USER_DATA, '', str(user_id), data or None)
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        self._buffer(CHAT_DATA, '', str(chat_id), data or None)
+
+    async def update_bot_data(self, data: dict) -> None:
+        self._buffer(BOT_DATA, '', '', data or None)
+
+    async def update_callback_data(self, data) -> None:
+        pass
+
+    async def update_conversation(self, name: str, key: ConversationKey, new_state: Optional[object]) -> None:
+        self._buffer(CONVERSATION, name, json.dumps(list(key)), new_state)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._buffer(USER_DATA, '', str(user_id), None)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        self._buffer(CHAT_DATA, '', str(chat_id), None)
+
+    # Only this process writes the state, so there is nothing to refresh
+    async def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        pass
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        pass
+
+    async def flush(self) -> None:
+        """Write all buffered changes in one transaction"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            try:
+                await asyncio.to_thread(self._write, pending)
+            except Exception as e:
+                # Keep the batch for the next run unless newer values arrived meanwhile
+                logger.error(f"Failed to write {len(pending)} bot persistence entries: {e}")
+                for entry, value in pending.items():
+                    self._pending.setdefault(entry, value)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of changes waiting for the next flush"""
+        return len(self._pending)
+
+    def _buffer(self, kind: str, name: str, entry_key: str, value) -> None:
+        if value is None:
+            self._pending[(kind, name, entry_key)] = None
+            return
+        try:
+            self._pending[(kind, name, entry_key)] = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping bot {kind} {name or ''}{entry_key}: not JSON serializable ({e})")
+
+    # ==================== Database ====================
+
+    def _load(self, kind: str, name: str = '') -> Dict[Tuple[str, str], object]:
+        session = self.session_factory()
+        try:
+            rows = session.query(
+                BotPersistenceModel.name,
+                BotPersistenceModel.entry_key,
+                BotPersistenceModel.data
+            ).filter_by(kind=kind, name=name).all()
+            return {(row_name, entry_key): json.loads(data) for row_name, entry_key, data in rows}
+        finally:
+            session.close()
+
+    def _write(self, pending: PendingWrites) -> None:
+        now = utc_now()
+        rows = [
+            {'kind': kind, 'name': name, 'entry_key': entry_key, 'data': data, 'updated_at': now}
+            for (kind, name, entry_key), data in pending.items()
+            if data is not None
+        ]
+        dropped = [entry for entry, data in pending.items() if data is None]
+
+        session = self.session_factory()
+        try:
+            upsert_many(
+                session,
+                BotPersistenceModel,
+                rows,
+                conflict_columns=['kind', 'name', 'entry_key'],
+                update_columns=['data', 'updated_at']
+            )
+            if dropped:
+                session.query(BotPersistenceModel).filter(or_(*(
+                    and_(
+                        BotPersistenceModel.kind == kind,
+                        BotPersistenceModel.name == name,
+                        BotPersistenceModel.entry_key == entry_key
+                    )
+                    for kind, name, entry_key in dropped
+                ))).delete(synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
@@ -3,74 +3,45 @@ Employee Registration Handler Wrappers
 Contains handlers for employee registration and related functionality
 """
 from telegram import Update
-from telegram.ext import ContextTypes, ConversationHandler
+from telegram.ext import ContextTypes
 from ....application.use_cases.register_employee import RegisterEmployeeUseCase
 from ....application.use_cases.get_employee import GetEmployeeUseCase
 from ....presentation.handlers.employee_handler import EmployeeHandler
 
 
-def create_employee_wrappers(get_repositories_func, show_menu_func):
+def create_employee_wrappers(container, show_menu_func):
     """
     Create employee-related handler wrappers
 
     Args:
-        get_repositories_func: Function that returns repository tuple
+        container: BotContainer providing the shared repositories
         show_menu_func: Function to show the main menu
 
     Returns:
         Dict of wrapper functions
     """
+    employee_handler = EmployeeHandler(
+        RegisterEmployeeUseCase(container.employee_repo),
+        GetEmployeeUseCase(container.employee_repo)
+    )
 
-    async def start_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        chat = update.effective_chat
-
-        session, employee_repo, _, _, _, _, _, _, _, _ = get_repositories_func()
-        employee_handler = EmployeeHandler(
-            RegisterEmployeeUseCase(employee_repo),
-            GetEmployeeUseCase(employee_repo)
-        )
-
-        # Create a wrapper for show_menu that skips in groups
-        async def show_menu_or_skip(update, context, employee_name=None):
-            if chat.type in ['group', 'supergroup']:
-                session.close()
-                return
-            await show_menu_func(update, context, employee_name)
-            session.close()
+    async def skip_menu(update, context, employee_name=None):
+        pass
 
-        return await employee_handler.start(update, context, show_menu_or_skip)
+    async def start_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        # In groups, don't show menu
+        if update.effective_chat.type in ['group', 'supergroup']:
+            return await employee_handler.start(update, context, skip_menu)
+        return await employee_handler.start(update, context, show_menu_func)
 
     async def register_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, _, _, _, _, _, _, _ = get_repositories_func()
-        employee_handler = EmployeeHandler(
-            RegisterEmployeeUseCase(employee_repo),
-            GetEmployeeUseCase(employee_repo)
-        )
-
-        chat = update.effective_chat
-
         # In groups, don't show menu
-        if chat.type in ['group', 'supergroup']:
-            async def skip_menu(update, context, employee_name=None):
-                session.close()
-            result = await employee_handler.register(update, context, skip_menu)
-            return result
-        else:
-            result = await employee_handler.register(update, context, show_menu_func)
-            session.close()
-            return result
+        if update.effective_chat.type in ['group', 'supergroup']:
+            return await employee_handler.register(update, context, skip_menu)
+        return await employee_handler.register(update, context, show_menu_func)
 
     async def register_command_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, _, _, _, _, _, _, _ = get_repositories_func()
-        employee_handler = EmployeeHandler(
-            RegisterEmployeeUseCase(employee_repo),
-            GetEmployeeUseCase(employee_repo)
-        )
-
         # In groups, don't show menu after registration
-        async def skip_menu(update, context, employee_name=None):
-            session.close()
-
         return await employee_handler.start(update, context, skip_menu)
 
     async def request_advance_placeholder(update: Update, context: ContextTypes.DEFAULT_TYPE):
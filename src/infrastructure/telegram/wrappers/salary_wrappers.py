@@ -8,61 +8,34 @@ from ....application.use_cases.record_salary_advance import RecordSalaryAdvanceU
 from ....presentation.handlers.salary_advance_handler import SalaryAdvanceHandler
 
 
-def create_salary_wrappers(get_repositories_func, show_menu_func):
+def create_salary_wrappers(container, show_menu_func):
     """
     Create salary advance handler wrappers
 
     Args:
-        get_repositories_func: Function that returns repository tuple
+        container: BotContainer providing the shared repositories
         show_menu_func: Function to show the main menu
 
     Returns:
         Dict of wrapper functions
     """
+    salary_advance_handler = SalaryAdvanceHandler(
+        RecordSalaryAdvanceUseCase(container.salary_advance_repo, container.employee_repo)
+    )
 
     async def salary_advance_start_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, salary_advance_repo, _, _, _, _, _, _ = get_repositories_func()
-        salary_advance_handler = SalaryAdvanceHandler(
-            RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo)
-        )
         if update.callback_query:
             await update.callback_query.answer()
             await update.callback_query.edit_message_reply_markup(reply_markup=None)
             context.chat_data['menu_message_id'] = update.callback_query.message.message_id
-        result = await salary_advance_handler.start(update, context)
-        session.close()
-        return result
-
-    async def salary_advance_amount_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, salary_advance_repo, _, _, _, _, _, _ = get_repositories_func()
-        salary_advance_handler = SalaryAdvanceHandler(
-            RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo)
-        )
-        result = await salary_advance_handler.get_amount(update, context)
-        session.close()
-        return result
-
-    async def salary_advance_note_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, salary_advance_repo, _, _, _, _, _, _ = get_repositories_func()
-        salary_advance_handler = SalaryAdvanceHandler(
-            RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo)
-        )
-        result = await salary_advance_handler.get_note(update, context)
-        session.close()
-        return result
+        return await salary_advance_handler.start(update, context)
 
     async def salary_advance_save_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        session, employee_repo, _, salary_advance_repo, _, _, _, _, _, _ = get_repositories_func()
-        salary_advance_handler = SalaryAdvanceHandler(
-            RecordSalaryAdvanceUseCase(salary_advance_repo, employee_repo)
-        )
-        result = await salary_advance_handler.save(update, context, show_menu_func)
-        session.close()
-        return result
+        return await salary_advance_handler.save(update, context, show_menu_func)
 
     return {
         'salary_advance_start_wrapper': salary_advance_start_wrapper,
-        'salary_advance_amount_wrapper': salary_advance_amount_wrapper,
-        'salary_advance_note_wrapper': salary_advance_note_wrapper,
+        'salary_advance_amount_wrapper': salary_advance_handler.get_amount,
+        'salary_advance_note_wrapper': salary_advance_handler.get_note,
         'salary_advance_save_wrapper': salary_advance_save_wrapper,
     }
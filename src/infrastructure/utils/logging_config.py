@@ -1,6 +1,29 @@
+"""
+Logging setup shared by the bots and the API server
+
+Records are written by a single QueueListener thread: application threads
+only put records on a queue, so formatting, level filtering and disk I/O
+stay off the request and update paths. With multiprocess=True (main.py)
+the queue is a multiprocessing queue created before the workers are forked
+and the parent process is the only writer, which keeps file rotation safe.
+
+Environment:
+    LOGS_ROOT        directory of the per-level log folders
+    LOG_LEVEL        root level (default DEBUG)
+    LOG_FORMAT       "text" (default) or "json", one object per line
+    LOG_SAMPLE_RATE  share of high-volume INFO records kept (default 0.1)
+"""
+
+import atexit
+import json
 import logging
 import logging.config
+import multiprocessing
 import os
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -16,14 +39,52 @@ class _LevelFilter(logging.Filter):
         return self.min_level <= record.levelno <= self.max_level
 
 
+class _SamplingFilter(logging.Filter):
+    """
+    Keeps a share of records logged with extra={"sample": True}
+
+    Only INFO and below are sampled; warnings and errors always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sample", False) or record.levelno > logging.INFO:
+            return True
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.processName,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
 def _default_logs_root() -> Path:
     return Path(__file__).resolve().parents[3] / "logs"
 
 
-def setup_logging(logs_root: Path | None = None) -> None:
+def setup_logging(logs_root: Path | None = None, multiprocess: bool = False) -> QueueListener | None:
+    """
+    Configure the root logger to hand records to a background writer
+
+    Returns the started QueueListener, or None if logging was already set up
+    in this process (or inherited from the parent of a forked worker).
+    """
     root_logger = logging.getLogger()
     if getattr(root_logger, "_office_automation_configured", False):
-        return
+        return None
 
     logs_root = logs_root or Path(os.getenv("LOGS_ROOT", _default_logs_root()))
     level_dirs = {
@@ -34,6 +95,7 @@ def setup_logging(logs_root: Path | None = None) -> None:
     }
     for path in level_dirs.values():
         path.mkdir(parents=True, exist_ok=True)
+    formatter = "json" if os.getenv("LOG_FORMAT", "text").lower() == "json" else "standard"
 
     logging_config = {
         "version": 1,
@@ -62,19 +124,22 @@ def setup_logging(logs_root: Path | None = None) -> None:
         "formatters": {
             "standard": {
                 "format": "%(asctime)s %(levelname)s %(name)s: %(message)s"
-            }
+            },
+            "json": {
+                "()": _JsonFormatter,
+            },
         },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
                 "level": "DEBUG",
-                "formatter": "standard",
+                "formatter": formatter,
                 "stream": "ext://sys.stdout",
             },
             "debug_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "DEBUG",
-                "formatter": "standard",
+                "formatter": formatter,
                 "filters": ["debug_only"],
                 "filename": str(level_dirs["debug"] / "app.log"),
                 "maxBytes": 5 * 1024 * 1024,
@@ -84,7 +149,7 @@ def setup_logging(logs_root: Path | None = None) -> None:
             "info_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "INFO",
-                "formatter": "standard",
+                "formatter": formatter,
                 "filters": ["info_only"],
                 "filename": str(level_dirs["info"] / "app.log"),
                 "maxBytes": 5 * 1024 * 1024,
@@ -94,7 +159,7 @@ def setup_logging(logs_root: Path | None = None) -> None:
             "warning_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "WARNING",
-                "formatter": "standard",
+                "formatter": formatter,
                 "filters": ["warning_only"],
                 "filename": str(level_dirs["warning"] / "app.log"),
                 "maxBytes": 5 * 1024 * 1024,
@@ -104,7 +169,7 @@ def setup_logging(logs_root: Path | None = None) -> None:
             "error_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "ERROR",
-                "formatter": "standard",
+                "formatter": formatter,
                 "filters": ["error_and_above"],
                 "filename": str(level_dirs["error"] / "app.log"),
                 "maxBytes": 5 * 1024 * 1024,
@@ -125,4 +190,26 @@ def setup_logging(logs_root: Path | None = None) -> None:
     }
 
     logging.config.dictConfig(logging_config)
+
+    # Move the configured handlers behind a queue served by one writer thread
+    handlers = root_logger.handlers[:]
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    log_queue = multiprocessing.Queue(-1) if multiprocess else queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(_stop_listener, listener, os.getpid())
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_SamplingFilter(float(os.getenv("LOG_SAMPLE_RATE", "0.1"))))
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(os.getenv("LOG_LEVEL", "DEBUG").upper())
     root_logger._office_automation_configured = True
+    return listener
+
+
+def _stop_listener(listener: QueueListener, owner_pid: int) -> None:
+    # Forked workers inherit this atexit hook; only the process running the writer may stop it.
+    # The listener may already be stopped (QueueListener.stop is not idempotent before 3.12).
+    if os.getpid() == owner_pid and listener._thread is not None:
+        listener.stop()
@@ -0,0 +1,79 @@
+import base64
+import json
+from typing import Any, List
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode keyset pagination values into an opaque, URL-safe cursor
+
+    Args:
+        values: JSON-serializable values of the last row on the page (e.g. [created_at_iso, id])
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+
+    Returns:
+        List of keyset values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def parse_limit(value: str, default: int = 50, maximum: int = 200) -> int:
+    """
+    Parse a page size query parameter, clamped to [1, maximum]
+
+    Args:
+        value: Raw query parameter value (may be None)
+        default: Page size when the parameter is absent
+        maximum: Largest page size allowed
+
+    Returns:
+        Page size
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    if value is None or value == '':
+        return default
+    return max(1, min(int(value), maximum))
+
+
+def parse_offset(value: str) -> int:
+    """
+    Parse an offset query parameter, clamped to be non-negative
+
+    Args:
+        value: Raw query parameter value (may be None)
+
+    Returns:
+        Number of rows to skip (0 when the parameter is absent)
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    if value is None or value == '':
+        return 0
+    return max(0, int(value))
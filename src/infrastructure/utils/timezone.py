@@ -113,3 +113,28 @@ def ict_date_to_utc_range(ict_date: date) -> tuple[datetime, datetime]:
     end_utc = end_ict.astimezone(timezone.utc).replace(tzinfo=None)
 
     return start_utc, end_utc
+
+
+def ict_month_to_utc_range(year: int, month: int) -> tuple[datetime, datetime]:
+    """
+    Convert an ICT calendar month to a UTC datetime range (start and end of month)
+
+    Example:
+        ICT month 2025-12
+        -> Start: 2025-11-30 17:00:00 UTC (2025-12-01 00:00:00 ICT)
+        -> End:   2025-12-31 16:59:59 UTC (2025-12-31 23:59:59 ICT)
+
+    Args:
+        year: Calendar year
+        month: Calendar month (1-12)
+
+    Returns:
+        Tuple of (start_datetime_utc, end_datetime_utc)
+    """
+    first_day = date(year, month, 1)
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    last_day = next_month - timedelta(days=1)
+
+    start_utc, _ = ict_date_to_utc_range(first_day)
+    _, end_utc = ict_date_to_utc_range(last_day)
+    return start_utc, end_utc
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache with per-entry expiry and LRU eviction
+
+    Entries live for `ttl` seconds. When `maxsize` is reached the least
+    recently used entry is evicted. The cache is per process, so values
+    written in one process are never seen (or invalidated) by another.
+    Every lookup is reported to `on_lookup` (True for a hit) when one is given,
+    e.g. the cache_lookups metric hook from cache_lookup_recorder().
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024, on_lookup: Optional[Callable[[bool], None]] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.on_lookup = on_lookup
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                hit, value = False, default
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                hit, value = True, entry[1]
+        if self.on_lookup:
+            self.on_lookup(hit)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (defaults to the cache TTL)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key if present"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every key for which predicate(key) is true; returns the number removed"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -145,10 +145,11 @@ class CheckInReportHandler:
                 f"No check-ins for today."
             )
 
-        # Collect all check-in data
+        # Collect all check-in data (employees loaded in one query)
+        employees = self.employee_repository.find_by_ids(checkin.employee_id for checkin in check_ins)
         check_in_data = []
         for checkin in check_ins:
-            employee = self.employee_repository.find_by_id(checkin.employee_id)
+            employee = employees.get(checkin.employee_id)
             employee_name = employee.name if employee else 'Unknown'
             time_str = format_ict_time(checkin.timestamp) if checkin.timestamp else "N/A"
             type_str = checkin.type.value if hasattr(checkin, 'type') else 'checkin'
@@ -225,12 +226,13 @@ class CheckInReportHandler:
                 f"No check-ins for this month."
             )
 
-        # Group check-ins by employee
+        # Group check-ins by employee (employees loaded in one query)
+        employees = self.employee_repository.find_by_ids(checkin.employee_id for checkin in check_ins)
         employee_stats = {}
         for checkin in check_ins:
             emp_id = checkin.employee_id
             if emp_id not in employee_stats:
-                employee = self.employee_repository.find_by_id(emp_id)
+                employee = employees.get(emp_id)
                 employee_stats[emp_id] = {
                     'name': employee.name if employee else 'Unknown',
                     'count': 0,
@@ -309,12 +311,7 @@ class CheckInReportHandler:
                 return
 
             # Build employees dictionary
-            employees = {}
-            for checkin in check_ins:
-                if checkin.employee_id not in employees:
-                    employee = self.employee_repository.find_by_id(checkin.employee_id)
-                    if employee:
-                        employees[checkin.employee_id] = employee
+            employees = self.employee_repository.find_by_ids(checkin.employee_id for checkin in check_ins)
 
             # Generate Excel file
             filepath = self.excel_export_service.generate_checkin_report(
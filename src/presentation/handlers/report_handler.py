@@ -9,6 +9,7 @@ from ...application.use_cases.get_monthly_report import GetMonthlyReportUseCase
 from ...application.use_cases.get_vehicle_performance import GetVehiclePerformanceUseCase
 from ...domain.repositories.vehicle_repository import IVehicleRepository
 from ...domain.repositories.driver_repository import IDriverRepository
+from ...domain.repositories.group_repository import IGroupRepository
 
 # Conversation states
 SELECT_VEHICLE_FOR_PERFORMANCE = 51
@@ -20,13 +21,15 @@ class ReportHandler:
         monthly_report_use_case: GetMonthlyReportUseCase,
         vehicle_performance_use_case: GetVehiclePerformanceUseCase,
         vehicle_repository: IVehicleRepository,
-        driver_repository: Optional[IDriverRepository] = None
+        driver_repository: Optional[IDriverRepository] = None,
+        group_repository: Optional[IGroupRepository] = None
     ):
         self.daily_report_use_case = daily_report_use_case
         self.monthly_report_use_case = monthly_report_use_case
         self.vehicle_performance_use_case = vehicle_performance_use_case
         self.vehicle_repository = vehicle_repository
         self.driver_repository = driver_repository
+        self.group_repository = group_repository
 
     # ==================== Daily Report ====================
 
@@ -38,13 +41,7 @@ class ReportHandler:
 
         chat = update.effective_chat
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(chat.id))
+        group = self.group_repository.find_by_chat_id(str(chat.id))
 
         if not group:
             message = "❌ កំហុស: រកមិនឃើញក្រុម។ សូមចុះឈ្មោះជាមុនសិន។"
@@ -52,7 +49,6 @@ class ReportHandler:
                 await query.edit_message_text(message)
             else:
                 await update.message.reply_text(message)
-            session.close()
             return
 
         try:
@@ -143,8 +139,6 @@ class ReportHandler:
                 await query.edit_message_text(error_message)
             else:
                 await update.message.reply_text(error_message)
-        finally:
-            session.close()
 
     # ==================== Monthly Report ====================
 
@@ -156,13 +150,7 @@ class ReportHandler:
 
         chat = update.effective_chat
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(chat.id))
+        group = self.group_repository.find_by_chat_id(str(chat.id))
 
         if not group:
             message = "❌ កំហុស: រកមិនឃើញក្រុម។ សូមចុះឈ្មោះជាមុនសិន។"
@@ -170,7 +158,6 @@ class ReportHandler:
                 await query.edit_message_text(message)
             else:
                 await update.message.reply_text(message)
-            session.close()
             return
 
         try:
@@ -261,6 +248,14 @@ class ReportHandler:
             else:
                 message_text += "\n\n⚠️ គ្មានសកម្មភាពកត់ត្រាសម្រាប់ខែនេះទេ។"
 
+            # Same month last year
+            if report.previous_year_total_trips:
+                message_text += (
+                    f"\n📊 {month_names[report.month]} {report.year - 1}: "
+                    f"{report.previous_year_total_trips} ដំណើរ, "
+                    f"{report.previous_year_total_fuel_liters:.0f}L({report.previous_year_total_fuel_cost:.0f}$)"
+                )
+
             # Display report without buttons (end of session)
             if query:
                 await query.edit_message_text(message_text, parse_mode=ParseMode.HTML)
@@ -273,8 +268,6 @@ class ReportHandler:
                 await query.edit_message_text(error_message)
             else:
                 await update.message.reply_text(error_message)
-        finally:
-            session.close()
 
     # ==================== Vehicle Performance Report ====================
 
@@ -287,13 +280,7 @@ class ReportHandler:
         chat = update.effective_chat
         context.user_data['report_group_id'] = chat.id
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(chat.id))
+        group = self.group_repository.find_by_chat_id(str(chat.id))
 
         if not group:
             message = "❌ កំហុស: រកមិនឃើញក្រុម។ សូមចុះឈ្មោះជាមុនសិន។"
@@ -301,12 +288,12 @@ class ReportHandler:
                 await query.edit_message_text(message)
             else:
                 await update.message.reply_text(message)
-            session.close()
             return ConversationHandler.END
 
+        context.user_data['performance_group_id'] = group.id
+
         # Get all vehicles
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
-        session.close()
 
         if not vehicles:
             message = (
@@ -334,6 +321,11 @@ class ReportHandler:
                 InlineKeyboardButton(label, callback_data=f"perf_vehicle_{vehicle.id}")
             ])
 
+        if len(vehicles) > 1:
+            keyboard.append([
+                InlineKeyboardButton("📊 យានជំនិះទាំងអស់", callback_data="perf_vehicle_all")
+            ])
+
         keyboard.append([InlineKeyboardButton("🏠 ត្រឡប់ទៅម៉ឺនុយ", callback_data="back_to_menu")])
         reply_markup = InlineKeyboardMarkup(keyboard)
 
@@ -349,6 +341,10 @@ class ReportHandler:
     async def show_vehicle_performance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show detailed performance report for selected vehicle"""
         query = update.callback_query
+
+        if query.data == "perf_vehicle_all":
+            return await self.show_fleet_performance(update, context)
+
         await query.answer()
 
         vehicle_id = int(query.data.replace("perf_vehicle_", ""))
@@ -424,6 +420,47 @@ class ReportHandler:
 
         return ConversationHandler.END
 
+    async def show_fleet_performance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show this month's and the last 7 days' performance for all vehicles"""
+        query = update.callback_query
+        await query.answer()
+
+        group_id = context.user_data.get('performance_group_id')
+        if not group_id:
+            await query.edit_message_text("❌ កំហុស: រកមិនឃើញក្រុម។ សូមចុះឈ្មោះជាមុនសិន។")
+            return ConversationHandler.END
+
+        try:
+            reports = self.vehicle_performance_use_case.execute_for_group(group_id)
+
+            # Create table: month trips(loading) | last 7 days trips | month fuel
+            table_lines = ["    ឡាន     ខែនេះ   ៧ថ្ងៃ   ប្រេង($)",
+                           "--------------------------------"]
+            for report in sorted(reports, key=lambda r: r.month_total_trips, reverse=True):
+                if report.month_total_loading_size > 0:
+                    month_str = f"{report.month_total_trips}({report.month_total_loading_size:.0f}m³)"
+                else:
+                    month_str = str(report.month_total_trips)
+                week_trips = sum(day.trips for day in report.last_7_days)
+                if report.month_total_fuel > 0:
+                    fuel_str = f"{report.month_total_fuel:.0f}L({report.month_total_cost:.0f}$)"
+                else:
+                    fuel_str = "—"
+                table_lines.append(f"{report.license_plate:<9}|{month_str:^9}|{week_trips:^5}| {fuel_str}")
+
+            message_text = (
+                "📈 របាយការណ៍ការអនុវត្តរបស់យានជំនិះទាំងអស់\n"
+                "<pre>" + escape('\n'.join(table_lines)) + "</pre>"
+            )
+
+            # Display report without buttons (end of session)
+            await query.edit_message_text(message_text, parse_mode=ParseMode.HTML)
+
+        except Exception as e:
+            await query.edit_message_text(f"❌ កំហុស: {str(e)}")
+
+        return ConversationHandler.END
+
     # ==================== Export Handlers (Placeholders) ====================
 
     async def export_placeholder(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -10,6 +10,7 @@ from ...application.dto.vehicle_dto import RegisterVehicleRequest
 from ...application.dto.driver_dto import RegisterDriverRequest
 from ...domain.repositories.vehicle_repository import IVehicleRepository
 from ...domain.repositories.driver_repository import IDriverRepository
+from ...domain.repositories.group_repository import IGroupRepository
 
 # Conversation states
 SETUP_MENU = 0
@@ -31,7 +32,8 @@ class SetupHandler:
         vehicle_repository: IVehicleRepository = None,
         driver_repository: Optional[IDriverRepository] = None,
         delete_vehicle_use_case: Optional[DeleteVehicleUseCase] = None,
-        delete_driver_use_case: Optional[DeleteDriverUseCase] = None
+        delete_driver_use_case: Optional[DeleteDriverUseCase] = None,
+        group_repository: Optional[IGroupRepository] = None
     ):
         self.register_vehicle_use_case = register_vehicle_use_case
         self.register_driver_use_case = register_driver_use_case
@@ -40,19 +42,14 @@ class SetupHandler:
         self.driver_repository = driver_repository
         self.delete_vehicle_use_case = delete_vehicle_use_case
         self.delete_driver_use_case = delete_driver_use_case
+        self.group_repository = group_repository
 
     def _get_group(self, context: ContextTypes.DEFAULT_TYPE):
         """Retrieve group by chat_id stored in user_data."""
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
         group_id = context.user_data.get('setup_group_id')
-        group = None
-        if group_id:
-            group = group_repo.find_by_chat_id(str(group_id))
-        return group, session
+        if not group_id:
+            return None
+        return self.group_repository.find_by_chat_id(str(group_id))
 
     async def setup_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show setup menu with vehicle and driver options"""
@@ -118,14 +115,12 @@ class SetupHandler:
         if 'setup_group_id' not in context.user_data:
             context.user_data['setup_group_id'] = update.effective_chat.id
 
-        group, session = self._get_group(context)
+        group = self._get_group(context)
         if not group:
             await query.edit_message_text("❌ កំហុស: រកមិនឃើញក្រុម។ សូមព្យាយាម /setup ម្តងទៀត។")
-            session.close()
             return ConversationHandler.END
 
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
-        session.close()
 
         type_emoji = {"TRUCK": "🚚", "VAN": "🚐", "MOTORCYCLE": "🏍️", "CAR": "🚗"}
         lines = ["🚗 ឡាន", ""]
@@ -168,16 +163,14 @@ class SetupHandler:
         if 'setup_group_id' not in context.user_data:
             context.user_data['setup_group_id'] = update.effective_chat.id
 
-        group, session = self._get_group(context)
+        group = self._get_group(context)
         if not group:
             await query.edit_message_text("❌ កំហុស: រកមិនឃើញក្រុម។ សូមព្យាយាម /setup ម្តងទៀត។")
-            session.close()
             return ConversationHandler.END
 
         drivers = self.driver_repository.find_by_group_id(group.id)
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
         vehicle_map = {v.id: v for v in vehicles}
-        session.close()
 
         lines = ["👤 អ្នកបើកបរ", ""]
         keyboard = []
@@ -214,10 +207,9 @@ class SetupHandler:
         if 'setup_group_id' not in context.user_data:
             context.user_data['setup_group_id'] = update.effective_chat.id
 
-        group, session = self._get_group(context)
+        group = self._get_group(context)
         if not group:
             await query.answer("រកមិនឃើញក្រុម", show_alert=True)
-            session.close()
             return ConversationHandler.END
 
         try:
@@ -225,10 +217,8 @@ class SetupHandler:
             await query.answer(f"បានលុប {response.license_plate}")
         except ValueError as e:
             await query.answer(str(e), show_alert=True)
-            session.close()
             return SETUP_MENU
 
-        session.close()
         return await self.list_vehicles(update, context, skip_answer=True)
 
     async def delete_driver(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -245,10 +235,9 @@ class SetupHandler:
         if 'setup_group_id' not in context.user_data:
             context.user_data['setup_group_id'] = update.effective_chat.id
 
-        group, session = self._get_group(context)
+        group = self._get_group(context)
         if not group:
             await query.answer("រកមិនឃើញក្រុម", show_alert=True)
-            session.close()
             return ConversationHandler.END
 
         try:
@@ -256,10 +245,8 @@ class SetupHandler:
             await query.answer(f"បានលុប {response.name}")
         except ValueError as e:
             await query.answer(str(e), show_alert=True)
-            session.close()
             return SETUP_MENU
 
-        session.close()
         return await self.list_drivers(update, context, skip_answer=True)
 
     async def back_to_setup_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -316,13 +303,7 @@ class SetupHandler:
 
         license_plate = context.user_data.get('vehicle_license_plate')
 
-        # Get group from database to get its ID
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(context.user_data['setup_group_id']))
+        group = self.group_repository.find_by_chat_id(str(context.user_data['setup_group_id']))
 
         if not group:
             error_msg = "❌ កំហុស: រកមិនឃើញក្រុម។ សូមព្យាយាមម្តងទៀត។"
@@ -330,7 +311,6 @@ class SetupHandler:
                 await update.callback_query.edit_message_text(error_msg)
             else:
                 await update.message.reply_text(error_msg)
-            session.close()
             return ConversationHandler.END
 
         try:
@@ -362,8 +342,6 @@ class SetupHandler:
                 await update.callback_query.edit_message_text(error_msg)
             else:
                 await update.message.reply_text(error_msg)
-        finally:
-            session.close()
 
         return ConversationHandler.END
 
@@ -434,22 +412,14 @@ class SetupHandler:
         driver_phone = update.message.text.strip()
         context.user_data['driver_phone'] = driver_phone
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(context.user_data['setup_group_id']))
+        group = self.group_repository.find_by_chat_id(str(context.user_data['setup_group_id']))
 
         if not group:
             await update.message.reply_text("❌ កំហុស: រកមិនឃើញក្រុម។")
-            session.close()
             return ConversationHandler.END
 
         # Get all vehicles for this group
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
-        session.close()
 
         if not vehicles:
             await update.message.reply_text(
@@ -501,17 +471,10 @@ class SetupHandler:
         driver_role = context.user_data.get('driver_role')
         driver_phone = context.user_data.get('driver_phone')
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(context.user_data['setup_group_id']))
+        group = self.group_repository.find_by_chat_id(str(context.user_data['setup_group_id']))
 
         if not group:
             await query.edit_message_text("❌ កំហុស: រកមិនឃើញក្រុម។")
-            session.close()
             return ConversationHandler.END
 
         try:
@@ -543,8 +506,6 @@ class SetupHandler:
 
         except ValueError as e:
             await query.edit_message_text(f"❌ កំហុស: {str(e)}")
-        finally:
-            session.close()
 
         return ConversationHandler.END
 
@@ -3,9 +3,11 @@ from telegram.ext import ContextTypes, ConversationHandler
 from datetime import datetime
 from ...application.use_cases.record_trip import RecordTripUseCase
 from ...application.use_cases.record_fuel import RecordFuelUseCase
-from ...application.dto.trip_dto import RecordTripRequest
+from ...application.use_cases.record_trips_batch import RecordTripsBatchUseCase
+from ...application.dto.trip_dto import RecordTripsBatchRequest
 from ...application.dto.fuel_dto import RecordFuelRequest
 from ...domain.repositories.vehicle_repository import IVehicleRepository
+from ...domain.repositories.group_repository import IGroupRepository
 from ...infrastructure.utils.datetime_utils import format_time_ict
 
 # Conversation states
@@ -22,11 +24,15 @@ class VehicleOperationsHandler:
         self,
         record_trip_use_case: RecordTripUseCase,
         record_fuel_use_case: RecordFuelUseCase,
-        vehicle_repository: IVehicleRepository
+        vehicle_repository: IVehicleRepository,
+        record_trips_batch_use_case: RecordTripsBatchUseCase = None,
+        group_repository: IGroupRepository = None
     ):
         self.record_trip_use_case = record_trip_use_case
         self.record_fuel_use_case = record_fuel_use_case
         self.vehicle_repository = vehicle_repository
+        self.record_trips_batch_use_case = record_trips_batch_use_case
+        self.group_repository = group_repository
 
     # ==================== Trip Recording ====================
 
@@ -39,13 +45,7 @@ class VehicleOperationsHandler:
         chat = update.effective_chat
         context.user_data['operation_group_id'] = chat.id
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(chat.id))
+        group = self.group_repository.find_by_chat_id(str(chat.id))
 
         if not group:
             message = "❌ កំហុស: រកមិនឃើញក្រុម។ សូមចុះឈ្មោះជាមុនសិន។"
@@ -53,12 +53,10 @@ class VehicleOperationsHandler:
                 await query.edit_message_text(message)
             else:
                 await update.message.reply_text(message)
-            session.close()
             return ConversationHandler.END
 
         # Get all vehicles
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
-        session.close()
 
         if not vehicles:
             message = (
@@ -168,78 +166,38 @@ class VehicleOperationsHandler:
         vehicle_plate = context.user_data.get('trip_vehicle_plate')
         trip_count = context.user_data.get('trip_count')
 
-        # Calculate loading size per trip (distributed equally)
-        loading_size_per_trip = total_loading_size / trip_count
-
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(context.user_data['operation_group_id']))
+        group = self.group_repository.find_by_chat_id(str(context.user_data['operation_group_id']))
 
         if not group:
             await update.message.reply_text("❌ កំហុស: រកមិនឃើញក្រុម។")
-            session.close()
-            return ConversationHandler.END
-
-        # Get vehicle
-        vehicle = self.vehicle_repository.find_by_id(vehicle_id)
-        if not vehicle:
-            await update.message.reply_text("❌ កំហុស: រកមិនឃើញឡាន។")
-            session.close()
             return ConversationHandler.END
 
         try:
-            # Create multiple trips
-            created_trips = []
-            for i in range(trip_count):
-                request = RecordTripRequest(
-                    group_id=group.id,
-                    vehicle_id=vehicle_id,
-                    loading_size_cubic_meters=loading_size_per_trip
-                )
-                response = self.record_trip_use_case.execute(request)
-                created_trips.append(response)
-
-            # Get total trips today
-            from datetime import date
-            from ...infrastructure.persistence.trip_repository_impl import TripRepository
-            trip_repo = TripRepository(session)
-            total_today = trip_repo.count_by_vehicle_and_date(vehicle_id, date.today())
-
-            type_emoji = {"TRUCK": "🚚", "VAN": "🚐", "MOTORCYCLE": "🏍️", "CAR": "🚗"}
-            emoji = type_emoji.get(vehicle.vehicle_type, "🚗")
-
-            # Get the last created trip for display
-            last_trip = created_trips[-1]
-            first_trip_num = created_trips[0].trip_number
-            last_trip_num = last_trip.trip_number
+            # Create all trips in one batch (loading size distributed equally)
+            response = self.record_trips_batch_use_case.execute(RecordTripsBatchRequest(
+                group_id=group.id,
+                vehicle_id=vehicle_id,
+                trip_count=trip_count,
+                total_loading_size_cubic_meters=total_loading_size
+            ))
 
             message_parts = [
-                f"✅ {trip_count} បានកត់ត្រាសម្រាប់ឡាន: {last_trip.vehicle_license_plate}\n",
-                # f"ឡាន: {emoji} {last_trip.vehicle_license_plate}"
+                f"✅ {trip_count} បានកត់ត្រាសម្រាប់ឡាន: {response.vehicle_license_plate}\n",
             ]
 
-            if last_trip.driver_name:
-                message_parts.append(f"អ្នកបើកបរ: {last_trip.driver_name}")
+            if response.driver_name:
+                message_parts.append(f"អ្នកបើកបរ: {response.driver_name}")
 
             message_parts.extend([
-                # f"លេខដំណើរ: #{first_trip_num} - #{last_trip_num}",
                 f"ចំនួនជើងសរុប: {trip_count}",
                 f"ទំហំផ្ទុកសរុប: {total_loading_size}m³",
-                f"កាលបរិច្ឆេទ: {last_trip.date}",
-                # f"ពេលវេលា: {format_time_ict(datetime.fromisoformat(last_trip.created_at))}\n",
-                # f"ដំណើរសរុបថ្ងៃនេះ: {total_today}"
+                f"កាលបរិច្ឆេទ: {response.date}",
             ])
 
             await update.message.reply_text("\n".join(message_parts))
 
         except Exception as e:
             await update.message.reply_text(f"❌ កំហុស: {str(e)}")
-        finally:
-            session.close()
 
         return ConversationHandler.END
 
@@ -254,13 +212,7 @@ class VehicleOperationsHandler:
         chat = update.effective_chat
         context.user_data['operation_group_id'] = chat.id
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(chat.id))
+        group = self.group_repository.find_by_chat_id(str(chat.id))
 
         if not group:
             message = "❌ កំហុស: រកមិនឃើញក្រុម។"
@@ -268,12 +220,10 @@ class VehicleOperationsHandler:
                 await query.edit_message_text(message)
             else:
                 await update.message.reply_text(message)
-            session.close()
             return ConversationHandler.END
 
         # Get all vehicles
         vehicles = self.vehicle_repository.find_by_group_id(group.id)
-        session.close()
 
         if not vehicles:
             message = "⚠️ រកមិនឃើញឡានទេ!\n\nសូមរៀបចំឡានជាមុនសិនដោយប្រើ /setup"
@@ -404,17 +354,10 @@ class VehicleOperationsHandler:
         liters = context.user_data.get('fuel_liters')
         cost = context.user_data.get('fuel_cost')
 
-        # Get group from database
-        from ...infrastructure.persistence.database import database
-        from ...infrastructure.persistence.group_repository_impl import GroupRepository
-
-        session = database.get_session()
-        group_repo = GroupRepository(session)
-        group = group_repo.find_by_chat_id(str(context.user_data['operation_group_id']))
+        group = self.group_repository.find_by_chat_id(str(context.user_data['operation_group_id']))
 
         if not group:
             await message.reply_text("❌ កំហុស: រកមិនឃើញក្រុម។")
-            session.close()
             return ConversationHandler.END
 
         try:
@@ -440,8 +383,6 @@ class VehicleOperationsHandler:
 
         except Exception as e:
             await message.reply_text(f"❌ កំហុស: {str(e)}")
-        finally:
-            session.close()
 
         return ConversationHandler.END
 
@@ -0,0 +1 @@
+# Application tests package
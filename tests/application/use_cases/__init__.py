@@ -0,0 +1 @@
+# Use case tests package
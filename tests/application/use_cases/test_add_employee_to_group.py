@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, EmployeeGroupModel, EmployeeModel, GroupModel
+from src.infrastructure.persistence.employee_group_repository_impl import EmployeeGroupRepository
+from src.infrastructure.persistence.employee_repository_impl import EmployeeRepository
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.application.use_cases.add_employee_to_group import AddEmployeeToGroupUseCase
+
+
+class TestAddEmployeeToGroupUseCase(unittest.TestCase):
+    """Test cases for AddEmployeeToGroupUseCase against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add(EmployeeModel(id=1, telegram_id='42', name='Sokha'))
+        self.session.add(GroupModel(id=1, chat_id='-100', name='Office'))
+        self.session.commit()
+
+        self.employee_group_repo = EmployeeGroupRepository(self.session)
+        self.use_case = AddEmployeeToGroupUseCase(
+            self.employee_group_repo,
+            EmployeeRepository(self.session),
+            GroupRepository(self.session)
+        )
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_already_linked_is_a_single_statement(self):
+        """Test that the steady-state check-in path only looks the link up"""
+        first = self.use_case.execute(employee_id=1, group_id=1)
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        link = self.use_case.execute(employee_id=1, group_id=1)
+
+        self.assertEqual(link.id, first.id)
+        self.assertEqual(len(statements), 1, statements)
+
+    def test_concurrently_created_link_is_returned(self):
+        """Test that losing the insert race returns the existing link instead of failing"""
+        winner = self.use_case.execute(employee_id=1, group_id=1)
+
+        with patch.object(self.employee_group_repo, 'find_by_employee_and_group', return_value=None):
+            link = self.use_case.execute(employee_id=1, group_id=1)
+
+        self.assertEqual(link.id, winner.id)
+        self.assertEqual(link.joined_at, winner.joined_at)
+        self.assertEqual(self.session.query(EmployeeGroupModel).count(), 1)
+
+    def test_unknown_employee_is_rejected(self):
+        """Test that linking a missing employee raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.use_case.execute(employee_id=99, group_id=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, EmployeeModel, SalaryAdvanceModel, AllowanceModel
+from src.infrastructure.persistence.employee_repository_impl import EmployeeRepository
+from src.infrastructure.persistence.salary_advance_repository_impl import SalaryAdvanceRepository
+from src.infrastructure.persistence.allowance_repository_impl import AllowanceRepository
+from src.infrastructure.utils.timezone import ict_month_to_utc_range
+from src.infrastructure.utils.ttl_cache import TTLCache
+from src.application.use_cases.get_employee_status import GetEmployeeStatusUseCase
+from src.application.use_cases.record_salary_advance import RecordSalaryAdvanceUseCase
+from src.application.dto.salary_advance_dto import SalaryAdvanceRequest
+
+
+class TestGetEmployeeStatusUseCase(unittest.TestCase):
+    """Test cases for GetEmployeeStatusUseCase against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add(EmployeeModel(id=1, telegram_id='111', name='Sokha'))
+        # Two advances in December 2025 (ICT), one on 1 Jan 2026 ICT that is still 31 Dec in UTC
+        for day, hour, amount in [(5, 3, '10.50'), (20, 3, '20.25'), (31, 18, '99.00')]:
+            self.session.add(SalaryAdvanceModel(
+                employee_id=1, amount=amount, created_by='admin', timestamp=datetime(2025, 12, day, hour)
+            ))
+        self.session.add(AllowanceModel(
+            employee_id=1, amount=5.0, allowance_type='meal', created_by='admin', timestamp=datetime(2025, 12, 10)
+        ))
+        self.session.commit()
+
+        self.cache = TTLCache(ttl=60)
+        self.employee_repo = EmployeeRepository(self.session)
+        self.advance_repo = SalaryAdvanceRepository(self.session)
+        self.use_case = GetEmployeeStatusUseCase(
+            self.employee_repo, self.advance_repo, AllowanceRepository(self.session), status_cache=self.cache
+        )
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_totals_cover_the_period_not_the_page(self):
+        """Test that totals and counts ignore pagination and respect the ICT month"""
+        december = ict_month_to_utc_range(2025, 12)
+
+        first_page = self.use_case.execute_by_id(1, period=december, limit=1)
+        second_page = self.use_case.execute_by_id(1, period=december, limit=1, offset=1)
+
+        self.assertEqual([a.amount for a in first_page.salary_advances], ['$20.25'])
+        self.assertEqual([a.amount for a in second_page.salary_advances], ['$10.50'])
+        self.assertEqual(first_page.total_salary_advances, 30.75)
+        self.assertEqual(first_page.salary_advance_count, 2)
+        self.assertEqual(first_page.total_allowances, 5.0)
+        self.assertEqual(first_page.allowance_count, 1)
+
+    def test_recording_an_advance_invalidates_cached_totals(self):
+        """Test that cached totals are dropped when an advance is recorded"""
+        self.assertEqual(self.use_case.execute_by_id(1).total_salary_advances, 129.75)
+        self.assertEqual(len(self.cache), 1)
+
+        RecordSalaryAdvanceUseCase(self.advance_repo, self.employee_repo, status_cache=self.cache).execute(
+            SalaryAdvanceRequest(employee_name='Sokha', amount=0.25, created_by='admin')
+        )
+
+        self.assertEqual(len(self.cache), 0)
+        status = self.use_case.execute_by_id(1)
+        self.assertEqual(status.total_salary_advances, 130.0)
+        self.assertEqual(status.salary_advance_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
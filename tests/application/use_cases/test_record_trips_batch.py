@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, GroupModel, VehicleModel, TripModel
+from src.infrastructure.persistence.trip_repository_impl import TripRepository
+from src.infrastructure.persistence.vehicle_repository_impl import VehicleRepository
+from src.application.use_cases.record_trips_batch import RecordTripsBatchUseCase
+from src.application.dto.trip_dto import RecordTripsBatchRequest
+
+
+class TestRecordTripsBatchUseCase(unittest.TestCase):
+    """Test cases for RecordTripsBatchUseCase against a temporary file-backed SQLite database"""
+
+    def setUp(self):
+        # File-backed so a second session can commit a competing trip
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.session = self.Session()
+        self.session.add(GroupModel(id=1, chat_id='-100', name='Fleet'))
+        self.session.add(VehicleModel(id=1, group_id=1, license_plate='2A-1234', vehicle_type='TRUCK', driver_name='Dara'))
+        self.session.commit()
+
+        self.trip_repo = TripRepository(self.session)
+        self.use_case = RecordTripsBatchUseCase(self.trip_repo, VehicleRepository(self.session))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def test_assigns_contiguous_trip_numbers(self):
+        """Test that trips continue numbering after today's existing trips"""
+        self.session.add(TripModel(group_id=1, vehicle_id=1, date=date.today(), trip_number=1))
+        self.session.commit()
+
+        response = self.use_case.execute(RecordTripsBatchRequest(
+            group_id=1, vehicle_id=1, trip_count=3, total_loading_size_cubic_meters=30.0
+        ))
+
+        self.assertEqual(response.first_trip_number, 2)
+        self.assertEqual(response.last_trip_number, 4)
+        self.assertEqual(response.loading_size_per_trip_cubic_meters, 10.0)
+        self.assertEqual(response.driver_name, 'Dara')
+        numbers = sorted(t.trip_number for t in self.session.query(TripModel).all())
+        self.assertEqual(numbers, [1, 2, 3, 4])
+
+    def test_query_count_is_independent_of_trip_count(self):
+        """Test that recording 20 trips costs a fixed number of statements"""
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        self.use_case.execute(RecordTripsBatchRequest(group_id=1, vehicle_id=1, trip_count=20))
+
+        # vehicle lookup, locked max(trip_number), one batched insert
+        self.assertLessEqual(len(statements), 3)
+        self.assertEqual(self.session.query(TripModel).count(), 20)
+
+    def test_retries_on_trip_number_conflict(self):
+        """Test that a concurrent writer taking the same numbers triggers a retry"""
+        original_get_max = self.trip_repo.get_max_trip_number_for_date
+        calls = []
+
+        def racing_get_max(vehicle_id, trip_date, lock=False):
+            result = original_get_max(vehicle_id, trip_date, lock=lock)
+            if not calls:
+                # Another writer commits trip #1 between our read and our insert
+                other_session = self.Session()
+                other_session.add(TripModel(group_id=1, vehicle_id=1, date=trip_date, trip_number=1))
+                other_session.commit()
+                other_session.close()
+            calls.append(result)
+            return result
+
+        self.trip_repo.get_max_trip_number_for_date = racing_get_max
+
+        response = self.use_case.execute(RecordTripsBatchRequest(group_id=1, vehicle_id=1, trip_count=2))
+
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(response.first_trip_number, 2)
+        self.assertEqual(response.last_trip_number, 3)
+
+    def _fail_first_insert(self, error_args):
+        """Make the first trips INSERT fail like a MySQL driver error with error_args"""
+        original_execute = self.session.execute
+        failures = []
+
+        def execute(statement, *args, **kwargs):
+            if getattr(statement, 'is_insert', False) and not failures:
+                failures.append(statement)
+                raise OperationalError('INSERT INTO trips ...', {}, Exception(*error_args))
+            return original_execute(statement, *args, **kwargs)
+
+        self.session.execute = execute
+        return failures
+
+    def test_retries_after_a_deadlock(self):
+        """Test that a deadlock on the insert is rolled back and the batch retried"""
+        failures = self._fail_first_insert((1213, 'Deadlock found when trying to get lock'))
+
+        response = self.use_case.execute(RecordTripsBatchRequest(group_id=1, vehicle_id=1, trip_count=2))
+
+        self.assertEqual(len(failures), 1)
+        self.assertEqual((response.first_trip_number, response.last_trip_number), (1, 2))
+        self.assertEqual(self.session.query(TripModel).count(), 2)
+
+    def test_other_database_errors_roll_back_and_propagate(self):
+        """Test that a non-retryable error leaves the session usable"""
+        self._fail_first_insert((2013, 'Lost connection to MySQL server during query'))
+
+        with self.assertRaises(OperationalError):
+            self.use_case.execute(RecordTripsBatchRequest(group_id=1, vehicle_id=1, trip_count=2))
+
+        self.assertFalse(self.session.in_transaction())
+        self.assertEqual(self.session.query(TripModel).count(), 0)
+
+    def test_rejects_vehicle_from_other_group(self):
+        """Test that a vehicle from another group is rejected"""
+        with self.assertRaises(ValueError):
+            self.use_case.execute(RecordTripsBatchRequest(group_id=2, vehicle_id=1, trip_count=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
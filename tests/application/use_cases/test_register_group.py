@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, GroupModel, TelegramUserModel
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.infrastructure.persistence.telegram_user_repository_impl import TelegramUserRepository
+from src.application.use_cases.register_group import RegisterGroupUseCase
+
+
+class TestRegisterGroupUseCase(unittest.TestCase):
+    """Test cases for RegisterGroupUseCase against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.group_repo = GroupRepository(self.session)
+        self.use_case = RegisterGroupUseCase(self.group_repo, TelegramUserRepository(self.session))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_existing_group_is_a_single_statement(self):
+        """Test that the steady-state check-in path only looks the group up"""
+        self.use_case.execute(chat_id='-100', name='Office')
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        group = self.use_case.execute(chat_id='-100', name='Office')
+
+        self.assertEqual(group.chat_id, '-100')
+        self.assertEqual(len(statements), 1, statements)
+
+    def test_concurrently_created_group_is_returned(self):
+        """Test that losing the insert race returns the winner's row instead of failing"""
+        winner = self.use_case.execute(chat_id='-100', name='Office')
+
+        # Simulate the other request's SELECT running before the winner's INSERT
+        with patch.object(self.group_repo, 'find_by_chat_id', return_value=None):
+            group = self.use_case.execute(chat_id='-100', name='Renamed')
+
+        self.assertEqual(group.id, winner.id)
+        self.assertEqual(group.name, 'Office')
+        self.assertEqual(self.session.query(GroupModel).count(), 1)
+
+    def test_owner_is_filled_in_once(self):
+        """Test that the first registering user becomes the owner and keeps it"""
+        self.use_case.execute(chat_id='-100', name='Office')
+
+        group = self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='1', created_by_username='a')
+        owner_id = group.created_by_user_id
+        group = self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='2', created_by_username='b')
+
+        self.assertIsNotNone(owner_id)
+        self.assertEqual(group.created_by_user_id, owner_id)
+
+    def test_user_profile_is_updated(self):
+        """Test that registering again refreshes the Telegram user's profile"""
+        self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='1', created_by_username='old')
+        self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='1', created_by_username='new')
+
+        users = self.session.query(TelegramUserModel).all()
+        self.assertEqual([u.username for u in users], ['new'])
+
+    def test_owned_group_costs_a_lookup_and_one_upsert(self):
+        """Test that once a group has an owner, registering again is a lookup plus the profile upsert"""
+        group = self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='1', created_by_username='old')
+        self.assertIsNotNone(group.created_by_user_id)
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        group = self.use_case.execute(chat_id='-100', name='Office', created_by_telegram_id='1', created_by_username='new')
+
+        self.assertEqual(len(statements), 2, statements)
+        users = self.session.query(TelegramUserModel).all()
+        self.assertEqual(group.created_by_user_id, users[0].id)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, GroupModel, VehicleModel, TripModel, FuelRecordModel
+from src.infrastructure.persistence.trip_repository_impl import TripRepository
+from src.infrastructure.persistence.fuel_record_repository_impl import FuelRecordRepository
+from src.infrastructure.persistence.vehicle_repository_impl import VehicleRepository
+from src.application.use_cases.get_daily_report import GetDailyReportUseCase
+from src.application.use_cases.get_monthly_report import GetMonthlyReportUseCase
+from src.application.use_cases.get_vehicle_performance import GetVehiclePerformanceUseCase
+
+
+class TestReportUseCases(unittest.TestCase):
+    """Test cases for the report use cases against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.today = date.today()
+
+        self.session.add(GroupModel(id=1, chat_id='-100', name='Fleet'))
+        self.session.add(VehicleModel(id=1, group_id=1, license_plate='2A-1234', vehicle_type='TRUCK'))
+        self.session.add(VehicleModel(id=2, group_id=1, license_plate='2B-5678', vehicle_type='VAN'))
+        noon = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=12)
+        self.session.add_all([
+            TripModel(group_id=1, vehicle_id=1, date=self.today, trip_number=1,
+                      loading_size_cubic_meters=10.0, created_at=noon),
+            TripModel(group_id=1, vehicle_id=1, date=self.today, trip_number=2,
+                      loading_size_cubic_meters=None, created_at=noon + timedelta(hours=1)),
+            TripModel(group_id=1, vehicle_id=2, date=self.today, trip_number=1,
+                      loading_size_cubic_meters=5.5, created_at=noon - timedelta(hours=1)),
+            FuelRecordModel(group_id=1, vehicle_id=1, date=self.today, liters=40.0, cost=52.0, created_at=noon),
+            FuelRecordModel(group_id=1, vehicle_id=1, date=self.today, liters=10.0, cost=13.0,
+                            created_at=noon + timedelta(hours=2)),
+        ])
+        self.session.commit()
+
+        self.repositories = (
+            VehicleRepository(self.session),
+            None,
+            TripRepository(self.session),
+            FuelRecordRepository(self.session)
+        )
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: self.statements.append(args[2]))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_daily_report(self):
+        """Test that the daily report totals and details come from projected rows"""
+        report = GetDailyReportUseCase(*self.repositories).execute(1, self.today)
+
+        truck, van = report.vehicles
+        self.assertEqual((truck.trip_count, truck.total_loading_size), (2, 10.0))
+        self.assertEqual((truck.total_fuel_liters, truck.total_fuel_cost), (50.0, 65.0))
+        self.assertEqual((van.trip_count, van.total_loading_size), (1, 5.5))
+        self.assertEqual(report.total_trips, 3)
+        self.assertEqual([t.vehicle_plate for t in report.trips], ['2B-5678', '2A-1234', '2A-1234'])
+        self.assertEqual([f.liters for f in report.fuel_records], [40.0, 10.0])
+
+    def test_monthly_report_groups_in_sql(self):
+        """Test that the monthly report aggregates with GROUP BY instead of loading rows"""
+        report = GetMonthlyReportUseCase(*self.repositories).execute(1, self.today.year, self.today.month)
+
+        truck, van = report.vehicles
+        self.assertEqual((truck.total_trips, truck.total_loading_size), (2, 10.0))
+        self.assertEqual((truck.total_fuel_liters, truck.avg_fuel_per_trip), (50.0, 25.0))
+        self.assertEqual((van.total_trips, van.total_fuel_liters), (1, 0.0))
+        self.assertEqual((report.total_trips, report.total_fuel_cost), (3, 65.0))
+
+        aggregates = [s for s in self.statements if 'GROUP BY' in s]
+        self.assertEqual(len(aggregates), 2)
+
+    def test_vehicle_performance(self):
+        """Test month totals and the 7-day breakdown for one vehicle"""
+        performance = GetVehiclePerformanceUseCase(*self.repositories).execute(1)
+
+        self.assertEqual(performance.month_total_trips, 2)
+        self.assertEqual(performance.month_total_fuel, 50.0)
+        self.assertEqual(performance.month_avg_cost_per_trip, 32.5)
+        self.assertEqual(len(performance.last_7_days), 7)
+        self.assertEqual(performance.last_7_days[-1].date, self.today.isoformat())
+        self.assertEqual(performance.last_7_days[-1].trips, 2)
+        self.assertEqual(performance.last_7_days[0].trips, 0)
+
+        # Month and 7-day figures share one aggregate per table
+        aggregates = [s for s in self.statements if 'GROUP BY' in s]
+        self.assertEqual(len(aggregates), 2)
+
+    def test_vehicle_performance_for_group(self):
+        """Test that all vehicles' performance is computed from two aggregates"""
+        reports = GetVehiclePerformanceUseCase(*self.repositories).execute_for_group(1)
+
+        self.assertEqual([r.license_plate for r in reports], ['2A-1234', '2B-5678'])
+        self.assertEqual([r.month_total_trips for r in reports], [2, 1])
+        self.assertEqual([r.month_total_fuel for r in reports], [50.0, 0.0])
+        self.assertEqual(reports[1].last_7_days[-1].total_loading_size, 5.5)
+
+        aggregates = [s for s in self.statements if 'GROUP BY' in s]
+        self.assertEqual(len(aggregates), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
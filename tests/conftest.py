@@ -0,0 +1,18 @@
+import pytest
+
+from src.infrastructure.metrics.query_profiler import assert_max_queries
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Query budget for an endpoint or handler call
+
+        def test_list_groups(client, max_queries):
+            with max_queries(2):
+                client.get('/api/admin/groups')
+
+    Fails when the block runs more queries than allowed. The engine under
+    test must be passed through instrument_engine() first.
+    """
+    return assert_max_queries
@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.api.middleware.admin_principal_cache import AdminPrincipalCache
+
+
+class TestAdminPrincipalCache(unittest.TestCase):
+    """Test cases for AdminPrincipalCache"""
+
+    def setUp(self):
+        self.db = MagicMock()
+        self.db.admin_users.find_one.return_value = {"telegram_id": "42", "status": "active"}
+        self.db.cache_versions.find_one.return_value = {"_id": "admin_users", "version": 1}
+
+        patcher = patch('src.infrastructure.api.middleware.admin_principal_cache.mongodb')
+        self.mongodb = patcher.start()
+        self.mongodb.get_database.return_value = self.db
+        self.addCleanup(patcher.stop)
+
+        # Check the shared version on every call to make tests deterministic
+        self.cache = AdminPrincipalCache(ttl=60, version_check_interval=0)
+
+    def test_repeated_lookups_hit_cache(self):
+        """Test that only the first lookup queries admin_users"""
+        for _ in range(5):
+            admin = self.cache.get_admin("42")
+
+        self.assertEqual(admin["status"], "active")
+        self.assertEqual(self.db.admin_users.find_one.call_count, 1)
+        self.assertEqual(self.cache.stats["hits"], 4)
+
+    def test_missing_admin_is_not_cached(self):
+        """Test that a missing admin is looked up again on the next request"""
+        self.db.admin_users.find_one.return_value = None
+
+        self.assertIsNone(self.cache.get_admin("99"))
+        self.assertIsNone(self.cache.get_admin("99"))
+        self.assertEqual(self.db.admin_users.find_one.call_count, 2)
+
+    def test_version_bump_from_other_process_clears_cache(self):
+        """Test that a changed shared version forces a reload"""
+        self.cache.get_admin("42")
+
+        self.db.cache_versions.find_one.return_value = {"_id": "admin_users", "version": 2}
+        self.db.admin_users.find_one.return_value = {"telegram_id": "42", "status": "inactive"}
+
+        admin = self.cache.get_admin("42")
+        self.assertEqual(admin["status"], "inactive")
+        self.assertEqual(self.db.admin_users.find_one.call_count, 2)
+
+    def test_invalidate_drops_entry_and_bumps_version(self):
+        """Test that invalidate removes the local entry and increments the shared version"""
+        self.cache.get_admin("42")
+        self.cache.invalidate("42")
+        self.cache.get_admin("42")
+
+        self.assertEqual(self.db.admin_users.find_one.call_count, 2)
+        self.db.cache_versions.update_one.assert_called_once_with(
+            {"_id": "admin_users"},
+            {"$inc": {"version": 1}},
+            upsert=True
+        )
+
+    def test_update_admin_writes_and_invalidates(self):
+        """Test that a status change is written and invalidates the admin everywhere"""
+        self.cache.get_admin("42")
+        self.db.admin_users.update_one.return_value.matched_count = 1
+
+        self.assertTrue(self.cache.update_admin("42", status="inactive"))
+        self.cache.get_admin("42")
+
+        (query, update), _ = self.db.admin_users.update_one.call_args
+        self.assertEqual(query, {"telegram_id": "42"})
+        self.assertEqual(update["$set"]["status"], "inactive")
+        self.assertNotIn("role", update["$set"])
+        self.db.cache_versions.update_one.assert_called_once()
+        self.assertEqual(self.db.admin_users.find_one.call_count, 2)
+
+    def test_update_unknown_admin_does_not_invalidate(self):
+        """Test that updating a missing admin reports it and leaves the version alone"""
+        self.db.admin_users.update_one.return_value.matched_count = 0
+
+        self.assertFalse(self.cache.update_admin("99", role="viewer"))
+        self.db.cache_versions.update_one.assert_not_called()
+
+    def test_clear_local_does_not_bump_version(self):
+        """Test that a local drop reloads the admin without signalling other processes"""
+        self.cache.get_admin("42")
+        self.cache.clear_local("42")
+        self.cache.get_admin("42")
+
+        self.assertEqual(self.db.admin_users.find_one.call_count, 2)
+        self.db.cache_versions.update_one.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from flask import Flask, jsonify, request
+from pymongo.errors import DuplicateKeyError
+
+from src.infrastructure.api.middleware.idempotency import idempotent
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for the idempotency_keys collection"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def insert_one(self, doc):
+        if doc['_id'] in self.docs:
+            raise DuplicateKeyError('duplicate key')
+        self.docs[doc['_id']] = dict(doc)
+
+    def find_one(self, query):
+        return self.docs.get(query['_id'])
+
+    def find_one_and_update(self, query, update):
+        doc = self.docs.get(query['_id'])
+        if doc and doc['status'] == query['status'] and doc['locked_at'] < query['locked_at']['$lt']:
+            doc.update(update['$set'])
+            return doc
+        return None
+
+    def update_one(self, query, update):
+        self.docs[query['_id']].update(update['$set'])
+
+    def delete_one(self, query):
+        doc = self.docs.get(query['_id'])
+        if doc and doc['status'] == query['status']:
+            del self.docs[query['_id']]
+
+
+class TestIdempotent(unittest.TestCase):
+    """Test cases for the @idempotent decorator"""
+
+    def setUp(self):
+        self.collection = FakeCollection()
+        patcher = patch('src.infrastructure.api.middleware.idempotency.mongodb')
+        mongodb = patcher.start()
+        mongodb.get_database.return_value = MagicMock(idempotency_keys=self.collection)
+        self.addCleanup(patcher.stop)
+
+        self.calls = 0
+        self.status_code = 200
+        app = Flask(__name__)
+
+        @app.route('/api/checkin', methods=['POST'])
+        @idempotent
+        def checkin():
+            self.calls += 1
+            photo = request.files.get('photo')
+            size = len(photo.read()) if photo else None
+            return jsonify({'success': True, 'call': self.calls, 'photo_size': size}), self.status_code
+
+        self.client = app.test_client()
+
+    def _post(self, key='key-1', data=None):
+        return self.client.post(
+            '/api/checkin',
+            data=data or {'telegram_user_id': '42', 'latitude': '1.0'},
+            headers={'Idempotency-Key': key} if key else {}
+        )
+
+    def test_replay_returns_original_response(self):
+        """Test that a retried request is not executed twice"""
+        first = self._post()
+        second = self._post()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual(second.headers.get('Idempotent-Replayed'), 'true')
+
+    def test_requests_without_key_are_not_deduplicated(self):
+        """Test that the decorator is transparent without a key"""
+        self._post(key=None)
+        self._post(key=None)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_key_reused_with_different_payload_is_rejected(self):
+        """Test that a key cannot be replayed against another payload"""
+        self._post()
+        response = self._post(data={'telegram_user_id': '42', 'latitude': '2.0'})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.calls, 1)
+
+    def test_same_file_name_with_different_content_is_rejected(self):
+        """Test that the fingerprint covers uploaded file content, not just its name"""
+        def photo_post(content):
+            return self._post(data={'telegram_user_id': '42', 'photo': (io.BytesIO(content), 'photo.jpg')})
+
+        first = photo_post(b'first photo')
+        replay = photo_post(b'first photo')
+        other = photo_post(b'another photo')
+
+        # Hashing must leave the stream readable for the route
+        self.assertEqual(first.get_json()['photo_size'], len(b'first photo'))
+        self.assertEqual(replay.headers.get('Idempotent-Replayed'), 'true')
+        self.assertEqual(other.status_code, 422)
+        self.assertEqual(self.calls, 1)
+
+    def test_server_errors_are_not_stored(self):
+        """Test that a 5xx response leaves the key free for a retry"""
+        self.status_code = 500
+        self._post()
+        self.status_code = 200
+        response = self._post()
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(response.status_code, 200)
+
+    def test_in_flight_key_returns_conflict(self):
+        """Test that a concurrent duplicate gets 409 while the first is running"""
+        self._post()
+        doc = next(iter(self.collection.docs.values()))
+        doc.update({'status': 'in_progress', 'locked_at': datetime.utcnow()})
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
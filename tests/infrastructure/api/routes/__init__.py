@@ -0,0 +1 @@
+# API routes tests package
@@ -0,0 +1,205 @@
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from bson import ObjectId
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.models import Base, GroupModel
+import src.infrastructure.api.routes.admin_group_routes as admin_group_routes
+
+
+def _matches(document, query):
+    """Evaluate the subset of MongoDB filters used by the submission routes"""
+    for key, condition in query.items():
+        if key == '$and':
+            if not all(_matches(document, part) for part in condition):
+                return False
+        elif key == '$or':
+            if not any(_matches(document, part) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = document.get(key)
+            for operator, operand in condition.items():
+                # Range operators never match null or missing fields
+                if value is None:
+                    return False
+                if operator == '$lt' and not value < operand:
+                    return False
+                if operator == '$gte' and not value >= operand:
+                    return False
+        elif document.get(key) != condition:
+            return False
+    return True
+
+
+class _Cursor(list):
+    def close(self):
+        pass
+
+
+class _FakeSubmissions:
+    """Just enough of a pymongo collection for find() and count_documents()"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.counted = 0
+
+    def count_documents(self, query, limit=0):
+        self.counted += 1
+        count = sum(1 for document in self.documents if _matches(document, query))
+        return min(count, limit) if limit else count
+
+    def find(self, query, projection=None, sort=None, skip=0, limit=0, batch_size=None):
+        rows = [dict(document) for document in self.documents if _matches(document, query)]
+        for field, direction in reversed(sort or []):
+            # Null sorts before any value, as in MongoDB
+            rows.sort(key=lambda row: (row.get(field) is not None, row.get(field)), reverse=direction < 0)
+        rows = rows[skip:skip + limit] if limit else rows[skip:]
+        for row in rows:
+            for field in projection or {}:
+                row.pop(field, None)
+        return _Cursor(rows)
+
+
+class TestGroupSubmissionRoutes(unittest.TestCase):
+    """Test cases for the cursor-paginated and NDJSON submission endpoints"""
+
+    def setUp(self):
+        engine = create_engine('sqlite://', poolclass=StaticPool)
+        self.addCleanup(engine.dispose)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        session.add(GroupModel(id=1, chat_id='-100', name='Office'))
+        session.commit()
+        session.close()
+
+        # Five submissions; the middle three share a created_at so _id breaks the tie
+        form_id = ObjectId()
+        same_time = datetime(2026, 3, 2, 9, 0)
+        self.submissions = _FakeSubmissions([
+            {'_id': ObjectId(), 'form_config_id': form_id, 'created_at': created_at, 'submission_data': {'n': n}}
+            for n, created_at in enumerate([
+                datetime(2026, 3, 1, 9, 0), same_time, same_time, same_time, datetime(2026, 3, 3, 9, 0)
+            ])
+        ])
+        mongo = SimpleNamespace(
+            form_configurations=SimpleNamespace(find_one=lambda query: {'_id': form_id, 'form_name': 'Daily'}),
+            form_submissions=self.submissions
+        )
+
+        patches = [
+            patch.object(admin_group_routes.database, 'get_session', Session),
+            patch.object(admin_group_routes.mongodb, 'get_database', return_value=mongo),
+            patch('src.infrastructure.api.middleware.jwt_auth.admin_principal_cache.get_admin',
+                  return_value={'telegram_id': '42', 'status': 'active'}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = Flask(__name__)
+        app.config['JWT_SECRET_KEY'] = 'test-secret-key-with-at-least-32-bytes'
+        JWTManager(app)
+        app.register_blueprint(admin_group_routes.admin_group_bp)
+        with app.app_context():
+            self.headers = {'Authorization': f'Bearer {create_access_token(identity="42")}'}
+        self.client = app.test_client()
+
+    def _get(self, path, **params):
+        return self.client.get(f'/api/admin/groups/1/{path}', query_string=params, headers=self.headers)
+
+    def _expected_order(self):
+        ordered = sorted(
+            self.submissions.documents,
+            key=lambda d: (d.get('created_at') is not None, d.get('created_at'), d['_id']),
+            reverse=True
+        )
+        return [str(document['_id']) for document in ordered]
+
+    def _walk(self):
+        ids, cursor, pages = [], None, 0
+        while True:
+            params = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            data = self._get('submissions', **params).get_json()['data']
+            ids += [submission['_id'] for submission in data['submissions']]
+            self.assertNotIn('submission_data', data['submissions'][0])
+            pages += 1
+            cursor = data['next_cursor']
+            if not cursor:
+                self.assertFalse(data['has_more'])
+                return ids, pages
+
+    def test_cursor_walks_every_submission_once_newest_first(self):
+        """Test that following next_cursor returns each submission once, ties broken by _id"""
+        ids, pages = self._walk()
+
+        self.assertEqual(ids, self._expected_order())
+        self.assertEqual(pages, 3)
+
+    def test_cursor_pages_through_submissions_without_created_at(self):
+        """Test that documents with a null or missing created_at are paged last instead of breaking the cursor"""
+        form_id = self.submissions.documents[0]['form_config_id']
+        self.submissions.documents += [
+            {'_id': ObjectId(), 'form_config_id': form_id, 'created_at': None},
+            {'_id': ObjectId(), 'form_config_id': form_id},
+            {'_id': ObjectId(), 'form_config_id': form_id, 'created_at': None},
+        ]
+
+        ids, pages = self._walk()
+
+        self.assertEqual(ids, self._expected_order())
+        self.assertEqual(pages, 4)
+
+    def test_total_is_counted_on_the_first_page_only_and_capped(self):
+        """Test that include_total defaults to the first page and stops at SUBMISSIONS_COUNT_CAP"""
+        with patch.object(admin_group_routes.settings, 'SUBMISSIONS_COUNT_CAP', 3):
+            first = self._get('submissions', limit=2).get_json()['data']
+            second = self._get('submissions', limit=2, cursor=first['next_cursor']).get_json()['data']
+            uncapped = self._get('submissions', limit=2, start_date='2026-03-03').get_json()['data']
+        with patch.object(admin_group_routes.settings, 'SUBMISSIONS_COUNT_CAP', 5):
+            exactly_cap = self._get('submissions', limit=2).get_json()['data']
+
+        self.assertEqual((first['total'], first['total_is_capped']), (3, True))
+        self.assertEqual((second['total'], second['total_is_capped']), (None, False))
+        self.assertEqual((uncapped['total'], uncapped['total_is_capped']), (1, False))
+        self.assertEqual((exactly_cap['total'], exactly_cap['total_is_capped']), (5, False))
+        self.assertEqual(self.submissions.counted, 3)
+
+    def test_legacy_offset_is_applied_without_a_cursor(self):
+        """Test that offset still skips documents and is echoed back"""
+        data = self._get('submissions', limit=2, offset=3).get_json()['data']
+
+        self.assertEqual([s['_id'] for s in data['submissions']], self._expected_order()[3:])
+        self.assertEqual(data['offset'], 3)
+
+    def test_bad_pagination_input_returns_400(self):
+        """Test that malformed offset, limit, cursor and dates are client errors"""
+        for params in [{'offset': 'abc'}, {'limit': 'ten'}, {'cursor': 'not-a-cursor'}, {'start_date': '03/01/2026'}]:
+            with self.subTest(params=params):
+                response = self._get('submissions', **params)
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.get_json()['success'])
+
+        self.assertEqual(self._get('submissions/export', end_date='yesterday').status_code, 400)
+
+    def test_export_streams_ndjson_with_submission_data(self):
+        """Test that the export writes one JSON document per line, newest first"""
+        response = self._get('submissions/export')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([line['_id'] for line in lines], self._expected_order())
+        self.assertIn('submission_data', lines[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
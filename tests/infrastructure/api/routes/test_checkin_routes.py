@@ -0,0 +1,149 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from flask import Flask, g
+from PIL import Image
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.check_in_job_queue import CheckInJobQueue
+from src.infrastructure.persistence.models import (
+    Base, CheckInJobModel, CheckInModel, EmployeeGroupModel, EmployeeModel, GroupModel
+)
+from src.infrastructure.persistence.employee_repository_impl import EmployeeRepository
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.infrastructure.services.photo_storage_service import PhotoStorageService
+import src.infrastructure.api.routes.checkin_routes as checkin_routes
+
+
+class TestCheckInRoutes(unittest.TestCase):
+    """Test cases for POST /api/checkin with the employee and group resolved by the auth middleware"""
+
+    # INSERT employee_groups (ignored if linked), INSERT check_ins, INSERT check_in_jobs
+    STATEMENT_BUDGET = 3
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+        session = self.Session()
+        session.add(EmployeeModel(id=1, telegram_id='42', name='Sokha'))
+        session.add(GroupModel(id=1, chat_id='-100', name='Office'))
+        session.commit()
+        employee = EmployeeRepository(session).find_by_id(1)
+        group = GroupRepository(session).find_by_id(1)
+        session.close()
+
+        upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, upload_dir)
+        self.staging_dir = f'{upload_dir}/staging'
+
+        patches = [
+            patch.object(checkin_routes.database, 'get_session', self.Session),
+            patch.object(checkin_routes, 'photo_storage', PhotoStorageService(
+                upload_dir=f'{upload_dir}/photos', staging_dir=self.staging_dir
+            )),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = Flask(__name__)
+
+        @app.before_request
+        def authenticate():
+            # What validate_telegram_auth attaches for a valid initData
+            g.current_user = employee
+            g.current_group = group
+            g.telegram_user_id = '42'
+
+        app.register_blueprint(checkin_routes.checkin_bp, url_prefix='/api')
+        self.client = app.test_client()
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self._record_statement)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _record_statement(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _post(self, **extra):
+        data = {'telegram_user_id': '42', 'group_chat_id': '-100', 'latitude': '11.5', 'longitude': '104.9'}
+        data.update(extra)
+        return self.client.post('/api/checkin', data=data, content_type='multipart/form-data')
+
+    def _count(self, model):
+        session = self.Session()
+        try:
+            return session.query(model).count()
+        finally:
+            session.close()
+
+    def test_first_check_in_stays_within_statement_budget(self):
+        """Test that a check-in links, inserts and queues without any SELECT"""
+        response = self._post()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(len(self.statements), self.STATEMENT_BUDGET, self.statements)
+        self.assertFalse(any(s.lstrip().upper().startswith('SELECT') for s in self.statements))
+        self.assertEqual(self._count(EmployeeGroupModel), 1)
+        self.assertEqual(self._count(CheckInModel), 1)
+        self.assertEqual(self._count(CheckInJobModel), 1)
+
+    def test_repeat_check_in_stays_within_statement_budget(self):
+        """Test that an existing employee-group link does not cost extra statements"""
+        self._post()
+        self.statements.clear()
+
+        response = self._post(type='checkout')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['data']['type'], 'checkout')
+        self.assertEqual(len(self.statements), self.STATEMENT_BUDGET, self.statements)
+        self.assertEqual(self._count(EmployeeGroupModel), 1)
+        self.assertEqual(self._count(CheckInModel), 2)
+
+    def _photo(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (64, 64)).save(buffer, format='JPEG')
+        buffer.seek(0)
+        return buffer, 'photo.jpg'
+
+    def test_photo_is_staged_and_queued(self):
+        """Test that the raw photo is stored and handed to the job"""
+        response = self._post(photo=self._photo())
+
+        self.assertEqual(response.get_json()['data']['photo_status'], 'processing')
+        session = self.Session()
+        job = session.query(CheckInJobModel).one()
+        session.close()
+        self.assertTrue(job.raw_photo_path.endswith('.upload'))
+
+    def test_failed_transaction_rolls_back_and_removes_the_staged_photo(self):
+        """Test that a failing enqueue leaves neither a check-in nor an orphaned staged file"""
+        with patch.object(CheckInJobQueue, 'enqueue', side_effect=RuntimeError('queue unavailable')):
+            response = self._post(photo=self._photo())
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self._count(CheckInModel), 0)
+        self.assertEqual(self._count(EmployeeGroupModel), 0)
+        self.assertEqual(os.listdir(self.staging_dir), [])
+
+    def test_rejects_other_users_telegram_id(self):
+        """Test that the form cannot check in someone other than the authenticated user"""
+        response = self._post(telegram_user_id='43')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._count(CheckInModel), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from flask import Flask
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.models import Base, EmployeeGroupModel, EmployeeModel, GroupModel
+from src.infrastructure.utils.pagination import encode_cursor
+import src.infrastructure.api.routes.employee_routes as employee_routes
+
+
+class TestEmployeeListing(unittest.TestCase):
+    """Test cases for the keyset-paginated GET /api/employees"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+        # Two pairs share a created_at, so the id tiebreaker decides their order
+        same_day = datetime(2026, 1, 2, 8, 0)
+        session = self.Session()
+        session.add(GroupModel(id=1, chat_id='-100', name='Office'))
+        for employee_id, created_at in [
+            (1, datetime(2026, 1, 1, 8, 0)), (2, same_day), (3, same_day),
+            (4, datetime(2026, 1, 3, 8, 0)), (5, datetime(2026, 1, 3, 8, 0)),
+        ]:
+            session.add(EmployeeModel(id=employee_id, telegram_id=str(employee_id), name=f'Employee {employee_id}',
+                                      created_at=created_at))
+        session.add_all([EmployeeGroupModel(employee_id=i, group_id=1, joined_at=same_day) for i in (1, 3, 5)])
+        session.commit()
+        session.close()
+
+        patcher = patch.object(employee_routes.database, 'get_session', self.Session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        app = Flask(__name__)
+        app.register_blueprint(employee_routes.employee_bp, url_prefix='/api')
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _all_pages(self, **params):
+        ids, cursor = [], None
+        while True:
+            query = dict(params, limit=2, **({'cursor': cursor} if cursor else {}))
+            body = self.client.get('/api/employees', query_string=query).get_json()
+            ids += [employee['id'] for employee in body['data']]
+            cursor = body['pagination']['next_cursor']
+            if not cursor:
+                return ids
+
+    def test_cursor_walks_every_employee_once_newest_first(self):
+        """Test that following next_cursor returns every row once, ties broken by id"""
+        self.assertEqual(self._all_pages(), [5, 4, 3, 2, 1])
+        self.assertEqual(self._all_pages(chat_id='-100'), [5, 3, 1])
+
+    def test_search_treats_wildcards_literally(self):
+        """Test that %, _ and backslash in search match themselves, not any character"""
+        session = self.Session()
+        session.add_all([
+            EmployeeModel(id=6, telegram_id='6', name='100% Sales', created_at=datetime(2026, 1, 4, 8, 0)),
+            EmployeeModel(id=7, telegram_id='7', name='a_b\\c', created_at=datetime(2026, 1, 4, 8, 0)),
+        ])
+        session.commit()
+        session.close()
+
+        self.assertEqual(self._all_pages(search='%'), [6])
+        self.assertEqual(self._all_pages(search='_'), [7])
+        self.assertEqual(self._all_pages(search='b\\c'), [7])
+        self.assertEqual(self._all_pages(search='employee 1'), [1])
+
+    def test_malformed_cursor_is_rejected(self):
+        """Test that a cursor that is not a (created_at, id) pair returns 400"""
+        for cursor in ['not-a-cursor', encode_cursor([None, 3])]:
+            response = self.client.get('/api/employees', query_string={'cursor': cursor})
+            self.assertEqual(response.status_code, 400)
+
+    def test_created_at_is_required(self):
+        """Test that a NULL created_at, which no cursor can reach, cannot be stored"""
+        with self.assertRaises(IntegrityError), self.engine.begin() as connection:
+            connection.execute(insert(EmployeeModel).values(telegram_id='99', name='Legacy', created_at=None))
+
+
+if __name__ == '__main__':
+    unittest.main()
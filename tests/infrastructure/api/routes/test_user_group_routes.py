@@ -0,0 +1,81 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from flask import Flask, g
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.models import Base, EmployeeGroupModel, EmployeeModel, GroupModel
+import src.infrastructure.api.routes.user_group_routes as user_group_routes
+
+
+class TestUserGroupRoutes(unittest.TestCase):
+    """Test cases for GET /api/user/groups"""
+
+    def setUp(self):
+        engine = create_engine('sqlite://', poolclass=StaticPool)
+        self.addCleanup(engine.dispose)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        session.add(EmployeeModel(id=1, telegram_id='42', name='Sokha'))
+        session.add_all([
+            GroupModel(id=1, chat_id='-101', name='Office', business_name='Head Office'),
+            GroupModel(id=2, chat_id='-102', name='Warehouse'),
+            GroupModel(id=3, chat_id='-103', name='Other team'),
+        ])
+        session.add_all([
+            EmployeeGroupModel(employee_id=1, group_id=2, joined_at=datetime(2026, 3, 2, 9, 0)),
+            EmployeeGroupModel(employee_id=1, group_id=1, joined_at=datetime(2026, 3, 1, 9, 0)),
+        ])
+        session.commit()
+        session.close()
+
+        self.form_configs = [
+            {'telegram_group_chat_id': '-101', 'opnform_form_id': 'form-1', 'form_name': 'Daily report', 'is_active': True}
+        ]
+        mongo = SimpleNamespace(form_configurations=SimpleNamespace(find=lambda query: [
+            config for config in self.form_configs if config['telegram_group_chat_id'] in query['telegram_group_chat_id']['$in']
+        ]))
+        patches = [
+            patch.object(user_group_routes.database, 'get_session', Session),
+            patch.object(user_group_routes.mongodb, 'get_database', return_value=mongo),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = Flask(__name__)
+        app.before_request(lambda: setattr(g, 'current_user', SimpleNamespace(id=1)))
+        app.register_blueprint(user_group_routes.user_group_bp, url_prefix='/api')
+        self.client = app.test_client()
+
+    def test_lists_the_users_groups_in_join_order_with_their_forms(self):
+        """Test that only the user's groups are returned, oldest membership first, with form links"""
+        forms = [{'id': 'form-1', 'slug': 'daily-report', 'title': 'Daily'}]
+        with patch.object(user_group_routes.opnform_client, 'get_forms', return_value=forms):
+            response = self.client.get('/api/user/groups')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual(data['total'], 2)
+        office, warehouse = data['groups']
+        self.assertEqual((office['name'], office['business_name']), ('Office', 'Head Office'))
+        self.assertEqual(office['joined_at'], '2026-03-01T09:00:00')
+        self.assertEqual(office['form_url'], 'https://opnform.com/forms/daily-report')
+        self.assertEqual(office['form_name'], 'Daily report')
+        self.assertEqual((warehouse['name'], warehouse['has_form']), ('Warehouse', False))
+
+    def test_form_is_flagged_without_a_url_when_opnform_is_down(self):
+        """Test that a failing OpnForm API still reports the configured form, just without its link"""
+        with patch.object(user_group_routes.opnform_client, 'get_forms', return_value=None):
+            office = self.client.get('/api/user/groups').get_json()['data']['groups'][0]
+
+        self.assertEqual((office['has_form'], office['form_url'], office['form_name']), (True, None, 'Daily report'))
+
+
+if __name__ == '__main__':
+    unittest.main()
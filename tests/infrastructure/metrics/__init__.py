@@ -0,0 +1 @@
+# Infrastructure metrics tests package
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.flask_metrics import init_metrics
+from src.infrastructure.metrics.registry import cache_lookup_recorder
+from src.infrastructure.metrics.request_stats import track_queries
+from src.infrastructure.metrics.sqlalchemy_metrics import instrument_engine
+from src.infrastructure.utils.ttl_cache import TTLCache
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the Prometheus instrumentation"""
+
+    def test_metrics_endpoint_reports_request_latency(self):
+        app = Flask(__name__)
+        init_metrics(app)
+        app.add_url_rule('/api/items/<int:item_id>', 'item', lambda item_id: 'ok')
+        client = app.test_client()
+
+        client.get('/api/items/7')
+        response = client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_data(as_text=True)
+        self.assertIn('http_request_duration_seconds', body)
+        self.assertIn('route="/api/items/<int:item_id>"', body)
+
+    def test_queries_counted_per_tracked_block(self):
+        engine = create_engine('sqlite://')
+        instrument_engine(engine)
+        instrument_engine(engine)
+        before = sample('db_query_duration_seconds_count', operation='SELECT')
+
+        with track_queries() as stats, engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+            conn.execute(text('SELECT 2'))
+
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(sample('db_query_duration_seconds_count', operation='SELECT') - before, 2)
+
+    def test_cache_lookup_recorder_counts_hits_and_misses(self):
+        with patch.object(settings, 'METRICS_ENABLED', True):
+            cache = TTLCache(ttl=60, on_lookup=cache_lookup_recorder('test_cache'))
+        cache.get('key')
+        cache.set('key', 'value')
+        cache.get('key')
+
+        self.assertEqual(sample('cache_lookups_total', cache='test_cache', result='miss'), 1)
+        self.assertEqual(sample('cache_lookups_total', cache='test_cache', result='hit'), 1)
+
+    def test_cache_lookups_are_not_recorded_when_metrics_are_off(self):
+        with patch.object(settings, 'METRICS_ENABLED', False):
+            self.assertIsNone(cache_lookup_recorder('disabled_cache'))
+
+
+if __name__ == '__main__':
+    unittest.main()
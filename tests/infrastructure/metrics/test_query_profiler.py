@@ -0,0 +1,76 @@
+import unittest
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.metrics.flask_metrics import init_query_profiling
+from src.infrastructure.metrics.query_profiler import assert_max_queries, profile_queries
+from src.infrastructure.metrics.sqlalchemy_metrics import instrument_engine
+from src.infrastructure.persistence.models import Base, GroupModel
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+
+
+class TestQueryProfiler(unittest.TestCase):
+    """Test cases for the per-request query profiler and N+1 detection"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        instrument_engine(self.engine)
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        for group_id in (1, 2, 3):
+            self.session.add(GroupModel(id=group_id, chat_id=f'-10{group_id}', name=f'Group {group_id}'))
+        self.session.commit()
+        self.repository = GroupRepository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_lookup_loop_flagged_as_n_plus_one(self):
+        """Test that find_by_id in a loop is reported as one repeated statement"""
+        with profile_queries('loop') as profile:
+            for group_id in (1, 2, 3):
+                self.repository.find_by_id(group_id)
+
+        self.assertEqual(profile.count, 3)
+        repeated = profile.repeated_statements(threshold=3)
+        self.assertEqual(len(repeated), 1)
+        self.assertEqual(repeated[0][1], 3)
+        self.assertIn('possible N+1, 3x', profile.summary())
+
+    def test_same_parameters_not_flagged(self):
+        """Test that re-running an identical query is not mistaken for N+1"""
+        with profile_queries() as profile:
+            for _ in range(3):
+                self.repository.find_by_id(1)
+
+        self.assertEqual(profile.repeated_statements(threshold=3), [])
+
+    def test_budget_exceeded_raises(self):
+        """Test that assert_max_queries fails with the query summary"""
+        with self.assertRaises(AssertionError) as ctx:
+            with assert_max_queries(1):
+                self.repository.find_by_id(1)
+                self.repository.find_by_chat_id('-102')
+
+        self.assertIn('Expected at most 1 queries, got 2', str(ctx.exception))
+
+    def test_request_summary_logged_and_seen_by_outer_budget(self):
+        """Test that a profiled request logs its queries and still counts towards an enclosing budget"""
+        app = Flask(__name__)
+        init_query_profiling(app)
+        app.add_url_rule('/groups/<int:group_id>', 'group',
+                         lambda group_id: self.repository.find_by_id(group_id).name)
+        client = app.test_client()
+
+        with assert_max_queries(1) as profile, \
+                self.assertLogs('src.infrastructure.metrics.query_profiler', level='INFO') as logs:
+            client.get('/groups/2')
+
+        self.assertEqual(profile.count, 1)
+        self.assertIn('GET /groups/2: 1 queries (1 SQL, 0 Mongo)', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+# Infrastructure persistence tests package
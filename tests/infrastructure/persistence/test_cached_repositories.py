@@ -0,0 +1,71 @@
+import unittest
+from dataclasses import replace
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.group import Group
+from src.domain.entities.vehicle import Vehicle
+from src.infrastructure.persistence.models import Base, GroupModel, VehicleModel
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.infrastructure.persistence.vehicle_repository_impl import VehicleRepository
+from src.infrastructure.persistence.cached_repositories import CachedGroupRepository, CachedVehicleRepository
+from src.infrastructure.utils.ttl_cache import TTLCache
+
+
+class TestCachedRepositories(unittest.TestCase):
+    """Test cases for the bot's cached group and vehicle lookups"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        self.session.add(GroupModel(id=1, chat_id='-100', name='Fleet'))
+        self.session.add(VehicleModel(id=1, group_id=1, license_plate='2A-1234', vehicle_type='TRUCK'))
+        self.session.commit()
+
+        self.group_repo = CachedGroupRepository(GroupRepository(self.session), TTLCache(ttl=60))
+        self.vehicle_repo = CachedVehicleRepository(VehicleRepository(self.session), TTLCache(ttl=60))
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: self.statements.append(args[2]))
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_group_lookup_is_cached(self):
+        """Test that repeated chat and id lookups hit the database once"""
+        group = self.group_repo.find_by_chat_id('-100')
+        self.assertEqual(self.group_repo.find_by_chat_id('-100'), group)
+        self.assertEqual(self.group_repo.find_by_id(1), group)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_missing_group_is_not_cached(self):
+        """Test that a group registered after a failed lookup is found"""
+        self.assertIsNone(self.group_repo.find_by_chat_id('-200'))
+        self.group_repo.upsert_by_chat_id(Group.create(chat_id='-200', name='New'))
+        self.assertEqual(self.group_repo.find_by_chat_id('-200').name, 'New')
+
+    def test_group_save_invalidates(self):
+        """Test that a package change saved through the repository is seen immediately"""
+        group = self.group_repo.find_by_chat_id('-100')
+        self.group_repo.save(replace(group, package_level='premium'))
+        self.assertEqual(self.group_repo.find_by_chat_id('-100').package_level, 'premium')
+        self.assertEqual(self.group_repo.find_by_id(1).package_level, 'premium')
+
+    def test_vehicle_list_invalidated_by_setup_changes(self):
+        """Test that adding and deleting vehicles refreshes the cached list"""
+        self.assertEqual(len(self.vehicle_repo.find_by_group_id(1)), 1)
+        self.vehicle_repo.find_by_group_id(1)
+        self.assertEqual(len(self.statements), 1)
+
+        added = self.vehicle_repo.save(Vehicle.create(group_id=1, license_plate='2B-5678', vehicle_type='VAN'))
+        self.assertEqual(len(self.vehicle_repo.find_by_group_id(1)), 2)
+
+        self.vehicle_repo.delete(added.id)
+        self.assertEqual([v.license_plate for v in self.vehicle_repo.find_by_group_id(1)], ['2A-1234'])
+
+
+if __name__ == '__main__':
+    unittest.main()
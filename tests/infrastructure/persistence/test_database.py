@@ -0,0 +1,46 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.persistence.database import ALEMBIC_SCRIPT_LOCATION, Database
+
+
+class TestFastStartupProfile(unittest.TestCase):
+    """Test cases for skipping create_all when the schema is at the Alembic head"""
+
+    def setUp(self):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        self.db = Database()
+        self.db.engine = create_engine(f"sqlite:///{os.path.join(work_dir, 'startup.db')}")
+        self.addCleanup(self.db.engine.dispose)
+
+        patcher = patch.object(settings, 'STARTUP_PROFILE', 'fast')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_skips_create_all_at_alembic_head(self):
+        """Test that a database stamped at head is not checked table by table"""
+        with self.db.engine.begin() as connection:
+            MigrationContext.configure(connection).stamp(ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION)), 'heads')
+
+        self.assertTrue(self.db.schema_is_current())
+        self.db.create_tables()
+        self.assertFalse(inspect(self.db.engine).has_table('groups'))
+
+    def test_creates_tables_without_alembic_revision(self):
+        """Test that an unmigrated database still gets its tables"""
+        self.assertFalse(self.db.schema_is_current())
+        self.db.create_tables()
+        self.assertTrue(inspect(self.db.engine).has_table('groups'))
+
+
+if __name__ == '__main__':
+    unittest.main()
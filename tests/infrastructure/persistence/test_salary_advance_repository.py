@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.salary_advance import SalaryAdvance
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.models import Base, EmployeeModel
+from src.infrastructure.persistence.salary_advance_repository_impl import SalaryAdvanceRepository
+
+
+class TestSalaryAdvanceRepository(unittest.TestCase):
+    """Test cases for SalaryAdvanceRepository against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add(EmployeeModel(id=1, telegram_id='111', name='Sokha'))
+        self.session.commit()
+        self.repo = SalaryAdvanceRepository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _save(self, amount: str, employee_id: int = 1, timestamp: datetime = None) -> SalaryAdvance:
+        advance = SalaryAdvance.create(employee_id=employee_id, amount=Money(Decimal(amount)), created_by='admin')
+        if timestamp is not None:
+            advance.timestamp = timestamp
+        return self.repo.save(advance)
+
+    def test_amounts_round_trip_as_exact_decimals(self):
+        """Test that cents survive a save and reload without float rounding"""
+        for amount in ['0.10', '0.20', '1234567.89', '99999999999.99']:
+            self._save(amount)
+
+        # Reload from the database rather than the identity map
+        self.session.expunge_all()
+        reloaded = self.repo.find_by_employee_id(1)
+
+        amounts = sorted(advance.amount.amount for advance in reloaded)
+        self.assertEqual(amounts, [Decimal('0.10'), Decimal('0.20'), Decimal('1234567.89'), Decimal('99999999999.99')])
+        self.assertTrue(all(isinstance(amount, Decimal) for amount in amounts))
+        self.assertEqual(str(reloaded[0].amount), '$0.10')
+
+    def test_summary_sums_exactly(self):
+        """Test that the SQL total of many small amounts is exact"""
+        for _ in range(10):
+            self._save('0.10')
+
+        total, count = self.repo.summarize_by_employee_id(1)
+
+        self.assertEqual(total, Decimal('1.00'))
+        self.assertEqual(count, 10)
+
+    def test_sum_by_employee_ids_groups_and_applies_bounds(self):
+        """Test the grouped per-employee totals with time and amount bounds, including a zero bound"""
+        self.session.add(EmployeeModel(id=2, telegram_id='222', name='Dara'))
+        self.session.commit()
+        march, april = datetime(2026, 3, 15), datetime(2026, 4, 15)
+        self._save('0.00', timestamp=march)
+        self._save('10.10', timestamp=march)
+        self._save('20.20', timestamp=april)
+        self._save('5.05', employee_id=2, timestamp=march)
+
+        self.assertEqual(self.repo.sum_by_employee_ids([1, 2, 3]), {1: Decimal('30.30'), 2: Decimal('5.05')})
+        self.assertEqual(
+            self.repo.sum_by_employee_ids([1, 2], start=march, end=datetime(2026, 3, 31)),
+            {1: Decimal('10.10'), 2: Decimal('5.05')}
+        )
+        self.assertEqual(self.repo.sum_by_employee_ids([1, 2], min_amount=Decimal('10'), max_amount=Decimal('20.20')),
+                         {1: Decimal('30.30')})
+        self.assertEqual(self.repo.sum_by_employee_ids([]), {})
+
+        # max_amount=0 is a bound, not "no filter"
+        page = self.repo.find_page_by_employee_id(1, limit=10, max_amount=Decimal('0'))
+        self.assertEqual([advance.amount.amount for advance in page], [Decimal('0.00')])
+
+
+if __name__ == '__main__':
+    unittest.main()
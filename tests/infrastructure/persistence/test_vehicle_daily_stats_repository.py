@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+from datetime import date, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.vehicle_daily_stats import VehicleDailyStats
+from src.infrastructure.persistence.models import Base, GroupModel, VehicleModel, TripModel, FuelRecordModel
+from src.infrastructure.persistence.vehicle_daily_stats_repository_impl import VehicleDailyStatsRepository
+from src.infrastructure.persistence.trip_repository_impl import TripRepository
+from src.infrastructure.persistence.fuel_record_repository_impl import FuelRecordRepository
+from src.infrastructure.persistence.vehicle_repository_impl import VehicleRepository
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from src.application.use_cases.record_fuel import RecordFuelUseCase
+from src.application.use_cases.record_trips_batch import RecordTripsBatchUseCase
+from src.application.use_cases.get_monthly_report import GetMonthlyReportUseCase
+from src.application.dto.fuel_dto import RecordFuelRequest
+from src.application.dto.trip_dto import RecordTripsBatchRequest
+
+
+class TestVehicleDailyStatsRepository(unittest.TestCase):
+    """Test cases for the vehicle_daily_stats rollup against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add(GroupModel(id=1, chat_id='-100', name='Fleet'))
+        self.session.add(VehicleModel(id=1, group_id=1, license_plate='2A-1234', vehicle_type='TRUCK'))
+        self.session.commit()
+        self.repo = VehicleDailyStatsRepository(self.session)
+        self.today = date.today()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_add_increments_existing_row(self):
+        """Test that repeated adds for the same day accumulate in one row"""
+        self.repo.add(VehicleDailyStats(group_id=1, vehicle_id=1, date=self.today, trip_count=2,
+                                        loading_size_cubic_meters=20.0))
+        self.repo.add(VehicleDailyStats(group_id=1, vehicle_id=1, date=self.today, fuel_liters=30.0, fuel_cost=39.0))
+        self.repo.add(VehicleDailyStats(group_id=1, vehicle_id=1, date=self.today, trip_count=1))
+
+        rows = self.repo.find_by_vehicle_and_date_range(1, self.today, self.today)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(
+            (rows[0].trip_count, rows[0].loading_size_cubic_meters, rows[0].fuel_liters, rows[0].fuel_cost),
+            (3, 20.0, 30.0, 39.0)
+        )
+
+    def test_use_cases_keep_rollup_in_step_with_rebuild(self):
+        """Test that incremental maintenance matches a rebuild from the raw tables"""
+        vehicle_repo = VehicleRepository(self.session)
+        unit_of_work = SqlAlchemyUnitOfWork(self.session)
+        RecordTripsBatchUseCase(TripRepository(self.session), vehicle_repo, self.repo, unit_of_work).execute(
+            RecordTripsBatchRequest(group_id=1, vehicle_id=1, trip_count=3, total_loading_size_cubic_meters=30.0)
+        )
+        RecordFuelUseCase(FuelRecordRepository(self.session), vehicle_repo, self.repo, unit_of_work).execute(
+            RecordFuelRequest(group_id=1, vehicle_id=1, liters=40.0, cost=52.0)
+        )
+        incremental = self.repo.find_by_group_and_date_range(1, self.today, self.today)
+
+        self.assertEqual(self.repo.rebuild(group_id=1), 1)
+        self.assertEqual(self.repo.find_by_group_and_date_range(1, self.today, self.today), incremental)
+        self.assertEqual(incremental[0].trip_count, 3)
+        self.assertEqual(incremental[0].fuel_liters, 40.0)
+
+    def test_failed_rollup_increment_rolls_back_the_record(self):
+        """Test that a fuel record is not committed when its rollup increment fails"""
+        use_case = RecordFuelUseCase(
+            FuelRecordRepository(self.session), VehicleRepository(self.session), self.repo,
+            SqlAlchemyUnitOfWork(self.session)
+        )
+
+        with patch('src.infrastructure.persistence.vehicle_daily_stats_repository_impl.upsert_increment',
+                   side_effect=RuntimeError('rollup unavailable')):
+            with self.assertRaises(RuntimeError):
+                use_case.execute(RecordFuelRequest(group_id=1, vehicle_id=1, liters=40.0, cost=52.0))
+
+        self.assertEqual(self.session.query(FuelRecordModel).count(), 0)
+        self.assertEqual(self.repo.find_by_vehicle_and_date_range(1, self.today, self.today), [])
+
+    def test_rebuild_scope_and_year_over_year(self):
+        """Test a scoped rebuild and the monthly report's comparison with last year"""
+        last_year = self.today.replace(year=self.today.year - 1, day=1)
+        self.session.add_all([
+            TripModel(group_id=1, vehicle_id=1, date=last_year, trip_number=1, loading_size_cubic_meters=5.0),
+            TripModel(group_id=1, vehicle_id=1, date=last_year, trip_number=2),
+            FuelRecordModel(group_id=1, vehicle_id=1, date=last_year, liters=10.0, cost=12.0),
+            TripModel(group_id=1, vehicle_id=1, date=self.today, trip_number=1),
+        ])
+        self.session.commit()
+
+        # Only last year's row is rebuilt
+        self.assertEqual(self.repo.rebuild(start_date=last_year, end_date=last_year + timedelta(days=1)), 1)
+        self.assertEqual(self.repo.find_by_vehicle_and_date_range(1, self.today, self.today), [])
+
+        report = GetMonthlyReportUseCase(
+            VehicleRepository(self.session), None,
+            TripRepository(self.session), FuelRecordRepository(self.session), self.repo
+        ).execute(1, self.today.year, self.today.month)
+
+        self.assertEqual(report.total_trips, 0)
+        self.assertEqual(report.previous_year_total_trips, 2)
+        self.assertEqual(report.previous_year_total_fuel_liters, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
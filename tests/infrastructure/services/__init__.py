@@ -0,0 +1 @@
+# Infrastructure services tests package
@@ -0,0 +1,166 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.persistence.models import (
+    Base, CheckInModel, CheckInJobModel, EmployeeModel, GroupModel, utc_now
+)
+from src.infrastructure.persistence.check_in_job_queue import CheckInJobQueue
+from src.infrastructure.services.check_in_job_worker import CheckInJobWorker
+from src.infrastructure.services.photo_storage_service import PhotoStorageService
+
+
+class TestCheckInJobWorker(unittest.TestCase):
+    """Test cases for CheckInJobWorker against an in-memory SQLite database"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+        session = self.Session()
+        session.add(GroupModel(id=1, chat_id='-100', name='Office'))
+        session.add(EmployeeModel(id=1, telegram_id='42', name='Sokha'))
+        session.add(CheckInModel(id=1, employee_id=1, group_id=1, latitude=11.5, longitude=104.9, type='checkin'))
+        session.commit()
+        session.close()
+
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir)
+        self.photo_storage = PhotoStorageService(
+            upload_dir=os.path.join(self.upload_dir, 'photos'),
+            staging_dir=os.path.join(self.upload_dir, 'staging'),
+            max_dimension=100
+        )
+
+        self.notifications = MagicMock()
+        self.notifications.send_checkin_notification.return_value = True
+        self.worker = CheckInJobWorker(
+            session_factory=self.Session,
+            photo_storage=self.photo_storage,
+            notification_service_factory=lambda: self.notifications,
+            max_attempts=2,
+            stale_after=60
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _enqueue(self, raw_photo_path=None, check_in_id=1):
+        session = self.Session()
+        try:
+            return CheckInJobQueue(session).enqueue(check_in_id, raw_photo_path)
+        finally:
+            session.close()
+
+    def _job(self, job_id):
+        session = self.Session()
+        try:
+            return session.query(CheckInJobModel).filter_by(id=job_id).one()
+        finally:
+            session.close()
+
+    def test_processes_photo_and_notifies(self):
+        """Test that a queued job resizes the photo, sets photo_url and notifies the group"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (800, 600)).save(buffer, format='JPEG')
+        buffer.seek(0)
+        staged_path = self.photo_storage.stage_upload(buffer)
+        job_id = self._enqueue(staged_path)
+
+        self.assertEqual(self.worker.run_pending(), 1)
+
+        session = self.Session()
+        photo_url = session.query(CheckInModel.photo_url).filter_by(id=1).scalar()
+        session.close()
+        self.assertTrue(photo_url.endswith('.webp'))
+        self.assertFalse(os.path.exists(staged_path))
+        self.assertEqual(self._job(job_id).status, 'done')
+        kwargs = self.notifications.send_checkin_notification.call_args.kwargs
+        self.assertEqual(kwargs['group_chat_id'], '-100')
+        self.assertEqual(kwargs['photo_url'], photo_url)
+
+    def test_identical_photos_are_staged_separately(self):
+        """Test that two check-ins uploading the same bytes both end up with the photo"""
+        session = self.Session()
+        session.add(CheckInModel(id=2, employee_id=1, group_id=1, latitude=11.5, longitude=104.9, type='checkin'))
+        session.commit()
+        session.close()
+
+        buffer = io.BytesIO()
+        Image.new('RGB', (800, 600)).save(buffer, format='JPEG')
+        staged_paths = []
+        for check_in_id in (1, 2):
+            buffer.seek(0)
+            staged_paths.append(self.photo_storage.stage_upload(buffer))
+            self._enqueue(staged_paths[-1], check_in_id=check_in_id)
+        self.assertNotEqual(staged_paths[0], staged_paths[1])
+
+        self.assertEqual(self.worker.run_pending(), 2)
+
+        session = self.Session()
+        photo_urls = [url for (url,) in session.query(CheckInModel.photo_url).order_by(CheckInModel.id)]
+        session.close()
+        self.assertIsNotNone(photo_urls[0])
+        self.assertEqual(photo_urls[0], photo_urls[1])
+        self.assertEqual(os.listdir(self.photo_storage.staging_dir), [])
+
+    def test_failed_notification_is_retried_then_failed(self):
+        """Test that a failed send is rescheduled until max_attempts"""
+        self.notifications.send_checkin_notification.return_value = False
+        job_id = self._enqueue()
+
+        self.worker.run_pending()
+        job = self._job(job_id)
+        self.assertEqual(job.status, 'pending')
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.available_at, utc_now())
+
+        # Not due yet
+        self.assertEqual(self.worker.run_pending(), 0)
+
+        session = self.Session()
+        session.query(CheckInJobModel).update({CheckInJobModel.available_at: utc_now()})
+        session.commit()
+        session.close()
+
+        self.worker.run_pending()
+        self.assertEqual(self._job(job_id).status, 'failed')
+
+    def test_reclaims_job_abandoned_in_processing(self):
+        """Test that a job locked by a crashed worker is picked up again"""
+        job_id = self._enqueue()
+        session = self.Session()
+        session.query(CheckInJobModel).update({
+            CheckInJobModel.status: 'processing',
+            CheckInJobModel.locked_at: utc_now() - timedelta(minutes=5),
+            CheckInJobModel.attempts: 1
+        })
+        session.commit()
+        session.close()
+
+        self.assertEqual(self.worker.run_pending(), 1)
+        self.assertEqual(self._job(job_id).status, 'done')
+
+    def test_is_alive_tracks_the_polling_thread(self):
+        """Test that is_alive reports the thread the supervisor heartbeat depends on"""
+        self.assertFalse(self.worker.is_alive)
+
+        self.worker.start()
+        self.assertTrue(self.worker.is_alive)
+
+        self.worker.stop()
+        self.assertFalse(self.worker.is_alive)
+
+
+if __name__ == '__main__':
+    unittest.main()
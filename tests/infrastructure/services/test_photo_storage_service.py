@@ -0,0 +1,108 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from src.infrastructure.services.photo_storage_service import PhotoStorageService
+
+
+def make_jpeg(width, height, orientation=None):
+    """Build an in-memory JPEG, optionally tagged with an EXIF orientation"""
+    image = Image.new('RGB', (width, height), color=(200, 30, 30))
+    buffer = io.BytesIO()
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        image.save(buffer, format='JPEG', exif=exif)
+    else:
+        image.save(buffer, format='JPEG')
+    buffer.seek(0)
+    return buffer
+
+
+class TestPhotoStorageService(unittest.TestCase):
+    """Test cases for PhotoStorageService"""
+
+    def setUp(self):
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir)
+        self.service = PhotoStorageService(
+            upload_dir=self.upload_dir,
+            max_dimension=400,
+            image_format='WEBP',
+            quality=80
+        )
+
+    def _path_for(self, photo_url):
+        return self.service.path_for_url(photo_url)
+
+    def test_downscales_and_reencodes_into_sharded_path(self):
+        """Test that photos are resized to max_dimension and stored as WebP"""
+        photo_url = self.service.save_upload(make_jpeg(2000, 1000))
+
+        name = os.path.basename(photo_url)
+        self.assertTrue(name.endswith('.webp'))
+        self.assertIn(f"/{name[:2]}/{name[2:4]}/", photo_url)
+        with Image.open(self._path_for(photo_url)) as stored:
+            self.assertEqual(stored.format, 'WEBP')
+            self.assertEqual(stored.size, (400, 200))
+
+    def test_applies_exif_orientation(self):
+        """Test that a rotated camera photo is stored upright"""
+        # Orientation 6 means the viewer must rotate 90 degrees clockwise
+        photo_url = self.service.save_upload(make_jpeg(800, 400, orientation=6))
+
+        with Image.open(self._path_for(photo_url)) as stored:
+            self.assertEqual(stored.size, (200, 400))
+
+    def test_retried_upload_is_deduplicated(self):
+        """Test that identical bytes map to the same stored file"""
+        data = make_jpeg(600, 600).getvalue()
+
+        first = self.service.save_upload(io.BytesIO(data))
+        second = self.service.save_upload(io.BytesIO(data))
+
+        self.assertEqual(first, second)
+        stored_files = [f for _, _, files in os.walk(self.upload_dir) for f in files]
+        self.assertEqual(len(stored_files), 1)
+
+    def test_rejects_non_image(self):
+        """Test that a non-image upload raises ValueError and leaves nothing behind"""
+        with self.assertRaises(ValueError):
+            self.service.save_upload(io.BytesIO(b'not an image'))
+
+        stored_files = [f for _, _, files in os.walk(self.upload_dir) for f in files]
+        self.assertEqual(stored_files, [])
+
+
+    def test_url_uses_prefix_not_upload_dir(self):
+        """Test that an absolute upload_dir does not leak into the URL and the URL maps back to the file"""
+        photo_url = self.service.save_upload(make_jpeg(100, 100))
+
+        self.assertTrue(photo_url.startswith('/uploads/photos/'), photo_url)
+        self.assertTrue(os.path.isfile(self._path_for(photo_url)))
+        self.assertIsNone(self.service.path_for_url('/uploads/photos/../../etc/passwd'))
+        self.assertIsNone(self.service.path_for_url('/elsewhere/ab/cd/x.webp'))
+
+    def test_decompression_bomb_is_rejected_and_cleaned_up(self):
+        """Test that an over-limit image is a ValueError and leaves no staged file"""
+        staging_dir = os.path.join(self.upload_dir, 'staging')
+        service = PhotoStorageService(upload_dir=self.upload_dir, staging_dir=staging_dir)
+
+        with patch.object(Image, 'MAX_IMAGE_PIXELS', 1000):
+            with self.assertRaises(ValueError):
+                service.stage_upload(make_jpeg(100, 100))
+            with self.assertRaises(ValueError):
+                service.save_upload(make_jpeg(100, 100))
+
+        self.assertEqual(os.listdir(staging_dir), [])
+        stored_files = [f for _, _, files in os.walk(self.upload_dir) for f in files]
+        self.assertEqual(stored_files, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+# Infrastructure supervisor tests package
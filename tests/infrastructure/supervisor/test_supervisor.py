@@ -0,0 +1,150 @@
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from src.infrastructure.supervisor import Component, Supervisor, parse_replicas
+
+
+def _crash(probe):
+    sys.exit(3)
+
+
+def _serve_until_sigterm(probe):
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+    probe.ready()
+    while not stopping.wait(0.05):
+        probe.beat()
+    # Simulated in-flight work that finishes within the drain timeout
+    time.sleep(0.2)
+    os._exit(0)
+
+
+def _wedged(probe):
+    # Alive and ready, but its main loop never comes round to beat again
+    probe.ready()
+    time.sleep(60)
+
+
+def _wedged_ignoring_sigterm(probe):
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    _wedged(probe)
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@unittest.skipIf(sys.platform == 'win32', "the supervisor forks its replicas")
+class TestSupervisor(unittest.TestCase):
+    """Test cases for the process supervisor"""
+
+    def test_parse_replicas(self):
+        """Test that overrides apply on top of the defaults and unknown components are rejected"""
+        defaults = {'api': 1, 'checkin_worker': 0}
+        self.assertEqual(parse_replicas('', defaults), defaults)
+        self.assertEqual(parse_replicas(' api=4, checkin_worker=1 ', defaults), {'api': 4, 'checkin_worker': 1})
+        with self.assertRaises(ValueError):
+            parse_replicas('web=2', defaults)
+        with self.assertRaises(ValueError):
+            Component('checkin_bot', _crash, replicas=2, max_replicas=1)
+
+    def test_restarts_crashed_replicas_and_drains_on_stop(self):
+        """Test restart with backoff, readiness over HTTP and a graceful drain"""
+        supervisor = Supervisor(
+            [Component('api', _serve_until_sigterm, replicas=2), Component('flaky', _crash)],
+            heartbeat_interval=0.1,
+            backoff_initial=0.1,
+            backoff_max=0.2,
+            drain_timeout=5,
+            probe_port=0,
+            poll_interval=0.05
+        )
+        thread = threading.Thread(target=supervisor.run)
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(supervisor.stop)
+
+        def flaky_restarts():
+            return supervisor.status()[2]['components']['flaky']['replicas'][0]['restarts']
+
+        self.assertTrue(_wait_for(lambda: flaky_restarts() >= 2))
+        self.assertTrue(_wait_for(lambda: supervisor.status()[2]['components']['api']['ready'] == 2))
+        # The flaky component never becomes ready, so neither does the supervisor
+        self.assertEqual(supervisor.status()[:2], (True, False))
+
+        port = supervisor._probe_server.port
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/livez') as response:
+            self.assertEqual(json.load(response)['draining'], False)
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/readyz')
+        self.assertEqual(ctx.exception.code, 503)
+
+        pids = [replica.process.pid for replica in supervisor._replicas if replica.component.name == 'api']
+        supervisor.stop()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        for pid in pids:
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+    def test_replica_with_a_stuck_main_loop_is_restarted(self):
+        """Test that a live process whose loop stopped beating is killed and restarted"""
+        supervisor = Supervisor(
+            [Component('api', _wedged)],
+            heartbeat_timeout=0.5,
+            backoff_initial=0.1,
+            drain_timeout=1,
+            poll_interval=0.05
+        )
+        thread = threading.Thread(target=supervisor.run)
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(supervisor.stop)
+
+        replica = supervisor._replicas[0]
+        self.assertTrue(_wait_for(lambda: replica.process is not None and replica.process.pid is not None))
+        first_pid = replica.process.pid
+        self.assertTrue(_wait_for(lambda: supervisor.status()[2]['components']['api']['replicas'][0]['restarts'] >= 1))
+        with self.assertRaises(ProcessLookupError):
+            os.kill(first_pid, 0)
+
+    def test_stuck_replica_that_ignores_sigterm_is_killed_after_the_grace(self):
+        """Test that SIGKILL follows SIGTERM only once kill_grace has passed"""
+        supervisor = Supervisor(
+            [Component('api', _wedged_ignoring_sigterm)],
+            heartbeat_timeout=0.5,
+            kill_grace=0.5,
+            backoff_initial=0.1,
+            drain_timeout=1,
+            poll_interval=0.05
+        )
+        thread = threading.Thread(target=supervisor.run)
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(supervisor.stop)
+
+        replica = supervisor._replicas[0]
+        self.assertTrue(_wait_for(lambda: replica.terminated_at is not None))
+        terminated_at = replica.terminated_at
+        first_pid = replica.process.pid
+        os.kill(first_pid, 0)
+        self.assertTrue(_wait_for(lambda: replica.starts >= 2))
+        self.assertGreaterEqual(time.time() - terminated_at, 0.5)
+        with self.assertRaises(ProcessLookupError):
+            os.kill(first_pid, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
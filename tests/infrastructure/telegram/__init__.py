@@ -0,0 +1 @@
+# Infrastructure telegram tests package
@@ -0,0 +1,64 @@
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, GroupModel
+from src.infrastructure.telegram.dependency_container import BotContainer
+
+
+class TestBotContainer(unittest.TestCase):
+    """Test cases for the per-update session scope of the bot container"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        factory = sessionmaker(bind=self.engine)
+        self.opened = []
+
+        def session_factory():
+            session = factory()
+            self.opened.append(session)
+            return session
+
+        self.container = BotContainer(session_factory)
+
+        with factory() as session:
+            session.add(GroupModel(id=1, chat_id='-100', name='Fleet'))
+            session.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_session_is_opened_lazily(self):
+        """Test that an update which never queries opens no session"""
+        with self.container.update_scope():
+            self.container.group_repo
+        self.assertEqual(self.opened, [])
+
+    def test_one_session_per_update(self):
+        """Test that repositories share one session within an update and get a new one per update"""
+        with self.container.update_scope():
+            self.assertEqual(self.container.group_repo.find_by_chat_id('-100').id, 1)
+            self.container.vehicle_repo.find_by_id(1)
+        with self.container.update_scope():
+            self.container.vehicle_repo.find_by_id(1)
+        self.assertEqual(len(self.opened), 2)
+
+    def test_session_closed_when_handler_raises(self):
+        """Test that the update's session is removed even if the handler fails"""
+        with self.assertRaises(ValueError):
+            with self.container.update_scope():
+                self.container.group_repo.find_by_id(1)
+                raise ValueError("handler failed")
+        session, = self.opened
+        self.assertFalse(session.in_transaction())
+        self.assertEqual(self.container.session.registry.registry, {})
+
+    def test_access_outside_update_scope(self):
+        """Test that using a repository outside an update is an error"""
+        with self.assertRaises(RuntimeError):
+            self.container.group_repo.find_by_id(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
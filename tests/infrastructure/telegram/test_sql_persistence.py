@@ -0,0 +1,101 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.models import Base, BotPersistenceModel
+from src.infrastructure.telegram.sql_persistence import SQLPersistence
+
+
+class TestSQLPersistence(unittest.TestCase):
+    """Test cases for the buffered MySQL persistence of the bot (run on SQLite)"""
+
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.persistence = SQLPersistence(self.session_factory)
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda *args: self.statements.append(args[2]))
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def _count_rows(self) -> int:
+        with self.session_factory() as session:
+            return session.query(BotPersistenceModel).count()
+
+    def test_state_survives_restart(self):
+        """Test that flushed conversation and user data are loaded by a new process"""
+        async def scenario():
+            await self.persistence.update_conversation('trip_recording', (-100, 7), 31)
+            await self.persistence.update_user_data(7, {'trip_vehicle_id': 3, 'trip_vehicle_plate': '2A-1234'})
+            await self.persistence.update_chat_data(-100, {'menu_message_id': 55})
+            self.assertEqual(self._count_rows(), 0)
+            await self.persistence.flush()
+
+            restarted = SQLPersistence(self.session_factory)
+            return (
+                await restarted.get_conversations('trip_recording'),
+                await restarted.get_user_data(),
+                await restarted.get_chat_data(),
+                await restarted.get_bot_data()
+            )
+
+        conversations, user_data, chat_data, bot_data = asyncio.run(scenario())
+        self.assertEqual(conversations, {(-100, 7): 31})
+        self.assertEqual(user_data, {7: {'trip_vehicle_id': 3, 'trip_vehicle_plate': '2A-1234'}})
+        self.assertEqual(chat_data, {-100: {'menu_message_id': 55}})
+        self.assertEqual(bot_data, {})
+
+    def test_flush_writes_one_batch(self):
+        """Test that a persistence run is written with a single INSERT"""
+        async def scenario():
+            for user_id in range(20):
+                await self.persistence.update_user_data(user_id, {'step': user_id})
+            await self.persistence.update_user_data(3, {'step': 'latest'})
+            await self.persistence.flush()
+            await self.persistence.flush()
+            return await SQLPersistence(self.session_factory).get_user_data()
+
+        user_data = asyncio.run(scenario())
+        self.assertEqual(len(user_data), 20)
+        self.assertEqual(user_data[3], {'step': 'latest'})
+        inserts = [s for s in self.statements if s.startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+
+    def test_ended_conversations_and_dropped_data_are_deleted(self):
+        """Test that ending a conversation or dropping data removes its row"""
+        async def scenario():
+            await self.persistence.update_conversation('setup', (-100, 7), 10)
+            await self.persistence.update_user_data(7, {'setup_group_id': -100})
+            await self.persistence.flush()
+
+            await self.persistence.update_conversation('setup', (-100, 7), None)
+            await self.persistence.drop_user_data(7)
+            await self.persistence.flush()
+
+        asyncio.run(scenario())
+        self.assertEqual(self._count_rows(), 0)
+
+    def test_unserializable_entry_is_skipped(self):
+        """Test that one value that is not JSON does not block the batch"""
+        async def scenario():
+            await self.persistence.update_user_data(1, {'bad': object()})
+            await self.persistence.update_user_data(2, {'good': True})
+            await self.persistence.flush()
+            return await SQLPersistence(self.session_factory).get_user_data()
+
+        with self.assertLogs('src.infrastructure.telegram.sql_persistence', level='WARNING'):
+            user_data = asyncio.run(scenario())
+        self.assertEqual(user_data, {2: {'good': True}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+# Infrastructure utils tests package
@@ -0,0 +1,71 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.infrastructure.utils.logging_config import setup_logging
+
+
+class TestLoggingConfig(unittest.TestCase):
+    """Test cases for the queue-based logging setup"""
+
+    def setUp(self):
+        self.logs_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.logs_root)
+
+        root = logging.getLogger()
+        saved = (root.handlers[:], root.level, getattr(root, '_office_automation_configured', False))
+        root.handlers = []
+        root._office_automation_configured = False
+
+        def restore():
+            root.handlers, root.level, root._office_automation_configured = saved
+        self.addCleanup(restore)
+
+    def _setup(self, **env):
+        with patch.dict(os.environ, env):
+            listener = setup_logging(self.logs_root)
+        # The tests stop the listener themselves to flush it; stop it here if an assertion failed first
+        self.addCleanup(lambda: listener._thread and listener.stop())
+        return listener
+
+    def _read(self, level):
+        return (self.logs_root / level / 'app.log').read_text(encoding='utf-8').splitlines()
+
+    def test_records_reach_level_files_through_the_writer_thread(self):
+        """Test that the root logger only enqueues and the listener writes each level's file"""
+        listener = self._setup()
+        self.assertEqual([type(h).__name__ for h in logging.getLogger().handlers], ['QueueHandler'])
+
+        logger = logging.getLogger('tests.logging')
+        logger.info('info line')
+        logger.error('error line')
+        listener.stop()
+
+        self.assertEqual(len(self._read('info')), 1)
+        self.assertIn('INFO tests.logging: info line', self._read('info')[0])
+        self.assertIn('error line', self._read('error')[0])
+        self.assertEqual(self._read('warning'), [])
+
+    def test_json_format_and_sampling(self):
+        """Test one JSON object per line, and that sampled INFO records are dropped at rate 0"""
+        listener = self._setup(LOG_FORMAT='json', LOG_SAMPLE_RATE='0')
+
+        logger = logging.getLogger('tests.logging')
+        logger.info('Authenticated user Sokha', extra={'sample': True})
+        logger.warning('sampled warnings are kept', extra={'sample': True})
+        logger.info('kept')
+        listener.stop()
+
+        info = [json.loads(line) for line in self._read('info')]
+        self.assertEqual([entry['message'] for entry in info], ['kept'])
+        self.assertEqual(info[0]['logger'], 'tests.logging')
+        self.assertEqual(json.loads(self._read('warning')[0])['message'], 'sampled warnings are kept')
+
+
+if __name__ == '__main__':
+    unittest.main()
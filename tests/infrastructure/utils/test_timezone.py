@@ -0,0 +1,36 @@
+import unittest
+from datetime import datetime
+
+from src.infrastructure.utils.timezone import ict_month_to_utc_range
+
+
+class TestIctMonthToUtcRange(unittest.TestCase):
+    """Test cases for converting ICT calendar months to UTC ranges"""
+
+    def test_december_ends_before_the_new_year(self):
+        """Test that December stops on 31 Dec ICT instead of running into January"""
+        start, end = ict_month_to_utc_range(2025, 12)
+
+        self.assertEqual(start, datetime(2025, 11, 30, 17, 0, 0))
+        self.assertEqual(end.replace(microsecond=0), datetime(2025, 12, 31, 16, 59, 59))
+
+    def test_january_starts_in_the_previous_utc_year(self):
+        """Test that 1 Jan 00:00 ICT falls on 31 Dec UTC"""
+        start, end = ict_month_to_utc_range(2026, 1)
+
+        self.assertEqual(start, datetime(2025, 12, 31, 17, 0, 0))
+        self.assertEqual(end.replace(microsecond=0), datetime(2026, 1, 31, 16, 59, 59))
+
+    def test_consecutive_months_do_not_overlap_or_leave_gaps(self):
+        """Test that a month ends just before the next one starts, including leap February"""
+        _, december_end = ict_month_to_utc_range(2025, 12)
+        january_start, _ = ict_month_to_utc_range(2026, 1)
+        self.assertLess(december_end, january_start)
+        self.assertLess((january_start - december_end).total_seconds(), 1)
+
+        _, february_end = ict_month_to_utc_range(2028, 2)
+        self.assertEqual(february_end.date(), datetime(2028, 2, 29).date())
+
+
+if __name__ == '__main__':
+    unittest.main()
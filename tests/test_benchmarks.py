@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from src.infrastructure.persistence.database import database
+import src.infrastructure.api.routes.checkin_routes as checkin_routes
+from src.infrastructure.api.middleware.telegram_auth import parse_init_data, verify_telegram_signature
+from benchmarks import compare, run, startup
+from benchmarks.load_checkin import sign_init_data
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Smoke tests for the benchmark and load-test harnesses"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Seeding dominates the run time, so every test shares a single benchmark run
+        cls.work_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.work_dir)
+        # run.main() points the database singleton and photo storage at its own work directory
+        engine, session_factory = database.engine, database.SessionLocal
+        photo_storage = checkin_routes.photo_storage
+        try:
+            cls.results_path = os.path.join(cls.work_dir, 'results.json')
+            cls.work_dirs_before = set(os.listdir(tempfile.gettempdir()))
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                run.main(['--iterations', '2', '--output', cls.results_path])
+        finally:
+            database.engine, database.SessionLocal = engine, session_factory
+            checkin_routes.photo_storage = photo_storage
+
+    def _report(self):
+        with open(self.results_path) as f:
+            return json.load(f)
+
+    def test_writes_results_for_every_case(self):
+        """Test that every case is timed (or skipped without MongoDB) and the dataset is described"""
+        report = self._report()
+
+        self.assertEqual(report['database'], 'sqlite')
+        self.assertEqual(report['dataset']['rows']['check_ins'], 10_000)
+        self.assertEqual(set(report['results']), set(run.CASES))
+        self.assertIn('skipped', report['results']['admin_group_listing'])
+        checkin = report['results']['checkin_post']
+        self.assertEqual(checkin['iterations'], 2)
+        self.assertEqual(checkin['queries_per_op'], 3)
+
+    def test_removes_its_work_directory(self):
+        """Test that the temporary database, photos and exports are cleaned up after the run"""
+        leftover = set(os.listdir(tempfile.gettempdir())) - self.work_dirs_before
+        self.assertFalse([name for name in leftover if name.startswith('office-automation-bench-')])
+
+    def test_compare_flags_regressions(self):
+        """Test that compare exits non-zero when a median slows down beyond the threshold"""
+        report = self._report()
+        for result in report['results'].values():
+            if 'median_ms' in result:
+                result['median_ms'] *= 2
+        candidate = os.path.join(self.work_dir, 'candidate.json')
+        with open(candidate, 'w') as f:
+            json.dump(report, f)
+
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+            self.assertEqual(compare.main([self.results_path, candidate, '--fail-above', '50']), 1)
+            self.assertEqual(compare.main([self.results_path, self.results_path, '--fail-above', '50']), 0)
+
+    def test_load_test_init_data_passes_verification(self):
+        """Test that the load generator signs initData the way the auth middleware verifies it"""
+        init_data = sign_init_data({'id': 42, 'first_name': 'Sokha'}, '123:TOKEN')
+
+        self.assertTrue(verify_telegram_signature(init_data, '123:TOKEN'))
+        self.assertFalse(verify_telegram_signature(init_data, '123:OTHER'))
+        self.assertEqual(parse_init_data(init_data)['user']['id'], 42)
+
+    def test_startup_importtime_breakdown(self):
+        """Test the -X importtime parser and the per-package grouping"""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     openpyxl.styles",
+            "import time:       400 |        500 |   openpyxl",
+            "import time:       200 |        200 |   src.infrastructure.services.excel_export_service",
+            "import time:        50 |        750 | main",
+        ])
+        modules = startup.parse_importtime(output)
+        self.assertEqual(modules[0], ('openpyxl.styles', 2, 100, 100))
+
+        report = startup.breakdown(modules, top=10)
+        self.assertEqual(report['total_ms'], 0.8)
+        self.assertEqual(report['packages_ms'], {'openpyxl': 0.5, 'src.infrastructure.services': 0.2, 'main': 0.1})
+        self.assertEqual(list(report['slowest_ms']), ['openpyxl', 'src.infrastructure.services.excel_export_service',
+                                                      'openpyxl.styles'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, g
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.metrics.sqlalchemy_metrics import instrument_engine
+from src.infrastructure.persistence.models import (
+    Base, CheckInModel, EmployeeGroupModel, EmployeeModel, GroupModel
+)
+from src.infrastructure.persistence.check_in_repository_impl import CheckInRepository
+from src.infrastructure.persistence.employee_repository_impl import EmployeeRepository
+from src.infrastructure.persistence.group_repository_impl import GroupRepository
+from src.presentation.handlers.checkin_report_handler import CheckInReportHandler
+import src.infrastructure.api.routes.employee_routes as employee_routes
+import src.infrastructure.api.routes.user_group_routes as user_group_routes
+
+EMPLOYEES = 10
+
+
+class TestQueryBudgets(unittest.TestCase):
+    """Query budgets for the call sites that used to look rows up one by one"""
+
+    @pytest.fixture(autouse=True)
+    def _query_budget(self, max_queries):
+        self.max_queries = max_queries
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        self.addCleanup(self.engine.dispose)
+        instrument_engine(self.engine)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+        # Every employee belongs to every group and checks in and out today
+        self.now = datetime(2026, 3, 2, 2, 0)
+        session = self.Session()
+        session.add_all([GroupModel(id=i, chat_id=f'-10{i}', name=f'Group {i}') for i in (1, 2, 3)])
+        for employee_id in range(1, EMPLOYEES + 1):
+            session.add(EmployeeModel(id=employee_id, telegram_id=str(employee_id), name=f'Employee {employee_id}'))
+            session.add_all([
+                EmployeeGroupModel(employee_id=employee_id, group_id=group_id, joined_at=self.now)
+                for group_id in (1, 2, 3)
+            ])
+            session.add_all([
+                CheckInModel(employee_id=employee_id, group_id=1, latitude=11.5, longitude=104.9,
+                             type=check_in_type, timestamp=self.now + timedelta(minutes=employee_id))
+                for check_in_type in ('checkin', 'checkout')
+            ])
+        session.commit()
+        session.close()
+
+    def test_daily_report_loads_employees_in_one_query(self):
+        """Test that formatting a report of 20 check-ins costs a single employee query"""
+        session = self.Session()
+        self.addCleanup(session.close)
+        handler = CheckInReportHandler(
+            GroupRepository(session), CheckInRepository(session), EmployeeRepository(session), None
+        )
+        group = handler.group_repository.find_by_id(1)
+        check_ins = handler.check_in_repository.find_by_group_and_datetime_range(
+            1, self.now, self.now + timedelta(days=1)
+        )
+        self.assertEqual(len(check_ins), 2 * EMPLOYEES)
+
+        with self.max_queries(1):
+            report = handler._format_daily_report(group, check_ins, self.now.date())
+
+        self.assertIn('Employee 10', report)
+
+    def test_get_employees_is_two_queries(self):
+        """Test that a filtered employee page is the group lookup plus one page query"""
+        app = Flask(__name__)
+        app.register_blueprint(employee_routes.employee_bp, url_prefix='/api')
+
+        with patch.object(employee_routes.database, 'get_session', self.Session), self.max_queries(2):
+            response = app.test_client().get('/api/employees', query_string={'chat_id': '-101', 'limit': 50})
+
+        self.assertEqual(len(response.get_json()['data']), EMPLOYEES)
+
+    def test_get_user_groups_is_one_query(self):
+        """Test that an employee's groups are loaded with their memberships in one query"""
+        app = Flask(__name__)
+        app.register_blueprint(user_group_routes.user_group_bp, url_prefix='/api')
+        app.before_request(lambda: setattr(g, 'current_user', SimpleNamespace(id=1)))
+        mongo = SimpleNamespace(form_configurations=SimpleNamespace(find=lambda query: []))
+
+        with patch.object(user_group_routes.database, 'get_session', self.Session), \
+                patch.object(user_group_routes.mongodb, 'get_database', return_value=mongo), \
+                self.max_queries(1):
+            response = app.test_client().get('/api/user/groups')
+
+        self.assertEqual(response.get_json()['data']['total'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()